@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+
+"""
+Corpus-Level Batch Filtering
+============================
+The per-posting filters run every rule against every posting: N postings and
+P patterns cost N x P ``re.search`` calls, each paying Python call overhead
+for a short string. ``evaluate_batch`` instead joins the corpus into one
+buffer and runs each compiled pattern once over it with ``finditer``.
+Match offsets are mapped back to postings through a sorted offset index.
+
+Results are identical to the per-posting path:
+
+- Postings are joined with ``"\\n\\x00\\n"``. ``.`` doesn't match the
+  newlines and ``\\s``/``\\w`` don't match the NUL, so ordinary patterns can't
+  match across postings, and ``\\b`` sees the same non-word character at a
+  posting's edge as at the start or end of a string.
+- A match that still crosses a separator (negated classes, ``[\\s\\S]``) may
+  hide a match inside a posting it covers, so every posting it touches is
+  re-checked on its own text.
+- Patterns whose result depends on text outside the match (lookarounds,
+  ``^``/``$``, ``\\B``) are not scanned as a corpus; they run per posting.
+"""
+
+from bisect import bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+
+from compiled_rules import CombinedMatcher, GuardedPattern, RuleTable
+from keyword_automaton import KeywordAutomaton
+import education_filters
+import run_collect
+from run_collect import PostingContext
+
+SEPARATOR = "\n\x00\n"
+
+# Postings buffered per pass in evaluate_batch. Past a few thousand the
+# per-pattern overhead is amortized; much larger chunks only add memory.
+DEFAULT_CHUNK_SIZE = 5000
+
+_REPEATS = tuple(getattr(sre_parse, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+                 if hasattr(sre_parse, name))
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", object())
+
+
+def _context_free(items) -> bool:
+    for op, av in items:
+        if op == sre_parse.AT:
+            # Only word boundaries behave the same at a posting's edge as at a string's
+            if av != sre_parse.AT_BOUNDARY:
+                return False
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT, sre_parse.GROUPREF_EXISTS):
+            return False
+        elif op == sre_parse.SUBPATTERN:
+            if not _context_free(av[-1]):
+                return False
+        elif op in _REPEATS:
+            if not _context_free(av[2]):
+                return False
+        elif op == sre_parse.BRANCH:
+            if not all(_context_free(branch) for branch in av[1]):
+                return False
+        elif op == _ATOMIC_GROUP:
+            if not _context_free(av):
+                return False
+    return True
+
+
+def is_context_free(rule: GuardedPattern) -> bool:
+    """True if whether the rule matches inside a posting can't depend on the text around it."""
+    return _context_free(sre_parse.parse(rule.regex.pattern, rule.regex.flags))
+
+
+class CorpusBuffer:
+    """
+    Texts joined into one buffer, with the offset index that maps a buffer
+    position back to the posting it falls in.
+    """
+
+    __slots__ = ("texts", "buffer", "starts", "ends", "_context_free", "_containing")
+
+    def __init__(self, texts: Iterable[str]):
+        self.texts: List[str] = list(texts)
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        offset = 0
+        for text in self.texts:
+            self.starts.append(offset)
+            offset += len(text)
+            self.ends.append(offset)
+            offset += len(SEPARATOR)
+        self.buffer = SEPARATOR.join(self.texts)
+        self._context_free: Dict[Tuple[str, int], bool] = {}
+        self._containing: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def posting_at(self, offset: int) -> int:
+        """Index of the posting whose text (or following separator) contains the offset."""
+        return bisect_right(self.starts, offset) - 1
+
+    def _touched(self, start: int, end: int) -> range:
+        """Postings whose text overlaps buffer[start:end]."""
+        first = self.posting_at(start)
+        if start > self.ends[first]:
+            first += 1
+        return range(first, self.posting_at(max(end - 1, start)) + 1)
+
+    def containing(self, literal: str) -> List[int]:
+        """Postings whose text contains the literal, from one ``find`` sweep over the buffer."""
+        if literal in self._containing:
+            return self._containing[literal]
+        postings = []
+        buffer, starts, ends = self.buffer, self.starts, self.ends
+        last = len(self.texts) - 1
+        pos = buffer.find(literal)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            if pos + len(literal) <= ends[i]:
+                postings.append(i)
+                if i == last:
+                    break
+                # One hit per posting is enough: resume at the next one
+                pos = buffer.find(literal, starts[i + 1])
+            else:
+                pos = buffer.find(literal, pos + 1)
+        self._containing[literal] = postings
+        return postings
+
+    def candidates(self, rule: GuardedPattern) -> List[int]:
+        """Postings that pass the rule's literal guard, in order."""
+        if len(rule.guard) == 1:
+            return self.containing(rule.guard[0])
+        found = set()
+        for literal in rule.guard:
+            found.update(self.containing(literal))
+        return sorted(found)
+
+    def _scannable(self, rule: GuardedPattern) -> bool:
+        key = (rule.regex.pattern, rule.regex.flags)
+        if key not in self._context_free:
+            self._context_free[key] = is_context_free(rule)
+        return self._context_free[key]
+
+    def postings_matching(self, rule: GuardedPattern, skip: Optional[List[bool]] = None) -> List[int]:
+        """
+        Indices of the postings where ``rule.search(text)`` would match, ascending.
+
+        Postings flagged in ``skip`` may be left out without being searched
+        (used by ``any`` for postings already known to match).
+        """
+        if not self.texts:
+            return []
+        if rule.guard:
+            # The literal index narrows the corpus to postings that can match;
+            # the regex only runs on those
+            search, texts = rule.engine.search, self.texts
+            return [i for i in self.candidates(rule)
+                    if not (skip and skip[i]) and search(texts[i]) is not None]
+        if not self._scannable(rule):
+            return [i for i, text in enumerate(self.texts) if rule.engine.search(text) is not None]
+
+        found = set()
+        recheck = set()
+        starts, ends = self.starts, self.ends
+        for m in rule.engine.finditer(self.buffer):
+            start, end = m.span()
+            i = bisect_right(starts, start) - 1
+            if end <= ends[i]:
+                found.add(i)
+            else:
+                # Crossed a separator (or lies inside one): the covered postings
+                # may have matches of their own that this one consumed
+                recheck.update(self._touched(start, end))
+        for i in recheck - found:
+            if rule.engine.search(self.texts[i]) is not None:
+                found.add(i)
+        return sorted(found)
+
+    def search(self, rule: GuardedPattern, skip: Optional[List[bool]] = None) -> List[bool]:
+        """Per posting, whether ``rule.search(text)`` would match (see ``postings_matching``)."""
+        hits = [False] * len(self.texts)
+        for i in self.postings_matching(rule, skip):
+            hits[i] = True
+        return hits
+
+    def any(self, table: RuleTable, skip: Optional[List[bool]] = None) -> List[bool]:
+        """Per posting, whether ``table.any(text)`` would be True (False for skipped postings)."""
+        found = [False] * len(self.texts)
+        done = list(skip) if skip else [False] * len(self.texts)
+        for rule in table:
+            for i, hit in enumerate(self.search(rule, skip=done)):
+                if hit and not done[i]:
+                    found[i] = done[i] = True
+        return found
+
+    def matched(self, matcher: CombinedMatcher) -> List[bytearray]:
+        """Per posting, ``matcher.matched(text)`` as 0/1 flags."""
+        rows = [bytearray(len(matcher)) for _ in self.texts]
+        for rule, positions in matcher.rules:
+            for i, hit in enumerate(self.search(rule)):
+                if hit:
+                    for position in positions:
+                        rows[i][position] = True
+        return rows
+
+    def contains_any(self, automaton: KeywordAutomaton, skip: Optional[List[bool]] = None) -> List[bool]:
+        """
+        Per posting, ``automaton.contains_any(text)`` (False for skipped postings).
+
+        An automaton already reads each text once and stops at the first hit;
+        run over the buffer it would report every hit in the corpus instead,
+        so this stays per posting.
+        """
+        return [not (skip and skip[i]) and automaton.contains_any(text) for i, text in enumerate(self.texts)]
+
+
+class BatchVerdict(NamedTuple):
+    """Filter results for one posting, as the per-posting functions return them."""
+    health_admin: Tuple[bool, str]
+    meets_entry_level: bool
+    bachelors: bool
+
+
+def entry_level_batch(education_texts: Sequence[str], titles: Sequence[str]) -> List[bool]:
+    """``_meets_entry_level`` for lowercased education texts and titles."""
+    education = CorpusBuffer(education_texts)
+    title_buffer = CorpusBuffer(titles)
+    # Like the per-posting checks, later rules skip postings already rejected
+    rejected = [not hit for hit in education.search(run_collect.BACHELORS_MENTIONED_RULE)]
+    for corpus, table in ((education, run_collect.STRICT_ADVANCED_DEGREE_RULES),
+                          (education, run_collect.STRICT_HIGH_EXPERIENCE_RULES),
+                          (title_buffer, run_collect.SENIOR_TITLE_RULES)):
+        for i, hit in enumerate(corpus.any(table, skip=rejected)):
+            if hit:
+                rejected[i] = True
+    return [not r for r in rejected]
+
+
+def health_admin_batch(combined_texts: Sequence[str], meets_entry_level: Sequence[bool]) -> List[Tuple[bool, str]]:
+    """``looks_like_health_admin`` for lowercased title + description texts."""
+    combined = CorpusBuffer(combined_texts)
+    reasons: List[Optional[str]] = [None] * len(combined)
+    rejected = [False] * len(combined)
+
+    def reject(hits: List[bool], reason: str) -> None:
+        for i, hit in enumerate(hits):
+            if hit and not rejected[i]:
+                rejected[i] = True
+                reasons[i] = reason
+
+    reject(combined.search(run_collect.CLINICAL_ROLE_RULE), "clinical_roles")
+    reject(combined.any(run_collect.SOFTWARE_ROLE_RULES, skip=rejected), "software_roles")
+    admin = combined.contains_any(run_collect.ADMIN_HINT_AUTOMATON, skip=rejected)
+    reject([not hit for hit in admin], "no_admin_keywords")
+    reject([not ok for ok in meets_entry_level], "education_requirements")
+    return [(False, reason) if reason else (True, "passes") for reason in reasons]
+
+
+def education_analysis_batch(job_descriptions: Sequence[str], qualifications: str = "") -> List[Dict]:
+    """``education_filters.analyze_education_requirements`` for every description."""
+    corpus = CorpusBuffer(f"{description} {qualifications}".lower() for description in job_descriptions)
+    high_school = corpus.search(education_filters.HIGH_SCHOOL_PRIMARY_RULE)
+    associates = corpus.search(education_filters.ASSOCIATES_PRIMARY_RULE)
+    family_hits = corpus.matched(education_filters.FAMILY_MATCHER)
+    analyses = []
+    for hs, assoc, hits in zip(high_school, associates, family_hits):
+        if hs:
+            analyses.append(education_filters.primary_requirement_analysis('high_school_only'))
+        elif assoc:
+            analyses.append(education_filters.primary_requirement_analysis('associates_only'))
+        else:
+            analyses.append(education_filters.analysis_from_family_hits(hits))
+    return analyses
+
+
+Posting = Union[PostingContext, Mapping[str, Any]]
+
+
+def _evaluate_chunk(contexts: List[PostingContext]) -> List[BatchVerdict]:
+    entry_level = entry_level_batch([c.education_text_lower for c in contexts], [c.title_lower for c in contexts])
+    health_admin = health_admin_batch([c.combined_lower for c in contexts], entry_level)
+    bachelors = [a['should_include'] for a in education_analysis_batch([c.description for c in contexts])]
+    return [BatchVerdict(*verdict) for verdict in zip(health_admin, entry_level, bachelors)]
+
+
+def evaluate_batch(postings: Iterable[Posting], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[BatchVerdict]:
+    """
+    Health-admin, entry-level and bachelor's verdicts for a whole corpus.
+
+    Postings are PostingContexts or dicts with title/location/description.
+    Per posting, the verdict equals ``PostingContext.health_admin``,
+    ``PostingContext.meets_entry_level`` and
+    ``education_filters.meets_bachelors_requirement(description)``.
+
+    The corpus is buffered ``chunk_size`` postings at a time, which keeps
+    memory bounded without giving up the per-pattern batching.
+    """
+    verdicts: List[BatchVerdict] = []
+    postings = iter(postings)
+    while True:
+        chunk = [
+            p if isinstance(p, PostingContext)
+            else PostingContext(p.get("title"), p.get("location"), p.get("description"))
+            for p in islice(postings, chunk_size)
+        ]
+        if not chunk:
+            return verdicts
+        verdicts.extend(_evaluate_chunk(chunk))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Per-Posting vs Corpus Batch Filtering
+=====================================
+Times the per-posting filter path (PostingContext checks plus
+education_filters.meets_bachelors_requirement) against
+batch_filters.evaluate_batch on synthetic corpora of increasing size, and
+confirms both return the same verdicts.
+
+Usage:
+    python benchmarks/bench_batch.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+import batch_filters
+import education_filters
+from run_collect import PostingContext
+
+
+def per_posting(postings):
+    verdicts = []
+    for p in postings:
+        posting = PostingContext(p["title"], p["location"], p["description"])
+        verdicts.append((posting.health_admin, posting.meets_entry_level,
+                         education_filters.meets_bachelors_requirement(p["description"])))
+    return verdicts
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-posting vs batch filter benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print("Per-posting vs corpus batch filtering (synthetic postings)")
+    print("=" * 72)
+    print(f"{'postings':>9} {'per-posting':>13} {'batch':>10} {'speedup':>8}  verdicts")
+    for size in args.sizes:
+        postings = generate_corpus(size)
+        expected, single_s = timed(per_posting, postings)
+        verdicts, batch_s = timed(batch_filters.evaluate_batch, postings)
+        same = [tuple(v) for v in verdicts] == expected
+        print(f"{size:>9} {single_s:>12.2f}s {batch_s:>9.2f}s {single_s / batch_s:>7.2f}x  "
+              f"{'identical' if same else 'DIFFERENT'}")
+
+    # Where the time goes: the education families gain most, the short
+    # health admin / entry-level tables were already cheap per posting
+    postings = generate_corpus(args.sizes[0])
+    descriptions = [p["description"] for p in postings]
+    _, single_s = timed(lambda: [education_filters.analyze_education_requirements(d) for d in descriptions])
+    _, batch_s = timed(batch_filters.education_analysis_batch, descriptions)
+    print(f"\neducation families only ({args.sizes[0]} postings): "
+          f"per-posting {single_s:.2f}s, batch {batch_s:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
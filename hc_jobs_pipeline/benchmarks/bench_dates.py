@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Date Handling Benchmark
+=======================
+Times the date work of a collection run and its summary over synthetic
+records: Greenhouse ``created_at``/``updated_at`` through dateutil (as
+run_collect used to) and through date_utils.parse_date, a ``collectedAt``
+per record against one per run, and the summary's timestamp parsing. Checks
+that both ways give the same dates.
+
+Usage:
+    python benchmarks/bench_dates.py [--records 100000] [--distinct 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dateutil import parser as dtparser
+
+import date_utils
+from date_utils import parse_date, parse_timestamp, utc_timestamp
+
+OFFSETS = ["-05:00", "-04:00", "-07:00", "+00:00", "Z", ".000Z"]
+
+
+def feed_dates(count, distinct, seed=49):
+    """``count`` created_at/updated_at pairs drawn from ``distinct`` timestamps, a few not ISO."""
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1)
+    pool = []
+    for _ in range(distinct):
+        moment = start + timedelta(seconds=rng.randrange(3 * 365 * 86400))
+        if rng.random() < 0.01:
+            pool.append(moment.strftime("%B %d, %Y %H:%M"))
+        else:
+            pool.append(moment.isoformat() + rng.choice(OFFSETS))
+    return [(rng.choice(pool), rng.choice(pool)) for _ in range(count)]
+
+
+def legacy_parse_date(val):
+    if not val:
+        return None
+    try:
+        return dtparser.parse(val).date().isoformat()
+    except Exception:
+        return None
+
+
+def legacy_parse_timestamp(val):
+    try:
+        return datetime.fromisoformat(val.replace('Z', '+00:00'))
+    except Exception:
+        return None
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Date handling benchmark")
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--distinct", type=int, default=20000,
+                        help="distinct feed timestamps the records draw from")
+    args = parser.parse_args()
+    pairs = feed_dates(args.records, args.distinct)
+
+    print(f"Date handling over {args.records} records ({args.distinct} distinct feed timestamps)")
+    print("=" * 72)
+
+    def run(parse):
+        return [(parse(created), parse(updated)) for created, updated in pairs]
+
+    expected, legacy_s = timed(lambda: run(legacy_parse_date))
+    date_utils._parse_date.cache_clear()
+    got, new_s = timed(lambda: run(parse_date))
+    date_utils._parse_date.cache_clear()
+    # The ISO fast path alone
+    _, unmemo_s = timed(lambda: run(date_utils._parse_date.__wrapped__))
+    print(f"{'created/updated dates':<28} dateutil {legacy_s:7.3f}s  date_utils {new_s:7.3f}s "
+          f"({legacy_s / new_s:5.1f}x)  {'identical' if got == expected else 'DIFFERENT'}")
+    print(f"{'  without the memo':<28} {'':17} {unmemo_s:7.3f}s ({legacy_s / unmemo_s:5.1f}x)")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # datetime.utcnow, as run_collect called it
+        per_record, per_record_s = timed(
+            lambda: [datetime.utcnow().isoformat(timespec="seconds") + "Z" for _ in range(args.records)])
+
+    def once():
+        collected_at = utc_timestamp()
+        return [collected_at for _ in range(args.records)]
+    stamps, once_s = timed(once)
+    print(f"{'collectedAt':<28} per record {per_record_s:5.3f}s  per run {once_s:9.3f}s "
+          f"({per_record_s / once_s:5.1f}x)")
+
+    old, legacy_s = timed(lambda: [legacy_parse_timestamp(value) for value in per_record])
+    date_utils._parse_timestamp.cache_clear()
+    new, new_s = timed(lambda: [parse_timestamp(value) for value in stamps])
+    print(f"{'summary collectedAt':<28} per record {legacy_s:5.3f}s  memoized {new_s:8.3f}s "
+          f"({legacy_s / new_s:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Years-of-Experience Rule Benchmark
+==================================
+Times the scored filter's experience patterns read numerically (a YearsRule)
+against the same patterns as regexes: every hit, as the analysis needs them
+(combined matcher), and the first hit, as the verdict needs it (combined
+search and the guarded table). Counts the postings where they disagree,
+which should be none.
+
+Usage:
+    python benchmarks/bench_experience_years.py [--postings 5000] [--join 1]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+from compiled_rules import RuleTable
+from rule_bundle import load_rules
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Years-of-experience rule benchmark")
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--join", type=int, default=1, help="postings joined into one text, for longer texts")
+    args = parser.parse_args()
+
+    descriptions = [f"{p['description']} ".lower() for p in generate_corpus(args.postings, seed=36)]
+    texts = [" ".join(descriptions[i:i + args.join]) for i in range(0, len(descriptions), args.join)]
+    n = len(texts)
+    rules = load_rules("education_filters")
+    years = rules.years("HIGH_EXPERIENCE_PATTERNS")
+    combined = rules.combined(years.patterns, re.I)
+    table = RuleTable(years.patterns, re.I)
+    numeric = sum(1 for form in years.numeric if form)
+    print(f"{len(years)} experience patterns ({numeric} numeric) over {n} texts "
+          f"of ~{sum(map(len, texts)) // n} chars")
+    print("=" * 72)
+
+    expected, regex_s = timed(lambda: [list(map(bool, combined.matched(t))) for t in texts])
+    got, years_s = timed(lambda: [years.matched(t) for t in texts])
+    differ = sum(a != b for a, b in zip(expected, got))
+    print(f"{'every hit':<12} combined regex {regex_s / n * 1e6:8.2f} us  years rule {years_s / n * 1e6:8.2f} us "
+          f"({regex_s / years_s:4.1f}x)  {differ} differ")
+
+    expected, regex_s = timed(lambda: [combined.search(t) for t in texts])
+    _, table_s = timed(lambda: [table.any(t) for t in texts])
+    got, years_s = timed(lambda: [years.any(t) for t in texts])
+    differ = sum(bool(a) != b for a, b in zip(expected, got))
+    print(f"{'first hit':<12} combined regex {regex_s / n * 1e6:8.2f} us  years rule {years_s / n * 1e6:8.2f} us "
+          f"({regex_s / years_s:4.1f}x)  {differ} differ")
+    print(f"{'':<12} guarded table  {table_s / n * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
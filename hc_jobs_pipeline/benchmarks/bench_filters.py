@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Per-Posting Filter Cost Microbenchmarks
+=======================================
+Measures the per-posting cost of each filter function in run_collect and the
+relaxed/simplified education filters, and compares the precompiled,
+literal-guarded rule tables against passing raw pattern strings to re.search.
+
+Usage:
+    python benchmarks/bench_filters.py [--postings 2000] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+import education_filters
+import relaxed_education_filters
+import run_collect
+import simplified_education_filters
+from enhanced_qualifications import QualificationsExtractor
+
+QUALIFICATIONS_EXTRACTOR = QualificationsExtractor()
+
+
+def per_posting_us(fn, postings, repeat: int) -> float:
+    """Best-of-``repeat`` average microseconds per posting."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for posting in postings:
+            fn(posting)
+        best = min(best, time.perf_counter() - start)
+    return best / len(postings) * 1e6
+
+
+def raw_table_search(patterns, flags, purge: bool):
+    """Old style: raw strings through re.search, optionally with a cold re cache."""
+    def run(text):
+        if purge:
+            re.purge()
+        for pattern in patterns:
+            if re.search(pattern, text, flags):
+                return True
+        return False
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-posting filter microbenchmarks")
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    postings = generate_corpus(args.postings)
+    texts = [p["description"].lower() for p in postings]
+
+    print(f"Per-posting filter cost ({args.postings} synthetic postings, best of {args.repeat})")
+    print("=" * 64)
+
+    filters = [
+        ("meets_entry_level_requirement", lambda p: run_collect.meets_entry_level_requirement(p["description"], p["title"], "")),
+        ("looks_like_health_admin", lambda p: run_collect.looks_like_health_admin(p["title"], p["description"])),
+        ("infer_career_track", lambda p: run_collect.infer_career_track(p["title"] + "\n" + p["description"])),
+        ("entry_level_flag", lambda p: run_collect.entry_level_flag(p["title"], p["description"])),
+        ("analyze_education_requirements", lambda p: education_filters.analyze_education_requirements(p["description"])),
+        ("meets_bachelors_requirement", lambda p: education_filters.meets_bachelors_requirement(p["description"])),
+        ("extract_qualifications", lambda p: run_collect.extract_qualifications(p["description"])),
+        ("QualificationsExtractor", lambda p: QUALIFICATIONS_EXTRACTOR.extract_comprehensive_qualifications(p["description"])),
+        ("relaxed education filter", lambda p: relaxed_education_filters.meets_relaxed_education_requirement(p["description"])),
+        ("simplified education filter", lambda p: simplified_education_filters.meets_simplified_education_requirement(p["description"])),
+    ]
+    for name, fn in filters:
+        print(f"{name:34} {per_posting_us(fn, postings, args.repeat):8.2f} us/posting")
+
+    print("\nRule table scan: guarded compiled vs raw re.search")
+    print("-" * 64)
+    tables = [
+        ("strict high-experience", run_collect.STRICT_HIGH_EXPERIENCE_RULES, re.I),
+        ("software roles", run_collect.SOFTWARE_ROLE_RULES, 0),
+        ("simplified bachelor mentions", simplified_education_filters.BACHELOR_MENTION_RULES, re.I),
+    ]
+    for name, table, flags in tables:
+        guarded = per_posting_us(table.any, texts, args.repeat)
+        warm = per_posting_us(raw_table_search(table.patterns, flags, purge=False), texts, args.repeat)
+        cold = per_posting_us(raw_table_search(table.patterns, flags, purge=True), texts, args.repeat)
+        print(f"{name:30} guarded {guarded:7.2f} us | raw cached {warm:7.2f} us | raw uncached {cold:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Multi-Profile Evaluation: Pattern Matrix vs Filter Functions
+============================================================
+Builds the postings x patterns matrix once, then evaluates the strict,
+scored, relaxed and simplified education profiles over it, against calling
+each filter function per posting.
+
+Usage:
+    python benchmarks/bench_profiles.py [--postings 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+import education_filters
+import relaxed_education_filters
+import simplified_education_filters
+from pattern_matrix import PROFILES, PatternMatrix, compare_profiles, format_report
+from run_collect import PostingContext
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pattern matrix profile benchmark")
+    parser.add_argument("--postings", type=int, default=100000)
+    args = parser.parse_args()
+
+    postings = generate_corpus(args.postings)
+    print(f"Multi-profile evaluation ({args.postings} synthetic postings)")
+    print("=" * 64)
+
+    start = time.perf_counter()
+    matrix = PatternMatrix.build(postings)
+    build_s = time.perf_counter() - start
+    print(f"matrix build (one scan, {len(matrix.columns)} columns)  {build_s:8.2f}s")
+
+    start = time.perf_counter()
+    results = matrix.evaluate(PROFILES)
+    print(f"evaluate {len(PROFILES)} profiles                    {(time.perf_counter() - start) * 1e3:8.1f}ms")
+
+    start = time.perf_counter()
+    custom = matrix.evaluate({"simplified_no_senior": lambda m: m.any("simplified.bachelor_mention")
+                              & ~m.any("strict.senior_title", "relaxed.senior_exec")})
+    print(f"evaluate a custom profile                {(time.perf_counter() - start) * 1e3:8.1f}ms")
+
+    functions = {
+        "strict": lambda p: PostingContext(p["title"], p["location"], p["description"]).meets_entry_level,
+        "scored": lambda p: education_filters.meets_bachelors_requirement(p["description"]),
+        "relaxed": lambda p: relaxed_education_filters.meets_relaxed_education_requirement(p["description"]),
+        "simplified": lambda p: simplified_education_filters.meets_simplified_education_requirement(p["description"]),
+    }
+    start = time.perf_counter()
+    per_posting = {name: [fn(p) for p in postings] for name, fn in functions.items()}
+    print(f"filter functions per posting             {time.perf_counter() - start:8.2f}s")
+    same = all(results[name].tolist() == per_posting[name] for name in functions)
+    print(f"results {'identical' if same else 'DIFFERENT'}\n")
+
+    print(format_report(compare_profiles(matrix)))
+
+
+if __name__ == "__main__":
+    main()
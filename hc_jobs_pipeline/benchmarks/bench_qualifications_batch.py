@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Batch Qualification Extraction
+==============================
+Times QualificationsExtractor.extract_many over a synthetic corpus with
+increasing worker counts against the one-posting-at-a-time loop, and
+confirms the results are the same.
+
+Usage:
+    python benchmarks/bench_qualifications_batch.py [--postings 20000] [--workers 1 2 4 8] [--chunk-size 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+from enhanced_qualifications import DEFAULT_CHUNK_SIZE, QualificationsExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch qualification extraction benchmark")
+    parser.add_argument("--postings", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    extractor = QualificationsExtractor()
+    descriptions = [p["description"] for p in generate_corpus(args.postings)]
+
+    print(f"Qualification extraction ({args.postings} synthetic postings, {os.cpu_count()} CPUs)")
+    print("=" * 64)
+    start = time.perf_counter()
+    expected = [extractor.extract_structured(d) for d in descriptions]
+    loop_s = time.perf_counter() - start
+    print(f"{'loop':<12} {loop_s:8.2f}s")
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = extractor.extract_many(descriptions, workers=workers, chunk_size=args.chunk_size)
+        batch_s = time.perf_counter() - start
+        print(f"{f'{workers} workers':<12} {batch_s:8.2f}s {loop_s / batch_s:6.2f}x  "
+              f"{'identical' if results == expected else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Regex Safety Stress Benchmark
+=============================
+Audits every rule file pattern for unbounded wildcards, builds adversarial
+single-line inputs for each one (see regex_safety.adversarial_texts), and
+reports the worst-case search time per pattern as written, with bounded
+windows, and on RE2 when installed. Then runs whole adversarial postings
+through the filters in each safety mode to show the per-posting worst case.
+
+Usage:
+    python benchmarks/bench_regex_safety.py [--sizes 2000 8000] [--window 200]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import education_filters
+import relaxed_education_filters
+import rule_bundle
+import simplified_education_filters
+from regex_safety import (HAVE_LINEAR_ENGINE, SafetySettings, adversarial_texts, audit_pattern,
+                          bound_pattern, linear_regex)
+from rule_bundle import compile_rules
+from run_collect import PostingContext
+
+
+def timed_ms(fn, text):
+    start = time.perf_counter()
+    fn(text)
+    return (time.perf_counter() - start) * 1e3
+
+
+def risky_patterns():
+    """(rule file, pattern, flags) for every shipped pattern with an unbounded wildcard."""
+    found = []
+    for path in sorted(rule_bundle.RULES_DIR.glob("*.json")):
+        bundle = compile_rules(path.stem, safety=SafetySettings())
+        for pattern, flags in rule_bundle._spec_patterns(bundle):
+            if any(f.kind == "unbounded_wildcard" for f in audit_pattern(pattern, flags)):
+                found.append((path.stem, pattern, flags))
+    return found
+
+
+def filter_posting(text):
+    posting = PostingContext("Patient Access Representative", "Boise, ID", text)
+    posting.health_admin
+    education_filters.analyze_education_requirements(text)
+    simplified_education_filters.meets_simplified_education_requirement(text)
+    relaxed_education_filters.meets_relaxed_education_requirement(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adversarial-input regex benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 8000])
+    parser.add_argument("--window", type=int, default=200)
+    args = parser.parse_args()
+    size = max(args.sizes)
+
+    patterns = risky_patterns()
+    print(f"{len(patterns)} rule patterns with unbounded wildcards; worst case per pattern "
+          f"on {size}-character adversarial lines (ms)")
+    print("=" * 96)
+    print(f"{'rule file':<22} {'pattern':<40} {'as written':>11} {'bounded':>9} {'linear':>9}")
+    worst = {"as written": 0.0, "bounded": 0.0, "linear": 0.0}
+    for name, pattern, flags in patterns:
+        bounded = bound_pattern(pattern, flags, args.window)
+        engines = {"as written": re.compile(pattern, flags), "bounded": re.compile(bounded, flags)}
+        if linear_regex(pattern, flags) is not None:
+            engines["linear"] = linear_regex(pattern, flags)
+        texts = adversarial_texts(pattern, flags, size)
+        row = {mode: max(timed_ms(regex.search, t) for t in texts) for mode, regex in engines.items()}
+        for mode, ms in row.items():
+            worst[mode] = max(worst[mode], ms)
+        label = pattern if len(pattern) <= 40 else pattern[:37] + "..."
+        linear = f"{row['linear']:9.2f}" if "linear" in row else f"{'-':>9}"
+        print(f"{name:<22} {label:<40} {row['as written']:11.2f} {row['bounded']:9.2f} {linear}")
+    print(f"{'worst':<63} {worst['as written']:11.2f} {worst['bounded']:9.2f} {worst['linear']:9.2f}")
+
+    # Whole postings: every filter over each adversarial line, per safety mode
+    modes = ["off", "bounded"] + (["linear"] if HAVE_LINEAR_ENGINE else [])
+    print(f"\nWorst per-posting filter time (health admin + all education filters, ms)")
+    print(f"{'chars':>7} " + " ".join(f"{mode:>10}" for mode in modes))
+    for n in args.sizes:
+        texts = [t for _, pattern, flags in patterns for t in adversarial_texts(pattern, flags, n)]
+        row = []
+        for mode in modes:
+            rule_bundle.set_regex_safety(SafetySettings(mode, args.window))
+            row.append(max(timed_ms(filter_posting, t) for t in texts))
+        print(f"{n:>7} " + " ".join(f"{ms:>10.2f}" for ms in row))
+    rule_bundle.set_regex_safety(SafetySettings())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Rejection Log Overhead
+======================
+Times the collect() filter chain over a synthetic corpus with and without a
+rejection log at a few sample rates, then times the query tool's two
+questions over a log of generated records.
+
+Usage:
+    python benchmarks/bench_rejection_log.py [--postings 5000] [--records 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import generate_corpus
+from filter_chain import Rejection
+from rejection_log import RejectionLog, top_rules, why
+from run_collect import PostingContext, build_filter_chain
+
+
+def run_chain(postings, log=None):
+    # Fixed order and no saved stats, so every run does the same work
+    chain = build_filter_chain(retune_every=None)
+    start = time.perf_counter()
+    for i, p in enumerate(postings):
+        posting = PostingContext(p["title"], p["location"], p["description"])
+        reason = chain.rejection_reason(posting)
+        if reason and log is not None:
+            log.record(f"https://jobs.example.com/{i}", reason, chain.last_rejection)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rejection log overhead benchmark")
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    postings = generate_corpus(args.postings)
+
+    print(f"Filter chain with a rejection log ({args.postings} synthetic postings)")
+    print("=" * 64)
+    with tempfile.TemporaryDirectory() as tmp:
+        rates = (None, 0.01, 0.1, 1.0)
+        times = {rate: [] for rate in rates}
+        logged = {}
+        # Interleaved so drift in machine speed doesn't land on one setting
+        for _ in range(args.repeat):
+            for rate in rates:
+                if rate is None:
+                    times[rate].append(run_chain(postings))
+                    continue
+                with RejectionLog(Path(tmp) / f"rejections-{rate}.bin", rate) as log:
+                    times[rate].append(run_chain(postings, log))
+                logged[rate] = log.logged
+        base = min(times[None])
+        print(f"{'no log':<16} {base / len(postings) * 1e6:8.1f} us/posting")
+        for rate in rates[1:]:
+            best = min(times[rate])
+            print(f"{'sample ' + str(rate):<16} {best / len(postings) * 1e6:8.1f} us/posting  "
+                  f"{(best / base - 1) * 100:+5.1f}%  {logged[rate]} records/run")
+
+        path = Path(tmp) / "large.bin"
+        rules = [Rejection(f"SOFTWARE_ROLE[{i}]", i, i + 8) for i in range(40)]
+        stages = ["clinical_roles", "software_roles", "education_requirements", "non_us_locations"]
+        with RejectionLog(path) as log:
+            for i in range(args.records):
+                log.record(f"https://jobs.example.com/{i}", stages[i % 4], rules[i % 40])
+        start = time.perf_counter()
+        found = why(path, "https://jobs.example.com/12345")
+        why_s = time.perf_counter() - start
+        start = time.perf_counter()
+        top = top_rules(path, 10)
+        top_s = time.perf_counter() - start
+        print(f"\n{args.records} records ({path.stat().st_size / 1e6:.0f} MB): "
+              f"why {why_s * 1000:.0f} ms ({len(found)} found), top {top_s * 1000:.0f} ms ({len(top)} rules)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Synthetic Posting Corpus for Benchmarks
+=======================================
+Generates reproducible job postings that look like what the ATS feeds
+return (title, location, multi-section description) so filter benchmarks
+don't depend on network access or collected data.
+"""
+
+import random
+from typing import Dict, List
+
+TITLES = [
+    "Patient Access Representative", "Medical Billing Specialist", "Healthcare Operations Coordinator",
+    "Front Desk Coordinator", "Scheduling Coordinator", "Registered Nurse", "Software Engineer",
+    "Director of Revenue Cycle", "Administrator in Training", "Referral Coordinator",
+    "Data Scientist", "Unit Clerk", "Practice Manager", "Prior Authorization Specialist",
+]
+
+LOCATIONS = [
+    "Nashville, TN", "Remote", "Austin, TX", "Pittsburgh, PA", "Toronto, ON", "London, UK",
+    "California, US", "New York, NY", "Denver, CO", "Remote - US", "Boise, ID", "Chicago, IL",
+]
+
+INTROS = [
+    "We are a growing health system dedicated to compassionate care across our clinics.",
+    "Join our team supporting patients and providers in a fast-paced outpatient setting.",
+    "Our mission is to make healthcare simpler for the communities we serve.",
+]
+
+RESPONSIBILITIES = [
+    "Register patients and verify insurance eligibility",
+    "Schedule appointments and manage provider calendars",
+    "Process referrals and prior authorizations",
+    "Answer phones and greet visitors at the front desk",
+    "Maintain accurate records in Epic",
+    "Coordinate with billing and revenue cycle teams",
+]
+
+QUALIFICATIONS = [
+    "Bachelor's degree in Healthcare Administration preferred",
+    "Bachelor's degree required",
+    "High school diploma or GED required",
+    "Associate's degree required",
+    "Master's degree required",
+    "0-2 years of experience in a healthcare setting",
+    "3+ years experience in patient access",
+    "5+ years of experience in revenue cycle",
+    "Knowledge of HIPAA regulations",
+    "Strong communication and customer service skills",
+    "Entry-level candidates welcome",
+]
+
+PAY = [
+    "$18 - $22 per hour", "$20/hr", "$45,000 - $55,000 per year", "$52,000 annually",
+    "Competitive pay", "",
+]
+
+
+def generate_posting(rng: random.Random, index: int) -> Dict[str, str]:
+    """One synthetic posting with the fields the collectors produce."""
+    responsibilities = rng.sample(RESPONSIBILITIES, rng.randint(2, 5))
+    qualifications = rng.sample(QUALIFICATIONS, rng.randint(2, 4))
+    pay = rng.choice(PAY)
+    lines = [rng.choice(INTROS), "", "Responsibilities:"]
+    lines += [f"- {r}" for r in responsibilities]
+    lines += ["", "Qualifications:"]
+    lines += [f"- {q}" for q in qualifications]
+    if pay:
+        lines += ["", f"Compensation: {pay}"]
+    lines += ["", "Equal Opportunity Employer. We do not discriminate based on veteran status."]
+    return {
+        "id": f"posting-{index}",
+        "title": rng.choice(TITLES),
+        "location": rng.choice(LOCATIONS),
+        "description": "\n".join(lines),
+    }
+
+
+def generate_corpus(size: int, seed: int = 42) -> List[Dict[str, str]]:
+    """``size`` reproducible postings."""
+    rng = random.Random(seed)
+    return [generate_posting(rng, i) for i in range(size)]
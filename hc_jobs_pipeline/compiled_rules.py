@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+
+"""
+Precompiled, Literal-Guarded Rule Tables
+========================================
+Filter rule tables compiled once at import instead of passing raw pattern
+strings to ``re.search`` on every call. Our filter modules carry more patterns
+than the ``re`` module's internal cache holds, so raw strings were being
+recompiled over and over.
+
+Each rule also gets a cheap required-literal guard derived from the pattern
+(``"bachelor" in text`` before running ``bachelor.{0,20}preferred``), so most
+rules are rejected with a substring check and never reach the regex engine.
+Guards assume IGNORECASE rules are run against lowercased text, which is how
+all of our filters call them.
+
+Rules built with regex safety settings search with a bounded or RE2 engine
+(see regex_safety). ``regex`` stays the pattern as written, for
+introspection; ``engine`` is what searches.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from regex_safety import SafetySettings, bound_pattern, linear_set, safe_engine
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+
+Guard = Tuple[str, ...]
+
+_ZERO_WIDTH = (sre_parse.AT,)
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+
+
+def _guard_score(guard: Guard) -> int:
+    # An any-of guard is only as selective as its shortest alternative
+    return min(len(g) for g in guard) if guard else 0
+
+
+def _best_guard(items) -> Guard:
+    """Best required literal (or any-of set of literals) for a parsed sequence."""
+    candidates: List[Guard] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            candidates.append(("".join(run),))
+            run.clear()
+
+    for op, av in items:
+        if op == sre_parse.LITERAL:
+            run.append(chr(av))
+        elif op in _ZERO_WIDTH:
+            # \b and anchors consume nothing, literals either side stay adjacent
+            continue
+        elif op == sre_parse.SUBPATTERN:
+            flush()
+            candidates.append(_best_guard(av[-1]))
+        elif op in _REPEATS:
+            flush()
+            min_count, _max_count, item = av
+            if min_count >= 1:
+                candidates.append(_best_guard(item))
+        elif op == sre_parse.BRANCH:
+            flush()
+            alternatives = [_best_guard(branch) for branch in av[1]]
+            if all(alternatives):
+                merged = []
+                for alt in alternatives:
+                    for literal in alt:
+                        if literal not in merged:
+                            merged.append(literal)
+                candidates.append(tuple(merged))
+        else:
+            flush()
+    flush()
+
+    candidates = [c for c in candidates if c]
+    if not candidates:
+        return ()
+    return max(candidates, key=_guard_score)
+
+
+def required_literal(pattern: str, flags: int = 0) -> Guard:
+    """
+    Derive literal substrings at least one of which every match must contain.
+
+    Returns an empty tuple when no useful guard exists (e.g. ``.*`` patterns
+    or character classes only).
+    """
+    parsed = sre_parse.parse(pattern, flags)
+    guard = _best_guard(parsed)
+    if (flags | parsed.state.flags) & re.IGNORECASE:
+        guard = tuple(dict.fromkeys(g.lower() for g in guard))
+    return guard
+
+
+class GuardedPattern:
+    """A compiled regex with its precomputed literal guard."""
+
+    __slots__ = ("pattern", "regex", "engine", "guard")
+
+    def __init__(self, pattern: str, flags: int = 0, guard: Optional[Union[str, Sequence[str]]] = None,
+                 safety: Optional[SafetySettings] = None):
+        self.pattern = pattern
+        self.regex = re.compile(pattern, flags)
+        self.engine = safe_engine(pattern, flags, safety) or self.regex
+        if guard is None:
+            self.guard = required_literal(pattern, flags)
+        elif isinstance(guard, str):
+            self.guard = (guard,)
+        else:
+            self.guard = tuple(guard)
+
+    def could_match(self, text: str) -> bool:
+        """Cheap pre-check: False means the regex cannot match."""
+        guard = self.guard
+        if not guard:
+            return True
+        if len(guard) == 1:
+            return guard[0] in text
+        return any(g in text for g in guard)
+
+    def search(self, text: str) -> Optional[re.Match]:
+        if not self.could_match(text):
+            return None
+        return self.engine.search(text)
+
+    def __repr__(self) -> str:
+        return f"GuardedPattern({self.pattern!r}, guard={self.guard!r})"
+
+
+class RuleTable:
+    """An ordered table of guarded patterns compiled once at import."""
+
+    __slots__ = ("rules",)
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0, guards: Optional[Mapping[str, Guard]] = None,
+                 safety: Optional[SafetySettings] = None):
+        guards = guards or {}
+        self.rules = [GuardedPattern(p, flags, guards.get(p), safety) for p in patterns]
+
+    @property
+    def patterns(self) -> List[str]:
+        return [rule.pattern for rule in self.rules]
+
+    def first(self, text: str) -> Optional[GuardedPattern]:
+        """First rule, in table order, that matches the text."""
+        for rule in self.rules:
+            if rule.could_match(text) and rule.engine.search(text):
+                return rule
+        return None
+
+    def any(self, text: str) -> bool:
+        return self.first(text) is not None
+
+    def search(self, text: str) -> Optional[Tuple[int, re.Match]]:
+        """Table index and match of the first rule, in table order, that matches the text."""
+        for index, rule in enumerate(self.rules):
+            if rule.could_match(text):
+                match = rule.engine.search(text)
+                if match:
+                    return index, match
+        return None
+
+    def matching(self, text: str) -> List[GuardedPattern]:
+        """All rules that match the text, in table order."""
+        return [rule for rule in self.rules if rule.could_match(text) and rule.engine.search(text)]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+
+def _first_chars(items) -> Optional[Set[str]]:
+    """Characters a match of a parsed sequence can start with, or None if unknown."""
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op == sre_parse.LITERAL:
+            return {chr(av)}
+        if op == sre_parse.IN:
+            chars: Set[str] = set()
+            for item_op, item_av in av:
+                if item_op == sre_parse.LITERAL:
+                    chars.add(chr(item_av))
+                elif item_op == sre_parse.RANGE and item_av[1] - item_av[0] < 64:
+                    chars.update(map(chr, range(item_av[0], item_av[1] + 1)))
+                else:
+                    return None
+            return chars
+        if op == sre_parse.SUBPATTERN:
+            return _first_chars(av[-1])
+        if op == sre_parse.BRANCH:
+            chars = set()
+            for branch in av[1]:
+                branch_chars = _first_chars(branch)
+                if branch_chars is None:
+                    return None
+                chars |= branch_chars
+            return chars
+        if op in _REPEATS and av[0] >= 1:
+            return _first_chars(av[2])
+        return None
+    # Pattern can match the empty string
+    return None
+
+
+def first_chars(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    Characters every match of the pattern starts with (both cases under
+    IGNORECASE), or None when they can't be determined.
+    """
+    parsed = sre_parse.parse(pattern, flags)
+    chars = _first_chars(parsed)
+    if chars is not None and (flags | parsed.state.flags) & re.IGNORECASE:
+        chars = {c.lower() for c in chars} | {c.upper() for c in chars}
+    return chars
+
+
+# (required-literal guard, possible first characters) for one pattern
+PatternAnalysis = Tuple[Guard, Optional[FrozenSet[str]]]
+
+
+def analyze_pattern(pattern: str, flags: int = 0) -> PatternAnalysis:
+    """Everything the matchers derive from a pattern's parse tree, in one place for caching."""
+    chars = first_chars(pattern, flags)
+    return required_literal(pattern, flags), (frozenset(chars) if chars is not None else None)
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    return "[" + "".join(re.escape(c) for c in sorted(chars)) + "]"
+
+
+class CombinedMatcher:
+    """
+    Reports every pattern of a family table that matches, from one scan.
+
+    All patterns are compiled into a single alternation with one named group
+    per pattern, and one ``finditer`` pass records which groups matched.
+    Branches are grouped by the characters they can start with behind a
+    lookahead, so the engine tries a handful of branches per position instead
+    of all of them.
+
+    An alternation reports one pattern per match and consumes the matched
+    text, so patterns that only match overlapping an earlier hit
+    (``\\bbachelor'?s?\\b`` inside ``bachelor's degree``) are then confirmed
+    individually, but only if their literal guard occurs in the text. The
+    result is exactly the set a separate ``re.search`` per pattern would report.
+
+    In linear safety mode an RE2 set reports every matching pattern in one
+    pass when RE2 supports all of them; otherwise, and in bounded mode, the
+    ``re`` alternation is built from bounded patterns.
+    """
+
+    __slots__ = ("patterns", "regex", "_rules", "_positions", "_linear_set")
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0,
+                 analysis: Optional[Mapping[str, PatternAnalysis]] = None, safety: Optional[SafetySettings] = None):
+        self.patterns = list(patterns)
+        unique = list(dict.fromkeys(self.patterns))
+        analysis = analysis or {}
+        for pattern in unique:
+            if pattern not in analysis:
+                analysis = dict(analysis)
+                analysis[pattern] = analyze_pattern(pattern, flags)
+        self._rules = [GuardedPattern(p, flags, analysis[p][0], safety) for p in unique]
+        # unique pattern index -> positions in self.patterns
+        self._positions = [[i for i, q in enumerate(self.patterns) if q == p] for p in unique]
+        self._linear_set = linear_set(unique, flags) if safety is not None and safety.linear else None
+        sources = unique
+        if safety is not None and safety.active:
+            sources = [bound_pattern(p, flags, safety.window) for p in unique]
+        self.regex = re.compile(self._build_alternation(sources, [analysis[p][1] for p in unique]), flags)
+
+    @staticmethod
+    def _build_alternation(sources: List[str], starts: List[Optional[FrozenSet[str]]]) -> str:
+        by_start: Dict[FrozenSet[str], List[int]] = {}
+        unknown: List[int] = []
+        for i, chars in enumerate(starts):
+            if chars is None:
+                unknown.append(i)
+            else:
+                by_start.setdefault(frozenset(chars), []).append(i)
+
+        branches = [
+            "(?=" + _char_class(chars) + ")(?:" + "|".join(f"(?P<r{i}>{sources[i]})" for i in indexes) + ")"
+            for chars, indexes in by_start.items()
+        ]
+        if branches and not unknown:
+            # Cheap rejection of positions no pattern can start at
+            return "(?=" + _char_class(set().union(*by_start)) + ")(?:" + "|".join(branches) + ")"
+        branches += [f"(?P<r{i}>{sources[i]})" for i in unknown]
+        return "|".join(branches) or r"(?!)"
+
+    @property
+    def rules(self) -> List[Tuple[GuardedPattern, List[int]]]:
+        """Each distinct pattern's guarded rule with its positions in ``self.patterns``."""
+        return list(zip(self._rules, self._positions))
+
+    def matched(self, text: str) -> List[bool]:
+        """Per-pattern hit flags, aligned with ``self.patterns``."""
+        hits = [False] * len(self.patterns)
+        if self._linear_set is not None:
+            for i in self._linear_set.Match(text) or ():
+                for position in self._positions[i]:
+                    hits[position] = True
+            return hits
+
+        found = set()
+        for m in self.regex.finditer(text):
+            found.add(m.lastgroup)
+
+        for i, rule in enumerate(self._rules):
+            if f"r{i}" in found or (rule.could_match(text) and rule.engine.search(text)):
+                for position in self._positions[i]:
+                    hits[position] = True
+        return hits
+
+    def search(self, text: str) -> bool:
+        """True if any pattern matches: one search that stops at the first hit."""
+        if self._linear_set is not None:
+            return bool(self._linear_set.Match(text))
+        # The alternation matches wherever one of its branches does
+        return self.regex.search(text) is not None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+Dates and Timestamps
+====================
+Date handling shared by run_collect.py and run_summary.py.
+
+ATS feeds state dates as ISO 8601 (Greenhouse ``created_at`` is
+``2024-03-05T14:22:31-05:00``), which ``datetime.fromisoformat`` reads
+directly. dateutil's parser handles everything else, but it is much slower,
+so it only sees strings that aren't ISO. Parsed values are memoized, since
+the same strings recur across postings and every record of a run shares its
+``collectedAt``.
+
+``utc_timestamp`` formats a time the way the job files store it. collect()
+takes one at the start of a run and stamps every record with it.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from dateutil import parser as dtparser
+
+# Distinct strings remembered by each parser
+MEMO_SIZE = 4096
+
+
+def utc_timestamp(moment: Optional[datetime] = None) -> str:
+    """``2024-03-05T19:22:31Z``: the time (now by default) in UTC, to the second."""
+    moment = (moment or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    return moment.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+
+
+def _looks_iso(val: str) -> bool:
+    return len(val) >= 10 and val[4] == "-" and val[7] == "-"
+
+
+def _parse(val: str) -> datetime:
+    if _looks_iso(val):
+        try:
+            return datetime.fromisoformat(val)
+        except ValueError:  # "Z" before Python 3.11, or not ISO after all
+            pass
+    return dtparser.parse(val)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse_date(val: str) -> Optional[str]:
+    try:
+        return _parse(val).date().isoformat()
+    except Exception:
+        return None
+
+
+def parse_date(val: Any) -> Optional[str]:
+    """
+    The calendar date (``YYYY-MM-DD``) a date or timestamp string states, in
+    its own time zone, or None if it can't be read.
+    """
+    if not val or not isinstance(val, str):
+        return None
+    return _parse_date(val)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse_timestamp(val: str) -> Optional[datetime]:
+    try:
+        moment = _parse(val)
+    except Exception:
+        return None
+    # Stored timestamps are UTC; a naive one would not compare with the rest
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def parse_timestamp(val: Any) -> Optional[datetime]:
+    """A timezone-aware datetime for a timestamp string (UTC if it names no zone), or None."""
+    if not val or not isinstance(val, str):
+        return None
+    return _parse_timestamp(val)
@@ -4,285 +4,99 @@
 import re
 from typing import Dict, List, Tuple
 
-# === EXCLUSION PATTERNS (High School / Associates Degree) ===
-# These patterns indicate jobs we want to EXCLUDE (too low education level)
-
-HIGH_SCHOOL_PATTERNS = [
-    # Direct high school references
-    r"high school diploma",
-    r"high school graduate", 
-    r"high school graduation",
-    r"high school degree",
-    r"hs diploma",
-    r"h\.s\. diploma",
-    
-    # GED references
-    r"ged",
-    r"general education development",
-    r"general educational development",
-    
-    # Associates degree variations
-    r"associate'?s? degree",
-    r"associates degree", 
-    r"associate degree",
-    r"aa degree",
-    r"as degree", 
-    r"aas degree",
-    r"a\.a\. degree",
-    r"a\.s\. degree",
-    r"a\.a\.s\. degree",
-    
-    # Two-year college references
-    r"two.year degree",
-    r"2.year degree",
-    r"two.year college",
-    r"2.year college",
-    r"community college degree",
-    
-    # Certificate programs (when no bachelor's mentioned)
-    r"certificate program",
-    r"certification program", 
-    r"diploma program",
-    r"technical certificate",
-    r"vocational certificate",
-    
-    # Experience in lieu of degree (red flags)
-    r"experience in lieu of degree",
-    r"experience may substitute",
-    r"equivalent experience",
-    r"or equivalent experience",
-    
-    # No degree required indicators
-    r"no degree required",
-    r"education not required",
-    r"degree preferred but not required"
-]
-
-# === INCLUSION PATTERNS (Bachelor's Degree) ===
-# These patterns indicate jobs we want to INCLUDE (bachelor's level)
-
-BACHELORS_PATTERNS = [
-    # Standard bachelor's degree terms
-    r"bachelor'?s? degree",
-    r"bachelors degree",
-    r"bachelor degree",
-    r"baccalaureate degree",
-    r"undergraduate degree",
-
-    # Just "bachelor's" or "bachelor" alone
-    r"\bbachelor'?s?\b",
-
-    # Common bachelor's abbreviations
-    r"b\.a\.",
-    r"b\.s\.",
-    r"ba degree",
-    r"bs degree",
-    r"ba/bs",
-    r"bs/ba",
-
-    # Four-year degree references
-    r"four.year degree",
-    r"4.year degree",
-    r"four.year college",
-    r"4.year college",
-    r"four.year university",
-    r"4.year university",
-
-    # University/college degree (when clearly bachelor's level)
-    r"university degree",
-    r"college degree",
-
-    # Professional bachelor's degrees
-    r"bba",  # Bachelor of Business Administration
-    r"bsn",  # Bachelor of Science in Nursing
-    r"bha",  # Bachelor of Healthcare Administration
-    r"bhsa", # Bachelor of Health Services Administration
-
-    # Business/Management with Healthcare context
-    r"business administration.{0,50}healthcare",
-    r"healthcare.{0,50}business administration",
-    r"management.{0,50}healthcare",
-    r"healthcare.{0,50}management",
-
-    # Long-term care specific
-    r"long.term care administration",
-    r"nursing home administration",
-    r"assisted living administration",
-    r"skilled nursing administration"
-]
-
-# === HEALTHCARE ADMINISTRATION SPECIFIC PATTERNS ===
-# These are high-priority matches for healthcare admin bachelor's degrees
-
-HEALTHCARE_ADMIN_BACHELORS = [
-    # Healthcare Administration variations
-    r"healthcare administration",
-    r"health care administration", 
-    r"health administration",
-    r"hospital administration",
-    r"medical administration",
-    
-    # Health Services/Management
-    r"health services administration",
-    r"health service administration",
-    r"healthcare management", 
-    r"health care management",
-    r"health management",
-    r"hospital management",
-    r"medical management",
-    
-    # Health Information Management
-    r"health information management",
-    r"healthcare information management",
-    r"health information administration",
-    r"him",  # Common abbreviation
-    
-    # Public Health Administration  
-    r"public health administration",
-    r"public health",
-    r"mph",  # Master of Public Health (higher than bachelor's but relevant)
-    r"mha",  # Master of Healthcare Administration (higher than bachelor's)
-    
-    # Business/Management with Healthcare context
-    r"business administration.{0,50}healthcare",
-    r"healthcare.{0,50}business administration",
-    r"management.{0,50}healthcare",
-    r"healthcare.{0,50}management",
-    
-    # Long-term care specific
-    r"long.term care administration",
-    r"nursing home administration", 
-    r"assisted living administration",
-    r"skilled nursing administration"
-]
-
-# === ADVANCED DEGREE PATTERNS (Also Include) ===
-# These indicate higher education than bachelor's - should definitely include
-
-ADVANCED_DEGREE_PATTERNS = [
-    # Master's degrees
-    r"master'?s? degree",
-    r"masters degree",
-    r"graduate degree", 
-    r"m\.a\.",
-    r"m\.s\.",
-    r"mba",
-    r"mha",  # Master of Healthcare Administration
-    r"mph",  # Master of Public Health 
-    r"mhsa", # Master of Health Services Administration
-    
-    # Doctoral degrees
-    r"doctorate",
-    r"doctoral degree",
-    r"ph\.?d\.?",
-    r"dha",  # Doctor of Healthcare Administration
-    
-    # Professional degrees
-    r"jd",   # Juris Doctor
-    r"md",   # Medical Doctor (though we're filtering admin roles)
-    r"pharmd" # Doctor of Pharmacy
-]
-
-# === HIGH EXPERIENCE REQUIREMENTS (Exclude) ===
-# These indicate positions requiring too much experience for entry-level candidates
-# We want entry-level positions with 0-2 years experience only
-
-HIGH_EXPERIENCE_PATTERNS = [
-    # 3+ years and higher experience requirements
-    r"3\+? years? experience",
-    r"4\+? years? experience",
-    r"5\+? years? experience",
-    r"6\+? years? experience", 
-    r"7\+? years? experience",
-    r"8\+? years? experience",
-    r"9\+? years? experience",
-    r"10\+? years? experience",
-    r"15\+? years? experience", 
-    r"20\+? years? experience",
-    
-    # Same patterns with "of experience"
-    r"3\+? years? of experience",
-    r"4\+? years? of experience",
-    r"5\+? years? of experience",
-    r"6\+? years? of experience",
-    r"7\+? years? of experience",
-    r"8\+? years? of experience",
-    r"9\+? years? of experience", 
-    r"10\+? years? of experience",
-    r"15\+? years? of experience",
-    r"20\+? years? of experience",
-    
-    # Range patterns that exclude entry-level
-    r"1-3 years? experience",
-    r"1-4 years? experience", 
-    r"1-5 years? experience",
-    r"2-3 years? experience",
-    r"2-4 years? experience",
-    r"2-5 years? experience",
-    r"3-5 years? experience",
-    r"4-6 years? experience", 
-    r"5-7 years? experience",
-    r"1 to 3 years? experience",
-    r"1 to 4 years? experience",
-    r"1 to 5 years? experience", 
-    r"2 to 3 years? experience",
-    r"2 to 4 years? experience",
-    r"2 to 5 years? experience",
-    r"3 to 5 years? experience",
-    r"4 to 6 years? experience",
-    r"5 to 7 years? experience",
-    
-    # Minimum experience patterns (2+ years and higher)
-    r"minimum.{0,10}2.{0,5}years?",
-    r"minimum.{0,10}3.{0,5}years?",
-    r"minimum.{0,10}4.{0,5}years?", 
-    r"minimum.{0,10}5.{0,5}years?",
-    
-    # General high experience terms
-    r"several years? experience",
-    r"multiple years? experience", 
-    r"many years? experience",
-    r"extensive experience",
-    r"significant experience",
-    r"substantial experience",
-    r"decade of experience",
-    r"decades of experience"
-]
-
-# === BACHELOR'S PREFERRED PATTERNS ===
-# These are positive indicators where bachelor's degree is preferred but not required
-
-BACHELORS_PREFERRED_PATTERNS = [
-    r"bachelor.{0,20}preferred",
-    r"preferred.{0,20}bachelor",
-    r"bachelor.{0,20}desired",
-    r"desired.{0,20}bachelor",
-    r"bachelor.{0,20}a plus",
-    r"bachelor.{0,20}plus"
-]
-
-# === CONTEXT EXCLUSIONS ===
-# Currently empty - we include ANY mention of bachelor's degree
-# Previous exclusions for entry-level removed to be more inclusive
-
-CONTEXT_EXCLUSIONS = [
-    # No exclusions - include any bachelor's mention regardless of context
-]
-
-# === SCORING WEIGHTS ===
-# For nuanced decision making when multiple patterns match
-
-PATTERN_WEIGHTS = {
-    'healthcare_admin_bachelors': 10,  # Highest priority
-    'advanced_degree': -100,          # Strict exclude - overqualified positions
-    'high_experience': -100,          # Strict exclude - overqualified positions
-    'bachelors_required': 6,          # Strong inclusion
-    'bachelors_mentioned': 4,         # Moderate inclusion
-    'bachelors_preferred': 5,         # Strong inclusion for preferred positions  
-    'high_school_only': -10,          # Strong exclusion when no bachelor's mentioned
-    'associates_only': -8,            # Strong exclusion when no bachelor's mentioned
-    'no_degree_required': -6          # Strong exclusion
-}
+from rule_bundle import RuleBundle, load_rules, on_reload
+
+# Pattern tables are defined in rules/education_filters.json and bound to
+# these names by _bind_rules.
+#
+# HIGH_SCHOOL_PATTERNS          exclusion: high school / associates degree
+# BACHELORS_PATTERNS            inclusion: bachelor's degree
+# HEALTHCARE_ADMIN_BACHELORS    healthcare administration specific degrees
+# ADVANCED_DEGREE_PATTERNS      above bachelor's, overqualified (strict exclude)
+# HIGH_EXPERIENCE_PATTERNS      too much experience for entry level (strict exclude)
+# BACHELORS_PREFERRED_PATTERNS  bachelor's preferred but not required
+# CONTEXT_EXCLUSIONS            currently empty - include any bachelor's mention
+# PATTERN_WEIGHTS               scoring weights when multiple patterns match
+
+# === COMPILED MATCHER ===
+# Every family is scanned with one combined regex instead of a re.search
+# per pattern. Each entry records the matches key the pattern reports
+# under, classified once at load rather than per posting.
+#
+# The numeric experience patterns (3\+? years? experience and the like) are
+# a fifth of the combined regex's work, so the experience family is
+# HIGH_EXPERIENCE_RULES instead, a YearsRule that reads the numbers from one
+# scan (see experience_years). family_hits gives the
+# same hits as FAMILY_MATCHER.
+#
+# meets_bachelors_requirement only needs the verdict, which the decisive
+# families settle: one hit in ADVANCED_DEGREE_MATCHER or
+# HIGH_EXPERIENCE_RULES excludes, then one BACHELORS_MATCHER hit includes.
+# Each stops at its first hit.
+
+
+def _classify_family_patterns() -> List[Tuple[str, str]]:
+    """(matches key, pattern) for every scanned pattern, in reporting order."""
+    entries = []
+    entries += [('healthcare_admin_bachelors', p) for p in HEALTHCARE_ADMIN_BACHELORS]
+    entries += [('advanced_degree', p) for p in ADVANCED_DEGREE_PATTERNS]
+    entries += [('high_experience', p) for p in HIGH_EXPERIENCE_PATTERNS]
+    for pattern in BACHELORS_PATTERNS:
+        if any(req_word in pattern for req_word in ['required', 'degree required']):
+            entries.append(('bachelors_required', pattern))
+        else:
+            entries.append(('bachelors_mentioned', pattern))
+    entries += [('bachelors_preferred', p) for p in BACHELORS_PREFERRED_PATTERNS]
+    for pattern in HIGH_SCHOOL_PATTERNS:
+        # "required" patterns are handled by the primary requirement checks
+        if re.search(r'required', pattern, re.IGNORECASE):
+            continue
+        if any(exclusion in pattern for exclusion in ['no degree', 'not required', 'preferred but']):
+            entries.append(('no_degree_required', pattern))
+        else:
+            entries.append(('high_school_only', pattern))
+    entries += [('context_exclusion', p) for p in CONTEXT_EXCLUSIONS]
+    return entries
+
+
+def _bind_rules(rules: RuleBundle) -> None:
+    """Bind the module's tables from a rule bundle (at import and on reload)."""
+    global HIGH_SCHOOL_PATTERNS, BACHELORS_PATTERNS, HEALTHCARE_ADMIN_BACHELORS, ADVANCED_DEGREE_PATTERNS
+    global HIGH_EXPERIENCE_PATTERNS, BACHELORS_PREFERRED_PATTERNS, CONTEXT_EXCLUSIONS, PATTERN_WEIGHTS
+    global HIGH_SCHOOL_PRIMARY_RULE, ASSOCIATES_PRIMARY_RULE, FAMILY_PATTERNS, FAMILY_MATCHER
+    global ADVANCED_DEGREE_MATCHER, BACHELORS_MATCHER
+    global HIGH_EXPERIENCE_RULES, OTHER_FAMILIES_MATCHER, _EXPERIENCE_POSITIONS, _OTHER_POSITIONS
+
+    HIGH_SCHOOL_PATTERNS = rules.patterns('HIGH_SCHOOL_PATTERNS')
+    BACHELORS_PATTERNS = rules.patterns('BACHELORS_PATTERNS')
+    HEALTHCARE_ADMIN_BACHELORS = rules.patterns('HEALTHCARE_ADMIN_BACHELORS')
+    ADVANCED_DEGREE_PATTERNS = rules.patterns('ADVANCED_DEGREE_PATTERNS')
+    HIGH_EXPERIENCE_PATTERNS = rules.patterns('HIGH_EXPERIENCE_PATTERNS')
+    BACHELORS_PREFERRED_PATTERNS = rules.patterns('BACHELORS_PREFERRED_PATTERNS')
+    CONTEXT_EXCLUSIONS = rules.patterns('CONTEXT_EXCLUSIONS')
+    PATTERN_WEIGHTS = rules.value('PATTERN_WEIGHTS')
+
+    HIGH_SCHOOL_PRIMARY_RULE = rules.pattern('HIGH_SCHOOL_PRIMARY')
+    ASSOCIATES_PRIMARY_RULE = rules.pattern('ASSOCIATES_PRIMARY')
+
+    FAMILY_PATTERNS = _classify_family_patterns()
+    FAMILY_MATCHER = rules.combined([pattern for _, pattern in FAMILY_PATTERNS], re.IGNORECASE)
+
+    def family(*keys: str):
+        return rules.combined([pattern for key, pattern in FAMILY_PATTERNS if key in keys], re.IGNORECASE)
+
+    ADVANCED_DEGREE_MATCHER = family('advanced_degree')
+    BACHELORS_MATCHER = family('healthcare_admin_bachelors', 'bachelors_required', 'bachelors_mentioned',
+                               'bachelors_preferred')
+
+    HIGH_EXPERIENCE_RULES = rules.years('HIGH_EXPERIENCE_PATTERNS')
+    _EXPERIENCE_POSITIONS = [i for i, (key, _) in enumerate(FAMILY_PATTERNS) if key == 'high_experience']
+    _OTHER_POSITIONS = [i for i, (key, _) in enumerate(FAMILY_PATTERNS) if key != 'high_experience']
+    OTHER_FAMILIES_MATCHER = rules.combined([FAMILY_PATTERNS[i][1] for i in _OTHER_POSITIONS], re.IGNORECASE)
+
+
+_bind_rules(load_rules('education_filters'))
+on_reload('education_filters', _bind_rules)
 
 
 def analyze_education_requirements(job_description: str, qualifications: str = "") -> Dict:
@@ -304,7 +118,48 @@ def analyze_education_requirements(job_description: str, qualifications: str = "
     """
     # Combine all text for analysis
     full_text = f"{job_description} {qualifications}".lower()
-    
+
+    # STRICT CHECK: If high school is mentioned as primary requirement, exclude immediately
+    if HIGH_SCHOOL_PRIMARY_RULE.search(full_text):
+        return primary_requirement_analysis('high_school_only')
+
+    # STRICT CHECK: If associates degree is listed as primary requirement, exclude
+    if ASSOCIATES_PRIMARY_RULE.search(full_text):
+        return primary_requirement_analysis('associates_only')
+
+    # Scan every pattern family; entries are already in reporting order
+    return analysis_from_family_hits(family_hits(full_text))
+
+
+def family_hits(full_text: str) -> List[bool]:
+    """FAMILY_MATCHER.matched(full_text), with the experience family read numerically."""
+    hits = [False] * len(FAMILY_PATTERNS)
+    for position, hit in zip(_OTHER_POSITIONS, OTHER_FAMILIES_MATCHER.matched(full_text)):
+        hits[position] = hit
+    for position, hit in zip(_EXPERIENCE_POSITIONS, HIGH_EXPERIENCE_RULES.matched(full_text)):
+        hits[position] = hit
+    return hits
+
+
+def primary_requirement_analysis(key: str) -> Dict:
+    """Analysis for a posting whose primary requirement is high school or associates."""
+    if key == 'high_school_only':
+        return {
+            'score': -100,
+            'should_include': False,
+            'matches': {'high_school_only': ['high_school_primary_requirement']},
+            'reasoning': "High school diploma listed as primary requirement"
+        }
+    return {
+        'score': -100,
+        'should_include': False,
+        'matches': {'associates_only': ['associates_primary_requirement']},
+        'reasoning': "Associates degree listed as primary requirement"
+    }
+
+
+def analysis_from_family_hits(hits: List[bool]) -> Dict:
+    """Score and explain per-pattern hits, aligned with FAMILY_PATTERNS."""
     matches = {
         'healthcare_admin_bachelors': [],
         'advanced_degree': [],
@@ -317,79 +172,12 @@ def analyze_education_requirements(job_description: str, qualifications: str = "
         'context_exclusion': [],
         'no_degree_required': []
     }
-    
-    score = 0
 
-    # STRICT CHECK: If high school is mentioned as primary requirement, exclude immediately
-    high_school_primary = re.search(r'high school.*required|high school diploma.*required|hs.*required|ged.*required', full_text, re.IGNORECASE)
-    if high_school_primary:
-        return {
-            'score': -100,
-            'should_include': False,
-            'matches': {'high_school_only': ['high_school_primary_requirement']},
-            'reasoning': "High school diploma listed as primary requirement"
-        }
-
-    # STRICT CHECK: If associates degree is listed as primary requirement, exclude
-    associates_primary = re.search(r'associate.?s? degree.*required|aa.*required|as.*required|aas.*required', full_text, re.IGNORECASE)
-    if associates_primary:
-        return {
-            'score': -100,
-            'should_include': False,
-            'matches': {'associates_only': ['associates_primary_requirement']},
-            'reasoning': "Associates degree listed as primary requirement"
-        }
-    
-    # Check healthcare administration specific patterns (highest priority)
-    for pattern in HEALTHCARE_ADMIN_BACHELORS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            matches['healthcare_admin_bachelors'].append(pattern)
-            score += PATTERN_WEIGHTS['healthcare_admin_bachelors']
-    
-    # Check advanced degrees
-    for pattern in ADVANCED_DEGREE_PATTERNS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            matches['advanced_degree'].append(pattern)
-            score += PATTERN_WEIGHTS['advanced_degree']
-    
-    # Check high experience requirements (overqualified positions)
-    for pattern in HIGH_EXPERIENCE_PATTERNS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            matches['high_experience'].append(pattern)
-            score += PATTERN_WEIGHTS['high_experience']
-    
-    # Check bachelor's degree patterns
-    for pattern in BACHELORS_PATTERNS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            if any(req_word in pattern for req_word in ['required', 'degree required']):
-                matches['bachelors_required'].append(pattern)
-                score += PATTERN_WEIGHTS['bachelors_required']
-            else:
-                matches['bachelors_mentioned'].append(pattern)
-                score += PATTERN_WEIGHTS['bachelors_mentioned']
-    
-    # Check bachelor's preferred patterns (should be included)
-    for pattern in BACHELORS_PREFERRED_PATTERNS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            matches['bachelors_preferred'].append(pattern)
-            score += PATTERN_WEIGHTS['bachelors_preferred']
-    
-    # Check exclusion patterns (but not primary requirements - already handled above)
-    for pattern in HIGH_SCHOOL_PATTERNS:
-        if not re.search(r'required', pattern, re.IGNORECASE):  # Skip "required" patterns (handled above)
-            if re.search(pattern, full_text, re.IGNORECASE):
-                if any(exclusion in pattern for exclusion in ['no degree', 'not required', 'preferred but']):
-                    matches['no_degree_required'].append(pattern)
-                    score += PATTERN_WEIGHTS['no_degree_required']
-                else:
-                    matches['high_school_only'].append(pattern)
-                    score += PATTERN_WEIGHTS['high_school_only']
-    
-    # Check context exclusions
-    for pattern in CONTEXT_EXCLUSIONS:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            matches['context_exclusion'].append(pattern)
-            score += PATTERN_WEIGHTS['context_exclusion']
+    score = 0
+    for (key, pattern), hit in zip(FAMILY_PATTERNS, hits):
+        if hit:
+            matches[key].append(pattern)
+            score += PATTERN_WEIGHTS[key]
     
     # FINAL INCLUSION LOGIC: Simple prioritized rules
     # 1. If advanced degree required -> EXCLUDE (overqualified)
@@ -462,13 +250,29 @@ def analyze_education_requirements(job_description: str, qualifications: str = "
 def meets_bachelors_requirement(job_description: str, qualifications: str = "") -> bool:
     """
     Simple boolean check if job meets bachelor's degree requirement.
-    
+
+    Same verdict as ``analyze_education_requirements(...)['should_include']``,
+    decided by the first decisive hit without building the matches and
+    reasoning; use the analysis to see why.
+
     Args:
         job_description: The full job description text
         qualifications: Extracted qualifications text (may be empty)
-        
+
     Returns:
         True if job should be included (meets bachelor's requirement)
     """
-    analysis = analyze_education_requirements(job_description, qualifications)
-    return analysis['should_include']
\ No newline at end of file
+    full_text = f"{job_description} {qualifications}".lower()
+
+    # Primary high school / associates requirement, as in the analysis
+    if HIGH_SCHOOL_PRIMARY_RULE.search(full_text) or ASSOCIATES_PRIMARY_RULE.search(full_text):
+        return False
+
+    # Overqualified: any advanced degree or high experience hit
+    if ADVANCED_DEGREE_MATCHER.search(full_text):
+        return False
+    if HIGH_EXPERIENCE_RULES.any(full_text):
+        return False
+
+    # Bachelor's mentioned in any context
+    return BACHELORS_MATCHER.search(full_text)
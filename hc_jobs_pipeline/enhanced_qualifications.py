@@ -4,17 +4,97 @@
 Enhanced Qualifications Extraction for Healthcare Admin Jobs
 ============================================================
 Comprehensive extraction of qualification information from job descriptions.
+
+``extract_many`` runs the extractor over a batch of descriptions (archived
+corpora, HTML- or Word-sourced jobs) across a process pool.
 """
 
+import os
 import re
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Dict, NamedTuple, Tuple, Optional
+
+from keyword_automaton import keyword_automaton
+from section_segmenter import HeadingIndex
+
+# What follows a qualification heading: the section content, up to the next heading-like line
+SECTION_BODY = r"\s*:?\s*\n(.{0,2000}?)(?=\n\s*[A-Z][A-Za-z \-/]{10,50}\s*:?\s*\n|\n\s*$|$)"
+
+# Line openings that are obviously not qualifications (about the company, pay, how to apply, hours)
+SKIP_LINE = re.compile(
+    r"\s*(?:about|our|we|the company|the role|this position|you will|responsibilities"
+    r"|benefits|salary|compensation|location"
+    r"|apply|contact|send|email"
+    r"|http[s]?://"
+    r"|equal opportunity"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday)")
+
+# Line categories. The first four are what makes a line a qualification; the
+# FORMAT_ ones are the (different) keyword groups that order the output.
+EDUCATION = 1
+EXPERIENCE = 2
+SKILLS = 4
+HEALTHCARE = 8
+QUALIFICATION = EDUCATION | EXPERIENCE | SKILLS | HEALTHCARE
+FORMAT_EDUCATION = 16
+FORMAT_EXPERIENCE = 32
+FORMAT_SKILLS = 64
+
+# Descriptions sent to a worker process per task in extract_many: enough
+# work (tens of milliseconds) to amortize pickling and dispatch
+DEFAULT_CHUNK_SIZE = 500
+
+
+class ExtractedQualifications(NamedTuple):
+    """Qualifications grouped the way they are formatted, plus the formatted string."""
+    education: List[str]
+    experience: List[str]
+    skills: List[str]
+    other: List[str]
+    formatted: str
+
+    @classmethod
+    def none(cls) -> "ExtractedQualifications":
+        return cls([], [], [], [], "N/A")
+
+
+class LineClassifier:
+    """
+    Assigns every category a line has keywords for in one automaton scan.
+    Each keyword maps to the bitmask of the categories listing it.
+    """
+
+    def __init__(self, categories: Tuple[Tuple[int, Tuple[str, ...]], ...]):
+        self._masks: Dict[str, int] = {}
+        for bit, keywords in categories:
+            for keyword in keywords:
+                self._masks[keyword] = self._masks.get(keyword, 0) | bit
+        self._all = 0
+        for bit, _ in categories:
+            self._all |= bit
+        self._automaton = keyword_automaton(self._masks)
+
+    def classify(self, text_lower: str) -> int:
+        """Bitmask of the categories with a keyword in the (lowercased) text."""
+        mask = 0
+        masks = self._masks
+        for _, keyword in self._automaton.iter_hits(text_lower):
+            mask |= masks[keyword]
+            if mask == self._all:
+                break
+        return mask
+
 
 class QualificationsExtractor:
     """
     Enhanced qualifications extractor that captures comprehensive qualification information
     from job descriptions, including education, experience, skills, and certifications.
     """
-    
+
+    # Compiled heading indexes and line classifiers, shared by all extractors with the same lists
+    _heading_indexes: Dict[Tuple[str, ...], HeadingIndex] = {}
+    _line_classifiers: Dict[tuple, LineClassifier] = {}
+
     def __init__(self):
         # Qualification section headings (ordered by priority)
         self.QUAL_SECTIONS = [
@@ -71,53 +151,140 @@ class QualificationsExtractor:
             "hipaa", "healthcare", "medical", "clinical", "hospital", "patient",
             "epic", "cerner", "emr", "ehr", "icd", "cpt", "billing", "coding"
         ]
+
+        # High-priority qualification indicators for sentence extraction
+        self.QUALIFICATION_INDICATORS = [
+            'required', 'must have', 'minimum', 'preferred', 'desired',
+            'bachelor', 'degree', 'experience', 'years', 'certification',
+            'license', 'skills', 'knowledge', 'ability to', 'proficient',
+            'familiar with', 'understanding of'
+        ]
+
+        # Keyword groups that order the formatted output (education first)
+        self.FORMAT_EDUCATION_KEYWORDS = [
+            'bachelor', 'degree', 'master', 'associate', 'certification', 'certificate', 'license', 'diploma', 'education'
+        ]
+        self.FORMAT_EXPERIENCE_KEYWORDS = ['experience', 'years', 'background', 'history', 'previous', 'prior']
+        self.FORMAT_SKILLS_KEYWORDS = ['skills', 'ability', 'knowledge', 'proficient', 'familiar', 'understanding']
+
+        self._compile()
+
+    def _compile(self) -> None:
+        # One-pass keyword matchers, shared between extractor instances
+        self._qualification_indicators = keyword_automaton(self.QUALIFICATION_INDICATORS)
+        self._classifier = self._line_classifier((
+            (EDUCATION, tuple(self.EDUCATION_KEYWORDS)),
+            (EXPERIENCE, tuple(self.EXPERIENCE_KEYWORDS)),
+            (SKILLS, tuple(self.SKILLS_KEYWORDS)),
+            (HEALTHCARE, tuple(self.HEALTHCARE_KEYWORDS)),
+            (FORMAT_EDUCATION, tuple(self.FORMAT_EDUCATION_KEYWORDS)),
+            (FORMAT_EXPERIENCE, tuple(self.FORMAT_EXPERIENCE_KEYWORDS)),
+            (FORMAT_SKILLS, tuple(self.FORMAT_SKILLS_KEYWORDS)),
+        ))
+
+    def __getstate__(self) -> dict:
+        # Worker processes get the keyword lists and rebuild the matchers from them
+        state = self.__dict__.copy()
+        del state["_qualification_indicators"], state["_classifier"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._compile()
     
-    def extract_comprehensive_qualifications(self, job_description: str) -> str:
+    def extract_comprehensive_qualifications(self, job_description: str, sections=None) -> str:
         """
         Extract comprehensive qualifications from job description.
         
+        Args:
+            job_description: The full job description text
+            sections: Optional PostingSections for the same text (see section_segmenter);
+                      lets the heading scan be skipped when no qualification heading exists
+        
         Returns formatted qualifications string with education first, then other requirements.
         """
+        return self.extract_structured(job_description, sections).formatted
+
+    def extract_structured(self, job_description: str, sections=None) -> ExtractedQualifications:
+        """
+        Same extraction as extract_comprehensive_qualifications, returning the
+        education/experience/skills/other groups as well as the formatted string.
+        """
         if not job_description:
-            return "N/A"
+            return ExtractedQualifications.none()
         
         # First try structured section extraction
-        structured_quals = self._extract_from_sections(job_description)
+        structured_quals = self._extract_from_sections(job_description, sections)
         if structured_quals:
-            return self._format_qualifications(structured_quals)
+            return self._group_qualifications(structured_quals)
         
         # Fallback to pattern-based extraction
         pattern_quals = self._extract_from_patterns(job_description)
         if pattern_quals:
-            return self._format_qualifications(pattern_quals)
+            return self._group_qualifications(pattern_quals)
         
         # Last resort: extract key qualification sentences
         sentence_quals = self._extract_qualification_sentences(job_description)
         if sentence_quals:
-            return self._format_qualifications(sentence_quals)
+            return self._group_qualifications(sentence_quals)
         
-        return "N/A"
+        return ExtractedQualifications.none()
+
+    def extract_many(self, job_descriptions: Iterable[str], workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[ExtractedQualifications]:
+        """
+        extract_structured for every description, in input order.
+
+        Descriptions are sent to a pool of ``workers`` processes (default: one
+        per CPU) ``chunk_size`` at a time; each worker keeps one copy of this
+        extractor. A batch of one chunk or less, or ``workers=1``, runs in
+        this process, where a pool would cost more than it saves.
+        """
+        descriptions = list(job_descriptions)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(descriptions) <= chunk_size:
+            return [self.extract_structured(d) for d in descriptions]
+
+        chunks = [descriptions[i:i + chunk_size] for i in range(0, len(descriptions), chunk_size)]
+        results: List[ExtractedQualifications] = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(self,)) as pool:
+            for chunk_results in pool.map(_extract_chunk, chunks):
+                results.extend(chunk_results)
+        return results
     
-    def _extract_from_sections(self, text: str) -> List[str]:
+    def _extract_from_sections(self, text: str, sections=None) -> List[str]:
         """Extract qualifications from structured sections with headings."""
         qualifications = []
+        if sections is not None and not sections.has_heading(self.QUAL_SECTIONS):
+            return qualifications
         lines = text.splitlines()
         joined_text = "\n".join(lines)
-        
-        for heading in self.QUAL_SECTIONS:
-            # Look for heading followed by content
-            pattern = rf"(^|\n)\s*{re.escape(heading)}\s*:?\s*\n(.{{0,2000}}?)(?=\n\s*[A-Z][A-Za-z \-/]{{10,50}}\s*:?\s*\n|\n\s*$|$)"
-            match = re.search(pattern, joined_text, re.IGNORECASE | re.MULTILINE)
-            
-            if match:
-                content = match.group(2).strip()
-                if content:
-                    # Clean up and extract meaningful qualifications
-                    cleaned_quals = self._parse_qualification_content(content)
-                    qualifications.extend(cleaned_quals)
-                    break  # Use first matching section
+
+        # Each heading's first match, in priority order
+        for _, match in self._heading_index(tuple(self.QUAL_SECTIONS)).matches(joined_text):
+            content = match.group(2).strip()
+            if content:
+                # Clean up and extract meaningful qualifications
+                cleaned_quals = self._parse_qualification_content(content)
+                qualifications.extend(cleaned_quals)
+                break  # Use first matching section
         
         return qualifications
+
+    @classmethod
+    def _heading_index(cls, headings: Tuple[str, ...]) -> HeadingIndex:
+        index = cls._heading_indexes.get(headings)
+        if index is None:
+            index = cls._heading_indexes[headings] = HeadingIndex(headings, SECTION_BODY, re.IGNORECASE | re.MULTILINE)
+        return index
+
+    @classmethod
+    def _line_classifier(cls, categories: tuple) -> LineClassifier:
+        classifier = cls._line_classifiers.get(categories)
+        if classifier is None:
+            classifier = cls._line_classifiers[categories] = LineClassifier(categories)
+        return classifier
     
     def _extract_from_patterns(self, text: str) -> List[str]:
         """Extract qualifications using pattern matching for bullet points and requirements."""
@@ -190,45 +357,29 @@ class QualificationsExtractor:
     
     def _is_qualification_line(self, line: str) -> bool:
         """Determine if a line contains qualification information."""
+        if len(line) <= 10:
+            return False
         line_lower = line.lower()
-        
-        # Must contain at least one qualification-related keyword
-        has_qualification_keyword = any(keyword in line_lower for keyword in 
-                                      self.EDUCATION_KEYWORDS + self.EXPERIENCE_KEYWORDS + 
-                                      self.SKILLS_KEYWORDS + self.HEALTHCARE_KEYWORDS)
-        
-        # Skip lines that are obviously not qualifications
-        skip_patterns = [
-            r'^\s*(about|our|we|the company|the role|this position|you will|responsibilities)',
-            r'^\s*(benefits|salary|compensation|location)',
-            r'^\s*(apply|contact|send|email)',
-            r'^\s*http[s]?://',
-            r'^\s*equal opportunity',
-            r'^\s*(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-        ]
-        
-        should_skip = any(re.match(pattern, line_lower) for pattern in skip_patterns)
-        
-        return has_qualification_keyword and not should_skip and len(line) > 10
+
+        # Skip lines that are obviously not qualifications; the rest need a qualification keyword
+        if SKIP_LINE.match(line_lower):
+            return False
+        return bool(self._classifier.classify(line_lower) & QUALIFICATION)
     
     def _contains_qualification_keywords(self, text: str) -> bool:
         """Check if text contains qualification-related keywords."""
         text_lower = text.lower()
         
-        # High-priority qualification indicators
-        qualification_indicators = [
-            'required', 'must have', 'minimum', 'preferred', 'desired',
-            'bachelor', 'degree', 'experience', 'years', 'certification',
-            'license', 'skills', 'knowledge', 'ability to', 'proficient',
-            'familiar with', 'understanding of'
-        ]
-        
-        return any(indicator in text_lower for indicator in qualification_indicators)
+        return self._qualification_indicators.contains_any(text_lower)
     
     def _format_qualifications(self, qualifications: List[str]) -> str:
         """Format qualifications list into a readable string with education first."""
+        return self._group_qualifications(qualifications).formatted
+
+    def _group_qualifications(self, qualifications: List[str]) -> ExtractedQualifications:
+        """Group qualifications by category and format them, education first."""
         if not qualifications:
-            return "N/A"
+            return ExtractedQualifications.none()
         
         # Separate education/certification from other qualifications
         education_quals = []
@@ -237,13 +388,13 @@ class QualificationsExtractor:
         other_quals = []
         
         for qual in qualifications:
-            qual_lower = qual.lower()
+            category = self._classifier.classify(qual.lower())
             
-            if any(keyword in qual_lower for keyword in ['bachelor', 'degree', 'master', 'associate', 'certification', 'certificate', 'license', 'diploma', 'education']):
+            if category & FORMAT_EDUCATION:
                 education_quals.append(qual)
-            elif any(keyword in qual_lower for keyword in ['experience', 'years', 'background', 'history', 'previous', 'prior']):
+            elif category & FORMAT_EXPERIENCE:
                 experience_quals.append(qual)
-            elif any(keyword in qual_lower for keyword in ['skills', 'ability', 'knowledge', 'proficient', 'familiar', 'understanding']):
+            elif category & FORMAT_SKILLS:
                 skill_quals.append(qual)
             else:
                 other_quals.append(qual)
@@ -265,7 +416,20 @@ class QualificationsExtractor:
         if result and not result.startswith('•'):
             result = '• ' + result
         
-        return result
+        return ExtractedQualifications(education_quals, experience_quals, skill_quals, other_quals, result)
+
+
+# Extractor of a pool worker process, set by _init_worker
+_worker_extractor: Optional[QualificationsExtractor] = None
+
+
+def _init_worker(extractor: QualificationsExtractor) -> None:
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_chunk(job_descriptions: List[str]) -> List[ExtractedQualifications]:
+    return [_worker_extractor.extract_structured(d) for d in job_descriptions]
 
 if __name__ == "__main__":
     # Test the extractor
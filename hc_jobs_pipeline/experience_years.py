@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+"""
+Years-of-Experience Rules
+=========================
+Our experience tables spell out one numeric comparison number by number:
+``3\\+? years? experience`` ... ``20\\+? years? of experience``, ``1-3
+years? experience`` ... ``5 to 7 years? experience``,
+``minimum.{0,10}3.{0,5}years?``; dozens of regexes per rule file, each
+searching the whole posting.
+
+A ``YearsRule`` is a RuleTable over the same patterns that recognizes
+those shapes and evaluates them from one scan of the text: the numbers
+read back from each ``years experience``/``years of experience``, and the
+window after each ``minimum``. Each numeric pattern is then a set lookup.
+Patterns of any other shape (``extensive experience``) stay guarded
+regexes. education_filters reads its experience family this way
+(benchmarks/bench_experience_years.py).
+
+The scan reproduces the regexes exactly, including their substring
+semantics: ``3\\+? years? experience`` matches ``13 years experience``,
+since the regex does. ``search`` runs the winning pattern's own regex for
+the match, so spans are the regex's too.
+
+Like literal guards, the scans assume IGNORECASE rules are run against
+lowercased text, which is how all of our filters call them.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from compiled_rules import Guard, GuardedPattern, RuleTable
+from regex_safety import SafetySettings
+
+# The pattern shapes a YearsRule evaluates numerically, as written in the rule files
+_COUNT_SHAPE = re.compile(r"([0-9]+)\\\+\? years\? (of )?experience")
+_RANGE_SHAPE = re.compile(r"([0-9]+)(-| to )([0-9]+) years\? experience")
+_MINIMUM_SHAPE = re.compile(r"minimum\.\{0,10\}([0-9]+)\.\{0,5\}years\?")
+
+# How far a minimum pattern reaches past "minimum": .{0,10}N.{0,5}year
+_MINIMUM_GAP = 10
+_YEAR_GAP = 5
+
+
+class YearsPattern(NamedTuple):
+    """A numeric pattern: ``shape`` is "count", "range" or "minimum"."""
+    shape: str
+    key: Tuple[str, ...]
+
+
+def years_pattern(pattern: str, flags: int = 0) -> Optional[YearsPattern]:
+    """The numeric form of a pattern, or None if it's evaluated as a regex."""
+    if flags & ~re.IGNORECASE:
+        return None
+    m = _COUNT_SHAPE.fullmatch(pattern)
+    if m:
+        return YearsPattern("count", (m.group(1), bool(m.group(2))))
+    m = _RANGE_SHAPE.fullmatch(pattern)
+    if m:
+        return YearsPattern("range", m.groups())
+    m = _MINIMUM_SHAPE.fullmatch(pattern)
+    if m:
+        return YearsPattern("minimum", (m.group(1),))
+    return None
+
+
+_DIGITS = frozenset("0123456789")
+
+
+def _digits_before(text: str, end: int) -> int:
+    """Start of the run of ASCII digits ending at ``end`` (``end`` if there is none)."""
+    start = end
+    while start > 0 and text[start - 1] in _DIGITS:
+        start -= 1
+    return start
+
+
+def _suffixes(run: str) -> List[str]:
+    return [run[i:] for i in range(len(run))]
+
+
+class _YearScanner:
+    """The scans for one rule's flags, and the numbers its minimum patterns look for."""
+
+    def __init__(self, flags: int, minimum_numbers: Iterable[str]):
+        # Each count and range pattern ends in one of these; the numbers are read back from it
+        self.unit = re.compile(r" years? (of )?experience", flags)
+        self.to = re.compile(r" to ", flags)
+        self.minimum = re.compile(r"m(?=inimum)", flags)
+        self.year = re.compile(r"year", flags)
+        self.minimum_numbers = frozenset(minimum_numbers)
+        self.minimum_lengths = sorted({len(n) for n in self.minimum_numbers})
+
+    def unit_numbers(self, text: str) -> Iterator[Tuple[List[Tuple[str, bool]], List[Tuple[str, str, str]]]]:
+        """Per unit, in text order: (number, "of") of its counts and (low, separator, high) of its ranges."""
+        if "experience" not in text:
+            return
+        for m in self.unit.finditer(text):
+            end = m.start()
+            plus = end > 0 and text[end - 1] == "+"
+            start = _digits_before(text, end - plus)
+            if start == end - plus:
+                continue
+            # A pattern's number matches the end of a digit run, as "3" does in "13"
+            counts = [(suffix, m.group(1) is not None) for suffix in _suffixes(text[start:end - plus])]
+            if plus or m.group(1) is not None:
+                yield counts, []
+                continue
+            # The high end of a range is the whole run between the separator and the unit
+            if start > 0 and text[start - 1] == "-":
+                separator, low_end = "-", start - 1
+            elif start >= 4 and self.to.match(text, start - 4):
+                separator, low_end = " to ", start - 4
+            else:
+                yield counts, []
+                continue
+            low = text[_digits_before(text, low_end):low_end]
+            yield counts, [(suffix, separator, text[start:end]) for suffix in _suffixes(low)]
+
+    def numbers(self, text: str) -> Tuple[Set[Tuple[str, bool]], Set[Tuple[str, str, str]]]:
+        """The counts and ranges of every unit."""
+        counts: Set[Tuple[str, bool]] = set()
+        ranges: Set[Tuple[str, str, str]] = set()
+        for unit_counts, unit_ranges in self.unit_numbers(text):
+            counts.update(unit_counts)
+            ranges.update(unit_ranges)
+        return counts, ranges
+
+    def minimums(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        if "minimum" not in text or not self.minimum_numbers:
+            return found
+        reach = _MINIMUM_GAP + self.minimum_lengths[-1] + _YEAR_GAP + len("year")
+        for m in self.minimum.finditer(text):
+            start = m.start() + len("minimum")
+            # "." stops at line ends
+            window = text[start:start + reach].split("\n", 1)[0]
+            years = [y.start() for y in self.year.finditer(window)]
+            if not years:
+                continue
+            for length in self.minimum_lengths:
+                for p in range(min(_MINIMUM_GAP, len(window) - length) + 1):
+                    number = window[p:p + length]
+                    if number in self.minimum_numbers and any(
+                            p + length <= y <= p + length + _YEAR_GAP for y in years):
+                        found.add(number)
+        return found
+
+
+class YearsRule(RuleTable):
+    """
+    A RuleTable whose years-of-experience patterns are evaluated numerically.
+
+    Same patterns, same table order and same results as
+    ``RuleTable(patterns, flags)``; ``matched`` gives the per-pattern hits
+    the way CombinedMatcher does.
+    """
+
+    __slots__ = ("name", "numeric", "_scanner", "_numbers")
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0, guards: Optional[Mapping[str, Guard]] = None,
+                 safety: Optional[SafetySettings] = None, name: str = ""):
+        super().__init__(patterns, flags, guards, safety)
+        self.name = name
+        self.numeric: List[Optional[YearsPattern]] = [years_pattern(rule.pattern, flags) for rule in self.rules]
+        self._scanner = _YearScanner(flags, [n.key[0] for n in self.numeric if n and n.shape == "minimum"])
+        # Count and range keys of the table, for any()
+        self._numbers = frozenset(n.key for n in self.numeric if n and n.shape != "minimum")
+
+    def _hits(self, text: str):
+        """Per pattern, whether it matches, in table order (lazily, so callers can stop early)."""
+        scans: Dict[str, set] = {}
+        for rule, numeric in zip(self.rules, self.numeric):
+            if numeric is None:
+                yield rule.could_match(text) and rule.engine.search(text) is not None
+            elif numeric.shape == "minimum":
+                if "minimum" not in scans:
+                    scans["minimum"] = self._scanner.minimums(text)
+                yield numeric.key[0] in scans["minimum"]
+            else:
+                if "count" not in scans:
+                    scans["count"], scans["range"] = self._scanner.numbers(text)
+                yield numeric.key in scans[numeric.shape]
+
+    def matched(self, text: str) -> List[bool]:
+        """Per pattern, whether ``re.search`` would match, in table order."""
+        return list(self._hits(text))
+
+    def any(self, text: str) -> bool:
+        """Whether any pattern matches; stops at the first unit with a number the table names."""
+        for unit_counts, unit_ranges in self._scanner.unit_numbers(text):
+            if not self._numbers.isdisjoint(unit_counts) or not self._numbers.isdisjoint(unit_ranges):
+                return True
+        if self._scanner.minimum_numbers and self._scanner.minimums(text):
+            return True
+        return any(rule.could_match(text) and rule.engine.search(text) is not None
+                   for rule, numeric in zip(self.rules, self.numeric) if numeric is None)
+
+    def first(self, text: str) -> Optional[GuardedPattern]:
+        for rule, hit in zip(self.rules, self._hits(text)):
+            if hit:
+                return rule
+        return None
+
+    def search(self, text: str) -> Optional[Tuple[int, re.Match]]:
+        for index, hit in enumerate(self._hits(text)):
+            if hit:
+                # The winning pattern's own regex, for the match and its span
+                return index, self.rules[index].engine.search(text)
+        return None
+
+    def matching(self, text: str) -> List[GuardedPattern]:
+        return [rule for rule, hit in zip(self.rules, self._hits(text)) if hit]
+
+    def __repr__(self) -> str:
+        numeric = sum(1 for n in self.numeric if n)
+        return f"YearsRule({self.name!r}, {len(self.rules)} patterns, {numeric} numeric)"
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+"""
+Cost- and Selectivity-Ordered Filter Chain
+==========================================
+Runs a posting through an ordered list of pass/fail predicates, stopping at
+the first one that rejects it. Each stage tracks its measured cost and how
+often it rejects, and the chain orders stages by expected cost: for
+independent filters the cheapest expected pipeline runs stages in ascending
+``cost / rejection_rate`` order, so a cheap location check that drops a
+third of the feed runs before a regex-heavy text check.
+
+Stage statistics can be saved after a run and loaded as priors for the
+next, so the order is re-tuned from recent runs instead of hard-coded.
+
+A rejected posting is counted once, under the reason of the stage that
+rejected it. A posting failing several stages is attributed to whichever
+runs first, so per-reason counts depend on the stage order; the set of
+included postings does not. stats() records the final order and how many
+times it changed during the run, and run_summary prints both next to the
+counts.
+
+With a per-posting time budget, a posting whose stages have taken longer
+than ``budget_ms`` so far is rejected under BUDGET_REASON instead of running
+the remaining stages. A regex can't be interrupted mid-search, so the check
+runs between stages; regex_safety's bounded patterns keep each stage short.
+
+A predicate may reject with a Rejection instead of False, naming the rule
+that fired and where it matched; it is kept as ``last_rejection`` for the
+rejection log (see rejection_log), at no cost to stages that don't.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+# Rejection rate assumed for a stage with no history
+DEFAULT_REJECTION_RATE = 0.5
+
+# Weight of prior statistics, in postings, against this run's measurements
+PRIOR_WEIGHT = 50
+
+# Floor on rejection rate so stages that never reject sort last, not undefined
+MIN_REJECTION_RATE = 1e-3
+
+# Rejection reason for postings that exceed the chain's time budget
+BUDGET_REASON = "time_budget"
+
+
+class Rejection:
+    """A falsy predicate result naming the rule that rejected and its match span (-1 if none)."""
+
+    __slots__ = ("rule", "start", "end")
+
+    def __init__(self, rule: str, start: int = -1, end: int = -1):
+        self.rule = rule
+        self.start = start
+        self.end = end
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"Rejection({self.rule!r}, {self.start}, {self.end})"
+
+
+class FilterStage:
+    """One predicate in the chain with its running cost and rejection statistics."""
+
+    __slots__ = ("reason", "predicate", "prior_cost_us", "prior_rejection_rate", "prior_weight",
+                 "evaluated", "rejected", "total_seconds")
+
+    def __init__(self, reason: str, predicate: Callable[[Any], bool], cost_us: float = 1.0,
+                 rejection_rate: float = DEFAULT_REJECTION_RATE, prior_weight: int = PRIOR_WEIGHT):
+        self.reason = reason
+        self.predicate = predicate
+        self.prior_cost_us = cost_us
+        self.prior_rejection_rate = rejection_rate
+        self.prior_weight = prior_weight
+        self.evaluated = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    @property
+    def cost_us(self) -> float:
+        """Mean cost per evaluation in microseconds, blended with the prior."""
+        weight = self.prior_weight + self.evaluated
+        return (self.prior_cost_us * self.prior_weight + self.total_seconds * 1e6) / weight
+
+    @property
+    def rejection_rate(self) -> float:
+        """Fraction of evaluated postings this stage rejects, blended with the prior."""
+        weight = self.prior_weight + self.evaluated
+        return (self.prior_rejection_rate * self.prior_weight + self.rejected) / weight
+
+    @property
+    def rank(self) -> float:
+        """Expected cost per rejection; lower runs earlier."""
+        return self.cost_us / max(self.rejection_rate, MIN_REJECTION_RATE)
+
+    def passes(self, posting) -> Union[bool, Rejection]:
+        """The predicate's result, which may be a Rejection; test it for truth."""
+        start = time.perf_counter()
+        ok = self.predicate(posting)
+        self.total_seconds += time.perf_counter() - start
+        self.evaluated += 1
+        if not ok:
+            self.rejected += 1
+        return ok
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cost_us": round(self.cost_us, 3),
+            "rejection_rate": round(self.rejection_rate, 4),
+            "evaluated": self.evaluated,
+            "rejected": self.rejected,
+        }
+
+
+class FilterChain:
+    """
+    Ordered predicates evaluated until the first rejection.
+
+    With ``retune_every`` set, the chain re-sorts its stages after that many
+    postings using the statistics measured so far in the run. With
+    ``budget_ms`` set, postings over budget stop early (see module docstring).
+    """
+
+    def __init__(self, stages: Iterable[FilterStage], retune_every: Optional[int] = None,
+                 budget_ms: Optional[float] = None):
+        self.stages: List[FilterStage] = list(stages)
+        self.retune_every = retune_every
+        self.budget_ms = budget_ms
+        self.over_budget = 0
+        # Re-tunes during the run that changed the stage order
+        self.reorders = 0
+        # Rejection from the stage that rejected the last posting, if it gave one
+        self.last_rejection: Optional[Rejection] = None
+        self._since_retune = 0
+        self.retune()
+
+    @property
+    def order(self) -> List[str]:
+        return [stage.reason for stage in self.stages]
+
+    def retune(self) -> None:
+        """Order stages by expected cost (stable for equal ranks)."""
+        self.stages.sort(key=lambda stage: stage.rank)
+
+    def rejection_reason(self, posting) -> Optional[str]:
+        """Reason of the first stage that rejects the posting, or None if all pass."""
+        if self.retune_every:
+            self._since_retune += 1
+            if self._since_retune >= self.retune_every:
+                self._since_retune = 0
+                before = self.order
+                self.retune()
+                if self.order != before:
+                    self.reorders += 1
+        self.last_rejection = None
+        if self.budget_ms is None:
+            for stage in self.stages:
+                result = stage.passes(posting)
+                if not result:
+                    if result.__class__ is Rejection:
+                        self.last_rejection = result
+                    return stage.reason
+            return None
+
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        last = len(self.stages) - 1
+        for index, stage in enumerate(self.stages):
+            result = stage.passes(posting)
+            if not result:
+                if result.__class__ is Rejection:
+                    self.last_rejection = result
+                return stage.reason
+            if index < last and time.perf_counter() > deadline:
+                self.over_budget += 1
+                return BUDGET_REASON
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Stage order and per-stage statistics, for filtering_stats and re-tuning."""
+        stats = {
+            "order": self.order,
+            "reorders": self.reorders,
+            "stages": {stage.reason: stage.to_dict() for stage in self.stages},
+        }
+        if self.budget_ms is not None:
+            stats["budget_ms"] = self.budget_ms
+            stats["over_budget"] = self.over_budget
+        return stats
+
+    def save_stats(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.stats(), indent=2), encoding="utf-8")
+
+    def load_stats(self, path: Union[str, Path]) -> bool:
+        """
+        Use a previous run's measurements as priors and re-order.
+
+        Returns False (keeping the built-in priors) if the file is missing or unreadable.
+        """
+        try:
+            saved = json.loads(Path(path).read_text(encoding="utf-8"))["stages"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        for stage in self.stages:
+            previous = saved.get(stage.reason)
+            if not previous:
+                continue
+            try:
+                stage.prior_cost_us = float(previous["cost_us"])
+                stage.prior_rejection_rate = float(previous["rejection_rate"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.retune()
+        return True
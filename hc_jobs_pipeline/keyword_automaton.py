@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+Multi-Keyword Automaton for Literal Keyword Lists
+=================================================
+Replaces ``any(k in text for k in keywords)`` checks, which scan the text
+once per keyword, with one automaton per keyword list that reports every
+hit in a single pass.
+
+Uses the native Aho-Corasick automaton from ``pyahocorasick`` when it is
+installed. Otherwise it falls back to a longest-first regex alternation,
+which the ``re`` engine runs as one left-to-right scan.
+
+Keywords are matched exactly as given, so callers pass lowercased text to
+lowercase keyword lists, as they did with the ``in`` checks.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional native dependency
+    ahocorasick = None
+
+HAVE_NATIVE_AUTOMATON = ahocorasick is not None
+
+_WORD_CHAR = re.compile(r"\w")
+
+Hit = Tuple[int, str]
+
+
+def _is_boundary(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not directly preceded or followed by a word character."""
+    if start > 0 and _WORD_CHAR.match(text, start - 1):
+        return False
+    if end < len(text) and _WORD_CHAR.match(text, end):
+        return False
+    return True
+
+
+class KeywordAutomaton:
+    """
+    One-pass matcher for a fixed list of literal keywords.
+
+    With ``word_boundary=True`` a keyword only counts when it is not part of a
+    longer word (``"rn"`` matches ``"rn, bsn"`` but not ``"learn"``), the same
+    as wrapping it in ``(?<!\\w)...(?!\\w)``.
+    """
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False, native: Optional[bool] = None):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+        self.word_boundary = word_boundary
+        self.native = HAVE_NATIVE_AUTOMATON if native is None else (native and HAVE_NATIVE_AUTOMATON)
+
+        if self.native:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            if self.keywords:
+                self._automaton.make_automaton()
+        else:
+            longest_first = sorted(self.keywords, key=len, reverse=True)
+            alternation = "|".join(re.escape(k) for k in longest_first) or r"(?!)"
+            if word_boundary:
+                alternation = r"(?<!\w)(?:" + alternation + r")(?!\w)"
+            self._search_re = re.compile(alternation)
+            # Lookahead so every start position is reported, not just non-overlapping hits
+            self._scan_re = re.compile("(?=(" + alternation + "))")
+            # Keywords matching at the same start are prefixes of the longest one there
+            self._prefixes: Dict[str, List[str]] = {
+                k: [p for p in self.keywords if p != k and k.startswith(p)] for k in self.keywords
+            }
+
+    def iter_hits(self, text: str):
+        """Yield ``(start, keyword)`` for every occurrence, overlapping ones included."""
+        if not self.keywords or not text:
+            return
+        if self.native:
+            for end, keyword in self._automaton.iter(text):
+                start = end - len(keyword) + 1
+                if not self.word_boundary or _is_boundary(text, start, end + 1):
+                    yield start, keyword
+            return
+        for m in self._scan_re.finditer(text):
+            start, longest = m.start(), m.group(1)
+            yield start, longest
+            for prefix in self._prefixes[longest]:
+                if not self.word_boundary or _is_boundary(text, start, start + len(prefix)):
+                    yield start, prefix
+
+    def find_all(self, text: str) -> List[Hit]:
+        """All hits ordered by position, longer keywords first at the same position."""
+        return sorted(self.iter_hits(text), key=lambda hit: (hit[0], -len(hit[1])))
+
+    def hits(self, text: str) -> Set[str]:
+        """Distinct keywords present in the text."""
+        return {keyword for _, keyword in self.iter_hits(text)}
+
+    def contains_any(self, text: str) -> bool:
+        """Same answer as ``any(k in text for k in keywords)``, stopping at the first hit."""
+        if not self.native:
+            return bool(self.keywords) and self._search_re.search(text) is not None
+        for _ in self.iter_hits(text):
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        mode = "native" if self.native else "regex"
+        return f"KeywordAutomaton({len(self.keywords)} keywords, {mode}, word_boundary={self.word_boundary})"
+
+
+@lru_cache(maxsize=None)
+def _shared_automaton(keywords: Tuple[str, ...], word_boundary: bool) -> KeywordAutomaton:
+    return KeywordAutomaton(keywords, word_boundary)
+
+
+def keyword_automaton(keywords: Iterable[str], word_boundary: bool = False) -> KeywordAutomaton:
+    """Shared automaton for a keyword list, built once per distinct list."""
+    return _shared_automaton(tuple(keywords), word_boundary)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+Posting Locations
+=================
+Resolves an ATS location string (``Nashville, TN``, ``California, US``,
+``Remote - Texas``) into the city, state, region and remote flag a job record
+stores, in one call.
+
+The state comes from, in order:
+
+1. A two-letter code (``TN``), as run_collect always read it. The first
+   uppercase two-letter word other than ``US`` decides: a state code gives
+   the state, anything else (``ON``, ``UK``) means the location isn't in the
+   US and nothing below is tried.
+2. A city in CITY_STATES (``Chicago``, ``Washington, D.C.``). Only large
+   cities whose name means one state are listed.
+3. A state's name anywhere in the string (``California, US``).
+
+Everything is looked up in tables built at import, with no network access.
+Feeds repeat the same few location strings across postings, so resolved
+locations are memoized in a bounded LRU cache.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+# Distinct location strings remembered by resolve_location
+LOCATION_CACHE_SIZE = 4096
+
+US_STATES: Dict[str, str] = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "DC": "District of Columbia",
+    "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+    "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana",
+    "ME": "Maine", "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+    "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma", "OR": "Oregon",
+    "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota",
+    "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont", "VA": "Virginia",
+    "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+
+US_REGIONS = {
+    "Northeast": {"ME", "NH", "VT", "MA", "RI", "CT", "NY", "NJ", "PA"},
+    "Midwest": {"OH", "IN", "IL", "MI", "WI", "MN", "IA", "MO", "ND", "SD", "NE", "KS"},
+    "South": {"DE", "MD", "DC", "VA", "WV", "NC", "SC", "GA", "FL", "KY", "TN", "AL", "MS", "AR", "LA", "OK", "TX"},
+    "West": {"MT", "ID", "WY", "CO", "NM", "AZ", "UT", "NV", "WA", "OR", "CA", "AK", "HI"}
+}
+
+# US Census region of each state code
+STATE_REGION: Dict[str, str] = {state: region for region, states in US_REGIONS.items() for state in states}
+
+# Lowercased, with periods dropped and commas as spaces (see _city_key)
+CITY_STATES: Dict[str, str] = {
+    "new york city": "NY", "nyc": "NY", "brooklyn": "NY", "buffalo": "NY",
+    "washington dc": "DC", "washington d c": "DC",
+    "los angeles": "CA", "san diego": "CA", "san jose": "CA", "san francisco": "CA", "fresno": "CA",
+    "sacramento": "CA", "long beach": "CA", "oakland": "CA", "bakersfield": "CA", "anaheim": "CA",
+    "santa ana": "CA", "riverside": "CA", "irvine": "CA", "chula vista": "CA", "san bernardino": "CA",
+    "chicago": "IL", "houston": "TX", "san antonio": "TX", "dallas": "TX", "austin": "TX",
+    "fort worth": "TX", "el paso": "TX", "corpus christi": "TX", "plano": "TX", "laredo": "TX",
+    "lubbock": "TX", "garland": "TX", "phoenix": "AZ", "tucson": "AZ", "mesa": "AZ", "chandler": "AZ",
+    "scottsdale": "AZ", "philadelphia": "PA", "pittsburgh": "PA", "charlotte": "NC", "raleigh": "NC",
+    "greensboro": "NC", "winston-salem": "NC", "indianapolis": "IN", "fort wayne": "IN",
+    "seattle": "WA", "spokane": "WA", "denver": "CO", "colorado springs": "CO", "nashville": "TN",
+    "memphis": "TN", "knoxville": "TN", "chattanooga": "TN", "boston": "MA", "detroit": "MI",
+    "grand rapids": "MI", "ann arbor": "MI", "louisville": "KY", "baltimore": "MD",
+    "milwaukee": "WI", "albuquerque": "NM", "atlanta": "GA", "omaha": "NE", "miami": "FL",
+    "tampa": "FL", "orlando": "FL", "hialeah": "FL", "fort lauderdale": "FL", "virginia beach": "VA",
+    "minneapolis": "MN", "st paul": "MN", "saint paul": "MN", "tulsa": "OK", "new orleans": "LA",
+    "baton rouge": "LA", "wichita": "KS", "cleveland": "OH", "cincinnati": "OH", "honolulu": "HI",
+    "st louis": "MO", "saint louis": "MO", "anchorage": "AK", "jersey city": "NJ", "boise": "ID",
+    "salt lake city": "UT", "des moines": "IA", "little rock": "AR", "providence": "RI",
+    "hartford": "CT", "las vegas": "NV", "reno": "NV",
+}
+
+STATE_CODE_RE = re.compile(r"\b([A-Z]{2})\b")
+REMOTE_LOCATION_RE = re.compile(r"\bremote\b|\bwork from home\b|\btelecommute\b", re.I)
+# Longest names first, so "West Virginia" isn't read as "Virginia"
+STATE_NAME_RE = re.compile(
+    r"\b(" + "|".join(re.escape(name) for name in sorted(US_STATES.values(), key=len, reverse=True)) + r")\b", re.I)
+STATE_BY_NAME: Dict[str, str] = {name.lower(): code for code, name in US_STATES.items()}
+
+
+class ResolvedLocation(NamedTuple):
+    city: str
+    state: Optional[str]  # two-letter code, None outside the US or if unknown
+    region: str  # US Census region, "Unknown" without a state
+    remote: bool
+
+
+def _city(location: str) -> str:
+    # Everything before the first comma; without a comma the whole location,
+    # which also keeps remote/hybrid indicators as they are
+    if "," in location:
+        return location.split(",")[0].strip()
+    return location
+
+
+def _city_key(text: str) -> str:
+    return " ".join(text.lower().replace(".", "").replace(",", " ").split())
+
+
+def _state(location: str, city: str) -> Optional[str]:
+    for code in STATE_CODE_RE.findall(location):
+        if code != "US":
+            return code if code in US_STATES else None
+    state = CITY_STATES.get(_city_key(location)) or CITY_STATES.get(_city_key(city))
+    if state:
+        return state
+    m = STATE_NAME_RE.search(location)
+    return STATE_BY_NAME[m.group(1).lower()] if m else None
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _resolve(location: str) -> ResolvedLocation:
+    city = _city(location)
+    state = _state(location, city)
+    return ResolvedLocation(city, state, STATE_REGION.get(state, "Unknown"),
+                            REMOTE_LOCATION_RE.search(location) is not None)
+
+
+def resolve_location(location: Optional[str]) -> ResolvedLocation:
+    """City, state, region and remote flag of a posting's location string."""
+    if not location:
+        return ResolvedLocation("", None, "Unknown", False)
+    return _resolve(location.strip())
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+
+"""
+Pattern-Match Matrix for Multi-Profile Filter Evaluation
+========================================================
+We maintain four education filters (strict entry-level in run_collect, the
+scored education_filters, relaxed and simplified). Comparing them used to
+mean re-running every regex once per filter. Here every known pattern is
+scanned once, producing a NumPy boolean matrix of postings x patterns. Each
+filter profile is then a few vectorized boolean operations over column groups,
+so strict, relaxed, simplified and custom profiles evaluate over 100k postings
+in milliseconds. ``compare_profiles`` reports where they disagree.
+
+Columns are distinct (field, pattern, flags) triples. A pattern used by
+several filters on the same text is scanned once. Fields are the texts the
+filters read:
+
+    description   lowercased description (scored, relaxed, simplified)
+    education     lowercased education-scoped text (strict)
+    title         lowercased title (strict senior-title check)
+
+Each profile reproduces its filter function exactly; tests check this
+against the per-posting functions.
+
+Usage:
+    python pattern_matrix.py postings.json [--examples 3]
+
+Requires NumPy (``pip install numpy``, listed in requirements-optional.txt).
+The column registry (PatternColumns, default_columns) works without it;
+building a matrix raises ImportError.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from batch_filters import DEFAULT_CHUNK_SIZE, CorpusBuffer
+from compiled_rules import GuardedPattern
+import education_filters
+import relaxed_education_filters
+import run_collect
+import simplified_education_filters
+from run_collect import PostingContext
+
+HAVE_NUMPY = np is not None
+
+FIELDS = ("description", "education", "title")
+
+# Matches keys of education_filters.analyze_education_requirements
+SCORED_FAMILIES = (
+    "healthcare_admin_bachelors", "advanced_degree", "high_experience", "bachelors_required",
+    "bachelors_mentioned", "bachelors_preferred", "high_school_only", "context_exclusion", "no_degree_required",
+)
+
+# A profile maps the matrix to one inclusion flag per posting
+Profile = Callable[["PatternMatrix"], "np.ndarray"]
+
+
+class PatternColumns:
+    """
+    Registry of matrix columns and the named groups profiles select them by.
+
+    A group name is ``"<filter>.<family>"``, e.g. ``"strict.high_experience"``.
+    """
+
+    def __init__(self):
+        self.rules: List[Tuple[str, GuardedPattern]] = []
+        self.groups: Dict[str, List[int]] = {}
+        self._index: Dict[Tuple[str, str, int], int] = {}
+
+    def add_group(self, name: str, field: str, rules: Iterable[GuardedPattern]) -> None:
+        """Register a group of rules scanned against ``field``, sharing existing columns."""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field {field!r}; expected one of {FIELDS}")
+        columns = self.groups.setdefault(name, [])
+        for rule in rules:
+            key = (field, rule.regex.pattern, rule.regex.flags)
+            if key not in self._index:
+                self._index[key] = len(self.rules)
+                self.rules.append((field, rule))
+            if self._index[key] not in columns:
+                columns.append(self._index[key])
+
+    def add_patterns(self, name: str, field: str, patterns: Iterable[str], flags: int = 0) -> None:
+        """Register raw patterns as a group (for custom profiles)."""
+        self.add_group(name, field, [GuardedPattern(p, flags) for p in patterns])
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def default_columns() -> PatternColumns:
+    """Columns for every pattern the four education filters use, as currently loaded."""
+    columns = PatternColumns()
+
+    columns.add_group("strict.bachelors_mentioned", "education", [run_collect.BACHELORS_MENTIONED_RULE])
+    columns.add_group("strict.advanced_degree", "education", run_collect.STRICT_ADVANCED_DEGREE_RULES)
+    columns.add_group("strict.high_experience", "education", run_collect.STRICT_HIGH_EXPERIENCE_RULES)
+    columns.add_group("strict.senior_title", "title", run_collect.SENIOR_TITLE_RULES)
+
+    columns.add_group("scored.high_school_primary", "description", [education_filters.HIGH_SCHOOL_PRIMARY_RULE])
+    columns.add_group("scored.associates_primary", "description", [education_filters.ASSOCIATES_PRIMARY_RULE])
+    # Every family key gets a group, even one with no patterns in the current rules
+    families: Dict[str, List[GuardedPattern]] = {key: [] for key in SCORED_FAMILIES}
+    rules_by_position = {}
+    for rule, positions in education_filters.FAMILY_MATCHER.rules:
+        for position in positions:
+            rules_by_position[position] = rule
+    for position, (key, _) in enumerate(education_filters.FAMILY_PATTERNS):
+        families.setdefault(key, []).append(rules_by_position[position])
+    for key, rules in families.items():
+        columns.add_group(f"scored.{key}", "description", rules)
+
+    columns.add_group("relaxed.advanced_required", "description", relaxed_education_filters.ADVANCED_REQUIRED_RULES)
+    columns.add_group("relaxed.senior_exec", "description", relaxed_education_filters.SENIOR_EXEC_RULES)
+
+    columns.add_group("simplified.bachelor_mention", "description",
+                      simplified_education_filters.BACHELOR_MENTION_RULES)
+    return columns
+
+
+def _field_texts(contexts: Sequence[PostingContext]) -> Dict[str, List[str]]:
+    return {
+        # What the scored, relaxed and simplified filters build with no qualifications
+        "description": [f"{c.description} ".lower() for c in contexts],
+        "education": [c.education_text_lower for c in contexts],
+        "title": [c.title_lower for c in contexts],
+    }
+
+
+class PatternMatrix:
+    """Postings x columns boolean matrix with group-level helpers for profiles."""
+
+    def __init__(self, columns: PatternColumns, matrix: "np.ndarray"):
+        self.columns = columns
+        self.matrix = matrix
+        self._any: Dict[str, "np.ndarray"] = {}
+
+    @classmethod
+    def build(cls, postings: Iterable[Any], columns: Optional[PatternColumns] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> "PatternMatrix":
+        """
+        Scan every column once over the corpus.
+
+        Postings are PostingContexts or dicts with title/location/description
+        (pipeline records with jobTitle/jobDescription work too).
+        """
+        if not HAVE_NUMPY:
+            raise ImportError("PatternMatrix needs NumPy: pip install numpy (see requirements-optional.txt)")
+        columns = columns or default_columns()
+        by_field: Dict[str, List[int]] = {}
+        for j, (field, _) in enumerate(columns.rules):
+            by_field.setdefault(field, []).append(j)
+
+        blocks = []
+        postings = iter(postings)
+        while True:
+            contexts = [_as_context(p) for _, p in zip(range(chunk_size), postings)]
+            if not contexts:
+                break
+            block = np.zeros((len(contexts), len(columns)), dtype=bool)
+            texts = _field_texts(contexts)
+            for field, indexes in by_field.items():
+                corpus = CorpusBuffer(texts[field])
+                for j in indexes:
+                    block[corpus.postings_matching(columns.rules[j][1]), j] = True
+            blocks.append(block)
+        matrix = np.vstack(blocks) if blocks else np.zeros((0, len(columns)), dtype=bool)
+        return cls(columns, matrix)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def group(self, name: str) -> "np.ndarray":
+        """Postings x group-columns submatrix."""
+        try:
+            return self.matrix[:, self.columns.groups[name]]
+        except KeyError:
+            raise KeyError(f"Unknown pattern group {name!r}") from None
+
+    def any(self, *names: str) -> "np.ndarray":
+        """Per posting, whether any pattern in any of the named groups matched."""
+        result = np.zeros(len(self), dtype=bool)
+        for name in names:
+            if name not in self._any:
+                group = self.group(name)
+                self._any[name] = group.any(axis=1) if group.shape[1] else np.zeros(len(self), dtype=bool)
+            result |= self._any[name]
+        return result
+
+    def evaluate(self, profiles: Mapping[str, Profile]) -> Dict[str, "np.ndarray"]:
+        return {name: np.asarray(profile(self), dtype=bool) for name, profile in profiles.items()}
+
+
+def _as_context(posting: Any) -> PostingContext:
+    if isinstance(posting, PostingContext):
+        return posting
+    return PostingContext(
+        posting.get("title", posting.get("jobTitle")),
+        posting.get("location", posting.get("city")),
+        posting.get("description", posting.get("jobDescription")),
+    )
+
+
+# === PROFILES ===
+# Each equals its filter function; see the filter modules for the rules.
+
+def strict_profile(m: PatternMatrix) -> "np.ndarray":
+    """run_collect.meets_entry_level_requirement (section-scoped, as collect() calls it)."""
+    return (m.any("strict.bachelors_mentioned")
+            & ~m.any("strict.advanced_degree", "strict.high_experience", "strict.senior_title"))
+
+
+def scored_profile(m: PatternMatrix) -> "np.ndarray":
+    """education_filters.meets_bachelors_requirement."""
+    has_bachelors = m.any("scored.healthcare_admin_bachelors", "scored.bachelors_required",
+                          "scored.bachelors_mentioned", "scored.bachelors_preferred")
+    excluded = m.any("scored.high_school_primary", "scored.associates_primary",
+                     "scored.advanced_degree", "scored.high_experience")
+    return has_bachelors & ~excluded
+
+
+def relaxed_profile(m: PatternMatrix) -> "np.ndarray":
+    """relaxed_education_filters.meets_relaxed_education_requirement."""
+    return ~m.any("relaxed.advanced_required", "relaxed.senior_exec")
+
+
+def simplified_profile(m: PatternMatrix) -> "np.ndarray":
+    """simplified_education_filters.meets_simplified_education_requirement."""
+    return m.any("simplified.bachelor_mention")
+
+
+PROFILES: Dict[str, Profile] = {
+    "strict": strict_profile,
+    "scored": scored_profile,
+    "relaxed": relaxed_profile,
+    "simplified": simplified_profile,
+}
+
+
+# === COMPARISON REPORT ===
+
+def compare_profiles(matrix: PatternMatrix, profiles: Optional[Mapping[str, Profile]] = None,
+                     examples: int = 3) -> Dict[str, Any]:
+    """
+    Inclusion counts per profile and, for every pair, the postings only one
+    of them includes, with the pattern groups most over-represented there.
+    """
+    profiles = profiles or PROFILES
+    results = matrix.evaluate(profiles)
+    names = list(results)
+    group_hits = {group: matrix.any(group) for group in matrix.columns.groups}
+
+    pairs = []
+    for a_index, a in enumerate(names):
+        for b in names[a_index + 1:]:
+            only_a = np.flatnonzero(results[a] & ~results[b])
+            only_b = np.flatnonzero(results[b] & ~results[a])
+            pairs.append({
+                "profiles": [a, b],
+                "agree": int(len(matrix) - len(only_a) - len(only_b)),
+                f"only_{a}": _disagreement(only_a, group_hits, examples),
+                f"only_{b}": _disagreement(only_b, group_hits, examples),
+            })
+    return {
+        "postings": len(matrix),
+        "columns": len(matrix.columns),
+        "included": {name: int(result.sum()) for name, result in results.items()},
+        "pairs": pairs,
+    }
+
+
+def _disagreement(indexes: "np.ndarray", group_hits: Dict[str, "np.ndarray"], examples: int) -> Dict[str, Any]:
+    """Count, example posting indexes and the groups most over-represented in these postings."""
+    groups = []
+    if len(indexes):
+        # Lift over the corpus-wide rate, so groups matching everywhere don't crowd the list
+        lifts = {group: (float(hits[indexes].mean()), float(hits[indexes].mean() - hits.mean()))
+                 for group, hits in group_hits.items()}
+        ranked = sorted(lifts.items(), key=lambda item: -item[1][1])[:3]
+        groups = [[group, round(rate, 3)] for group, (rate, lift) in ranked if lift > 0]
+    return {"count": int(len(indexes)), "examples": indexes[:examples].tolist(), "top_groups": groups}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"Profile comparison: {report['postings']} postings, {report['columns']} pattern columns",
+             "=" * 64]
+    for name, count in report["included"].items():
+        share = count / report["postings"] * 100 if report["postings"] else 0.0
+        lines.append(f"{name:12} includes {count:7} ({share:5.1f}%)")
+    for pair in report["pairs"]:
+        a, b = pair["profiles"]
+        lines.append(f"\n{a} vs {b}: agree on {pair['agree']}")
+        for name in (a, b):
+            side = pair[f"only_{name}"]
+            if not side["count"]:
+                continue
+            groups = ", ".join(f"{group} {rate:.0%}" for group, rate in side["top_groups"])
+            lines.append(f"  only {name:11} {side['count']:6}  e.g. #{side['examples']}  [{groups}]")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare education filter profiles over a postings file")
+    parser.add_argument("postings", type=Path, help="JSON list of postings (pipeline output or title/description dicts)")
+    parser.add_argument("--examples", type=int, default=3, help="example posting indexes per disagreement")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    postings = json.loads(args.postings.read_text(encoding="utf-8"))
+    matrix = PatternMatrix.build(postings)
+    report = compare_profiles(matrix, examples=args.examples)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+"""
+Pay Mention Scanner
+===================
+One scanner for every way postings state pay, shared by run_collect.py and
+update_pay_from_urls.py (which used to keep their own, diverging, pattern
+lists).
+
+``pay_mentions`` returns every compensation mention in a text with its
+offsets, whether it is hourly or annual, and its amounts. All variants are
+alternatives of one compiled regex, in priority order, so the text is
+scanned once instead of once per pattern. The scan restarts one character
+after each mention's start, so a mention nested in a longer one (``$25 per
+hour`` inside ``$20 - $25 per hour``) is found too.
+
+Which mention becomes the posting's pay is a selection policy over the
+mentions. ``first_hit`` is the original one: the highest-priority variant
+found anywhere, at its leftmost position, as trying each pattern in turn
+with ``re.search`` did.
+
+``pay_from_amounts`` and ``pay_from_range`` convert pay the ATS or the
+page lists as structured fields the same way, so listed and scanned pay come
+out alike.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Paid hours in a year, for annual-to-hourly conversion
+HOURS_PER_YEAR = 2080.0
+
+AMOUNT = r"\d+(?:\.\d+)?"
+GROUPED_AMOUNT = r"\d{1,3}(?:,\d{3})*(?:\.\d{2})?"
+PER_HOUR = r"(?:per\s?hour|/hr|hr)"
+PER_YEAR = r"(?:per\s?year|/yr|annually|a\s?year)"
+
+
+class PayVariant(NamedTuple):
+    """One way of stating pay; ``pattern`` captures ``low`` and, for ranges, ``high``."""
+    name: str
+    unit: str  # "hour" or "year"
+    pattern: str
+
+
+# In priority order: when several variants match, the first one listed wins
+PAY_VARIANTS: Tuple[PayVariant, ...] = (
+    PayVariant("hourly_range", "hour",
+               rf"\$\s?(?P<low>{AMOUNT})\s?[-–]\s?\$\s?(?P<high>{AMOUNT})\s?{PER_HOUR}\b"),
+    PayVariant("hourly", "hour", rf"\$\s?(?P<low>{AMOUNT})\s?{PER_HOUR}\b"),
+    PayVariant("annual_range", "year",
+               rf"\$\s?(?P<low>{GROUPED_AMOUNT})\s?(?:and|\s?[-–]\s?)\s?\$\s?(?P<high>{GROUPED_AMOUNT})\s?{PER_YEAR}\b"),
+    PayVariant("annual", "year", rf"\$\s?(?P<low>{GROUPED_AMOUNT})\s?{PER_YEAR}\b"),
+    PayVariant("between_annual_range", "year",
+               rf"between\s+\$\s?(?P<low>{GROUPED_AMOUNT})\s+and\s+\$\s?(?P<high>{GROUPED_AMOUNT})\s+per\s+year"),
+    PayVariant("salary_annual_range", "year",
+               rf"salary\s+(?:range\s+)?\$\s?(?P<low>{GROUPED_AMOUNT})\s?[-–]\s?\$\s?(?P<high>{GROUPED_AMOUNT})"
+               rf"\s?(?:per\s?year|/yr|annually)"),
+    PayVariant("starting_hourly", "hour", rf"starting\s+(?:at\s+)?\$\s?(?P<low>{GROUPED_AMOUNT})\s?{PER_HOUR}"),
+    PayVariant("up_to_hourly", "hour", rf"up\s+to\s+\$\s?(?P<low>{GROUPED_AMOUNT})\s?{PER_HOUR}"),
+)
+
+
+# Characters besides a letter's two cases that re.IGNORECASE treats as that letter
+_CASE_EQUIVALENTS = {"i": "\u0130\u0131", "k": "\u212a", "s": "\u017f"}
+
+
+def _compile_scanner(variants: Sequence[PayVariant]) -> "re.Pattern[str]":
+    # re only skips quickly to candidate positions when a pattern starts with a
+    # literal or a character set, and case-insensitive letters rule both out.
+    # So the scanner starts with the variants' first characters as an explicit
+    # set ([$BbSsUu]); the variants sharing a first character then check it
+    # with one lookbehind and match the rest case-insensitively. Group names must be
+    # unique across the alternation: variant i is v<i>, its amounts v<i>_low/_high.
+    by_lead: Dict[str, List[str]] = {}
+    for i, variant in enumerate(variants):
+        pattern = variant.pattern.replace("(?P<low>", f"(?P<v{i}_low>").replace("(?P<high>", f"(?P<v{i}_high>")
+        if pattern.startswith("\\$"):
+            lead, rest = "\\$", pattern[2:]
+        else:
+            letter = pattern[0].lower()
+            lead, rest = letter.upper() + letter + _CASE_EQUIVALENTS.get(letter, ""), pattern[1:]
+        # Variants with different first characters never match at the same
+        # position, so grouping them by first character keeps their priority
+        by_lead.setdefault(lead, []).append(f"(?P<v{i}>{rest})")
+    branches = [f"(?<=[{lead}])(?:{'|'.join(rests)})" for lead, rests in by_lead.items()]
+    return re.compile(f"[{''.join(by_lead)}](?i:{'|'.join(branches)})")
+
+
+SCANNER = _compile_scanner(PAY_VARIANTS)
+
+
+def _amount(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def pay_from_amounts(unit: str, low: float, high: Optional[float] = None) -> Tuple[float, Dict[str, Any]]:
+    """
+    (hourly rate, payRaw dict) for an hourly or annual ("hour"/"year") amount
+    or range. The rate is the range's midpoint, annual pay divided by
+    HOURS_PER_YEAR, to the cent.
+    """
+    value = low if high is None else (low + high) / 2.0
+    hourly = round(value if unit == "hour" else value / HOURS_PER_YEAR, 2)
+    kind = "hourly" if unit == "hour" else "annual"
+    if high is None:
+        return hourly, {"type": kind, "value": low}
+    raw = {"type": kind + "_range", "min": low, "max": high}
+    if unit == "year":
+        raw["annual_mid"] = value
+    return hourly, raw
+
+
+def pay_from_range(unit: str, low: float, high: float) -> Tuple[float, Dict[str, Any]]:
+    """pay_from_amounts for a listed min and max, which may be swapped or equal."""
+    if high < low:
+        low, high = high, low
+    return pay_from_amounts(unit, low, high if high != low else None)
+
+
+class PayMention(NamedTuple):
+    start: int
+    end: int
+    variant: int  # index into PAY_VARIANTS; lower is higher priority
+    unit: str
+    low: float
+    high: Optional[float]  # None for a single amount
+
+    @property
+    def type(self) -> str:
+        """hourly, hourly_range, annual or annual_range, as stored in payRaw."""
+        kind = "hourly" if self.unit == "hour" else "annual"
+        return kind if self.high is None else kind + "_range"
+
+    @property
+    def hourly(self) -> float:
+        return pay_from_amounts(self.unit, self.low, self.high)[0]
+
+    def raw(self) -> Dict[str, Any]:
+        """The payRaw dict written to the job record."""
+        return pay_from_amounts(self.unit, self.low, self.high)[1]
+
+
+def pay_mentions(text: str) -> List[PayMention]:
+    """
+    Every pay mention in the text, in order of position. At a given position
+    the highest-priority variant that matches is reported.
+    """
+    mentions: List[PayMention] = []
+    # Every variant states an amount in dollars
+    if not text or "$" not in text:
+        return mentions
+    pos = 0
+    while True:
+        m = SCANNER.search(text, pos)
+        if m is None:
+            return mentions
+        name = m.lastgroup
+        i = int(name[1:])
+        high = m.group(name + "_high") if name + "_high" in SCANNER.groupindex else None
+        mentions.append(PayMention(m.start(), m.end(), i, PAY_VARIANTS[i].unit,
+                                   _amount(m.group(name + "_low")), _amount(high) if high else None))
+        pos = m.start() + 1
+
+
+def has_pay_mention(text: str) -> bool:
+    """True if pay_mentions(text) would find anything."""
+    return bool(text) and "$" in text and SCANNER.search(text) is not None
+
+
+def first_hit(mentions: Sequence[PayMention]) -> Optional[PayMention]:
+    """The highest-priority variant's leftmost mention."""
+    return min(mentions, key=lambda mention: mention.variant, default=None)
+
+
+Policy = Callable[[Sequence[PayMention]], Optional[PayMention]]
+
+
+def hourly_pay(text: str, policy: Policy = first_hit) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+    """(hourly rate, payRaw dict) of the mention the policy picks, or (None, None)."""
+    mention = policy(pay_mentions(text))
+    if mention is None:
+        return None, None
+    return pay_from_amounts(mention.unit, mention.low, mention.high)
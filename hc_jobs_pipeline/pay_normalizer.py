@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+"""
+Numeric Pay Fields
+==================
+Turns the payRaw dicts pay_engine produces (hourly or annual, one amount or
+a range) into numeric fields kept on each job record, so consumers don't
+re-parse the ``"$23.5/hr"`` string:
+
+- ``payMin``, ``payMax``: the stated amounts as hourly rates
+- ``payHourlyMid``: the hourly midpoint, the number in ``pay``
+- ``payType``: how the pay was stated (hourly, hourly_range, annual, annual_range)
+- ``payFlags``: why the pay looks implausible, if it does
+
+``normalize_pay`` converts a whole batch at once. It uses NumPy when it is
+installed: annual-to-hourly conversion, midpoints and the outlier rules are
+array operations over the batch. Otherwise it falls back to a plain loop
+that gives the same fields.
+
+Flags:
+
+- ``below_minimum``, ``above_maximum``: the hourly midpoint is outside
+  MIN_PLAUSIBLE_HOURLY..MAX_PLAUSIBLE_HOURLY, usually a misread number
+- ``wide_range``: the top of the range is over MAX_RANGE_RATIO times the bottom
+- ``batch_outlier``: far from the rest of the batch (robust z-score of the
+  log hourly midpoint over OUTLIER_SCORE), in batches of MIN_OUTLIER_BATCH or more
+
+``pay_is_plausible`` applies the first two to a single payRaw; pay read from
+posting pages is only used when it passes. ``reflag_batch`` redoes the batch
+rule over records already carrying these fields, once pages have added pay.
+"""
+
+import math
+import statistics
+from typing import Any, Dict, List, Optional, Sequence
+
+from pay_engine import HOURS_PER_YEAR
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+HAVE_NUMPY = np is not None
+
+MIN_PLAUSIBLE_HOURLY = 10.0
+MAX_PLAUSIBLE_HOURLY = 200.0
+MAX_RANGE_RATIO = 3.0
+
+# Modified z-score (0.6745 * deviation / median absolute deviation) of the log
+# hourly midpoint above which pay is an outlier in its batch
+OUTLIER_SCORE = 3.5
+MIN_OUTLIER_BATCH = 20
+
+PAY_FIELDS = ("payMin", "payMax", "payHourlyMid", "payType", "payFlags")
+
+# Placeholders for records whose batch hasn't been normalized yet
+NO_PAY_FIELDS: Dict[str, Any] = dict.fromkeys(PAY_FIELDS)
+
+HARD_FLAGS = frozenset({"below_minimum", "above_maximum"})
+
+
+def _amounts(raw: Dict[str, Any]) -> tuple:
+    """(low, high, divisor to hourly) of a payRaw dict; high == low for one amount."""
+    low = float(raw["value"] if "value" in raw else raw["min"])
+    high = float(raw.get("max", low))
+    return low, high, (1.0 if raw["type"].startswith("hourly") else HOURS_PER_YEAR)
+
+
+def _flags(low: float, high: float, mid: float) -> List[str]:
+    flags = []
+    if mid < MIN_PLAUSIBLE_HOURLY:
+        flags.append("below_minimum")
+    if mid > MAX_PLAUSIBLE_HOURLY:
+        flags.append("above_maximum")
+    if high > MAX_RANGE_RATIO * low:
+        flags.append("wide_range")
+    return flags
+
+
+def pay_is_plausible(raw: Optional[Dict[str, Any]]) -> bool:
+    """True for a payRaw whose hourly midpoint is within the plausible range."""
+    if not raw:
+        return False
+    low, high, divisor = _amounts(raw)
+    return not HARD_FLAGS.intersection(_flags(low, high, round((low + high) / 2.0 / divisor, 2)))
+
+
+def normalize_pay(raws: Sequence[Optional[Dict[str, Any]]], use_numpy: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    The PAY_FIELDS of each payRaw in the batch, in order; None (no pay) gives
+    None fields and no flags. payHourlyMid is the hourly figure pay_engine
+    computed for the ``pay`` string, to the cent.
+    """
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    present = [i for i, raw in enumerate(raws) if raw]
+    fields = [dict(NO_PAY_FIELDS, payFlags=[]) for _ in raws]
+    if not present:
+        return fields
+    amounts = [_amounts(raws[i]) for i in present]
+    columns = _normalize_numpy(amounts) if use_numpy and HAVE_NUMPY else _normalize_loop(amounts)
+    for i, low, high, mid, flags in zip(present, *columns):
+        fields[i] = {"payMin": low, "payMax": high, "payHourlyMid": mid, "payType": raws[i]["type"], "payFlags": flags}
+    return fields
+
+
+def _normalize_loop(amounts: List[tuple]) -> tuple:
+    lows, highs, mids, flags = [], [], [], []
+    for low, high, divisor in amounts:
+        # Same operations, in the same order, as pay_engine.pay_from_amounts
+        mid = round((low + high) / 2.0 / divisor, 2)
+        lows.append(round(low / divisor, 2))
+        highs.append(round(high / divisor, 2))
+        mids.append(mid)
+        flags.append(_flags(low, high, mid))
+    for row_flags, outlier in zip(flags, _batch_outliers(mids)):
+        if outlier:
+            row_flags.append("batch_outlier")
+    return lows, highs, mids, flags
+
+
+def _batch_outliers(mids: Sequence[Optional[float]]) -> List[bool]:
+    """The batch rule per hourly midpoint; None (no pay) is never an outlier."""
+    logs = [math.log(mid) if mid is not None and mid > 0 else None for mid in mids]
+    valid = [value for value in logs if value is not None]
+    if len(valid) < MIN_OUTLIER_BATCH:
+        return [False] * len(mids)
+    center = statistics.median(valid)
+    spread = statistics.median(abs(value - center) for value in valid)
+    if spread == 0:
+        return [False] * len(mids)
+    return [value is not None and 0.6745 * abs(value - center) / spread > OUTLIER_SCORE for value in logs]
+
+
+def reflag_batch(records: Sequence[Dict[str, Any]]) -> None:
+    """
+    Redo the batch rule over records that already have PAY_FIELDS, such as a
+    jobs file after update_pay_from_urls filled in pay from posting pages, so
+    new pay is judged against the whole file and the file against it.
+    """
+    mids = [record.get("payHourlyMid") if isinstance(record.get("payHourlyMid"), (int, float)) else None
+            for record in records]
+    for record, mid, outlier in zip(records, mids, _batch_outliers(mids)):
+        if mid is None:
+            continue
+        flags = [flag for flag in record.get("payFlags") or [] if flag != "batch_outlier"]
+        record["payFlags"] = flags + ["batch_outlier"] if outlier else flags
+
+
+def _round_cents(values: "np.ndarray") -> List[float]:
+    # np.round rounds half-cents to even after scaling, where round() rounds the
+    # float's exact value; the two only disagree on ties, which are redone one by one
+    scaled = values * 100.0
+    rounded = np.round(scaled) / 100.0
+    for i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded.tolist()
+
+
+def _normalize_numpy(amounts: List[tuple]) -> tuple:
+    low, high, divisor = np.array(amounts, dtype=float).T
+    mid = np.array(_round_cents((low + high) / 2.0 / divisor))
+    below = mid < MIN_PLAUSIBLE_HOURLY
+    above = mid > MAX_PLAUSIBLE_HOURLY
+    wide = high > MAX_RANGE_RATIO * low
+    outlier = np.zeros(len(mid), dtype=bool)
+    positive = mid > 0
+    if positive.sum() >= MIN_OUTLIER_BATCH:
+        logs = np.log(np.where(positive, mid, 1.0))
+        center = np.median(logs[positive])
+        spread = np.median(np.abs(logs[positive] - center))
+        if spread > 0:
+            outlier = positive & (0.6745 * np.abs(logs - center) / spread > OUTLIER_SCORE)
+    # Most rows have no flags; only the flagged ones are visited
+    flags: List[List[str]] = [[] for _ in range(len(mid))]
+    for name, hits in (("below_minimum", below), ("above_maximum", above), ("wide_range", wide),
+                       ("batch_outlier", outlier)):
+        for i in np.flatnonzero(hits).tolist():
+            flags[i].append(name)
+    return _round_cents(low / divisor), _round_cents(high / divisor), mid.tolist(), flags
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+
+"""
+Regex Safety Mode: Bounded Windows and a Linear-Time Engine
+===========================================================
+Some rule patterns put an unbounded wildcard between two phrases
+(``high school.*required``, ``degree from.*university``). The ``re`` engine
+backtracks: each occurrence of the first phrase scans to the end of the
+line looking for the second. A long single-line description that repeats
+the first phrase but never follows it with the second costs time quadratic
+in its length.
+
+This module finds those patterns and makes them safe:
+
+    audit_pattern       reports unbounded wildcards (``.*``, ``[^x]+``,
+                        ``\\S*``) and nested quantifiers (``(a+)*``)
+    bound_pattern       rewrites unbounded wildcards into a bounded window
+                        (``.*`` -> ``.{0,200}``), so each start position
+                        scans at most ``window`` characters
+    linear_regex        compiles a pattern with RE2 (``pip install
+                        google-re2``) when installed and the pattern has no
+                        lookarounds or backreferences; RE2 runs in time
+                        linear in the text
+
+Safety mode is off by default and applies when rule bundles compile
+(``rule_bundle.set_regex_safety``), so every filter module picks it up.
+Rules keep their pattern strings and literal guards; only the engine that
+searches changes (see ``safe_engine``):
+
+    off      patterns as written
+    bounded  ``re`` on patterns with wildcards bounded to ``window`` characters
+    linear   RE2 on the patterns as written where it supports them, bounded
+             ``re`` otherwise
+
+Bounding changes results only when the two phrases are more than ``window``
+characters apart on one line. RE2's ``\\b``, ``\\w`` and ``\\s`` are
+ASCII-only, so linear mode can also differ next to non-ASCII letters or
+non-breaking spaces. ``budget_ms`` caps filter time per posting; see
+``filter_chain.FilterChain``.
+"""
+
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+    import sre_constants
+
+try:
+    import re2
+except ImportError:  # optional linear-time engine
+    re2 = None
+
+HAVE_LINEAR_ENGINE = re2 is not None
+
+SAFETY_MODES = ("off", "bounded", "linear")
+
+# Characters a rewritten wildcard may span; a long sentence, well under
+# RE2's repetition limit of 1000
+DEFAULT_WINDOW = 200
+
+# Per-posting filter time budget used when safety mode is on
+DEFAULT_BUDGET_MS = 250.0
+
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+_NEGATED_CATEGORIES = {
+    sre_constants.CATEGORY_NOT_SPACE, sre_constants.CATEGORY_NOT_WORD, sre_constants.CATEGORY_NOT_DIGIT,
+}
+_CATEGORY_PAIRS = (
+    {sre_constants.CATEGORY_SPACE, sre_constants.CATEGORY_NOT_SPACE},
+    {sre_constants.CATEGORY_WORD, sre_constants.CATEGORY_NOT_WORD},
+    {sre_constants.CATEGORY_DIGIT, sre_constants.CATEGORY_NOT_DIGIT},
+)
+# Constructs RE2 does not support
+_NOT_LINEAR = {sre_parse.ASSERT, sre_parse.ASSERT_NOT, sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS}
+_NOT_LINEAR |= {getattr(sre_parse, name) for name in ("ATOMIC_GROUP", "POSSESSIVE_REPEAT") if hasattr(sre_parse, name)}
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+class SafetySettings(NamedTuple):
+    """How rule patterns are compiled; the default leaves them untouched."""
+
+    mode: str = "off"
+    window: int = DEFAULT_WINDOW
+    budget_ms: Optional[float] = DEFAULT_BUDGET_MS
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def linear(self) -> bool:
+        return self.mode == "linear"
+
+    @property
+    def compile_key(self) -> Tuple:
+        """What compiled rule tables depend on (not the budget)."""
+        return (self.mode, self.window) if self.active else ("off",)
+
+    def validate(self) -> "SafetySettings":
+        if self.mode not in SAFETY_MODES:
+            raise ValueError(f"Unknown regex safety mode {self.mode!r}; expected one of {SAFETY_MODES}")
+        if not 1 <= self.window <= 1000:
+            raise ValueError(f"Safety window must be between 1 and 1000 characters, got {self.window}")
+        return self
+
+
+class Finding(NamedTuple):
+    """One risky construct in a pattern."""
+
+    kind: str     # "unbounded_wildcard" or "nested_quantifier"
+    detail: str   # e.g. "high school.*required"
+
+
+# === PARSE-TREE ANALYSIS ===
+
+def _is_broad(item) -> bool:
+    """True if a repeated item is a single character class matching most text (``.``, ``[^x]``, ``\\S``)."""
+    if len(item) != 1:
+        return False
+    op, av = item[0]
+    if op in (sre_parse.ANY, sre_parse.NOT_LITERAL):
+        return True
+    if op != sre_parse.IN:
+        return False
+    categories = {value for kind, value in av if kind == sre_parse.CATEGORY}
+    return (any(kind == sre_parse.NEGATE for kind, _ in av)
+            or bool(categories & _NEGATED_CATEGORIES)
+            or any(pair <= categories for pair in _CATEGORY_PAIRS))
+
+
+def _has_unbounded_repeat(items) -> bool:
+    for op, av in items:
+        if op in _REPEATS and (av[1] == sre_parse.MAXREPEAT or _has_unbounded_repeat(av[2])):
+            return True
+        if op == sre_parse.SUBPATTERN and _has_unbounded_repeat(av[-1]):
+            return True
+        if op == sre_parse.BRANCH and any(_has_unbounded_repeat(branch) for branch in av[1]):
+            return True
+    return False
+
+
+def _sample(items) -> str:
+    """A short string matching a parsed sequence (best effort; zero-width items ignored)."""
+    out = []
+    for op, av in items:
+        if op == sre_parse.LITERAL:
+            out.append(chr(av))
+        elif op in (sre_parse.ANY, sre_parse.NOT_LITERAL):
+            out.append("x")
+        elif op == sre_parse.IN:
+            kind, value = av[0]
+            if kind == sre_parse.LITERAL:
+                out.append(chr(value))
+            elif kind == sre_parse.RANGE:
+                out.append(chr(value[0]))
+            else:
+                out.append(" " if value == sre_constants.CATEGORY_SPACE else "x")
+        elif op == sre_parse.SUBPATTERN:
+            out.append(_sample(av[-1]))
+        elif op == sre_parse.BRANCH:
+            out.append(_sample(av[1][0]))
+        elif op in _REPEATS:
+            out.append(_sample(av[2]) * av[0])
+    return "".join(out)
+
+
+def _children(op, av):
+    if op == sre_parse.SUBPATTERN:
+        return [av[-1]]
+    if op == sre_parse.BRANCH:
+        return list(av[1])
+    if op in _REPEATS:
+        return [av[2]]
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return [av[1]]
+    if getattr(sre_parse, "ATOMIC_GROUP", None) == op:
+        return [av]
+    return []
+
+
+def _wildcards(items, found: List[Tuple[str, str]], prefix: str = "") -> None:
+    """
+    (text before, text after) for every unbounded broad repeat in a parsed
+    sequence. ``prefix`` carries what enclosing sequences matched first, since
+    the parser factors common prefixes out of alternations.
+    """
+    for i, (op, av) in enumerate(items):
+        if op in _REPEATS and av[1] == sre_parse.MAXREPEAT and _is_broad(av[2]):
+            found.append((prefix + _sample(items[:i]), _sample(items[i + 1:])))
+        for child in _children(op, av):
+            _wildcards(child, found, prefix + _sample(items[:i]))
+
+
+def _nested(items, found: List[str]) -> None:
+    for op, av in items:
+        if op in _REPEATS and av[1] > 1 and _has_unbounded_repeat(av[2]):
+            found.append(op)
+        for child in _children(op, av):
+            _nested(child, found)
+
+
+def _parse(pattern: str, flags: int):
+    parsed = sre_parse.parse(pattern, flags)
+    return parsed, flags | parsed.state.flags
+
+
+def audit_pattern(pattern: str, flags: int = 0) -> List[Finding]:
+    """Risky constructs in a pattern: unbounded wildcards and nested quantifiers."""
+    parsed, _ = _parse(pattern, flags)
+    wildcards: List[Tuple[str, str]] = []
+    _wildcards(parsed, wildcards)
+    findings = [Finding("unbounded_wildcard", f"{before}.*{after}") for before, after in wildcards]
+    nested: List[str] = []
+    _nested(parsed, nested)
+    findings += [Finding("nested_quantifier", "repeat of an unbounded repeat") for _ in nested]
+    return findings
+
+
+def adversarial_texts(pattern: str, flags: int = 0, size: int = 10000) -> List[str]:
+    """
+    One line per unbounded wildcard that makes it backtrack: the text after
+    the wildcard once (so literal guards pass), then the text before it
+    repeated to ``size`` characters and never followed by the text after.
+    Empty for patterns without unbounded wildcards.
+    """
+    parsed, all_flags = _parse(pattern, flags)
+    wildcards: List[Tuple[str, str]] = []
+    _wildcards(parsed, wildcards)
+    texts = []
+    for before, after in dict.fromkeys(wildcards):
+        head = f"{after or 'x'} | "
+        unit = f"{before or 'x'} "
+        text = head + unit * max(1, (size - len(head)) // len(unit))
+        texts.append(text.lower() if all_flags & re.IGNORECASE else text)
+    return texts
+
+
+# === BOUNDED REWRITE ===
+
+_UNBOUNDED_QUANTIFIER = re.compile(r"\*|\+|\{(\d*),\}")
+_COUNTED_QUANTIFIER = re.compile(r"\{\d*,?\d*\}")
+
+
+def _atom_end(pattern: str, i: int) -> int:
+    """End index of the atom (escape, class or single character) starting at ``i``."""
+    if pattern[i] == "\\":
+        return i + 2
+    if pattern[i] != "[":
+        return i + 1
+    j = i + 1
+    if j < len(pattern) and pattern[j] == "^":
+        j += 1
+    if j < len(pattern) and pattern[j] == "]":
+        j += 1
+    while j < len(pattern) and pattern[j] != "]":
+        j += 2 if pattern[j] == "\\" else 1
+    return j + 1
+
+
+def bound_pattern(pattern: str, flags: int = 0, window: int = DEFAULT_WINDOW) -> str:
+    """
+    Rewrite unbounded repeats of broad single-character atoms into windows
+    of at most ``window`` characters (``.*`` -> ``.{0,200}``, ``[^,]+?`` ->
+    ``[^,]{1,200}?``). Everything else, including ``\\s+`` and groups, is
+    left as written. Verbose patterns are returned unchanged.
+    """
+    _, all_flags = _parse(pattern, flags)
+    if all_flags & re.VERBOSE:
+        return pattern
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("(?#", i):
+            end = pattern.index(")", i) + 1
+            out.append(pattern[i:end])
+            i = end
+            continue
+        if pattern[i] in "()|^$*+?":
+            out.append(pattern[i])
+            i += 1
+            continue
+        counted = _COUNTED_QUANTIFIER.match(pattern, i)
+        if counted is not None:
+            # Quantifier of a group, copied as written
+            out.append(counted.group(0))
+            i = counted.end()
+            continue
+        end = _atom_end(pattern, i)
+        atom = pattern[i:end]
+        out.append(atom)
+        i = end
+        quantifier = _UNBOUNDED_QUANTIFIER.match(pattern, i)
+        if quantifier is None:
+            continue
+        if _is_broad(sre_parse.parse(atom, all_flags)):
+            minimum = int(quantifier.group(1) or 0) if quantifier.group(0) != "+" else 1
+            out.append(f"{{{minimum},{max(minimum, window)}}}")
+        else:
+            out.append(quantifier.group(0))
+        i = quantifier.end()
+    bounded = "".join(out)
+    re.compile(bounded, flags)
+    return bounded
+
+
+# === LINEAR-TIME ENGINE ===
+
+def _linear_supported(items) -> bool:
+    for op, av in items:
+        if op in _NOT_LINEAR:
+            return False
+        if not all(_linear_supported(child) for child in _children(op, av)):
+            return False
+    return True
+
+
+def _linear_source(pattern: str, flags: int) -> Optional[str]:
+    """Pattern with ``re`` flags inlined for RE2, or None if RE2 can't run it."""
+    parsed, all_flags = _parse(pattern, flags)
+    if all_flags & re.VERBOSE or not _linear_supported(parsed):
+        return None
+    inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    return f"(?{inline}){pattern}" if inline else pattern
+
+
+def linear_regex(pattern: str, flags: int = 0):
+    """
+    RE2 regex for the pattern, or None when RE2 is not installed or the
+    pattern needs backtracking features (lookarounds, backreferences).
+    The returned object has ``search``, ``match`` and ``finditer``.
+    """
+    if re2 is None:
+        return None
+    source = _linear_source(pattern, flags)
+    if source is None:
+        return None
+    try:
+        return re2.compile(source)
+    except re2.error:
+        return None
+
+
+def linear_set(patterns: List[str], flags: int = 0):
+    """
+    RE2 set reporting which of the patterns occur in a text, in one linear
+    pass (``.Match(text)`` -> indexes or None). None when RE2 is not
+    installed or doesn't support every pattern.
+    """
+    if re2 is None or not patterns:
+        return None
+    matcher = re2.Set.SearchSet()
+    for pattern in patterns:
+        source = _linear_source(pattern, flags)
+        if source is None:
+            return None
+        try:
+            matcher.Add(source)
+        except re2.error:
+            return None
+    matcher.Compile()
+    return matcher
+
+
+def safe_engine(pattern: str, flags: int = 0, settings: Optional[SafetySettings] = None):
+    """
+    What to search with under ``settings``: RE2 on the pattern as written
+    (linear mode, when supported), else ``re`` on the bounded rewrite. None
+    means the plain ``re`` compilation, i.e. safety off or nothing to bound.
+
+    RE2 is linear for unbounded wildcards, so they stay as written there;
+    bounded windows would only inflate its automaton.
+    """
+    if settings is None or not settings.active:
+        return None
+    if settings.linear:
+        engine = linear_regex(pattern, flags)
+        if engine is not None:
+            return engine
+    bounded = bound_pattern(pattern, flags, settings.window)
+    return re.compile(bounded, flags) if bounded != pattern else None
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+
+"""
+Per-Posting Rejection Log
+=========================
+filtering_stats.json only counts rejections per stage. When a good posting
+goes missing, the rejection log says which stage and which rule dropped it,
+and where in the text the rule matched, without re-running the filters.
+
+One fixed-size record is appended per rejected posting::
+
+    posting key  u64   first 8 bytes of blake2b(posting id); the id is the URL
+    run time     u32   epoch seconds when the run's log was opened
+    stage        u16   name id
+    rule         u16   name id; 0 when the stage gave no rule (e.g. location)
+    start, end   i32   match span in the text the rule read; -1 if none
+
+Records go to ``<path>`` (24 bytes each, little-endian) and the names they
+refer to go to ``<path>.names``, one per line, a record's ids being line
+numbers. Both grow across runs until an append would take the log past
+``max_bytes``; the pair is then rotated to ``<path>.1`` and
+``<path>.1.names`` (replacing the previous ones) and a new pair started, so
+the log takes at most about twice ``max_bytes``. Query ``<path>.1`` for
+older rejections.
+
+Rule names are the rule file table, with the row for tables:
+``SOFTWARE_ROLE[3]``, ``STRICT_HIGH_EXPERIENCE[2]``. Spans are into the lowercased text the stage read (title +
+description for role rules, the education text for degree and experience
+rules, the title for SENIOR_TITLE).
+
+With ``sample_rate`` below 1, a fixed fraction of posting keys is logged,
+so a given posting is either always or never logged across runs.
+collect() logs 5% by default (REJECTION_LOG_SAMPLE_RATE in run_collect).
+
+Query from the command line::
+
+    python rejection_log.py data/json/webScrape/rejections.bin why <posting url>
+    python rejection_log.py data/json/webScrape/rejections.bin top --limit 20
+"""
+
+import argparse
+import hashlib
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+RECORD = struct.Struct("<QIHHii")
+
+# Records buffered before an append to disk
+FLUSH_RECORDS = 4096
+
+# Bytes read per chunk when scanning a log (a multiple of the record size)
+READ_CHUNK = RECORD.size * 65536
+
+MAX_NAMES = 0xFFFF
+
+# Log size at which it's rotated (see the module docstring)
+MAX_LOG_BYTES = 64 * 2 ** 20
+
+
+def posting_key(posting_id: str) -> int:
+    """64-bit key of a posting id, as stored in the log."""
+    return int.from_bytes(hashlib.blake2b(posting_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def names_path(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".names")
+
+
+def rotated_path(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".1")
+
+
+def _read_names(path: Path) -> List[str]:
+    try:
+        names = path.read_text(encoding="utf-8").split("\n")[:-1]
+    except FileNotFoundError:
+        return [""]
+    return names or [""]
+
+
+class RejectionLog:
+    """
+    Append-only writer. ``record`` is cheap enough to call for every
+    rejection in collect(): a hash, a dict lookup and a struct pack into a
+    buffer that is appended to disk every FLUSH_RECORDS records. Use it as a
+    context manager (or close it in a ``finally``) so the buffer is written
+    when the run fails.
+    """
+
+    def __init__(self, path: Union[str, Path], sample_rate: float = 1.0, max_bytes: int = MAX_LOG_BYTES):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in [0, 1], got {sample_rate}")
+        if max_bytes < RECORD.size:
+            raise ValueError(f"max_bytes must hold at least one record, got {max_bytes}")
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.rotations = 0
+        self.run_time = int(time.time())
+        self.logged = 0
+        self._threshold = int(sample_rate * 2 ** 64)
+        self._names = _read_names(names_path(self.path))
+        self._ids: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        self._new_names: List[str] = []
+        self._buffer = bytearray()
+        self._buffered = 0
+        if self._names[0] != "":
+            raise ValueError(f"{names_path(self.path)} is not a rejection log names file")
+
+    def _id(self, name: str) -> int:
+        name_id = self._ids.get(name)
+        if name_id is None:
+            if len(self._names) >= MAX_NAMES:
+                raise ValueError(f"{self.path}: more than {MAX_NAMES} stage and rule names")
+            name_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._new_names.append(name.replace("\n", " "))
+        return name_id
+
+    def record(self, posting_id: str, stage: str, rejection=None) -> bool:
+        """Log one rejection (a filter_chain.Rejection or None); False if sampled out."""
+        key = posting_key(posting_id)
+        if key >= self._threshold:
+            return False
+        if rejection is None:
+            rule, start, end = 0, -1, -1
+        else:
+            rule, start, end = self._id(rejection.rule), rejection.start, rejection.end
+        self._buffer += RECORD.pack(key, self.run_time, self._id(stage), rule, start, end)
+        self.logged += 1
+        self._buffered += 1
+        if self._buffered >= FLUSH_RECORDS:
+            self.flush()
+        return True
+
+    def _rotate(self) -> None:
+        """Move the log and its names to ``<path>.1``; the new names file lists every name in use."""
+        rotated = rotated_path(self.path)
+        self.path.replace(rotated)
+        names = names_path(self.path)
+        if names.exists():
+            names.replace(names_path(rotated))
+        # Buffered records keep their ids, so the new file starts with all the names
+        self._new_names = [name.replace("\n", " ") for name in self._names[1:]]
+        self.rotations += 1
+
+    def flush(self) -> None:
+        if self._buffer:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(self._buffer) > self.max_bytes:
+                self._rotate()
+        # Names first, so every record on disk refers to a name on disk
+        if self._new_names:
+            with names_path(self.path).open("a", encoding="utf-8") as f:
+                # Line 0 is the empty name, for records without a rule
+                header = "" if f.tell() else "\n"
+                f.write(header + "".join(name + "\n" for name in self._new_names))
+            self._new_names = []
+        if self._buffer:
+            with self.path.open("ab") as f:
+                f.write(self._buffer)
+            self._buffer = bytearray()
+            self._buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "RejectionLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RejectionRecord(NamedTuple):
+    key: int
+    run_time: int
+    stage: str
+    rule: str
+    start: int
+    end: int
+
+    def describe(self) -> str:
+        when = datetime.fromtimestamp(self.run_time, timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+        where = f" at {self.start}-{self.end}" if self.start >= 0 else ""
+        return f"{when}  {self.stage}" + (f"  {self.rule}{where}" if self.rule else "")
+
+
+def _chunks(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        while True:
+            data = f.read(READ_CHUNK)
+            if not data:
+                return
+            # A run that died mid-append may leave a partial record at the end
+            yield data[:len(data) - len(data) % RECORD.size]
+
+
+def _columns(data: bytes, typecode: str) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def read_records(path: Union[str, Path]) -> Iterator[RejectionRecord]:
+    """Every record in the log, oldest first."""
+    path = Path(path)
+    names = _read_names(names_path(path))
+    for data in _chunks(path):
+        for key, run_time, stage, rule, start, end in RECORD.iter_unpack(data):
+            yield RejectionRecord(key, run_time, names[stage], names[rule], start, end)
+
+
+def why(path: Union[str, Path], posting_id: str) -> List[RejectionRecord]:
+    """Every logged rejection of one posting, oldest first."""
+    path = Path(path)
+    key = posting_key(posting_id)
+    names = _read_names(names_path(path))
+    found = []
+    step = RECORD.size // 8
+    for data in _chunks(path):
+        # Compare keys as a u64 column; unpack only the records that match
+        keys = _columns(data, "Q")[::step]
+        index = -1
+        while True:
+            try:
+                index = keys.index(key, index + 1)
+            except ValueError:
+                break
+            _, run_time, stage, rule, start, end = RECORD.unpack_from(data, index * RECORD.size)
+            found.append(RejectionRecord(key, run_time, names[stage], names[rule], start, end))
+    return found
+
+
+def top_rules(path: Union[str, Path], limit: Optional[int] = 20,
+              stage: Optional[str] = None) -> List[Tuple[str, str, int]]:
+    """(stage, rule, rejections) for the most frequent rules, most first."""
+    path = Path(path)
+    names = _read_names(names_path(path))
+    counts: Counter = Counter()
+    step = RECORD.size // 2
+    for data in _chunks(path):
+        # Stage and rule ids are u16 columns 6 and 7 of each record
+        ids = _columns(data, "H")
+        counts.update(zip(ids[6::step], ids[7::step]))
+    ranked = [(names[s], names[r], n) for (s, r), n in counts.most_common()]
+    if stage is not None:
+        ranked = [row for row in ranked if row[0] == stage]
+    return ranked[:limit] if limit else ranked
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Query a rejection log")
+    parser.add_argument("log", help="rejections.bin written by run_collect.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    why_parser = commands.add_parser("why", help="why was a posting excluded")
+    why_parser.add_argument("posting_id", help="posting URL (sourceFile)")
+    top_parser = commands.add_parser("top", help="rules by number of rejections")
+    top_parser.add_argument("--limit", type=int, default=20)
+    top_parser.add_argument("--stage", help="only rules of this stage")
+    args = parser.parse_args(argv)
+
+    if args.command == "why":
+        records = why(args.log, args.posting_id)
+        if not records:
+            print("No rejections logged for this posting (included, sampled out, or not seen)")
+            return 1
+        for record in records:
+            print(record.describe())
+        return 0
+
+    for stage, rule, count in top_rules(args.log, args.limit, args.stage):
+        print(f"{count:>10}  {stage:<24}  {rule or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
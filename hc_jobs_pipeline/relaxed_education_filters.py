@@ -6,9 +6,36 @@ RELAXED Education Filter for Healthcare Admin Jobs
 This version is more permissive to capture entry-level and experience-based positions.
 """
 
-import re
 from typing import Dict, List, Tuple
 
+from rule_bundle import RuleBundle, load_rules, on_reload
+
+# Rule tables are defined in rules/relaxed_education.json:
+# ADVANCED_REQUIRED_RULES / SENIOR_EXEC_RULES are the strict exclusions,
+# the single-pattern rules give analyze_relaxed_education_requirements its
+# exclusion reasons, and EDUCATION_LEVEL_RULES are checked in order.
+
+
+def _bind_rules(rules: RuleBundle) -> None:
+    """Bind the module's rule tables from a rule bundle (at import and on reload)."""
+    global ADVANCED_REQUIRED_RULES, SENIOR_EXEC_RULES, ADVANCED_DEGREE_RULE, DOCTORAL_DEGREE_RULE
+    global SENIOR_EXECUTIVE_RULE, EXTENSIVE_EXPERIENCE_RULE, EDUCATION_LEVEL_RULES
+
+    # STRICT EXCLUSIONS - Advanced degree requirements, senior executive roles
+    ADVANCED_REQUIRED_RULES = rules.table("ADVANCED_REQUIRED")
+    SENIOR_EXEC_RULES = rules.table("SENIOR_EXEC")
+
+    ADVANCED_DEGREE_RULE = rules.pattern("ADVANCED_DEGREE")
+    DOCTORAL_DEGREE_RULE = rules.pattern("DOCTORAL_DEGREE")
+    SENIOR_EXECUTIVE_RULE = rules.pattern("SENIOR_EXECUTIVE")
+    EXTENSIVE_EXPERIENCE_RULE = rules.pattern("EXTENSIVE_EXPERIENCE")
+
+    EDUCATION_LEVEL_RULES = rules.levels("EDUCATION_LEVELS")
+
+
+_bind_rules(load_rules("relaxed_education"))
+on_reload("relaxed_education", _bind_rules)
+
 def meets_relaxed_education_requirement(job_description: str, qualifications: str = "") -> bool:
     """
     More permissive education filter for healthcare admin jobs.
@@ -36,38 +63,12 @@ def meets_relaxed_education_requirement(job_description: str, qualifications: st
     full_text = f"{job_description} {qualifications}".lower()
     
     # STRICT EXCLUSIONS - Advanced degree requirements
-    advanced_required_patterns = [
-        r"master'?s? degree.{0,20}required",
-        r"master'?s? degree in",
-        r"masters? required",
-        r"mba required",
-        r"mha required", 
-        r"mph required",
-        r"doctoral? degree required",
-        r"ph\.?d\.? required",
-        r"doctorate required"
-    ]
-    
-    for pattern in advanced_required_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return False  # Exclude overqualified positions
+    if ADVANCED_REQUIRED_RULES.any(full_text):
+        return False  # Exclude overqualified positions
     
     # STRICT EXCLUSIONS - Senior executive roles
-    senior_exec_patterns = [
-        r"chief executive officer",
-        r"chief operating officer", 
-        r"chief financial officer",
-        r"vice president",
-        r"senior vice president",
-        r"executive vice president",
-        r"10\+? years? experience",
-        r"15\+? years? experience",
-        r"20\+? years? experience"
-    ]
-    
-    for pattern in senior_exec_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return False  # Exclude senior positions
+    if SENIOR_EXEC_RULES.any(full_text):
+        return False  # Exclude senior positions
     
     # EVERYTHING ELSE IS INCLUDED!
     # This includes:
@@ -93,33 +94,27 @@ def analyze_relaxed_education_requirements(job_description: str, qualifications:
     exclusion_reasons = []
     
     # Advanced degree requirements
-    if re.search(r"master'?s? degree.{0,20}required|master'?s? degree in|masters? required|mba required|mha required|mph required", full_text, re.IGNORECASE):
+    if ADVANCED_DEGREE_RULE.search(full_text):
         exclusion_reasons.append("Advanced degree required")
     
-    if re.search(r"doctoral? degree required|ph\.?d\.? required|doctorate required", full_text, re.IGNORECASE):
+    if DOCTORAL_DEGREE_RULE.search(full_text):
         exclusion_reasons.append("Doctoral degree required")
     
     # Senior executive roles
-    if re.search(r"chief executive officer|chief operating officer|chief financial officer|vice president", full_text, re.IGNORECASE):
+    if SENIOR_EXECUTIVE_RULE.search(full_text):
         exclusion_reasons.append("Senior executive position")
     
-    if re.search(r"10\+? years? experience|15\+? years? experience|20\+? years? experience", full_text, re.IGNORECASE):
+    if EXTENSIVE_EXPERIENCE_RULE.search(full_text):
         exclusion_reasons.append("Extensive experience required")
     
     should_include = len(exclusion_reasons) == 0
     
     # Determine education level mentioned
     education_level = "Unknown"
-    if re.search(r"high school|hs diploma|ged", full_text, re.IGNORECASE):
-        education_level = "High School"
-    elif re.search(r"associate'?s? degree|aa degree|as degree", full_text, re.IGNORECASE):
-        education_level = "Associates"
-    elif re.search(r"bachelor'?s? degree|ba degree|bs degree", full_text, re.IGNORECASE):
-        education_level = "Bachelors"
-    elif re.search(r"master'?s? degree|mba|mha|mph", full_text, re.IGNORECASE):
-        education_level = "Masters"
-    elif re.search(r"certificate|certification program", full_text, re.IGNORECASE):
-        education_level = "Certificate"
+    for level, rule in EDUCATION_LEVEL_RULES:
+        if rule.search(full_text):
+            education_level = level
+            break
     
     reasoning = f"Education level: {education_level}"
     if exclusion_reasons:
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+
+"""
+Declarative Rule Files and Cached Matcher Bundles
+=================================================
+Filter rules live once, as data, in ``rules/*.json``, and the filter
+modules bind their tables from there. This module compiles a rule file into
+a ``RuleBundle``: guarded patterns, rule tables, keyword automata and
+combined matchers, built lazily per table.
+
+Deriving literal guards and first-character sets walks every pattern's
+parse tree. That analysis is cached on disk in ``rules/__pycache__`` and keyed
+by the sha256 of the rule file, so startup loads it instead of re-deriving
+it, and editing a rule file invalidates it. Compiled ``re`` programs can't
+be serialized, so ``re.compile`` itself still runs on load.
+
+Pattern lists several filter modules share (degree terms) are defined once,
+in a shared rule file, and included by reference: an ``{"include":
+"file.TABLE"}`` or ``{"include": "file.TABLE.group"}`` entry in a pattern
+list is replaced by those patterns, in place, when the file is loaded.
+Included tables must have the including table's flags, and a shared file
+can't include others. The cache key covers the included files too.
+
+Long-running processes call ``reload_if_changed()`` to pick up edited
+rule files. Modules that bind tables to globals register a callback with
+``on_reload()`` to rebind them. ``set_regex_safety()`` recompiles every
+bundle in a regex safety mode (see regex_safety) and rebinds the same way.
+
+Rule file format::
+
+    {
+      "description": "...",
+      "tables": {
+        "NAME": {"kind": "table", "flags": "i", "description": "...",
+                 "patterns": ["...", {"name": "group", "comment": "...", "patterns": ["..."]},
+                              {"include": "shared_file.TABLE.group"}]},
+        ...
+      },
+      "values": {"NAME": <any JSON value>}
+    }
+
+Table kinds:
+    patterns     raw pattern list (families the module combines itself)
+    table        ordered RuleTable
+    pattern      one GuardedPattern ("pattern")
+    alternation  one GuardedPattern joining other tables or groups ("of": ["TABLE", "TABLE.group"])
+    keywords     literal keyword list with a KeywordAutomaton ("keywords", optional "word_boundary")
+    tracks       ordered (label, RuleTable) pairs ("tracks": [{"track", "patterns"}])
+    levels       ordered (label, GuardedPattern) pairs ("levels": [{"level", "pattern"}])
+
+``years(TABLE)`` builds a ``table`` or ``patterns`` table as a YearsRule
+instead: the same patterns, with the years-of-experience ones evaluated
+numerically (see experience_years).
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from compiled_rules import CombinedMatcher, GuardedPattern, PatternAnalysis, RuleTable, analyze_pattern
+from keyword_automaton import KeywordAutomaton, keyword_automaton
+from regex_safety import SafetySettings
+from experience_years import YearsRule
+
+RULES_DIR = Path(__file__).resolve().parent / "rules"
+
+# Analysis cache, next to the rule files (gitignored like any __pycache__)
+CACHE_SUBDIR = "__pycache__"
+
+# Bump when the cached analysis format or derivation changes
+BUNDLE_FORMAT = 1
+
+RULE_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL}
+
+PATTERN_KINDS = ("patterns", "table", "pattern", "alternation", "tracks", "levels")
+
+# Pattern-list entry naming patterns of another rule file: "file.TABLE" or "file.TABLE.group"
+INCLUDE_KEY = "include"
+
+# How bundles compile patterns; changed with set_regex_safety()
+REGEX_SAFETY = SafetySettings()
+
+
+class RuleFileError(ValueError):
+    """A rule file is malformed or references a table that doesn't exist."""
+
+
+def parse_flags(flags: str) -> int:
+    value = 0
+    for flag in flags or "":
+        if flag not in RULE_FLAGS:
+            raise RuleFileError(f"Unknown rule flag {flag!r}")
+        value |= RULE_FLAGS[flag]
+    return value
+
+
+def flatten_patterns(entries: List[Any]) -> List[str]:
+    """Pattern strings of a table, with groups expanded in order."""
+    patterns: List[str] = []
+    for entry in entries:
+        if isinstance(entry, str):
+            patterns.append(entry)
+        else:
+            patterns.extend(entry["patterns"])
+    return patterns
+
+
+def group_patterns(entries: List[Any], group: str) -> List[str]:
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("name") == group:
+            return list(entry["patterns"])
+    raise RuleFileError(f"No pattern group named {group!r}")
+
+
+def source_hash(data: bytes, included: Optional[Dict[str, bytes]] = None) -> str:
+    """Cache key: rule file and included file contents plus everything the derived analysis depends on."""
+    digest = hashlib.sha256(data)
+    for name in sorted(included or {}):
+        digest.update(f"\0include={name}\0".encode())
+        digest.update(included[name])
+    digest.update(f"format={BUNDLE_FORMAT};python={sys.version_info[0]}.{sys.version_info[1]}".encode())
+    return digest.hexdigest()
+
+
+def _read_spec(rules_dir: Path, name: str) -> Tuple[bytes, Dict[str, Any]]:
+    path = rules_dir / f"{name}.json"
+    data = path.read_bytes()
+    try:
+        return data, json.loads(data.decode("utf-8"))
+    except ValueError as e:
+        raise RuleFileError(f"{path}: {e}") from None
+
+
+def _group_entries(entries: List[Any]) -> List[Any]:
+    """Entries of a pattern list with groups opened one level."""
+    return [inner for entry in entries
+            for inner in (entry["patterns"] if isinstance(entry, dict) and "patterns" in entry else [entry])]
+
+
+def _expand_includes(name: str, spec: Dict[str, Any], rules_dir: Path) -> Dict[str, bytes]:
+    """
+    Replace include entries in the spec's pattern lists with the patterns
+    they name, in place. Returns the contents of each included file.
+    """
+    included: Dict[str, bytes] = {}
+    shared: Dict[str, Dict[str, Any]] = {}
+
+    def resolve(reference: str, flags: str) -> List[str]:
+        source, _, table = reference.partition(".")
+        if source not in shared:
+            data, shared[source] = _read_spec(rules_dir, source)
+            included[source] = data
+        table, _, group = table.partition(".")
+        try:
+            entry = shared[source]["tables"][table]
+        except KeyError:
+            raise RuleFileError(f"{name}: no table {table!r} in {source!r}") from None
+        if entry["kind"] not in ("patterns", "table"):
+            raise RuleFileError(f"{name}: included table {reference!r} is {entry['kind']!r}")
+        if entry.get("flags", "") != flags:
+            raise RuleFileError(f"{name}: included table {reference!r} has flags {entry.get('flags', '')!r}, "
+                                f"expected {flags!r}")
+        if any(isinstance(e, dict) and INCLUDE_KEY in e for e in _group_entries(entry["patterns"])):
+            raise RuleFileError(f"{name}: included table {reference!r} includes other tables")
+        return group_patterns(entry["patterns"], group) if group else flatten_patterns(entry["patterns"])
+
+    def expand(entries: List[Any], flags: str) -> List[Any]:
+        expanded: List[Any] = []
+        for entry in entries:
+            if isinstance(entry, dict) and INCLUDE_KEY in entry:
+                expanded.extend(resolve(entry[INCLUDE_KEY], flags))
+            elif isinstance(entry, dict):
+                expanded.append(dict(entry, patterns=expand(entry["patterns"], flags)))
+            else:
+                expanded.append(entry)
+        return expanded
+
+    for entry in spec.get("tables", {}).values():
+        if entry.get("kind") in ("patterns", "table"):
+            entry["patterns"] = expand(entry["patterns"], entry.get("flags", ""))
+    return included
+
+
+class RuleBundle:
+    """Compiled tables for one rule file, built on first use."""
+
+    def __init__(self, name: str, spec: Dict[str, Any], digest: str,
+                 analysis: Dict[Tuple[str, int], PatternAnalysis], safety: Optional[SafetySettings] = None,
+                 includes: Tuple[str, ...] = ()):
+        self.name = name
+        self.spec = spec
+        self.digest = digest
+        # Shared rule files this one includes patterns from
+        self.includes = includes
+        self.safety = safety
+        self._analysis = analysis
+        self._compiled: Dict[str, Any] = {}
+
+    # --- raw data ---
+
+    def _table_spec(self, table: str, kinds: Tuple[str, ...]) -> Dict[str, Any]:
+        try:
+            entry = self.spec["tables"][table]
+        except KeyError:
+            raise RuleFileError(f"{self.name}: no table {table!r}") from None
+        if entry["kind"] not in kinds:
+            raise RuleFileError(f"{self.name}: table {table!r} is {entry['kind']!r}, expected one of {kinds}")
+        return entry
+
+    def flags(self, table: str) -> int:
+        return parse_flags(self._table_spec(table, PATTERN_KINDS).get("flags", ""))
+
+    def patterns(self, table: str) -> List[str]:
+        """Pattern strings of a ``patterns`` or ``table`` table, groups flattened."""
+        return flatten_patterns(self._table_spec(table, ("patterns", "table"))["patterns"])
+
+    def keywords(self, table: str) -> List[str]:
+        return list(self._table_spec(table, ("keywords",))["keywords"])
+
+    def value(self, name: str) -> Any:
+        try:
+            return self.spec["values"][name]
+        except KeyError:
+            raise RuleFileError(f"{self.name}: no value {name!r}") from None
+
+    def _resolve(self, reference: str) -> List[str]:
+        table, _, group = reference.partition(".")
+        entries = self._table_spec(table, ("patterns", "table"))["patterns"]
+        return group_patterns(entries, group) if group else flatten_patterns(entries)
+
+    def pattern_source(self, table: str) -> str:
+        """Regex source of a ``pattern`` or ``alternation`` table."""
+        entry = self._table_spec(table, ("pattern", "alternation"))
+        if entry["kind"] == "pattern":
+            return entry["pattern"]
+        return "|".join(p for reference in entry["of"] for p in self._resolve(reference))
+
+    # --- compiled objects ---
+
+    def _guard(self, pattern: str, flags: int):
+        analysis = self._analysis.get((pattern, flags))
+        return analysis[0] if analysis is not None else None
+
+    def _memo(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self._compiled:
+            self._compiled[key] = build()
+        return self._compiled[key]
+
+    def pattern(self, table: str) -> GuardedPattern:
+        def build():
+            source, flags = self.pattern_source(table), self.flags(table)
+            return GuardedPattern(source, flags, self._guard(source, flags), self.safety)
+        return self._memo("pattern:" + table, build)
+
+    def table(self, table: str) -> RuleTable:
+        def build():
+            flags = self.flags(table)
+            patterns = self.patterns(table)
+            return RuleTable(patterns, flags, {p: self._guard(p, flags) for p in patterns if (p, flags) in self._analysis},
+                             self.safety)
+        return self._memo("table:" + table, build)
+
+    def combined(self, patterns: List[str], flags: int) -> CombinedMatcher:
+        """CombinedMatcher over patterns from this bundle, using the cached analysis."""
+        analysis = {p: self._analysis[(p, flags)] for p in patterns if (p, flags) in self._analysis}
+        return CombinedMatcher(patterns, flags, analysis, self.safety)
+
+    def automaton(self, table: str) -> KeywordAutomaton:
+        entry = self._table_spec(table, ("keywords",))
+        return keyword_automaton(entry["keywords"], bool(entry.get("word_boundary", False)))
+
+    def tracks(self, table: str) -> List[Tuple[str, RuleTable]]:
+        def build():
+            entry = self._table_spec(table, ("tracks",))
+            flags = parse_flags(entry.get("flags", ""))
+            return [
+                (track["track"], RuleTable(track["patterns"], flags,
+                                           {p: self._guard(p, flags) for p in track["patterns"]
+                                            if (p, flags) in self._analysis}, self.safety))
+                for track in entry["tracks"]
+            ]
+        return self._memo("tracks:" + table, build)
+
+    def levels(self, table: str) -> List[Tuple[str, GuardedPattern]]:
+        def build():
+            entry = self._table_spec(table, ("levels",))
+            flags = parse_flags(entry.get("flags", ""))
+            return [(level["level"], GuardedPattern(level["pattern"], flags, self._guard(level["pattern"], flags),
+                                                    self.safety))
+                    for level in entry["levels"]]
+        return self._memo("levels:" + table, build)
+
+    def years(self, table: str) -> YearsRule:
+        """A ``table`` or ``patterns`` table as a YearsRule (same patterns and results as ``table``)."""
+        def build():
+            flags = self.flags(table)
+            patterns = self.patterns(table)
+            return YearsRule(patterns, flags, {p: self._guard(p, flags) for p in patterns if (p, flags) in self._analysis},
+                             self.safety, f"{self.name}.{table}")
+        return self._memo("years:" + table, build)
+
+
+def _spec_patterns(bundle: RuleBundle) -> List[Tuple[str, int]]:
+    """Every (pattern, flags) a bundle can compile, for the analysis cache."""
+    found: List[Tuple[str, int]] = []
+    for table, entry in bundle.spec.get("tables", {}).items():
+        kind = entry.get("kind")
+        if kind not in PATTERN_KINDS:
+            continue
+        flags = parse_flags(entry.get("flags", ""))
+        if kind in ("patterns", "table"):
+            found += [(p, flags) for p in flatten_patterns(entry["patterns"])]
+        elif kind in ("pattern", "alternation"):
+            found.append((bundle.pattern_source(table), flags))
+        elif kind == "tracks":
+            found += [(p, flags) for track in entry["tracks"] for p in track["patterns"]]
+        elif kind == "levels":
+            found += [(level["pattern"], flags) for level in entry["levels"]]
+    return list(dict.fromkeys(found))
+
+
+def _cache_path(rules_dir: Path, name: str, digest: str) -> Path:
+    return rules_dir / CACHE_SUBDIR / f"{name}.{digest[:16]}.json"
+
+
+def _read_cached_analysis(rules_dir: Path, name: str,
+                          digest: str) -> Optional[Dict[Tuple[str, int], PatternAnalysis]]:
+    try:
+        cached = json.loads(_cache_path(rules_dir, name, digest).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("digest") != digest:
+        return None
+    return {
+        (pattern, flags): (tuple(guard), frozenset(chars) if chars is not None else None)
+        for pattern, flags, guard, chars in cached["patterns"]
+    }
+
+
+def _write_cached_analysis(rules_dir: Path, name: str, digest: str, analysis: Dict[Tuple[str, int], PatternAnalysis]) -> None:
+    payload = {
+        "digest": digest,
+        "patterns": [
+            [pattern, flags, list(guard), sorted(chars) if chars is not None else None]
+            for (pattern, flags), (guard, chars) in analysis.items()
+        ],
+    }
+    path = _cache_path(rules_dir, name, digest)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        for stale in path.parent.glob(f"{name}.*.json"):
+            stale.unlink()
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # Read-only checkout: compile every time, same results
+        pass
+
+
+def compile_rules(name: str, rules_dir: Optional[Path] = None, use_cache: bool = True,
+                  safety: Optional[SafetySettings] = None) -> RuleBundle:
+    """
+    Build the bundle for ``rules/<name>.json``, reusing cached analysis when current.
+
+    Patterns run in the ``safety`` mode, by default the process-wide REGEX_SAFETY.
+    """
+    rules_dir = Path(rules_dir or RULES_DIR)
+    data, spec = _read_spec(rules_dir, name)
+    included = _expand_includes(name, spec, rules_dir)
+    digest = source_hash(data, included)
+
+    analysis = _read_cached_analysis(rules_dir, name, digest) if use_cache else None
+    bundle = RuleBundle(name, spec, digest, analysis or {}, safety or REGEX_SAFETY, tuple(sorted(included)))
+    if analysis is None:
+        bundle._analysis = {key: analyze_pattern(*key) for key in _spec_patterns(bundle)}
+        if use_cache:
+            _write_cached_analysis(rules_dir, name, digest, bundle._analysis)
+    return bundle
+
+
+_BUNDLES: Dict[str, RuleBundle] = {}
+_MTIMES: Dict[str, Tuple[float, ...]] = {}
+_RELOAD_CALLBACKS: Dict[str, List[Callable[[RuleBundle], None]]] = {}
+
+
+def _mtime(name: str) -> float:
+    try:
+        return (RULES_DIR / f"{name}.json").stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _source_mtimes(bundle: RuleBundle) -> Tuple[float, ...]:
+    """Modification times of a bundle's rule file and the files it includes."""
+    return tuple(_mtime(name) for name in (bundle.name,) + bundle.includes)
+
+
+def _source_digest(name: str) -> str:
+    data, spec = _read_spec(RULES_DIR, name)
+    return source_hash(data, _expand_includes(name, spec, RULES_DIR))
+
+
+def load_rules(name: str) -> RuleBundle:
+    """Shared bundle for a rule file, compiled on first request."""
+    if name not in _BUNDLES:
+        _BUNDLES[name] = compile_rules(name)
+        _MTIMES[name] = _source_mtimes(_BUNDLES[name])
+    return _BUNDLES[name]
+
+
+def on_reload(name: str, callback: Callable[[RuleBundle], None]) -> None:
+    """Call ``callback(bundle)`` whenever ``reload_if_changed`` rebuilds this rule file."""
+    _RELOAD_CALLBACKS.setdefault(name, []).append(callback)
+
+
+def _rebuild(name: str) -> None:
+    _BUNDLES[name] = compile_rules(name)
+    _MTIMES[name] = _source_mtimes(_BUNDLES[name])
+    for callback in _RELOAD_CALLBACKS.get(name, []):
+        callback(_BUNDLES[name])
+
+
+def set_regex_safety(settings: SafetySettings) -> List[str]:
+    """
+    Run rule patterns in a regex safety mode from now on, rebuilding and
+    rebinding every loaded bundle. Returns the names of the rebuilt rule
+    files (none when only the budget changed).
+    """
+    global REGEX_SAFETY
+    previous, REGEX_SAFETY = REGEX_SAFETY, settings.validate()
+    if previous.compile_key == settings.compile_key:
+        return []
+    for name in list(_BUNDLES):
+        _rebuild(name)
+    return list(_BUNDLES)
+
+
+def reload_if_changed() -> List[str]:
+    """
+    Rebuild bundles whose rule file, or a file it includes, changed since it
+    was loaded.
+
+    Cheap enough to call between batches in daemon mode: an unchanged file
+    costs one stat() per file. Returns the names of the reloaded rule files.
+    """
+    reloaded = []
+    for name, bundle in list(_BUNDLES.items()):
+        mtimes = _source_mtimes(bundle)
+        if mtimes == _MTIMES.get(name):
+            continue
+        _MTIMES[name] = mtimes
+        try:
+            digest = _source_digest(name)
+        except OSError:
+            continue
+        if digest == bundle.digest:
+            continue
+        _rebuild(name)
+        reloaded.append(name)
+    return reloaded
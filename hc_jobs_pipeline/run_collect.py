@@ -1,18 +1,71 @@
 import json
 import re
-from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import httpx
 from bs4 import BeautifulSoup
-from dateutil import parser as dtparser
 from rapidfuzz import fuzz
 
 # Import our education filtering logic
+from date_utils import parse_date, utc_timestamp
+from filter_chain import BUDGET_REASON, FilterChain, FilterStage, Rejection
+from rejection_log import RejectionLog
 from enhanced_qualifications import QualificationsExtractor
-
-def meets_entry_level_requirement(job_description: str, title: str, qualifications: str = "") -> bool:
+from location_resolver import STATE_REGION, ResolvedLocation, resolve_location
+from pay_engine import has_pay_mention, hourly_pay, pay_from_range
+from pay_normalizer import NO_PAY_FIELDS, normalize_pay
+from regex_safety import SafetySettings
+from rule_bundle import RuleBundle, load_rules, on_reload, reload_if_changed, set_regex_safety
+from section_segmenter import HeadingIndex, PostingSections, segment_posting
+from update_pay_from_urls import PayEnricher, apply_page, host_stats_path, load_host_stats, needs_pay
+
+# === RULE TABLES ===
+# Defined in rules/strict_entry_level.json and compiled once into a rule
+# bundle; see compiled_rules for the literal guards. SENIOR_TITLE_RULES is
+# matched against the lowercased title, the description rules against
+# lowercased text.
+
+
+def _bind_rules(rules: RuleBundle) -> None:
+    """Bind the module's rule tables from a rule bundle (at import and on reload)."""
+    global BACHELORS_MENTIONED_RULE, STRICT_ADVANCED_DEGREE_RULES, STRICT_HIGH_EXPERIENCE_RULES, SENIOR_TITLE_RULES
+    global ENTRY_LEVEL_TITLE_HINTS, EXCLUDE_TITLE_HINTS, ENTRY_LEVEL_TITLE_AUTOMATON, EXCLUDE_TITLE_AUTOMATON
+    global CAREER_TRACK_RULES, COMPILED_CAREER_TRACK_RULES
+    global ENTRY_LEVEL_DESCRIPTION_RULE, SENIOR_EXPERIENCE_DESCRIPTION_RULE, CLINICAL_ROLE_RULE, SOFTWARE_ROLE_RULES
+    global ADMIN_HINTS, ADMIN_HINT_AUTOMATON
+
+    BACHELORS_MENTIONED_RULE = rules.pattern("BACHELORS_MENTIONED")
+    STRICT_ADVANCED_DEGREE_RULES = rules.table("STRICT_ADVANCED_DEGREE")
+    STRICT_HIGH_EXPERIENCE_RULES = rules.table("STRICT_HIGH_EXPERIENCE")
+    SENIOR_TITLE_RULES = rules.table("SENIOR_TITLE")
+
+    # One-pass keyword matchers for the title hint lists (plain substring semantics)
+    ENTRY_LEVEL_TITLE_HINTS = rules.keywords("ENTRY_LEVEL_TITLE_HINTS")
+    EXCLUDE_TITLE_HINTS = rules.keywords("EXCLUDE_TITLE_HINTS")
+    ENTRY_LEVEL_TITLE_AUTOMATON = rules.automaton("ENTRY_LEVEL_TITLE_HINTS")
+    EXCLUDE_TITLE_AUTOMATON = rules.automaton("EXCLUDE_TITLE_HINTS")
+
+    COMPILED_CAREER_TRACK_RULES = rules.tracks("CAREER_TRACKS")
+    CAREER_TRACK_RULES = [(track, table.patterns) for track, table in COMPILED_CAREER_TRACK_RULES]
+
+    # entry_level_flag description fallbacks
+    ENTRY_LEVEL_DESCRIPTION_RULE = rules.pattern("ENTRY_LEVEL_DESCRIPTION")
+    SENIOR_EXPERIENCE_DESCRIPTION_RULE = rules.pattern("SENIOR_EXPERIENCE_DESCRIPTION")
+
+    # looks_like_health_admin exclusions and admin keywords
+    CLINICAL_ROLE_RULE = rules.pattern("CLINICAL_ROLE")
+    SOFTWARE_ROLE_RULES = rules.table("SOFTWARE_ROLE")
+    ADMIN_HINTS = rules.keywords("ADMIN_HINTS")
+    ADMIN_HINT_AUTOMATON = rules.automaton("ADMIN_HINTS")
+
+
+_bind_rules(load_rules("strict_entry_level"))
+on_reload("strict_entry_level", _bind_rules)
+
+def meets_entry_level_requirement(job_description: str, title: str, qualifications: str = "",
+                                  sections: Optional[PostingSections] = None) -> bool:
     """
     STRICT bachelor's degree filtering for recent graduates with healthcare admin degrees.
 
@@ -29,250 +82,66 @@ def meets_entry_level_requirement(job_description: str, title: str, qualificatio
     - Senior/executive positions
     - Clinical roles (RN, NP, etc.)
     - Jobs that don't mention bachelor's degree at all
-    """
-    full_text = f"{job_description} {qualifications}".lower()
-    title_lower = (title or "").lower()
 
+    When ``sections`` is given and the posting has a qualifications/education
+    section, responsibilities, benefits/compensation and EEO text is skipped.
+    """
+    scoped_text = sections.education_text() if sections is not None else None
+    if scoped_text is None:
+        scoped_text = job_description
+    full_text = f"{scoped_text} {qualifications}".lower()
+    return _meets_entry_level(full_text, (title or "").lower())
+
+def _meets_entry_level(full_text: str, title_lower: str) -> bool:
+    """meets_entry_level_requirement on already lowercased education text and title."""
+    return _entry_level_rejection(full_text, title_lower) is None
+
+def _entry_level_rejection(full_text: str, title_lower: str) -> Optional[Rejection]:
+    """The rule that excludes the posting from entry level, or None if it is included."""
     # MANDATORY: Bachelor's degree must be mentioned somewhere in the posting
-    bachelors_mentioned = re.search(r"bachelor'?s?\s+degree|bachelor'?s?\b|\bbachelor'?s?\s+or\s+equivalent", full_text, re.IGNORECASE)
-
     # If no bachelor's degree mentioned at all, exclude immediately
-    if not bachelors_mentioned:
-        return False
+    if not BACHELORS_MENTIONED_RULE.search(full_text):
+        return Rejection("BACHELORS_MENTIONED")
 
     # EXCLUDE: Advanced degree requirements (even if bachelor's is mentioned)
-    advanced_degree_patterns = [
-        r"master'?s? degree.{0,20}required",
-        r"masters? required",
-        r"mba required",
-        r"mha required",
-        r"mph required",
-        r"doctoral? degree required",
-        r"ph\.?d\.? required",
-        r"doctorate required"
-    ]
-
-    for pattern in advanced_degree_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return False
+    hit = STRICT_ADVANCED_DEGREE_RULES.search(full_text)
+    if hit:
+        index, match = hit
+        return Rejection(f"STRICT_ADVANCED_DEGREE[{index}]", match.start(), match.end())
 
     # EXCLUDE: High experience requirements (3+ years)
-    high_exp_patterns = [
-        r"3\+? years? experience",
-        r"4\+? years? experience",
-        r"5\+? years? experience",
-        r"6\+? years? experience",
-        r"7\+? years? experience",
-        r"8\+? years? experience",
-        r"9\+? years? experience",
-        r"10\+? years? experience"
-    ]
-
-    for pattern in high_exp_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return False
-
-    # EXCLUDE: Senior/executive positions
-    senior_patterns = [
-        r"\bdirector\b",
-        r"\bsenior director\b",
-        r"\bvp\b",
-        r"vice president",
-        r"\bchief\b",
-        r"\bcfo\b",
-        r"\bcoo\b",
-        r"\bceo\b",
-        r"senior manager",
-        r"sr manager",
-        r"principal"
-    ]
-
-    for pattern in senior_patterns:
-        if re.search(pattern, title_lower):
-            return False
+    hit = STRICT_HIGH_EXPERIENCE_RULES.search(full_text)
+    if hit:
+        index, match = hit
+        return Rejection(f"STRICT_HIGH_EXPERIENCE[{index}]", match.start(), match.end())
 
-    # INCLUDE: Since bachelor's is mentioned and we passed all exclusions, include the job
-    return True
-
-    # EXCLUDE: High experience requirements (3+ years)
-    # Recent graduates typically have 0-2 years experience max
-    high_exp_patterns = [
-        r"3\+? years? experience",
-        r"4\+? years? experience",
-        r"5\+? years? experience",
-        r"6\+? years? experience",
-        r"7\+? years? experience",
-        r"8\+? years? experience",
-        r"9\+? years? experience",
-        r"10\+? years? experience"
-    ]
-
-    for pattern in high_exp_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return False
-
-    # EXCLUDE: Senior/executive positions
-    senior_patterns = [
-        r"\bdirector\b",
-        r"\bsenior director\b",
-        r"\bvp\b",
-        r"vice president",
-        r"\bchief\b",
-        r"\bcfo\b",
-        r"\bcoo\b",
-        r"\bceo\b",
-        r"senior manager",
-        r"sr manager",
-        r"principal"
-    ]
-
-    for pattern in senior_patterns:
-        if re.search(pattern, title_lower):
-            return False
-
-    # INCLUDE: Entry-level indicators (focused on recent graduates)
-    entry_level_indicators = [
-        # Experience patterns (0-2 years max)
-        r"\bentry[-\s]?level\b",
-        r"\b0\s?[-–]\s?1\s?year\b",
-        r"\b0\s?[-–]\s?2\s?years?\b",
-        r"\b1\s?[-–]\s?2\s?years?\b",
-        r"\bno experience required\b",
-        r"\bno prior experience\b",
-        r"\bexperience preferred\b",
-        r"\blittle experience\b",
-        r"\bsome experience\b",
-        r"\binternship\b",
-        r"\bintern\b",
-        r"\btrainee\b",
-        r"\bgraduate\b",
-        r"\brecent graduate\b",
-        r"\bnew graduate\b",
-
-        # Title patterns (entry-level roles)
-        r"\bcoordinator\b",
-        r"\brepresentative\b",
-        r"\bspecialist\b",
-        r"\bassistant\b",
-        r"\bassociate\b",
-        r"\bclerk\b",
-        r"\bscheduler\b",
-        r"\bscheduling\b",
-        r"\bpatient access\b",
-        r"\bregistration\b",
-        r"\bfront desk\b",
-        r"\bmedical receptionist\b",
-        r"\badmin\b",
-        r"\badministrator in training\b",
-        r"\bait\b"
-    ]
-
-    for pattern in entry_level_indicators:
-        if re.search(pattern, full_text, re.IGNORECASE) or re.search(pattern, title_lower):
-            return True
-
-    # INCLUDE: Bachelor's preferred (not required)
-    bachelors_preferred_patterns = [
-        r"bachelor.{0,20}preferred",
-        r"preferred.{0,20}bachelor",
-        r"bachelor.{0,20}a plus",
-        r"bachelor.{0,20}plus",
-        r"bachelor.{0,20}helpful",
-        r"bachelor.{0,20}desirable"
-    ]
-
-    for pattern in bachelors_preferred_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return True
-
-    # INCLUDE: Healthcare admin roles with reasonable requirements
-    if re.search(r"healthcare administration|health care administration|hospital administration|medical administration|patient access|registration|scheduler|billing|revenue cycle", full_text, re.IGNORECASE):
-        # Check if experience is reasonable (not explicitly requiring 3+ years)
-        if not re.search(r"minimum.{0,10}3.{0,5}years?|at least.{0,10}3.{0,5}years?", full_text, re.IGNORECASE):
-            return True
-
-    # DEFAULT: If bachelor's is mentioned in any context, include it
-    if re.search(r"bachelor'?s? degree", full_text, re.IGNORECASE):
-        return True
+    # EXCLUDE: Senior/executive positions (span in the title)
+    hit = SENIOR_TITLE_RULES.search(title_lower)
+    if hit:
+        index, match = hit
+        return Rejection(f"SENIOR_TITLE[{index}]", match.start(), match.end())
 
-    # If no clear indicators either way, be conservative and exclude
-    return False
-
-# US Census Bureau regions and states
-US_REGIONS = {
-    "Northeast": {"ME", "NH", "VT", "MA", "RI", "CT", "NY", "NJ", "PA"},
-    "Midwest": {"OH", "IN", "IL", "MI", "WI", "MN", "IA", "MO", "ND", "SD", "NE", "KS"},
-    "South": {"DE", "MD", "DC", "VA", "WV", "NC", "SC", "GA", "FL", "KY", "TN", "AL", "MS", "AR", "LA", "OK", "TX"},
-    "West": {"MT", "ID", "WY", "CO", "NM", "AZ", "UT", "NV", "WA", "OR", "CA", "AK", "HI"}
-}
+    # INCLUDE: Since bachelor's is mentioned and we passed all exclusions, include the job
+    return None
 
 # All US states and territories for target filtering
-TARGET_STATES = set()
-for region_states in US_REGIONS.values():
-    TARGET_STATES.update(region_states)
+TARGET_STATES = set(STATE_REGION)
 
 def get_state_region(state_code: str) -> str:
     """Get the US Census region for a given state code."""
-    state_code = state_code.upper().strip()
-    for region, states in US_REGIONS.items():
-        if state_code in states:
-            return region
-    return "Unknown"
+    return STATE_REGION.get(state_code.upper().strip(), "Unknown")
 
 def extract_city_from_location(location: str) -> str:
     """Extract city name from location string (e.g. 'Nashville, TN' -> 'Nashville')."""
-    if not location:
-        return ""
-    
-    # Handle common location formats
-    location = location.strip()
-    
-    # If location contains comma, take everything before the first comma as city
-    if ',' in location:
-        city = location.split(',')[0].strip()
-        return city
-    
-    # If no comma, check if it's a remote/hybrid indicator
-    location_lower = location.lower()
-    if any(keyword in location_lower for keyword in ['remote', 'hybrid', 'work from home', 'nationwide']):
-        return location  # Keep as-is for remote positions
-    
-    # Otherwise return the whole location as city
-    return location
-
-ENTRY_LEVEL_TITLE_HINTS = [
-    "coordinator", "representative", "specialist", "assistant", "associate",
-    "clerk", "scheduler", "scheduling", "patient access", "registration",
-    "referral", "prior auth", "authorization", "front desk", "unit clerk",
-    "medical receptionist", "office", "admin", "administrator in training", "ait"
-]
+    return resolve_location(location).city
 
-EXCLUDE_TITLE_HINTS = [
-    # avoid obviously non-entry admin tracks
-    "director", "senior director", "vp", "vice president", "chief", "cfo", "coo",
-    "manager, senior", "sr manager", "principal", "physician", "rn", "np", "pa-c"
-]
-
-CAREER_TRACK_RULES = [
-    ("Long-Term Care Administration", [r"\bait\b", r"administrator in training", r"assisted living", r"skilled nursing", r"snf", r"memory care", r"long[-\s]?term care"]),
-    ("Hospital Administration", [r"patient access", r"registration", r"scheduler", r"scheduling", r"clinic", r"front desk", r"revenue cycle", r"billing", r"referral", r"prior auth", r"authorization", r"him", r"health information"]),
-]
+WORD_TOKEN_RE = re.compile(r"\w+")
 
 QUAL_SECTIONS = [
     "Qualifications", "Required Qualifications", "Requirements", "Minimum Qualifications",
     "What you'll need", "What you bring", "Education and Experience", "Skills and Qualifications"
 ]
-
-PAY_PATTERNS = [
-    # hourly patterns
-    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?[-–]\s?\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
-    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
-    # annual patterns with decimal support and broader matching
-    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:and|\s?[-–]\s?)\s?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
-    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
-    # catch "between $X and $Y per year" patterns
-    re.compile(r"between\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+and\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+per\s+year", re.I),
-]
+QUAL_HEADING_INDEX = HeadingIndex(QUAL_SECTIONS, r"\s*\n(.{0,1200})", re.I)
 
 def strip_html(html: str) -> str:
     """Strip HTML tags and clean up text formatting."""
@@ -329,56 +198,53 @@ def clean_text_field(text: str) -> str:
     return cleaned.strip()
 
 def infer_state(location: str) -> Optional[str]:
-    if not location:
-        return None
-    m = re.search(r"\b([A-Z]{2})\b", location)
-    if m and m.group(1) in TARGET_STATES:
-        return m.group(1)
-    return None
+    return resolve_location(location).state
 
 def infer_remote_flag(location: str) -> bool:
-    if not location:
-        return False
-    return bool(re.search(r"\bremote\b|\bwork from home\b|\btelecommute\b", location, re.I))
+    return resolve_location(location).remote
 
 def infer_career_track(text: str) -> str:
-    t = (text or "").lower()
-    for track, patterns in CAREER_TRACK_RULES:
-        for p in patterns:
-            if re.search(p, t, re.I):
-                return track
+    return _career_track((text or "").lower())
+
+def _career_track(t: str) -> str:
+    for track, rules in COMPILED_CAREER_TRACK_RULES:
+        if rules.any(t):
+            return track
     return "Hospital Administration"
 
 def title_is_excluded(title: str) -> bool:
     t = (title or "").lower()
-    return any(h in t for h in EXCLUDE_TITLE_HINTS)
+    return EXCLUDE_TITLE_AUTOMATON.contains_any(t)
 
 def entry_level_flag(title: str, description: str) -> bool:
-    t = (title or "").lower()
-    if title_is_excluded(title):
+    return _entry_level_flag((title or "").lower(), (description or "").lower())
+
+def _entry_level_flag(t: str, d: str) -> bool:
+    """entry_level_flag on already lowercased title and description."""
+    if EXCLUDE_TITLE_AUTOMATON.contains_any(t):
         return False
-    if any(h in t for h in ENTRY_LEVEL_TITLE_HINTS):
+    if ENTRY_LEVEL_TITLE_AUTOMATON.contains_any(t):
         return True
 
     # fallback: look for "0-1 years", "no experience required", etc.
-    d = (description or "").lower()
-    if re.search(r"\bno experience required\b|\b0\s?[-–]\s?1\s?year\b|\bentry[-\s]?level\b", d):
+    if ENTRY_LEVEL_DESCRIPTION_RULE.search(d):
         return True
     # if explicitly requires 5+ years, treat as not entry
-    if re.search(r"\b5\+\s?years\b|\bfive\+\s?years\b|\b7\+\s?years\b", d):
+    if SENIOR_EXPERIENCE_DESCRIPTION_RULE.search(d):
         return False
     return False
 
-def extract_qualifications(full_text: str) -> str:
+def extract_qualifications(full_text: str, sections: Optional[PostingSections] = None) -> str:
     if not full_text:
         return ""
     # Try to find a qualifications-like heading and capture a chunk after it.
     lines = full_text.splitlines()
     joined = "\n".join(lines)
-    for heading in QUAL_SECTIONS:
-        # capture up to ~1200 chars after heading
-        m = re.search(rf"(^|\n)\s*{re.escape(heading)}\s*\n(.{{0,1200}})", joined, re.I)
-        if m:
+    # Skip the heading scan when the segmenter saw none of our headings
+    if sections is None or sections.has_heading(QUAL_SECTIONS):
+        # The first heading, in priority order, with a match
+        for _, m in QUAL_HEADING_INDEX.matches(joined):
+            # capture up to ~1200 chars after heading
             block = m.group(2).strip()
             # stop at next "heading-ish" line
             block = re.split(r"\n[A-Z][A-Za-z \-/]{2,40}\n", block)[0].strip()
@@ -407,55 +273,28 @@ def extract_pay_from_html(html: str) -> Tuple[Optional[float], Optional[Dict[str
     text = soup.get_text(separator="\n", strip=True)
     return normalize_pay_to_hourly(text)
 
-def normalize_pay_to_hourly(text: str) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+def normalize_pay_to_hourly(text: str, sections: Optional[PostingSections] = None) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
     """
     Returns (payHourly_midpoint, payRaw_dict).
     payRaw_dict includes type/hourly/annual min/max when found.
+
+    When ``sections`` is given, the pay sections (Pay, Salary, Compensation)
+    are scanned first and the full text only if they don't state pay. Benefits
+    sections aren't: their amounts are tuition or bonuses, not the wage.
     """
     if not text:
         return None, None
 
-    for pat in PAY_PATTERNS:
-        m = pat.search(text)
-        if not m:
-            continue
+    compensation_text = sections.compensation_text() if sections is not None else None
+    if compensation_text:
+        pay_hr, pay_raw = _scan_pay(compensation_text)
+        if pay_hr is not None:
+            return pay_hr, pay_raw
+    return _scan_pay(text)
 
-        groups = m.groups()
-        # hourly range
-        if len(groups) == 2 and pat.pattern.lower().find("hour") != -1:
-            low = float(groups[0])
-            high = float(groups[1])
-            mid = round((low + high) / 2.0, 2)
-            return mid, {"type": "hourly_range", "min": low, "max": high}
-        # hourly single
-        if len(groups) == 1 and pat.pattern.lower().find("hour") != -1:
-            val = float(groups[0])
-            return round(val, 2), {"type": "hourly", "value": val}
-
-        # annual range
-        if len(groups) == 2 and pat.pattern.lower().find("year") != -1:
-            low = float(groups[0].replace(",", ""))
-            high = float(groups[1].replace(",", ""))
-            mid_annual = (low + high) / 2.0
-            mid_hr = round(mid_annual / 2080.0, 2)
-            return mid_hr, {"type": "annual_range", "min": low, "max": high, "annual_mid": mid_annual}
-
-        # annual single
-        if len(groups) == 1 and pat.pattern.lower().find("year") != -1:
-            val = float(groups[0].replace(",", ""))
-            hr = round(val / 2080.0, 2)
-            return hr, {"type": "annual", "value": val}
-
-    return None, None
-
-def parse_date(val: Optional[str]) -> Optional[str]:
-    if not val:
-        return None
-    try:
-        dt = dtparser.parse(val)
-        return dt.date().isoformat()
-    except Exception:
-        return None
+def _scan_pay(text: str) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+    """The first-hit pay mention (see pay_engine), as (hourly, payRaw)."""
+    return hourly_pay(text)
 
 async def fetch_lever(client: httpx.AsyncClient, slug: str) -> List[Dict[str, Any]]:
     url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
@@ -464,8 +303,8 @@ async def fetch_lever(client: httpx.AsyncClient, slug: str) -> List[Dict[str, An
     return r.json()
 
 async def fetch_greenhouse(client: httpx.AsyncClient, slug: str) -> List[Dict[str, Any]]:
-    # public GH job board endpoint
-    url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
+    # public GH job board endpoint; pay_transparency adds pay_input_ranges where the board lists pay
+    url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true&pay_transparency=true"
     r = await client.get(url, timeout=30)
     r.raise_for_status()
     payload = r.json()
@@ -494,6 +333,44 @@ def lever_description(job: Dict[str, Any]) -> str:
         extra.append(f"\n{name}\n{strip_html(items)}")
     return strip_html(html) + ("\n\n" + "\n\n".join(extra) if extra else "")
 
+# Lever salaryRange intervals: pay periods per year, or hourly
+LEVER_PAY_INTERVALS = {"per-hour-wage": None, "per-week-salary": 52, "per-month-salary": 12, "per-year-salary": 1}
+
+# Greenhouse pay ranges don't state a unit; amounts below this many dollars are hourly
+GH_HOURLY_CEILING = 500
+
+def lever_listed_pay(job: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """(hourly, payRaw) from Lever's salaryRange, or None if the posting doesn't list USD pay."""
+    salary = job.get("salaryRange") or {}
+    if (salary.get("currency") or "").upper() != "USD" or salary.get("interval") not in LEVER_PAY_INTERVALS:
+        return None
+    try:
+        low, high = float(salary["min"]), float(salary["max"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if low <= 0 or high <= 0:
+        return None
+    per_year = LEVER_PAY_INTERVALS[salary["interval"]]
+    if per_year is None:
+        return pay_from_range("hour", low, high)
+    return pay_from_range("year", low * per_year, high * per_year)
+
+def gh_listed_pay(job: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """(hourly, payRaw) from the first USD range in Greenhouse's pay_input_ranges, or None."""
+    for pay_range in job.get("pay_input_ranges") or []:
+        if (pay_range.get("currency_type") or "").upper() != "USD":
+            continue
+        try:
+            low, high = pay_range["min_cents"] / 100.0, pay_range["max_cents"] / 100.0
+        except (KeyError, TypeError):
+            continue
+        if low <= 0 or high <= 0:
+            continue
+        label = ((pay_range.get("title") or "") + " " + (pay_range.get("blurb") or "")).lower()
+        hourly = "hour" in label or max(low, high) < GH_HOURLY_CEILING
+        return pay_from_range("hour" if hourly else "year", low, high)
+    return None
+
 def choose_company_name(seed_company: str, job_company: Optional[str]) -> str:
     return job_company or seed_company
 
@@ -504,63 +381,254 @@ def in_scope_state(location: str) -> bool:
         return True
     return st in TARGET_STATES
 
-def looks_like_health_admin(title: str, text: str) -> Tuple[bool, str]:
+def looks_like_health_admin(title: str, text: str, sections: Optional[PostingSections] = None) -> Tuple[bool, str]:
     """Check if job looks like health admin role suitable for recent graduates. Returns (passes, reason)."""
     # Include admin-support roles; exclude obviously clinical roles and software/engineering roles
     combined = (title + "\n" + (text or "")).lower()
+    role_check, reason = _health_admin_role_check(combined)
+    if not role_check:
+        return role_check, reason
+
+    # NEW: Apply entry-level education filtering
+    education_check = meets_entry_level_requirement(text, title, "", sections)
+    if not education_check:
+        return False, "education_requirements"
 
+    return True, "passes"
+
+def _health_admin_role_check(combined: str) -> Tuple[bool, str]:
+    """Role keyword part of looks_like_health_admin on lowercased title + description."""
     # Exclude clinical-heavy roles by keyword
-    if re.search(r"\bregistered nurse\b|\brn\b|\bnurse practitioner\b|\bnp\b|\bphysician\b|\bmd\b|\bpharm\b|\btherapist\b", combined):
+    if CLINICAL_ROLE_RULE.search(combined):
         return False, "clinical_roles"
 
     # Exclude software development/engineering roles by keyword
-    software_patterns = [
-        r"\bsoftware developer\b", r"\bsoftware engineer\b", r"\bdeveloper\b", r"\bengineer\b",
-        r"\bprogrammer\b", r"\bdevops\b", r"\bfull stack\b", r"\bfront[- ]end\b", r"\bback[- ]end\b",
-        r"\bcloud engineer\b", r"\bsecurity engineer\b", r"\bdata engineer\b", r"\bdata scientist\b",
-        r"\bweb developer\b", r"\bapplication developer\b", r"\bmobile developer\b", r"\bqa engineer\b",
-        r"\btest engineer\b", r"\barchitect\b.*\bsoftware\b", r"\bplatform engineer\b"
-    ]
-
-    for pattern in software_patterns:
-        if re.search(pattern, combined):
-            return False, "software_roles"
+    if SOFTWARE_ROLE_RULES.any(combined):
+        return False, "software_roles"
 
     # Require at least one admin-ish hint
-    admin_hints = [
-        "patient access", "registration", "scheduler", "scheduling", "clinic", "front desk",
-        "administrative", "admin", "coordinator", "referral", "prior auth", "authorization",
-        "billing", "revenue cycle", "unit clerk", "office", "medical receptionist", "him",
-        "health information", "admissions", "intake", "case management assistant", "bed management", "ait"
-    ]
-    admin_check = any(h in combined for h in admin_hints)
+    admin_check = ADMIN_HINT_AUTOMATON.contains_any(combined)
 
     if not admin_check:
         return False, "no_admin_keywords"
 
-    # NEW: Apply entry-level education filtering
-    education_check = meets_entry_level_requirement(text, title, "")
-    if not education_check:
-        return False, "education_requirements"
-
     return True, "passes"
 
-async def collect() -> None:
+
+class PostingContext:
+    """
+    Derived values for one posting, computed on first use and then reused.
+
+    Filters used to re-derive the same things per posting: lowercased text in
+    every helper, the title + location + description concatenation for pay and
+    qualifications, infer_state twice, and the entry-level education check both
+    inside looks_like_health_admin and again in collect(). Every check on a
+    posting reads from one context instead.
+    """
+
+    def __init__(self, title: str, location: str, description: str, qualifications: str = "",
+                 listed_pay: Optional[Tuple[float, Dict[str, Any]]] = None):
+        self.title = title or ""
+        self.location = location or ""
+        self.description = description or ""
+        self.qualifications = qualifications or ""
+        # (hourly, payRaw) from the ATS's structured pay fields, if it listed any
+        self.listed_pay = listed_pay
+
+    @cached_property
+    def full_text(self) -> str:
+        """Title, location and description; what pay and qualifications are read from."""
+        return (self.title + "\n" + self.location + "\n" + self.description).strip()
+
+    @cached_property
+    def sections(self) -> PostingSections:
+        """Section offsets over full_text."""
+        return segment_posting(self.full_text)
+
+    @cached_property
+    def title_lower(self) -> str:
+        return self.title.lower()
+
+    @cached_property
+    def description_lower(self) -> str:
+        return self.description.lower()
+
+    @cached_property
+    def combined_lower(self) -> str:
+        """Lowercased title + description, as the role and career-track checks read it."""
+        return (self.title + "\n" + self.description).lower()
+
+    @cached_property
+    def education_text_lower(self) -> str:
+        """Lowercased text the education rules scan (section-scoped when possible)."""
+        scoped_text = self.sections.education_text()
+        if scoped_text is None:
+            scoped_text = self.description
+        return f"{scoped_text} {self.qualifications}".lower()
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Distinct words of the lowercased title + description."""
+        return frozenset(WORD_TOKEN_RE.findall(self.combined_lower))
+
+    @cached_property
+    def location_info(self) -> ResolvedLocation:
+        """City, state, region and remote flag, resolved together."""
+        return resolve_location(self.location)
+
+    @property
+    def state(self) -> Optional[str]:
+        return self.location_info.state
+
+    @property
+    def remote(self) -> bool:
+        return self.location_info.remote
+
+    @cached_property
+    def entry_level_rejection(self) -> Optional[Rejection]:
+        """Why the posting fails the entry-level education check, or None if it passes."""
+        return _entry_level_rejection(self.education_text_lower, self.title_lower)
+
+    @cached_property
+    def meets_entry_level(self) -> bool:
+        return self.entry_level_rejection is None
+
+    @cached_property
+    def health_admin(self) -> Tuple[bool, str]:
+        """Same result as looks_like_health_admin(title, description, sections)."""
+        role_check, reason = _health_admin_role_check(self.combined_lower)
+        if not role_check:
+            return role_check, reason
+        if not self.meets_entry_level:
+            return False, "education_requirements"
+        return True, "passes"
+
+    @cached_property
+    def pay(self) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+        # Pay the ATS lists in structured fields wins over scanning the text
+        if self.listed_pay is not None:
+            return self.listed_pay
+        return normalize_pay_to_hourly(self.full_text, self.sections)
+
+    @property
+    def pay_source(self) -> Optional[str]:
+        """Where the pay came from: "listing", "description", or None if neither states pay."""
+        if self.listed_pay is not None:
+            return "listing"
+        return "description" if self.pay[0] is not None else None
+
+    @cached_property
+    def career_track(self) -> str:
+        return _career_track(self.combined_lower)
+
+    @cached_property
+    def entry_level(self) -> bool:
+        return _entry_level_flag(self.title_lower, self.description_lower)
+
+
+def count_pay_source(pay_stats: Dict[str, int], posting: PostingContext) -> Optional[str]:
+    """Count an included posting's pay source in filtering_stats["pay_sources"]."""
+    source = posting.pay_source
+    pay_stats[source or "none"] += 1
+    # Without the listing, a description that states no pay would leave "N/A",
+    # which update_pay_from_urls.py then fetches the posting's page for
+    if source == "listing" and not has_pay_mention(posting.full_text):
+        pay_stats["page_fetches_avoided"] += 1
+    return source
+
+def _clinical_role_stage(p: PostingContext):
+    match = CLINICAL_ROLE_RULE.search(p.combined_lower)
+    return Rejection("CLINICAL_ROLE", match.start(), match.end()) if match else True
+
+def _software_role_stage(p: PostingContext):
+    hit = SOFTWARE_ROLE_RULES.search(p.combined_lower)
+    if hit:
+        index, match = hit
+        return Rejection(f"SOFTWARE_ROLE[{index}]", match.start(), match.end())
+    return True
+
+def _education_stage(p: PostingContext):
+    # A Rejection is falsy, so test for None rather than `rejection or True`
+    rejection = p.entry_level_rejection
+    return True if rejection is None else rejection
+
+
+# Posting filters as independent predicates on a PostingContext. Their AND is
+# looks_like_health_admin + meets_entry_level_requirement + the US location
+# check. Priors (cost in us, rejection rate) were measured on the synthetic
+# benchmark corpus and are replaced by the previous run's numbers when saved.
+# Rule predicates reject with a Rejection so the rejection log can name the rule.
+FILTER_STAGE_PRIORS = [
+    ("non_us_locations", lambda p: p.state in TARGET_STATES, 1.5, 0.40),
+    ("clinical_roles", _clinical_role_stage, 7.0, 0.10),
+    ("software_roles", _software_role_stage, 16.0, 0.15),
+    ("no_admin_keywords", lambda p: ADMIN_HINT_AUTOMATON.contains_any(p.combined_lower), 6.0, 0.05),
+    ("education_requirements", _education_stage, 55.0, 0.70),
+]
+
+# Regex safety mode for the rule tables, e.g. SafetySettings("bounded") or
+# SafetySettings("linear", budget_ms=100); off runs the patterns as written
+REGEX_SAFETY = SafetySettings()
+
+# Fraction of rejected postings recorded in the rejection log (rejections.bin
+# next to filtering_stats.json; query with rejection_log.py); 0 turns it off.
+# 1.0 logs every rejection, e.g. while chasing a missing posting
+REJECTION_LOG_SAMPLE_RATE = 0.05
+
+# Size at which the rejection log is rotated to rejections.bin.1 (the one
+# before that is dropped)
+REJECTION_LOG_MAX_BYTES = 64 * 2 ** 20
+
+# Read the posting pages of included jobs without pay for it while the other
+# employers are still being fetched (see update_pay_from_urls.PayEnricher)
+ENRICH_PAY = False
+
+
+def build_filter_chain(stats_path: Optional[Path] = None, retune_every: Optional[int] = 250,
+                       budget_ms: Optional[float] = None) -> FilterChain:
+    """Filter chain ordered by expected cost, re-tuned from ``stats_path`` when present."""
+    chain = FilterChain(
+        (FilterStage(reason, predicate, cost_us, rejection_rate)
+         for reason, predicate, cost_us, rejection_rate in FILTER_STAGE_PRIORS),
+        retune_every=retune_every,
+        budget_ms=budget_ms,
+    )
+    if stats_path is not None:
+        chain.load_stats(stats_path)
+    return chain
+
+async def collect(enrich_pay: bool = ENRICH_PAY) -> None:
     root = Path(__file__).resolve().parent
     employers_path = root / "employers.json"
     out_dir = root / "data" / "json" / "webScrape"
     out_dir.mkdir(parents=True, exist_ok=True)
+    out_json = out_dir / "healthcare_admin_jobs_us_nationwide.json"
 
     employers = json.loads(employers_path.read_text(encoding="utf-8"))
     
     # Initialize enhanced qualifications extractor
     quals_extractor = QualificationsExtractor()
 
+    # Recompiles the rule tables only if the safety mode changed
+    set_regex_safety(REGEX_SAFETY)
+    # Pick up edited rule files when collect() runs again in the same process
+    reload_if_changed()
+
+    # Cheapest, most selective filters first; order re-tuned from the last run
+    stage_stats_path = out_dir / "filter_stage_stats.json"
+    filter_chain = build_filter_chain(stage_stats_path,
+                                      budget_ms=REGEX_SAFETY.budget_ms if REGEX_SAFETY.active else None)
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) JobResearchCollector/1.0"
     }
 
+    # One collection time for the whole run
+    collected_at = utc_timestamp()
+
     results: List[Dict[str, Any]] = []
+    # Each result's payRaw, for its numeric pay fields
+    pay_raws: List[Optional[Dict[str, Any]]] = []
     errors: List[Dict[str, Any]] = []
     
     # Track filtering statistics
@@ -568,163 +636,201 @@ async def collect() -> None:
         "total_jobs_analyzed": 0,
         "filtered_out": {
             "clinical_roles": 0,
+            "software_roles": 0,
             "no_admin_keywords": 0,
             "education_requirements": 0,
             "non_us_locations": 0
         },
         "final_jobs_included": 0,
         "duplicates_removed": 0,
-        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z"
+        # Where included postings' pay came from (before deduplication)
+        "pay_sources": {"listing": 0, "description": 0, "none": 0, "page_fetches_avoided": 0},
+        "timestamp": collected_at
     }
 
-    async with httpx.AsyncClient(headers=headers, follow_redirects=True) as client:
-        for emp in employers:
-            company = emp["company"]
-            platform = emp["platform"].lower().strip()
-            slug = emp["slug"].strip()
-
-            try:
-                 if platform == "lever":
-                     jobs = await fetch_lever(client, slug)
-                     for j in jobs:
-                         title = j.get("text") or ""
-                         url = j.get("hostedUrl") or ""
-                         loc = lever_location(j)
-                         desc = lever_description(j)
-
-                         # Track all jobs analyzed
-                         filtering_stats["total_jobs_analyzed"] += 1
-
-                         admin_check, reason = looks_like_health_admin(title, desc)
-                         if not admin_check:
-                             filtering_stats["filtered_out"][reason] += 1
-                             continue
-
-                         # Check education requirements - entry-level filter
-                         education_check = meets_entry_level_requirement(desc, title, "")
-                         if not education_check:
-                             filtering_stats["filtered_out"]["education_requirements"] += 1
-                             continue
-
-                         # Check if job is in US (allow all US states, filter international)
-                         state = infer_state(loc)
-                         if not state or state not in TARGET_STATES:
-                             filtering_stats["filtered_out"]["non_us_locations"] += 1
-                             continue
-
-                         full_text_for_pay = (title + "\n" + loc + "\n" + desc).strip()
-                         pay_hr, pay_raw = normalize_pay_to_hourly(full_text_for_pay)
-                         track = infer_career_track(title + "\n" + desc)
-                         entry = entry_level_flag(title, desc)
-
-                         full_text = (title + "\n" + loc + "\n" + desc).strip()
-                         quals = quals_extractor.extract_comprehensive_qualifications(full_text)
-
-                         # This job passed all filters
-                         filtering_stats["final_jobs_included"] += 1
-
-                         state = infer_state(loc)
-                         city = extract_city_from_location(loc)
-                         results.append({
-                            "jobTitle": clean_text_field(title),
-                            "company": clean_text_field(company),
-                            "city": clean_text_field(city),
-                            "state": state,
-                            "region": get_state_region(state) if state else "Unknown",
-                            "remoteFlag": infer_remote_flag(loc),
-                            "jobDescription": clean_text_field(desc),  # Apply HTML cleaning to job description
-                            "qualifications": clean_text_field(quals),
-                            "pay": f"${pay_hr}/hr" if pay_hr else "N/A",
-                            "date": None,  # most APIs don't provide closing dates
-                            "sourceFile": url,
-                            "sourcePlatform": "lever",
-                            "careerTrack": track,
-                            "entryLevelFlag": entry,
-                            "collectedAt": datetime.utcnow().isoformat(timespec="seconds") + "Z"
-                        })
-
-                 elif platform == "greenhouse":
-                     jobs = await fetch_greenhouse(client, slug)
-                     for j in jobs:
-                         title = j.get("title") or ""
-                         url = j.get("absolute_url") or ""
-                         loc = gh_location(j)
-                         desc = gh_description(j)
-
-                         # Track all jobs analyzed
-                         filtering_stats["total_jobs_analyzed"] += 1
-
-                         admin_check, reason = looks_like_health_admin(title, desc)
-                         if not admin_check:
-                             filtering_stats["filtered_out"][reason] += 1
-                             continue
-
-                         # Check education requirements - entry-level filter
-                         education_check = meets_entry_level_requirement(desc, title, "")
-                         if not education_check:
-                             filtering_stats["filtered_out"]["education_requirements"] += 1
-                             continue
-
-                         # Check if job is in US (allow all US states, filter international)
-                         state = infer_state(loc)
-                         if not state or state not in TARGET_STATES:
-                             filtering_stats["filtered_out"]["non_us_locations"] += 1
-                             continue
-
-                         full_text_for_pay = (title + "\n" + loc + "\n" + desc).strip()
-                         pay_hr, pay_raw = normalize_pay_to_hourly(full_text_for_pay)
-                         track = infer_career_track(title + "\n" + desc)
-                         entry = entry_level_flag(title, desc)
-
-                         full_text = (title + "\n" + loc + "\n" + desc).strip()
-                         quals = quals_extractor.extract_comprehensive_qualifications(full_text)
-
-                         # GH provides updated_at / created_at but not close date
-                         created = parse_date(j.get("created_at"))
-                         updated = parse_date(j.get("updated_at"))
-
-                         # This job passed all filters
-                         filtering_stats["final_jobs_included"] += 1
-
-                         state = infer_state(loc)
-                         city = extract_city_from_location(loc)
-                         results.append({
-                            "jobTitle": clean_text_field(title),
-                            "company": clean_text_field(company),
-                            "city": clean_text_field(city),
-                            "state": state,
-                            "region": get_state_region(state) if state else "Unknown",
-                            "remoteFlag": infer_remote_flag(loc),
-                            "jobDescription": clean_text_field(desc),  # Apply HTML cleaning to job description
-                            "qualifications": clean_text_field(quals),
-                            "pay": f"${pay_hr}/hr" if pay_hr else "N/A",
-                            "date": None,
-                            "sourceFile": url,
-                            "sourcePlatform": "greenhouse",
-                            "careerTrack": track,
-                            "entryLevelFlag": entry,
-                            "createdDate": created,
-                            "updatedDate": updated,
-                            "collectedAt": datetime.utcnow().isoformat(timespec="seconds") + "Z"
-                        })
-                 else:
-                    errors.append({"company": company, "platform": platform, "slug": slug, "error": "Unsupported platform"})
-            except Exception as e:
-                errors.append({"company": company, "platform": platform, "slug": slug, "error": str(e)})
+    if filter_chain.budget_ms is not None:
+        filtering_stats["filtered_out"][BUDGET_REASON] = 0
+
+    rejection_log = (RejectionLog(out_dir / "rejections.bin", REJECTION_LOG_SAMPLE_RATE, REJECTION_LOG_MAX_BYTES)
+                     if REJECTION_LOG_SAMPLE_RATE else None)
+    try:
+        async with httpx.AsyncClient(headers=headers, follow_redirects=True) as client:
+            # Page reads share the client's connection pool and run between employer fetches
+            enricher = None
+            if enrich_pay:
+                enricher = PayEnricher(client, host_stats=load_host_stats(host_stats_path(out_json)))
+                enricher.start()
+
+            for emp in employers:
+                company = emp["company"]
+                platform = emp["platform"].lower().strip()
+                slug = emp["slug"].strip()
+
+                try:
+                     if platform == "lever":
+                         jobs = await fetch_lever(client, slug)
+                         for j in jobs:
+                             title = j.get("text") or ""
+                             url = j.get("hostedUrl") or ""
+                             loc = lever_location(j)
+                             desc = lever_description(j)
+
+                             # Track all jobs analyzed
+                             filtering_stats["total_jobs_analyzed"] += 1
+
+                             posting = PostingContext(title, loc, desc, listed_pay=lever_listed_pay(j))
+
+                             # Health admin role, entry-level education and US location checks
+                             reason = filter_chain.rejection_reason(posting)
+                             if reason:
+                                 filtering_stats["filtered_out"][reason] += 1
+                                 if rejection_log is not None:
+                                     rejection_log.record(url or f"{company}|{title}", reason, filter_chain.last_rejection)
+                                 continue
+
+                             state = posting.state
+
+                             pay_hr, pay_raw = posting.pay
+                             pay_source = count_pay_source(filtering_stats["pay_sources"], posting)
+                             track = posting.career_track
+                             entry = posting.entry_level
+
+                             quals = quals_extractor.extract_comprehensive_qualifications(posting.full_text, posting.sections)
+
+                             # This job passed all filters
+                             filtering_stats["final_jobs_included"] += 1
+
+                             where = posting.location_info
+                             results.append({
+                                "jobTitle": clean_text_field(title),
+                                "company": clean_text_field(company),
+                                "city": clean_text_field(where.city),
+                                "state": state,
+                                "region": where.region,
+                                "remoteFlag": posting.remote,
+                                "jobDescription": clean_text_field(desc),  # Apply HTML cleaning to job description
+                                "qualifications": clean_text_field(quals),
+                                "pay": f"${pay_hr}/hr" if pay_hr else "N/A",
+                                "paySource": pay_source,
+                                **NO_PAY_FIELDS,  # set from pay_raws once the batch is complete
+                                "date": None,  # most APIs don't provide closing dates
+                                "sourceFile": url,
+                                "sourcePlatform": "lever",
+                                "careerTrack": track,
+                                "entryLevelFlag": entry,
+                                "collectedAt": collected_at
+                            })
+                             pay_raws.append(pay_raw if pay_hr else None)
+                             if enricher is not None and needs_pay(results[-1]):
+                                 enricher.submit(url)
+
+                     elif platform == "greenhouse":
+                         jobs = await fetch_greenhouse(client, slug)
+                         for j in jobs:
+                             title = j.get("title") or ""
+                             url = j.get("absolute_url") or ""
+                             loc = gh_location(j)
+                             desc = gh_description(j)
+
+                             # Track all jobs analyzed
+                             filtering_stats["total_jobs_analyzed"] += 1
+
+                             posting = PostingContext(title, loc, desc, listed_pay=gh_listed_pay(j))
+
+                             # Health admin role, entry-level education and US location checks
+                             reason = filter_chain.rejection_reason(posting)
+                             if reason:
+                                 filtering_stats["filtered_out"][reason] += 1
+                                 if rejection_log is not None:
+                                     rejection_log.record(url or f"{company}|{title}", reason, filter_chain.last_rejection)
+                                 continue
+
+                             state = posting.state
+
+                             pay_hr, pay_raw = posting.pay
+                             pay_source = count_pay_source(filtering_stats["pay_sources"], posting)
+                             track = posting.career_track
+                             entry = posting.entry_level
+
+                             quals = quals_extractor.extract_comprehensive_qualifications(posting.full_text, posting.sections)
+
+                             # GH provides updated_at / created_at but not close date
+                             created = parse_date(j.get("created_at"))
+                             updated = parse_date(j.get("updated_at"))
+
+                             # This job passed all filters
+                             filtering_stats["final_jobs_included"] += 1
+
+                             where = posting.location_info
+                             results.append({
+                                "jobTitle": clean_text_field(title),
+                                "company": clean_text_field(company),
+                                "city": clean_text_field(where.city),
+                                "state": state,
+                                "region": where.region,
+                                "remoteFlag": posting.remote,
+                                "jobDescription": clean_text_field(desc),  # Apply HTML cleaning to job description
+                                "qualifications": clean_text_field(quals),
+                                "pay": f"${pay_hr}/hr" if pay_hr else "N/A",
+                                "paySource": pay_source,
+                                **NO_PAY_FIELDS,  # set from pay_raws once the batch is complete
+                                "date": None,
+                                "sourceFile": url,
+                                "sourcePlatform": "greenhouse",
+                                "careerTrack": track,
+                                "entryLevelFlag": entry,
+                                "createdDate": created,
+                                "updatedDate": updated,
+                                "collectedAt": collected_at
+                            })
+                             pay_raws.append(pay_raw if pay_hr else None)
+                             if enricher is not None and needs_pay(results[-1]):
+                                 enricher.submit(url)
+                     else:
+                        errors.append({"company": company, "platform": platform, "slug": slug, "error": "Unsupported platform"})
+                except Exception as e:
+                    errors.append({"company": company, "platform": platform, "slug": slug, "error": str(e)})
+
+            if enricher is not None:
+                await enricher.finish()
+    finally:
+        # Whatever was logged reaches disk even if the run fails part way
+        if rejection_log is not None:
+            rejection_log.close()
 
     # Deduplicate by sourceFile (some feeds repeat)
     dedup = {}
-    for r in results:
+    for i, r in enumerate(results):
         key = r.get("sourceFile") or (r["company"] + "|" + r["jobTitle"] + "|" + (r.get("location") or ""))
-        dedup[key] = r
-    final = list(dedup.values())
+        dedup[key] = i
+    final = [results[i] for i in dedup.values()]
+    final_pay_raws = [pay_raws[i] for i in dedup.values()]
 
     # Update final stats after deduplication
     filtering_stats["final_jobs_included"] = len(final)
     filtering_stats["duplicates_removed"] = len(results) - len(final)
+    # Counts above are attributed to the first rejecting stage in this order
+    filtering_stats["filter_stages"] = filter_chain.stats()
+
+    if enricher is not None:
+        for i, r in enumerate(final):
+            page = enricher.pages.get(r["sourceFile"]) if needs_pay(r) else None
+            if page is not None and apply_page(r, page):
+                final_pay_raws[i] = page.pay_raw
+                enricher.stats.jobs_updated += 1
+        filtering_stats["pay_enrichment"] = enricher.stats.as_dict()
+        host_stats_path(out_json).write_text(json.dumps(enricher.host_stats, indent=2, sort_keys=True),
+                                             encoding="utf-8")
+
+    # Numeric pay fields for the whole batch, with implausible pay flagged
+    pay_flags: Dict[str, int] = {}
+    for r, fields in zip(final, normalize_pay(final_pay_raws)):
+        r.update(fields)
+        for flag in fields["payFlags"]:
+            pay_flags[flag] = pay_flags.get(flag, 0) + 1
+    filtering_stats["pay_flags"] = pay_flags
 
     # Write outputs
-    out_json = out_dir / "healthcare_admin_jobs_us_nationwide.json"
     out_json.write_text(json.dumps(final, indent=2, ensure_ascii=False), encoding="utf-8")
 
     out_err = out_dir / "errors.json"
@@ -733,12 +839,26 @@ async def collect() -> None:
     # Write filtering statistics
     out_stats = out_dir / "filtering_stats.json"
     out_stats.write_text(json.dumps(filtering_stats, indent=2, ensure_ascii=False), encoding="utf-8")
+    filter_chain.save_stats(stage_stats_path)
 
     print(f"Saved {len(final)} jobs to: {out_json}")
     print(f"Filtering stats: {filtering_stats['total_jobs_analyzed']} analyzed, {len(final)} included")
+    pay_sources = filtering_stats["pay_sources"]
+    print(f"Pay: {pay_sources['listing']} from listed pay fields, {pay_sources['description']} from descriptions; "
+          f"{pay_sources['page_fetches_avoided']} page fetches avoided")
+    if enricher is not None:
+        print(f"Pay enrichment: {enricher.stats.jobs_updated} jobs updated from their pages; "
+              f"{enricher.stats.summary()}")
+    if rejection_log is not None:
+        print(f"Rejection log: {rejection_log.logged} rejections appended to {rejection_log.path}")
     if errors:
         print(f"Encountered {len(errors)} employer errors. See: {out_err}")
 
 if __name__ == "__main__":
+    import argparse
     import asyncio
-    asyncio.run(collect())
+    parser = argparse.ArgumentParser(description="Collect healthcare admin jobs from the employers' ATS feeds")
+    parser.add_argument("--enrich-pay", action="store_true", default=ENRICH_PAY,
+                        help="read the pages of included jobs without pay for it while collecting")
+    args = parser.parse_args()
+    asyncio.run(collect(enrich_pay=args.enrich_pay))
@@ -8,9 +8,12 @@ Saves results as timestamped Markdown files for historical tracking.
 import json
 import os
 from collections import Counter, defaultdict
+from statistics import median
 from pathlib import Path
 from datetime import datetime
 
+from date_utils import parse_timestamp
+
 def load_job_data():
     """Load job data from both pipeline output and HTML processing."""
     jobs = []
@@ -64,9 +67,10 @@ def load_filtering_stats():
             print(f"⚠️  Error loading filtering stats: {e}")
     return None
 
-def add_filtering_analysis(output_lines):
+def add_filtering_analysis(output_lines, stats=None):
     """Add filtering statistics analysis to the report."""
-    stats = load_filtering_stats()
+    if stats is None:
+        stats = load_filtering_stats()
     if not stats:
         output_lines.append("⚠️  No filtering statistics available")
         return
@@ -94,24 +98,47 @@ def add_filtering_analysis(output_lines):
     
     # Filtering breakdown
     if filtered_out:
+        # Stage order the filter chain ran in (filter_chain.py); older stats files have none
+        stages = stats.get('filter_stages') or {}
+        order = stages.get('order') or []
+
         output_lines.append(f"### 🚫 Filtering Breakdown")
-        output_lines.append("| Reason | Count | % of Total |")
-        output_lines.append("|--------|-------|-----------|")
+        if order:
+            output_lines.append("| Stage | Reason | Count | % of Total |")
+            output_lines.append("|-------|--------|-------|-----------|")
+        else:
+            output_lines.append("| Reason | Count | % of Total |")
+            output_lines.append("|--------|-------|-----------|")
         
         filter_names = {
             'clinical_roles': 'Clinical Roles (RN, MD, etc.)',
+            'software_roles': 'Software/Engineering Roles',
             'no_admin_keywords': 'No Admin Keywords',
             'education_requirements': 'Education Requirements',
             'non_us_locations': 'Non-US Locations'
         }
         
-        for reason, count in filtered_out.items():
+        # Rows in stage order, reasons that aren't stages (time budget) last
+        reasons = sorted(filtered_out, key=lambda r: order.index(r) if r in order else len(order))
+        for reason in reasons:
+            count = filtered_out[reason]
             if count > 0:
                 percentage = (count / total_analyzed * 100) if total_analyzed > 0 else 0
                 display_name = filter_names.get(reason, reason.replace('_', ' ').title())
-                output_lines.append(f"| {display_name} | {count:,} | {percentage:.1f}% |")
+                if order:
+                    stage = order.index(reason) + 1 if reason in order else "-"
+                    output_lines.append(f"| {stage} | {display_name} | {count:,} | {percentage:.1f}% |")
+                else:
+                    output_lines.append(f"| {display_name} | {count:,} | {percentage:.1f}% |")
         
         output_lines.append("")
+        if order:
+            reorders = stages.get('reorders', 0)
+            changed = f" (final order; it changed {reorders} time{'s' if reorders != 1 else ''} during the run)" if reorders else ""
+            output_lines.append(f"*Stage is the order the filters ran in{changed}. Each rejected posting is "
+                                f"counted once, under the first stage to reject it, so per-reason counts are "
+                                f"only comparable between runs with the same order.*")
+            output_lines.append("")
     
     # Add timestamp info
     if stats.get('timestamp'):
@@ -256,18 +283,27 @@ def analyze_jobs(jobs, output_lines):
     output_lines.append(f"| With Pay Info | {pay_available} |")
     output_lines.append(f"| No Pay Info | {pay_missing} |")
     output_lines.append("")
+
+    # Numeric pay fields (payHourlyMid, payFlags) written by run_collect.py
+    hourly = [job['payHourlyMid'] for job in jobs if isinstance(job.get('payHourlyMid'), (int, float))]
+    if hourly:
+        flagged = Counter(flag for job in jobs for flag in job.get('payFlags') or [])
+        output_lines.append(f"### 💵 Hourly Pay")
+        output_lines.append("| Measure | Value |")
+        output_lines.append("|---------|-------|")
+        output_lines.append(f"| Median | ${median(hourly):.2f}/hr |")
+        output_lines.append(f"| Range | ${min(hourly):.2f} - ${max(hourly):.2f}/hr |")
+        for flag, count in flagged.most_common():
+            output_lines.append(f"| Flagged {flag.replace('_', ' ')} | {count} |")
+        output_lines.append("")
     
     # Collection timestamp analysis
     collection_dates = []
     for job in jobs:
-        collected_at = job.get('collectedAt')
-        if collected_at:
-            try:
-                # Parse ISO timestamp
-                dt = datetime.fromisoformat(collected_at.replace('Z', '+00:00'))
-                collection_dates.append(dt)
-            except:
-                pass
+        # Jobs from one run share a timestamp, which is parsed once
+        dt = parse_timestamp(job.get('collectedAt'))
+        if dt:
+            collection_dates.append(dt)
     
     if collection_dates:
         latest = max(collection_dates)
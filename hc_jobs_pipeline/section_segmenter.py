@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+"""
+Section Segmentation for Healthcare Admin Job Postings
+======================================================
+Splits a posting into typed sections (responsibilities, qualifications,
+education, compensation, benefits, EEO) in a single pass so the filters, the
+qualifications extractor and the pay normalizer can each scan only the
+parts of the text they care about.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# Heading vocabulary per section type (compared lowercased, without trailing colon)
+SECTION_HEADINGS = {
+    "responsibilities": [
+        "responsibilities", "key responsibilities", "job responsibilities",
+        "primary responsibilities", "essential responsibilities", "duties",
+        "essential duties", "job duties", "essential functions",
+        "duties and responsibilities", "duties & responsibilities",
+        "what you'll do", "what you will do", "what you do", "the role",
+        "about the role", "your role", "day to day", "a day in the life",
+    ],
+    "qualifications": [
+        "qualifications", "required qualifications", "minimum qualifications",
+        "preferred qualifications", "desired qualifications", "basic qualifications",
+        "requirements", "minimum requirements", "job requirements",
+        "additional requirements", "required skills", "skills and qualifications",
+        "skills & qualifications", "skills and experience", "skills & experience",
+        "what you'll need", "what you need", "what you bring", "what we're looking for",
+        "what we are looking for", "we're looking for", "experience required",
+        "must have", "you have", "candidate profile", "ideal candidate",
+        "knowledge, skills and abilities", "knowledge, skills, and abilities",
+    ],
+    "education": [
+        "education", "education requirements", "education and experience",
+        "education & experience", "education/experience", "education and training",
+        "licensure", "licenses and certifications", "certifications",
+        "licensure and certification", "licensure/certification",
+    ],
+    "compensation": [
+        "compensation", "pay", "pay range", "salary", "salary range", "wage",
+        "pay rate",
+    ],
+    # Benefit amounts (tuition, bonuses, 401k match) aren't the wage, so these
+    # are kept out of the pay scan like any other non-pay section
+    "benefits": [
+        "benefits", "our benefits", "what we offer", "perks", "perks and benefits",
+        "benefits and perks", "total rewards", "compensation and benefits",
+        "compensation & benefits",
+    ],
+    "eeo": [
+        "equal opportunity employer", "equal employment opportunity", "eeo statement",
+        "eeo", "diversity statement", "our commitment to diversity",
+        "reasonable accommodation", "accommodations", "e-verify",
+    ],
+}
+
+# Section types that never carry education requirements
+NON_EDUCATION_SECTIONS = ("responsibilities", "compensation", "benefits", "eeo")
+
+# Section types that carry education requirements
+QUALIFICATION_SECTIONS = ("qualifications", "education")
+
+# Section types whose amounts are the posting's pay
+COMPENSATION_SECTIONS = ("compensation",)
+
+# Lines longer than this are never treated as headings
+MAX_HEADING_LENGTH = 80
+
+_HEADING_KIND = {
+    heading: kind
+    for kind, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# "Requirements: Bachelor's degree ..." - known heading with content on the same line
+_INLINE_HEADING = re.compile(
+    r"^\s*(" + "|".join(re.escape(h) for h in sorted(_HEADING_KIND, key=len, reverse=True)) + r")\s*:\s*(\S.*)$",
+    re.I,
+)
+
+# Short line ending with a colon, e.g. "About Us:" - closes the current section
+_GENERIC_HEADING = re.compile(r"^\s*[A-Za-z][A-Za-z0-9 ,&/'()\-]{1,60}:\s*$")
+
+# Short capitalized line without a colon or closing punctuation, e.g. "Who you are".
+# Unknown headings like this close the sections education text leaves out, so
+# requirements listed under them after a Benefits block are still scanned.
+_BARE_HEADING = re.compile(r"^\s*[A-Z][A-Za-z'’&/()\-]*(?: [A-Za-z'’&/()\-]+){0,5}[?!]?\s*$")
+
+
+class Section(NamedTuple):
+    """One typed section of a posting. ``start``/``end`` delimit the section body."""
+    kind: str
+    heading: str
+    heading_start: int
+    start: int
+    end: int
+
+
+def normalize_heading(line: str) -> str:
+    """Normalize a line for heading lookups ('What You’ll Need:' -> "what you'll need")."""
+    return line.strip().rstrip(":").strip().replace("’", "'").lower()
+
+
+class PostingSections:
+    """Typed section index over one posting's text."""
+
+    def __init__(self, text: str, sections: List[Section], heading_lines: Set[str]):
+        self.text = text
+        self.sections = sections
+        # Normalized text of every short line, for exact heading lookups by consumers
+        self.heading_lines = heading_lines
+        self._kinds = {s.kind for s in sections}
+
+    def has(self, *kinds: str) -> bool:
+        """True if the posting has at least one section of any of the given types."""
+        return any(kind in self._kinds for kind in kinds)
+
+    def has_heading(self, headings: Iterable[str]) -> bool:
+        """True if any of the given headings appears alone on a line of the posting."""
+        return any(normalize_heading(h) in self.heading_lines for h in headings)
+
+    def of_kind(self, *kinds: str) -> List[Section]:
+        return [s for s in self.sections if s.kind in kinds]
+
+    def text_for(self, *kinds: str) -> str:
+        """Concatenated bodies of all sections of the given types."""
+        return "\n".join(self.text[s.start:s.end] for s in self.sections if s.kind in kinds)
+
+    def text_excluding(self, *kinds: str) -> str:
+        """Concatenated bodies (and headings) of all sections not of the given types."""
+        return "\n".join(self.text[s.heading_start:s.end] for s in self.sections if s.kind not in kinds)
+
+    def education_text(self) -> Optional[str]:
+        """Text the education rules should scan, or None to scan the whole posting.
+
+        Only postings with an explicit qualifications/education section are narrowed;
+        unstructured postings keep full-text scanning.
+        """
+        if not self.has(*QUALIFICATION_SECTIONS):
+            return None
+        return self.text_excluding(*NON_EDUCATION_SECTIONS)
+
+    def compensation_text(self) -> Optional[str]:
+        """Body of the pay sections, or None if the posting has none."""
+        if not self.has(*COMPENSATION_SECTIONS):
+            return None
+        return self.text_for(*COMPENSATION_SECTIONS)
+
+
+class HeadingIndex:
+    """
+    First match of each heading regex, in heading priority order, from one scan.
+
+    The extractors used to try ``(^|\n)\s*<heading><body>`` once per heading,
+    in priority order, each a full-text search. Here one multiline
+    alternation lists every line that is one of the headings (alone on its
+    line, optional colon) with its offset, and only those headings' regexes
+    are matched, anchored at their lines. The result is what the per-heading
+    ``re.search`` calls returned, at a cost that doesn't grow with the number
+    of headings.
+    """
+
+    def __init__(self, headings: Sequence[str], body: str, flags: int = re.I):
+        self.headings = list(headings)
+        alternatives = "|".join(f"(?P<h{i}>{re.escape(h)})" for i, h in enumerate(self.headings))
+        self._lines = re.compile(rf"^[^\S\n]*(?:{alternatives})[^\S\n]*:?[^\S\n]*$", re.I | re.M)
+        self._regexes = [re.compile(rf"(^|\n)\s*{re.escape(h)}{body}", flags) for h in self.headings]
+
+    def matches(self, text: str) -> Iterator[Tuple[int, re.Match]]:
+        """(heading index, match) per heading with a match, in priority order."""
+        occurrences: Dict[int, List[int]] = {}
+        for line in self._lines.finditer(text):
+            # A heading listed twice in different case only ever reports under its first index
+            occurrences.setdefault(int(line.lastgroup[1:]), []).append(line.start())
+        for index in sorted(occurrences):
+            regex = self._regexes[index]
+            for pos in occurrences[index]:
+                # From the newline before the line, which (^|\n) matches with or without re.M
+                match = regex.match(text, max(pos - 1, 0))
+                if match:
+                    yield index, match
+                    break
+
+    def __len__(self) -> int:
+        return len(self.headings)
+
+
+def segment_posting(text: str) -> PostingSections:
+    """
+    Split posting text into typed sections with character offsets.
+
+    Text before the first heading, and under headings we don't recognize,
+    is recorded as an ``other`` section so offsets always cover the posting.
+    """
+    text = text or ""
+    sections: List[Section] = []
+    heading_lines: Set[str] = set()
+
+    kind, heading, heading_start, body_start = "other", "", 0, 0
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        line_start = pos
+        pos += len(line)
+        new_kind = None
+        new_heading = line.strip()
+        new_body_start = pos
+        if len(line) <= MAX_HEADING_LENGTH + 2:
+            normalized = normalize_heading(line)
+            if not normalized:
+                continue
+            heading_lines.add(normalized)
+            new_kind = _HEADING_KIND.get(normalized)
+
+        inline = None
+        if new_kind is None:
+            inline = _INLINE_HEADING.match(line)
+            if inline:
+                new_kind = _HEADING_KIND.get(normalize_heading(inline.group(1)))
+                new_heading = inline.group(1)
+                new_body_start = line_start + inline.start(2)
+            elif _GENERIC_HEADING.match(line) or (kind in NON_EDUCATION_SECTIONS and _BARE_HEADING.match(line)):
+                new_kind = "other"
+            else:
+                continue
+
+        # Zero-length untyped sections only come from the line after an inline heading
+        if (sections or line_start > 0) and not (kind == "other" and not heading and body_start == line_start):
+            sections.append(Section(kind, heading, heading_start, body_start, line_start))
+        kind, heading, heading_start, body_start = new_kind, new_heading, line_start, new_body_start
+        if inline and new_kind in ("compensation", "benefits", "eeo"):
+            # "Pay: $20 - $24 per hour" is the whole section; what follows is untyped
+            sections.append(Section(kind, heading, heading_start, body_start, pos))
+            kind, heading, heading_start, body_start = "other", "", pos, pos
+
+    if not sections or not (kind == "other" and not heading and body_start == len(text)):
+        sections.append(Section(kind, heading, heading_start, body_start, len(text)))
+    return PostingSections(text, sections, heading_lines)
+
+
+def section_summary(sections: PostingSections) -> Dict[str, int]:
+    """Character count per section type (debugging aid)."""
+    summary: Dict[str, int] = {}
+    for s in sections.sections:
+        summary[s.kind] = summary.get(s.kind, 0) + (s.end - s.start)
+    return summary
+
+
+if __name__ == "__main__":
+    sample = """Patient Access Coordinator
+Responsibilities:
+- Register patients and verify insurance
+Qualifications:
+- Bachelor's degree preferred
+- 0-2 years of experience
+Compensation: $20 - $24 per hour
+Equal Opportunity Employer
+We do not discriminate."""
+
+    segmented = segment_posting(sample)
+    for s in segmented.sections:
+        print(f"{s.kind:16} {s.heading!r:28} {segmented.text[s.start:s.end]!r}")
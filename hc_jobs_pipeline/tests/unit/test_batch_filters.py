@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Corpus-Level Batch Filtering
+===========================================
+Tests that evaluate_batch returns exactly the per-posting verdicts, and that
+corpus scans map matches back to the right postings, including matches that
+cross the separators between postings.
+"""
+
+import sys
+import os
+import re
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import education_filters
+from batch_filters import CorpusBuffer, education_analysis_batch, evaluate_batch, is_context_free
+from compiled_rules import GuardedPattern
+from run_collect import PostingContext
+from benchmarks.corpus import generate_corpus
+
+
+class TestBatchFilters:
+    """Test class for batch filtering"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_matches_per_posting_path(self):
+        """Batch verdicts equal the per-posting filters"""
+        print("Testing Batch vs Per-Posting Verdicts")
+        postings = generate_corpus(1500, seed=33)
+        expected = []
+        for p in postings:
+            posting = PostingContext(p["title"], p["location"], p["description"])
+            expected.append((posting.health_admin, posting.meets_entry_level,
+                             education_filters.meets_bachelors_requirement(p["description"])))
+        verdicts = [tuple(v) for v in evaluate_batch(postings)]
+        mismatches = sum(v != e for v, e in zip(verdicts, expected))
+        self.check(len(verdicts) == len(postings) and mismatches == 0,
+                   f"{len(postings)} postings agree", f"{mismatches} mismatches")
+
+        chunked = [tuple(v) for v in evaluate_batch(iter(postings[:40]), chunk_size=7)]
+        self.check(chunked == expected[:40], "Chunked evaluation agrees")
+        self.check(evaluate_batch([]) == [], "Empty corpus")
+
+    def test_education_analysis(self):
+        """Full education analyses, not just the verdict, are identical"""
+        print("\nTesting Education Analysis Batch")
+        descriptions = [p["description"] for p in generate_corpus(400, seed=3)]
+        descriptions += ["High school diploma required.", "Associate's degree required", "", "MBA preferred"]
+        expected = [education_filters.analyze_education_requirements(d) for d in descriptions]
+        self.check(education_analysis_batch(descriptions) == expected, "Analyses identical")
+
+    def test_separator_crossing(self):
+        """Matches spanning postings are re-checked against each posting's own text"""
+        print("\nTesting Separator Crossing")
+        texts = ["abc x", "y def", "", "x\nx", "zz x", "x y", "no match here"]
+        corpus = CorpusBuffer(texts)
+        patterns = [r"x[^q]*y", r"[\s\S]{0,8}d", r"x\W+", r"", r"\bx\b", r"x\s*x",
+                    r"(?s)x.*?y", r"\W", r"(?<=c) x", r"^y", r"x$", r"\Bx"]
+        wrong = []
+        for pattern in patterns:
+            expected = [re.search(pattern, t) is not None for t in texts]
+            # Guarded rules go through the literal index, unguarded ones scan the buffer
+            for rule in (GuardedPattern(pattern), GuardedPattern(pattern, 0, ())):
+                if corpus.search(rule) != expected:
+                    wrong.append((pattern, rule.guard))
+        self.check(not wrong, f"{len(patterns)} patterns agree", f"Wrong: {wrong}")
+        self.check(corpus.containing("x") == [0, 3, 4, 5], "Literal index lists each posting once")
+
+    def test_context_free(self):
+        """Patterns that look outside the match are not scanned as a corpus"""
+        print("\nTesting Context-Free Detection")
+        free = [is_context_free(GuardedPattern(p)) for p in (r"\bba\b", r"bachelor.{0,20}preferred", r"a|b+")]
+        bound = [is_context_free(GuardedPattern(p)) for p in (r"^a", r"a$", r"(?<!x)a", r"a(?=b)", r"\Ba")]
+        self.check(all(free) and not any(bound), "Lookarounds and anchors detected",
+                   f"free={free} bound={bound}")
+
+    def run_all_tests(self):
+        """Run all batch filter tests"""
+        print("UNIT TESTS: Batch Filters")
+        print("=" * 50)
+
+        self.test_matches_per_posting_path()
+        self.test_education_analysis()
+        self.test_separator_crossing()
+        self.test_context_free()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Batch Filter Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All batch filter tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review batch filters")
+
+
+def main():
+    """Main test execution"""
+    tester = TestBatchFilters()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL BATCH FILTER TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review batch filters")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
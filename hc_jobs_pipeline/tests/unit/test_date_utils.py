@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Date Handling
+============================
+Tests that date_utils.parse_date gives the same dates as dateutil's parser
+(which run_collect used for every date) through its ISO fast path and its
+fallback, and the timestamp helpers collect() and run_summary use.
+"""
+
+import random
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from dateutil import parser as dtparser
+
+import date_utils
+from date_utils import parse_date, parse_timestamp, utc_timestamp
+
+
+def dateutil_date(val):
+    """The date run_collect.parse_date gave before date_utils."""
+    if not val:
+        return None
+    try:
+        return dtparser.parse(val).date().isoformat()
+    except Exception:
+        return None
+
+
+def random_date_string(rng):
+    moment = datetime(2020, 1, 1) + timedelta(seconds=rng.randrange(6 * 365 * 86400), microseconds=rng.randrange(10 ** 6))
+    return rng.choice([
+        lambda: moment.isoformat() + rng.choice(["", "Z", "-05:00", "+05:30", "-0400"]),
+        lambda: moment.isoformat(timespec="milliseconds") + "Z",
+        lambda: moment.isoformat(sep=" ", timespec="seconds"),
+        lambda: moment.date().isoformat(),
+        lambda: moment.strftime("%Y%m%d"),
+        lambda: moment.strftime("%B %d, %Y %H:%M"),
+        lambda: moment.strftime("%m/%d/%Y"),
+        lambda: moment.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        lambda: moment.isoformat()[:rng.randrange(4, 19)] + rng.choice(["", "x", "T99"]),
+        lambda: moment.strftime("%Y-%m-") + str(rng.randrange(28, 40)),
+    ])()
+
+
+class TestDateUtils:
+    """Test class for date handling"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_parse_date(self):
+        """Same dates as dateutil"""
+        print("Testing parse_date")
+        self.check(parse_date("2024-03-05T23:22:31-05:00") == "2024-03-05", "Date in the string's own zone")
+        self.check(parse_date("2024-03-05T14:22:31.000Z") == "2024-03-05", "Fractional seconds and Z")
+        self.check(parse_date("March 5, 2024") == "2024-03-05", "Non-ISO dates fall back to dateutil")
+        self.check(all(parse_date(val) is None for val in (None, "", "not a date", "2024-02-30", 1709650951, ["2024"])),
+                   "Unreadable and non-string values")
+
+        rng = random.Random(49)
+        values = [random_date_string(rng) for _ in range(5000)]
+        wrong = [(val, parse_date(val), dateutil_date(val)) for val in values if parse_date(val) != dateutil_date(val)]
+        self.check(not wrong, f"{len(values)} random strings give dateutil's date", f"Wrong: {wrong[:3]}")
+
+        date_utils._parse_date.cache_clear()
+        repeated = [parse_date(val) for val in values[:100] * 3]
+        info = date_utils._parse_date.cache_info()
+        self.check(repeated == [parse_date(val) for val in values[:100]] * 3 and info.misses == len(set(values[:100])),
+                   "Repeated strings are parsed once", f"Cache: {info}")
+
+    def test_timestamps(self):
+        """collectedAt formatting and parsing"""
+        print("\nTesting Timestamps")
+        eastern = timezone(timedelta(hours=-5))
+        self.check(utc_timestamp(datetime(2024, 3, 5, 14, 22, 31, 999, tzinfo=eastern)) == "2024-03-05T19:22:31Z",
+                   "UTC, to the second, with Z")
+        stamp = utc_timestamp()
+        now = datetime.now(timezone.utc)
+        self.check(len(stamp) == 20 and abs((parse_timestamp(stamp) - now).total_seconds()) < 5,
+                   "Now by default", f"Got: {stamp}")
+        self.check(parse_timestamp("2024-03-05T19:22:31Z") == datetime(2024, 3, 5, 19, 22, 31, tzinfo=timezone.utc),
+                   "Parsed timestamps are aware")
+        self.check(parse_timestamp("2024-03-05T19:22:31") == parse_timestamp("2024-03-05T19:22:31+00:00"),
+                   "Naive timestamps are UTC")
+        mixed = [parse_timestamp(val) for val in ("2024-03-05T19:22:31Z", "2024-03-04T10:00:00", "March 6, 2024")]
+        self.check(max(mixed).day == 6 and min(mixed).day == 4, "Mixed forms compare")
+        self.check(parse_timestamp(None) is None and parse_timestamp("yesterday-ish") is None,
+                   "Missing and unreadable timestamps")
+
+    def run_all_tests(self):
+        """Run all date handling tests"""
+        print("UNIT TESTS: Date Handling")
+        print("=" * 50)
+
+        self.test_parse_date()
+        self.test_timestamps()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Date Handling Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All date handling tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review date handling")
+
+
+def main():
+    """Main test execution"""
+    tester = TestDateUtils()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL DATE HANDLING TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review date handling")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Differential Tests for the Combined Education Matcher
+=====================================================
+Checks that analyze_education_requirements, which scans all pattern families
+in one combined pass, reports exactly what the original per-pattern
+re.search loop reported, and that the meets_bachelors_requirement fast path
+returns the analysis verdict.
+"""
+
+import random
+import re
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import education_filters as ef
+from compiled_rules import CombinedMatcher
+from benchmarks.corpus import generate_corpus
+
+# Phrases that exercise every family, including overlapping matches
+FRAGMENTS = [
+    "bachelor's degree", "bachelors", "bachelor", "ba", "bs", "b.s.", "4-year degree",
+    "degree in healthcare administration", "bachelor's in health information management",
+    "mba", "mha", "mph", "master's degree", "phd", "doctorate", "jd", "pharmd",
+    "5+ years", "7 years of experience", "ten years", "extensive experience",
+    "significant experience", "senior", "director", "preferred", "desired", "a plus",
+    "no degree", "not required", "diploma", "ged", "hs", "associate", "as", "aa",
+    "required", "healthcare", "patient access", "experience", "or equivalent",
+]
+
+
+FAMILY_KEYS = (
+    'healthcare_admin_bachelors', 'advanced_degree', 'high_experience',
+    'bachelors_required', 'bachelors_mentioned', 'bachelors_preferred',
+    'high_school_only', 'no_degree_required', 'context_exclusion',
+)
+
+
+def legacy_family_matches(full_text: str):
+    """The original per-pattern loop, kept as the reference implementation."""
+    matches = {key: [] for key in FAMILY_KEYS}
+    for pattern in ef.HEALTHCARE_ADMIN_BACHELORS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            matches['healthcare_admin_bachelors'].append(pattern)
+    for pattern in ef.ADVANCED_DEGREE_PATTERNS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            matches['advanced_degree'].append(pattern)
+    for pattern in ef.HIGH_EXPERIENCE_PATTERNS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            matches['high_experience'].append(pattern)
+    for pattern in ef.BACHELORS_PATTERNS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            if any(req_word in pattern for req_word in ['required', 'degree required']):
+                matches['bachelors_required'].append(pattern)
+            else:
+                matches['bachelors_mentioned'].append(pattern)
+    for pattern in ef.BACHELORS_PREFERRED_PATTERNS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            matches['bachelors_preferred'].append(pattern)
+    for pattern in ef.HIGH_SCHOOL_PATTERNS:
+        if not re.search(r'required', pattern, re.IGNORECASE):
+            if re.search(pattern, full_text, re.IGNORECASE):
+                if any(exclusion in pattern for exclusion in ['no degree', 'not required', 'preferred but']):
+                    matches['no_degree_required'].append(pattern)
+                else:
+                    matches['high_school_only'].append(pattern)
+    for pattern in ef.CONTEXT_EXCLUSIONS:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            matches['context_exclusion'].append(pattern)
+    return matches
+
+
+def combined_family_matches(full_text: str):
+    matches = {key: [] for key in FAMILY_KEYS}
+    for (key, pattern), hit in zip(ef.FAMILY_PATTERNS, ef.FAMILY_MATCHER.matched(full_text)):
+        if hit:
+            matches[key].append(pattern)
+    return matches
+
+
+class TestEducationMatcherDifferential:
+    """Test class for the combined education matcher"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def sample_texts(self, count: int = 3000):
+        rng = random.Random(28)
+        texts = [p["description"] for p in generate_corpus(300)]
+        for _ in range(count):
+            texts.append(" ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))))
+        return texts
+
+    def test_family_matches(self):
+        """Every family reports the same patterns, in the same order"""
+        print("Testing Family Matches")
+        mismatches = []
+        for text in self.sample_texts():
+            lowered = text.lower()
+            legacy = legacy_family_matches(lowered)
+            combined = combined_family_matches(lowered)
+            if combined != legacy:
+                mismatches.append(text)
+        self.check(not mismatches, "Combined scan matches per-pattern loop",
+                   f"{len(mismatches)} mismatches, first: {mismatches[:1]!r}")
+
+    def test_overlapping_matches(self):
+        """Patterns shadowed by an earlier hit at the same position are still reported"""
+        print("\nTesting Overlapping Matches")
+        text = "bachelor's degree in healthcare administration or mha"
+        combined = combined_family_matches(text)
+        self.check(combined == legacy_family_matches(text), "Overlapping bachelor's patterns")
+        self.check(r"\bbachelor'?s?\b" in combined['bachelors_mentioned'],
+                   "Bare bachelor pattern reported inside longer match")
+
+        matcher = CombinedMatcher([r"bachelor'?s? degree", r"\bbachelor'?s?\b", "mha", "mha", "nowhere"], re.I)
+        hits = matcher.matched("bachelor's degree or mha")
+        self.check(hits == [True, True, True, True, False], "Duplicate and overlapping patterns", f"Got: {hits}")
+
+    def test_full_analysis(self):
+        """matches reported by analyze_education_requirements equal the reference loop"""
+        print("\nTesting Full Analysis")
+        different = 0
+        scanned = 0
+        for text in self.sample_texts(500):
+            result = ef.analyze_education_requirements(text)
+            if 'bachelors_required' not in result['matches']:
+                continue  # primary requirement short-circuit, no family scan
+            scanned += 1
+            expected = legacy_family_matches(f"{text} ".lower())
+            expected['associates_only'] = []
+            if result['matches'] != expected:
+                different += 1
+        self.check(scanned > 0 and different == 0, "Full analysis matches reference",
+                   f"{different} of {scanned} differ")
+
+    def test_fast_verdict(self):
+        """meets_bachelors_requirement agrees with the full analysis"""
+        print("\nTesting Fast Verdict")
+        texts = self.sample_texts()
+        texts += ["High school diploma required. Bachelor's degree preferred.",
+                  "Associate's degree required", "Bachelor's degree required; MBA preferred",
+                  "Bachelor's degree and 12 years of experience", "", "No degree required"]
+        different = [t for t in texts
+                     if ef.meets_bachelors_requirement(t) != ef.analyze_education_requirements(t)['should_include']]
+        self.check(not different, f"{len(texts)} verdicts agree", f"First: {different[:1]!r}")
+        quals = [ef.meets_bachelors_requirement("Patient access role", q) for q in ("Bachelor's degree", "MHA", "")]
+        self.check(quals == [True, False, False], "Qualifications text is read too", f"Got: {quals}")
+
+        matcher = CombinedMatcher([r"bachelor'?s? degree", r"\bmha\b"], re.I)
+        self.check(matcher.search("an mha") and not matcher.search("a degree") and
+                   not CombinedMatcher([]).search("anything"), "Combined search stops at any hit")
+
+    def run_all_tests(self):
+        """Run all combined matcher tests"""
+        print("UNIT TESTS: Education Matcher Differential")
+        print("=" * 50)
+
+        self.test_family_matches()
+        self.test_overlapping_matches()
+        self.test_full_analysis()
+        self.test_fast_verdict()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Education Matcher Differential Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All education matcher differential tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - combined matcher diverged from per-pattern loop")
+
+
+def main():
+    """Main test execution"""
+    tester = TestEducationMatcherDifferential()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL EDUCATION MATCHER DIFFERENTIAL TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review combined matcher")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Years-of-Experience Rules
+========================================
+Tests that YearsRule gives exactly what the same patterns give as a plain
+RuleTable (which hits, in which order, with the same match spans) on the
+phrasings the regexes are sensitive to and on random and synthetic text,
+and which rule-file patterns it evaluates numerically.
+"""
+
+import random
+import re
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import education_filters
+import relaxed_education_filters
+import run_collect
+from compiled_rules import RuleTable
+from experience_years import YearsRule, years_pattern
+from rule_bundle import load_rules
+from benchmarks.corpus import generate_corpus
+
+# Phrasings where a numeric reading and the regexes could part ways
+EDGE_TEXTS = [
+    "3+ years experience", "5 years of experience", "5 years of related experience", "12 years experience",
+    "13 years experience", "115 years experience", "10+ years of experience", "2 years experience",
+    "1-3 years experience", "11-3 years experience", "1-23 years experience", "1-2-3 years experience",
+    "2 to 4 year experience", "1 to 5 years of experience", "0-2 years experience", "1 - 3 years experience",
+    "minimum 2 years", "minimum of 2 years", "minimum: 12 months, 3 year", "minimum\n2 years",
+    "minimum qualifications: 2023 yearly review", "a minimum of five years", "minimum   3      years",
+    "minimuminimum 4 years", "minimum 2 3 4 5 yea", "3years experience", "3++ years experience",
+    "no experience required", "",
+]
+
+WORDS = ["1", "2", "3", "5", "10", "12", "15", "20", "2023", "-", " to ", "+", "years", "year", "yrs", "of",
+         "related", "experience", "minimum", "\n", ".", "extensive experience", "vice president", "a",
+         "years experience", "years of experience", "1-3", "4-6", "2 to 5", "1 to 3"]
+
+
+def random_text(rng):
+    return "".join(rng.choice(WORDS) + rng.choice(["", " ", " ", " ", "  "]) for _ in range(rng.randint(1, 14)))
+
+
+def table_results(table, text):
+    hits = [rule.regex.search(text) is not None for rule in table.rules]
+    found = table.search(text)
+    return hits, (found[0], found[1].span()) if found else None
+
+
+class TestExperienceYears:
+    """Test class for years-of-experience rules"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def years_differ(self, rule, texts):
+        """Texts where ``rule`` and a plain RuleTable over its patterns disagree."""
+        table = RuleTable(rule.patterns, rule.rules[0].regex.flags & re.IGNORECASE)
+        differ = []
+        for text in texts:
+            expected_hits, expected_search = table_results(table, text)
+            found = rule.search(text)
+            got = (rule.matched(text), (found[0], found[1].span()) if found else None)
+            if got != (expected_hits, expected_search) or rule.any(text) != table.any(text):
+                differ.append(text)
+        return differ
+
+    def test_shapes(self):
+        """Which patterns are evaluated numerically"""
+        print("Testing Pattern Shapes")
+        self.check(years_pattern(r"3\+? years? experience", re.I) == ("count", ("3", False))
+                   and years_pattern(r"10\+? years? of experience", re.I) == ("count", ("10", True)),
+                   "Counts, with and without 'of'")
+        self.check(years_pattern("1-3 years? experience", re.I) == ("range", ("1", "-", "3"))
+                   and years_pattern("2 to 4 years? experience", re.I) == ("range", ("2", " to ", "4")),
+                   "Ranges")
+        self.check(years_pattern("minimum.{0,10}2.{0,5}years?", re.I) == ("minimum", ("2",)), "Minimums")
+        self.check(all(years_pattern(p, flags) is None for p, flags in [
+            ("extensive experience", re.I), (r"3\+? years? experience", re.I | re.M),
+            (r"3\+? years? experience\b", re.I), ("minimum.{0,20}2.{0,5}years?", re.I)]),
+            "Other patterns and flags stay regexes")
+
+        strict = load_rules("strict_entry_level").years("STRICT_HIGH_EXPERIENCE")
+        senior = load_rules("relaxed_education").years("SENIOR_EXEC")
+        scored = education_filters.HIGH_EXPERIENCE_RULES
+        self.check(isinstance(scored, YearsRule) and all(strict.numeric), "Strict table is all numeric",
+                   f"Got: {strict}")
+        self.check(sum(1 for n in senior.numeric if n) == 3 and sum(1 for n in scored.numeric if n) == 42,
+                   "Relaxed and scored tables", f"Got: {senior}, {scored}")
+        self.check(strict.patterns == run_collect.STRICT_HIGH_EXPERIENCE_RULES.patterns
+                   and senior.patterns == relaxed_education_filters.SENIOR_EXEC_RULES.patterns
+                   and scored.patterns == education_filters.HIGH_EXPERIENCE_PATTERNS,
+                   "Same patterns, same order as the tables")
+
+    def test_same_results(self):
+        """Hits, order and spans of a plain RuleTable"""
+        print("\nTesting Results Against RuleTable")
+        rules = {
+            "strict": load_rules("strict_entry_level").years("STRICT_HIGH_EXPERIENCE"),
+            "relaxed": load_rules("relaxed_education").years("SENIOR_EXEC"),
+            "scored": education_filters.HIGH_EXPERIENCE_RULES,
+        }
+        rng = random.Random(36)
+        random_texts = [random_text(rng) for _ in range(20000)]
+        corpus = [f"{p['title']} {p['description']} ".lower() for p in generate_corpus(1000, seed=36)]
+        for name, rule in rules.items():
+            differ = self.years_differ(rule, EDGE_TEXTS)
+            self.check(not differ, f"{name}: edge phrasings", f"Differ: {differ[:3]}")
+            differ = self.years_differ(rule, random_texts)
+            self.check(not differ, f"{name}: {len(random_texts)} random texts", f"Differ: {differ[:3]}")
+            differ = self.years_differ(rule, corpus)
+            self.check(not differ, f"{name}: {len(corpus)} synthetic postings", f"Differ: {differ[:1]}")
+
+        strict = rules["strict"]
+        self.check(strict.matching("13 years experience") == [strict.rules[0]]
+                   and not strict.any("5 years of experience"), "Substring semantics, as the regexes have them")
+        found = strict.search("bachelor's degree and 15+ years experience")
+        self.check(found is not None and found[0] == 2 and found[1].group() == "5+ years experience",
+                   "Span of the winning pattern", f"Got: {found}")
+
+    def run_all_tests(self):
+        """Run all experience years tests"""
+        print("UNIT TESTS: Experience Years")
+        print("=" * 50)
+
+        self.test_shapes()
+        self.test_same_results()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Experience Years Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All experience years tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review experience years")
+
+
+def main():
+    """Main test execution"""
+    tester = TestExperienceYears()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL EXPERIENCE YEARS TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review experience years")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
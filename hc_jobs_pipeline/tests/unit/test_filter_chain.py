@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Cost-Ordered Filter Chain
+============================================
+Tests stage ordering by expected cost, rejection attribution, statistics
+persistence, that the posting filters accept exactly the postings the
+fixed-order checks did, and that the run summary shows the stage order
+next to the rejection counts.
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from filter_chain import BUDGET_REASON, FilterChain, FilterStage
+from run_collect import PostingContext, TARGET_STATES, build_filter_chain
+from run_summary import add_filtering_analysis
+from benchmarks.corpus import generate_corpus
+
+
+class TestFilterChain:
+    """Test class for the filter chain"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_ordering(self):
+        """Stages run in ascending cost / rejection rate"""
+        print("Testing Stage Ordering")
+        chain = FilterChain([
+            FilterStage("expensive", lambda x: True, cost_us=100.0, rejection_rate=0.5),
+            FilterStage("cheap_selective", lambda x: True, cost_us=1.0, rejection_rate=0.5),
+            FilterStage("cheap_rare", lambda x: True, cost_us=1.0, rejection_rate=0.001),
+        ])
+        self.check(chain.order == ["cheap_selective", "expensive", "cheap_rare"],
+                   "Ordered by expected cost", f"Got: {chain.order}")
+
+    def test_attribution(self):
+        """A rejected posting is counted once, under the first rejecting stage"""
+        print("\nTesting Rejection Attribution")
+        chain = FilterChain([
+            FilterStage("odd", lambda n: n % 2 == 0, cost_us=1.0),
+            FilterStage("small", lambda n: n >= 10, cost_us=2.0),
+        ])
+        reasons = [chain.rejection_reason(n) for n in range(20)]
+        self.check(reasons[3] == "odd" and reasons[4] == "small" and reasons[12] is None,
+                   "First failing stage reported", f"Got: {reasons}")
+        stats = chain.stats()["stages"]
+        self.check(stats["odd"]["evaluated"] == 20 and stats["small"]["evaluated"] == 10,
+                   "Later stages skip rejected postings", f"Got: {stats}")
+
+    def test_stats_round_trip(self):
+        """Saved statistics become priors for the next run"""
+        print("\nTesting Statistics Persistence")
+        first = FilterChain([
+            FilterStage("a", lambda n: n > 90, cost_us=1.0, rejection_rate=0.01),
+            FilterStage("b", lambda n: True, cost_us=1.0, rejection_rate=0.5),
+        ])
+        for n in range(100):
+            first.rejection_reason(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stage_stats.json")
+            first.save_stats(path)
+            second = FilterChain([
+                FilterStage("b", lambda n: True, cost_us=1.0, rejection_rate=0.5),
+                FilterStage("a", lambda n: n > 90, cost_us=1.0, rejection_rate=0.01),
+            ])
+            loaded = second.load_stats(path)
+            missing = second.load_stats(os.path.join(tmp, "missing.json"))
+        self.check(loaded and second.order[0] == "a", "Re-tuned from saved stats", f"Got: {second.order}")
+        self.check(not missing, "Missing stats file keeps priors")
+
+    def test_posting_filters_equivalent(self):
+        """The chain accepts exactly the postings the fixed-order checks accepted"""
+        print("\nTesting Posting Filter Equivalence")
+        chain = build_filter_chain(retune_every=50)
+        postings = generate_corpus(1500, seed=31)
+        mismatches = 0
+        counts = {}
+        for p in postings:
+            reason = chain.rejection_reason(PostingContext(p["title"], p["location"], p["description"]))
+            posting = PostingContext(p["title"], p["location"], p["description"])
+            admin_check, _ = posting.health_admin
+            expected = admin_check and posting.meets_entry_level and posting.state in TARGET_STATES
+            if (reason is None) != expected:
+                mismatches += 1
+            if reason:
+                counts[reason] = counts.get(reason, 0) + 1
+        self.check(mismatches == 0, "Same postings included", f"{mismatches} differ")
+        self.check(chain.order[0] == "non_us_locations", "Location check runs first", f"Got: {chain.order}")
+        stage_rejections = sum(s["rejected"] for s in chain.stats()["stages"].values())
+        self.check(stage_rejections == sum(counts.values()), "Stage counts match reasons")
+
+    def test_time_budget(self):
+        """Postings over the time budget stop before the remaining stages"""
+        print("\nTesting Time Budget")
+        seen = []
+        chain = FilterChain([
+            FilterStage("slow", lambda n: time.sleep(0.02 if n == 1 else 0) or True, cost_us=1.0),
+            FilterStage("last", lambda n: seen.append(n) or True, cost_us=100.0),
+        ], budget_ms=10)
+        reasons = [chain.rejection_reason(n) for n in range(3)]
+        self.check(reasons == [None, BUDGET_REASON, None] and seen == [0, 2],
+                   "Slow posting rejected, others unaffected", f"Got: {reasons}, ran: {seen}")
+        stats = chain.stats()
+        self.check(stats["over_budget"] == 1 and stats["budget_ms"] == 10, "Budget counted in stats")
+        self.check("over_budget" not in FilterChain([]).stats(), "No budget, no budget stats")
+
+    def test_summary_order(self):
+        """run_summary shows per-reason counts with the stage order they depend on"""
+        print("\nTesting Summary Stage Order")
+        chain = FilterChain([
+            FilterStage("odd", lambda n: n % 2 == 0, cost_us=1.0, rejection_rate=0.1, prior_weight=1),
+            FilterStage("small", lambda n: n >= 10, cost_us=1.0, rejection_rate=0.2, prior_weight=1),
+        ], retune_every=5)
+        self.check(chain.order == ["small", "odd"], "Starts with the more selective prior")
+        counts = {"odd": 0, "small": 0}
+        for n in range(40):
+            reason = chain.rejection_reason(n)
+            if reason:
+                counts[reason] += 1
+        stats = chain.stats()
+        self.check(stats["reorders"] == 1 and chain.order == ["odd", "small"], "Re-orders during the run counted",
+                   f"Got: {stats['reorders']} {chain.order}")
+
+        lines = []
+        add_filtering_analysis(lines, {"total_jobs_analyzed": 40, "final_jobs_included": 15,
+                                       "filtered_out": counts, "filter_stages": stats})
+        rows = [line for line in lines if line.startswith("| 1 ") or line.startswith("| 2 ")]
+        self.check([row.split(" | ")[1] for row in rows] == ["Odd", "Small"], "Rows in stage order", f"Got: {rows}")
+        self.check(any("changed 1 time during the run" in line for line in lines), "Re-ordering noted")
+        lines = []
+        add_filtering_analysis(lines, {"total_jobs_analyzed": 40, "filtered_out": counts})
+        self.check("| Reason | Count | % of Total |" in lines, "Stats without stage order")
+
+    def run_all_tests(self):
+        """Run all filter chain tests"""
+        print("UNIT TESTS: Filter Chain")
+        print("=" * 50)
+
+        self.test_ordering()
+        self.test_attribution()
+        self.test_stats_round_trip()
+        self.test_posting_filters_equivalent()
+        self.test_time_budget()
+        self.test_summary_order()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Filter Chain Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All filter chain tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review filter chain")
+
+
+def main():
+    """Main test execution"""
+    tester = TestFilterChain()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL FILTER CHAIN TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review filter chain")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Multi-Keyword Automaton
+==========================================
+Tests one-pass keyword matching against the ``any(k in text)`` checks it
+replaces, word-boundary semantics, and parity between the native and
+pure-Python backends.
+"""
+
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from keyword_automaton import HAVE_NATIVE_AUTOMATON, KeywordAutomaton, keyword_automaton
+from run_collect import ADMIN_HINTS, EXCLUDE_TITLE_HINTS
+from benchmarks.corpus import generate_corpus
+
+
+class TestKeywordAutomaton:
+    """Test class for the keyword automaton"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        # Always exercise the fallback; the native backend only when installed
+        self.backends = [False, True] if HAVE_NATIVE_AUTOMATON else [False]
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_substring_semantics(self):
+        """contains_any and hits agree with plain substring checks"""
+        print("Testing Substring Semantics")
+        texts = [(p["title"] + "\n" + p["description"]).lower() for p in generate_corpus(300)]
+        texts += ["", "administrative", "learn more", "pa-c and rn"]
+        for native in self.backends:
+            automaton = KeywordAutomaton(ADMIN_HINTS, native=native)
+            bad = [t for t in texts
+                   if automaton.contains_any(t) != any(h in t for h in ADMIN_HINTS)
+                   or automaton.hits(t) != {h for h in ADMIN_HINTS if h in t}]
+            self.check(not bad, f"Admin hints match substring checks (native={native})",
+                       f"{len(bad)} differ, first: {bad[:1]!r}")
+
+    def test_overlapping_hits(self):
+        """Every occurrence is reported, including keywords inside other keywords"""
+        print("\nTesting Overlapping Hits")
+        for native in self.backends:
+            automaton = KeywordAutomaton(["admin", "administrative", "strat", "rat"], native=native)
+            hits = automaton.find_all("administrative")
+            self.check(hits == [(0, "administrative"), (0, "admin"), (6, "strat"), (8, "rat")],
+                       f"Overlapping keywords (native={native})", f"Got: {hits}")
+
+    def test_word_boundary(self):
+        """Word-boundary mode ignores keywords inside longer words"""
+        print("\nTesting Word Boundary")
+        for native in self.backends:
+            automaton = KeywordAutomaton(EXCLUDE_TITLE_HINTS, word_boundary=True, native=native)
+            self.check(automaton.hits("rn, bsn required") == {"rn"}, f"Whole word matched (native={native})")
+            self.check(not automaton.contains_any("learn the intern role"),
+                       f"Keyword inside word ignored (native={native})")
+            self.check(automaton.hits("pa-c / np") == {"pa-c", "np"},
+                       f"Keywords with punctuation (native={native})")
+
+    def test_shared_automata(self):
+        """Automata are built once per distinct keyword list"""
+        print("\nTesting Shared Automata")
+        self.check(keyword_automaton(ADMIN_HINTS) is keyword_automaton(list(ADMIN_HINTS)),
+                   "Same list shares one automaton")
+        self.check(keyword_automaton(ADMIN_HINTS) is not keyword_automaton(ADMIN_HINTS, word_boundary=True),
+                   "Boundary mode builds its own automaton")
+        self.check(not KeywordAutomaton([]).contains_any("anything"), "Empty keyword list matches nothing")
+
+    def run_all_tests(self):
+        """Run all keyword automaton tests"""
+        print("UNIT TESTS: Keyword Automaton")
+        print("=" * 50)
+
+        self.test_substring_semantics()
+        self.test_overlapping_hits()
+        self.test_word_boundary()
+        self.test_shared_automata()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Keyword Automaton Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All keyword automaton tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review keyword matching")
+
+
+def main():
+    """Main test execution"""
+    tester = TestKeywordAutomaton()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL KEYWORD AUTOMATON TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review keyword matching")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Location Resolution
+==================================
+Tests that location_resolver keeps what run_collect read from two-letter
+state codes and city prefixes, and that it also resolves state names and
+cities, keeps non-US locations out, and memoizes repeated strings.
+"""
+
+import random
+import re
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import location_resolver
+from location_resolver import STATE_REGION, US_STATES, ResolvedLocation, resolve_location
+from run_collect import PostingContext, TARGET_STATES, extract_city_from_location, get_state_region, infer_state
+from benchmarks.corpus import LOCATIONS
+
+LEGACY_STATE_CODE_RE = re.compile(r"\b([A-Z]{2})\b")
+
+
+def legacy_state(location):
+    """run_collect.infer_state before location_resolver."""
+    m = LEGACY_STATE_CODE_RE.search(location or "")
+    return m.group(1) if m and m.group(1) in TARGET_STATES else None
+
+
+def legacy_city(location):
+    """run_collect.extract_city_from_location before location_resolver."""
+    if not location:
+        return ""
+    location = location.strip()
+    if ',' in location:
+        return location.split(',')[0].strip()
+    return location
+
+
+def random_location(rng):
+    city = rng.choice(["Nashville", "Springfield", "Remote", "Hybrid", "San Jose", " Boise ", "Work from home", ""])
+    code = rng.choice(list(US_STATES) + ["ON", "BC", "UK", "US", "tn", ""])
+    return rng.choice([
+        f"{city}, {code}",
+        f"{city} {code}",
+        f"{city},{code}, US",
+        f"{code} - {city}",
+        f"{city}, {code} (Remote)",
+        f"{city} , {rng.choice(list(US_STATES.values()))}",
+        f"{city}",
+    ])
+
+
+class TestLocationResolver:
+    """Test class for location resolution"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_legacy_results(self):
+        """State codes and cities read as before"""
+        print("Testing Legacy Results")
+        rng = random.Random(50)
+        locations = LOCATIONS + [random_location(rng) for _ in range(5000)]
+        # Wherever the old code found a state, it's the same state now
+        changed = [(loc, legacy_state(loc), infer_state(loc)) for loc in locations
+                   if legacy_state(loc) and legacy_state(loc) != infer_state(loc)]
+        self.check(not changed, f"{len(locations)} locations keep their state code", f"Changed: {changed[:3]}")
+        cities = [(loc, legacy_city(loc), resolve_location(loc).city) for loc in locations
+                  if legacy_city(loc) != resolve_location(loc).city]
+        self.check(not cities, "Cities as extract_city_from_location read them", f"Changed: {cities[:3]}")
+        self.check(all(get_state_region(code) == STATE_REGION[code] for code in TARGET_STATES)
+                   and get_state_region(" ny ") == "Northeast" and get_state_region("ON") == "Unknown",
+                   "Regions of state codes")
+        self.check(extract_city_from_location("Nashville, TN") == "Nashville" and extract_city_from_location(None) == "",
+                   "extract_city_from_location")
+
+    def test_new_formats(self):
+        """State names, cities and non-US locations"""
+        print("\nTesting New Formats")
+        expected = {
+            "California, US": ("California", "CA", "West", False),
+            "New York, US": ("New York", "NY", "Northeast", False),
+            "Remote - Texas": ("Remote - Texas", "TX", "South", True),
+            "Charleston, West Virginia": ("Charleston", "WV", "South", False),
+            "Washington, D.C.": ("Washington", "DC", "South", False),
+            "Seattle, Washington": ("Seattle", "WA", "West", False),
+            "St. Louis, United States": ("St. Louis", "MO", "Midwest", False),
+            "Chicago": ("Chicago", "IL", "Midwest", False),
+            "Remote - US, PA": ("Remote - US", "PA", "Northeast", True),
+            "Toronto, ON, CA": ("Toronto", None, "Unknown", False),
+            "London, UK": ("London", None, "Unknown", False),
+            "Remote - US": ("Remote - US", None, "Unknown", True),
+            "Portland": ("Portland", None, "Unknown", False),
+            "": ("", None, "Unknown", False),
+        }
+        wrong = {loc: tuple(resolve_location(loc)) for loc, want in expected.items() if tuple(resolve_location(loc)) != want}
+        self.check(not wrong, f"{len(expected)} locations resolve", f"Wrong: {wrong}")
+        self.check(all(resolve_location(f"{name}, US").state == code for code, name in US_STATES.items()),
+                   "Every state's name")
+
+    def test_posting_context(self):
+        """PostingContext reads the resolved location"""
+        print("\nTesting PostingContext")
+        posting = PostingContext("Unit Clerk", "Texas, US", "")
+        self.check(posting.location_info == ResolvedLocation("Texas", "TX", "South", False)
+                   and posting.state == "TX" and not posting.remote, "State, region and remote together")
+
+        location_resolver._resolve.cache_clear()
+        for loc in LOCATIONS * 100:
+            PostingContext("Unit Clerk", loc, "").state
+        info = location_resolver._resolve.cache_info()
+        self.check(info.misses == len(set(LOCATIONS)), "Repeated locations are resolved once", f"Cache: {info}")
+
+    def run_all_tests(self):
+        """Run all location resolution tests"""
+        print("UNIT TESTS: Location Resolution")
+        print("=" * 50)
+
+        self.test_legacy_results()
+        self.test_new_formats()
+        self.test_posting_context()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Location Resolution Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All location resolution tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review location resolution")
+
+
+def main():
+    """Main test execution"""
+    tester = TestLocationResolver()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL LOCATION RESOLUTION TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review location resolution")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Pattern-Match Matrix
+=======================================
+Tests that each matrix profile reproduces its filter function exactly, that
+shared patterns get a single column, and that the comparison report is
+consistent with the profile results.
+"""
+
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import education_filters
+import relaxed_education_filters
+import simplified_education_filters
+from pattern_matrix import HAVE_NUMPY, PROFILES, PatternColumns, PatternMatrix, compare_profiles, default_columns
+from run_collect import PostingContext
+from benchmarks.corpus import generate_corpus
+
+
+class TestPatternMatrix:
+    """Test class for the pattern matrix"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_profiles_match_filters(self):
+        """Every profile equals the filter function it replaces"""
+        print("Testing Profiles vs Filter Functions")
+        postings = generate_corpus(1500, seed=34)
+        matrix = PatternMatrix.build(postings, chunk_size=400)
+        results = matrix.evaluate(PROFILES)
+        functions = {
+            "strict": lambda p: PostingContext(p["title"], p["location"], p["description"]).meets_entry_level,
+            "scored": lambda p: education_filters.meets_bachelors_requirement(p["description"]),
+            "relaxed": lambda p: relaxed_education_filters.meets_relaxed_education_requirement(p["description"]),
+            "simplified": lambda p: simplified_education_filters.meets_simplified_education_requirement(
+                p["description"]),
+        }
+        for name, fn in functions.items():
+            expected = [fn(p) for p in postings]
+            mismatches = sum(bool(r) != e for r, e in zip(results[name], expected))
+            self.check(len(results[name]) == len(postings) and mismatches == 0,
+                       f"{name} profile agrees", f"{mismatches} mismatches")
+
+    def test_columns(self):
+        """Patterns shared between filters are scanned once"""
+        print("\nTesting Column Registry")
+        columns = PatternColumns()
+        columns.add_patterns("a.one", "description", ["bachelor", "mba"])
+        columns.add_patterns("b.two", "description", ["mba", "ph\\.?d"])
+        columns.add_patterns("c.three", "title", ["mba"])
+        self.check(len(columns) == 4, "Same field and pattern share a column", f"Got {len(columns)}")
+        self.check(columns.groups["a.one"][1] == columns.groups["b.two"][0], "Groups point at the shared column")
+
+        defaults = default_columns()
+        self.check(len(defaults) < sum(len(c) for c in defaults.groups.values()),
+                   "Default profiles share columns")
+        try:
+            columns.add_patterns("d.four", "location", ["x"])
+            rejected = False
+        except ValueError:
+            rejected = True
+        self.check(rejected, "Unknown field rejected")
+
+    def test_custom_profile(self):
+        """Custom groups and profiles evaluate over pipeline records"""
+        print("\nTesting Custom Profile")
+        columns = default_columns()
+        columns.add_patterns("custom.coding", "description", [r"\bcoding\b", r"\bicd-?10\b"])
+        records = [
+            {"jobTitle": "Medical Coder", "city": "Boise", "jobDescription": "ICD-10 coding. Bachelor's degree."},
+            {"jobTitle": "Director of Coding", "city": "Boise", "jobDescription": "Coding oversight. Bachelor's."},
+            {"jobTitle": "Scheduler", "city": "Boise", "jobDescription": "High school diploma."},
+        ]
+        matrix = PatternMatrix.build(records, columns)
+        result = matrix.evaluate({"coding_entry": lambda m: m.any("custom.coding") & PROFILES["strict"](m)})
+        self.check(result["coding_entry"].tolist() == [True, False, False], "Custom profile",
+                   f"Got {result['coding_entry'].tolist()}")
+        try:
+            matrix.any("custom.missing")
+            unknown = False
+        except KeyError:
+            unknown = True
+        self.check(unknown, "Unknown group raises KeyError")
+
+    def test_report(self):
+        """Pair counts add up and examples are real disagreements"""
+        print("\nTesting Comparison Report")
+        matrix = PatternMatrix.build(generate_corpus(600, seed=5))
+        results = matrix.evaluate(PROFILES)
+        report = compare_profiles(matrix, examples=2)
+        self.check(len(report["pairs"]) == 6 and report["postings"] == 600, "All profile pairs reported")
+        consistent = True
+        for pair in report["pairs"]:
+            a, b = pair["profiles"]
+            only_a, only_b = pair[f"only_{a}"], pair[f"only_{b}"]
+            consistent &= pair["agree"] + only_a["count"] + only_b["count"] == 600
+            consistent &= all(results[a][i] and not results[b][i] for i in only_a["examples"])
+            consistent &= len(only_a["examples"]) <= 2
+        self.check(consistent, "Counts and examples consistent")
+
+        empty = PatternMatrix.build([])
+        self.check(len(empty) == 0 and compare_profiles(empty)["included"]["strict"] == 0, "Empty corpus")
+
+    def run_all_tests(self):
+        """Run all pattern matrix tests"""
+        print("UNIT TESTS: Pattern Matrix")
+        print("=" * 50)
+
+        self.test_profiles_match_filters()
+        self.test_columns()
+        self.test_custom_profile()
+        self.test_report()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Pattern Matrix Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All pattern matrix tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review pattern matrix")
+
+
+def main():
+    """Main test execution"""
+    if not HAVE_NUMPY:
+        print("SKIPPED: pattern matrix tests need NumPy (pip install -r requirements-optional.txt)")
+        return 0
+    tester = TestPatternMatrix()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL PATTERN MATRIX TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review pattern matrix")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
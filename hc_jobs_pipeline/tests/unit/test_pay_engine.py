@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Pay Engine
+=============================
+Tests that the single-pass scanner finds every pay mention with its offsets
+and type, and that the first-hit policy picks the same pay as the pattern
+lists it replaced in run_collect.py and update_pay_from_urls.py.
+"""
+
+import random
+import re
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import run_collect
+from pay_engine import PAY_VARIANTS, first_hit, hourly_pay, pay_mentions
+
+# The pattern list update_pay_from_urls.py had; run_collect.py had the first five
+LEGACY_PAY_PATTERNS = [
+    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?[-–]\s?\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
+    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
+    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:and|\s?[-–]\s?)\s?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
+    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
+    re.compile(r"between\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+and\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+per\s+year", re.I),
+    re.compile(r"salary\s+(?:range\s+)?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?[-–]\s?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually)", re.I),
+    re.compile(r"starting\s+(?:at\s+)?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?hour|/hr|hr)", re.I),
+    re.compile(r"up\s+to\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?hour|/hr|hr)", re.I),
+]
+
+
+def legacy_pay(text, patterns):
+    """The removed per-pattern loop"""
+    for pat in patterns:
+        m = pat.search(text)
+        if not m:
+            continue
+        groups = m.groups()
+        if len(groups) == 2 and pat.pattern.lower().find("hour") != -1:
+            low, high = float(groups[0]), float(groups[1])
+            return round((low + high) / 2.0, 2), {"type": "hourly_range", "min": low, "max": high}
+        if len(groups) == 1 and pat.pattern.lower().find("hour") != -1:
+            val = float(groups[0])
+            return round(val, 2), {"type": "hourly", "value": val}
+        if len(groups) == 2 and pat.pattern.lower().find("year") != -1:
+            low, high = float(groups[0].replace(",", "")), float(groups[1].replace(",", ""))
+            mid_annual = (low + high) / 2.0
+            return round(mid_annual / 2080.0, 2), {"type": "annual_range", "min": low, "max": high, "annual_mid": mid_annual}
+        if len(groups) == 1 and pat.pattern.lower().find("year") != -1:
+            val = float(groups[0].replace(",", ""))
+            return round(val / 2080.0, 2), {"type": "annual", "value": val}
+    return None, None
+
+
+PIECES = ["$", "$ ", "$20", "$18.50", "$1,200", "$45,000", "$55,000.00", "$60,000", "17", " - ", "-", " – ",
+          " and ", " per hour", "/hr", "hr", " hrs", "per hour", " per year", "/yr", " annually", " a year",
+          "ayear", "between ", "Between ", "salary ", "Salary range ", "starting at ", "Starting ", "up to ",
+          "Pay: ", " DOE", ", ", ". ", "\n", "hourly", "year", "wage ", "x"]
+
+
+class TestPayEngine:
+    """Test class for the pay engine"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_mentions(self):
+        """Every mention, with offsets and type"""
+        print("Testing Pay Mentions")
+        text = "Pay: $20 - $25 per hour. Supervisors earn $52,000 annually, starting at $19/hrs."
+        found = [(text[m.start:m.end], m.type, m.low, m.high) for m in pay_mentions(text)]
+        self.check(found == [("$20 - $25 per hour", "hourly_range", 20.0, 25.0),
+                             ("$25 per hour", "hourly", 25.0, None),
+                             ("$52,000 annually", "annual", 52000.0, None),
+                             ("starting at $19/hr", "hourly", 19.0, None)],
+                   "Mentions in order, nested ones included", f"Got: {found}")
+        between = pay_mentions("between $50,000 and $60,000 per year")
+        self.check([PAY_VARIANTS[m.variant].name for m in between] == ["between_annual_range", "annual_range", "annual"],
+                   "Highest-priority variant at each position")
+        self.check([m.type for m in pay_mentions("ſalary $40,000 - $50,000 annually")] == ["annual_range", "annual_range", "annual"],
+                   "Case-insensitive lead letters")
+        self.check(pay_mentions("") == [] and pay_mentions("Competitive pay, DOE") == [], "No mentions")
+        self.check(hourly_pay("$41,600 per year") == (20.0, {"type": "annual", "value": 41600.0}),
+                   "Annual converted at 2080 hours")
+        self.check(hourly_pay("$52,000 annually or $20/hr", policy=lambda ms: ms[0] if ms else None)[0] == 25.0,
+                   "Policies choose among mentions")
+        self.check(first_hit([]) is None, "First hit of nothing")
+
+    def test_first_hit_matches_legacy(self):
+        """First hit gives what the old pattern loops gave"""
+        print("\nTesting First Hit Against the Old Pattern Loops")
+        rng = random.Random(42)
+        texts = ["Pay: $20 - $25 per hour", "$55,000 annually and $20/hr", "between $50,000 and $60,000 per year",
+                 "salary range $45,000 - $55,000 per year", "Starting at $18/hrs", "up to $1,200 per hour"]
+        texts += ["".join(rng.choice(PIECES) for _ in range(rng.randint(1, 14))) for _ in range(20000)]
+        wrong_all, wrong_collect, compared = [], [], 0
+        for text in texts:
+            try:
+                expected = legacy_pay(text, LEGACY_PAY_PATTERNS)
+            except ValueError:
+                # The old "starting at"/"up to" patterns couldn't parse "$1,200" as an hourly rate
+                expected = None
+            got = hourly_pay(text)
+            if expected is not None:
+                compared += 1
+                if got != expected:
+                    wrong_all.append((text, expected, got))
+            collect = legacy_pay(text, LEGACY_PAY_PATTERNS[:5])
+            if collect != (None, None) and run_collect._scan_pay(text) != collect:
+                wrong_collect.append((text, collect))
+        self.check(compared > 15000 and not wrong_all, f"{compared} texts agree with update_pay_from_urls",
+                   f"Wrong: {wrong_all[:3]}")
+        self.check(not wrong_collect, "run_collect pay unchanged wherever it found pay", f"Wrong: {wrong_collect[:3]}")
+        self.check(hourly_pay("up to $1,200 per hour")[0] == 1200.0, "Grouped hourly amounts parse")
+
+    def run_all_tests(self):
+        """Run all pay engine tests"""
+        print("UNIT TESTS: Pay Engine")
+        print("=" * 50)
+
+        self.test_mentions()
+        self.test_first_hit_matches_legacy()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Pay Engine Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All pay engine tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review pay engine")
+
+
+def main():
+    """Main test execution"""
+    tester = TestPayEngine()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL PAY ENGINE TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review pay engine")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Concurrent Pay Enrichment
+========================================
+Tests that update_pay_from_urls fills in N/A pay from posting pages
+concurrently without exceeding its per-host limit, fetches hosts with a
+history of stating pay first, and reports pages, hits and bytes; and that
+streamed page reads see the same text as BeautifulSoup and the same pay as
+whole pages while reading less, taking pay and closing dates from JobPosting
+JSON-LD when the page has it; and that pages are read while URLs are still
+being submitted, as collect() does with --enrich-pay. Pages are served by an in-process httpx
+transport, so no network is needed.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import random
+import sys
+import os
+import tempfile
+import warnings
+from pathlib import Path
+
+import httpx
+from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import update_pay_from_urls
+from update_pay_from_urls import (PageText, PayEnricher, apply_page, enrich_pay, extract_pay_from_html,
+                                  host_hit_rate, job_postings, json_ld_closing_date, json_ld_pay,
+                                  order_by_host_history, read_page_pay)
+
+# Short random pages can look like file names to BeautifulSoup
+warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
+
+PAY_PAGE = "<html><body><h1>Scheduler</h1><p>Pay: $22 - $24 per hour</p></body></html>"
+NO_PAY_PAGE = "<html><body><h1>Scheduler</h1><p>Competitive pay</p></body></html>"
+
+
+class PageServer:
+    """Serves pay pages on paying.example, others elsewhere; tracks concurrency per host"""
+
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.active = {}
+        self.peak = {}
+        self.order = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.order.append(host)
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        await asyncio.sleep(self.latency)
+        self.active[host] -= 1
+        if host == "broken.example":
+            return httpx.Response(500)
+        return httpx.Response(200, text=PAY_PAGE if host == "paying.example" else NO_PAY_PAGE)
+
+
+MARKUP = ["<p>", "</p>", "<div class='a'>", "</div>", "<br>", "<b>", "</b>", "<!-- $99/hr -->", "&amp;", "&nbsp;",
+          "&#36;", "<script>var pay = '$50/hr';</script>", "<style>p { content: '$' }</style>", "<template>$70/hr</template>",
+          "<noscript>$15/hr</noscript>", "<![CDATA[$30/hr]]>", "<!DOCTYPE html>", "<li>", "\n   ", "  ",
+          '<script type="application/ld+json">{"@type": "JobPosting", "title": "$40/hr"}</script>']
+TEXT = ["Pay: ", "$20", " - ", "$25", " per hour", "$52,000", " annually", "between ", " and ", "Salary range ",
+        "Medical Scheduler", "Front desk", "up to ", "starting at ", "/hr", ".", "x" * 40, "$18 - $21/hr",
+        "$19 – <b>$23</b> per hour"]
+
+
+def make_page(rng, parts):
+    return "".join(rng.choice(MARKUP + TEXT) for _ in range(parts))
+
+
+async def stream_page(html, max_bytes=0, headers=None):
+    async def handle(request):
+        return httpx.Response(200, content=html.encode("utf-8"), headers=headers)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        async with client.stream("GET", "https://jobs.example/1") as response:
+            return await read_page_pay(response, max_bytes)
+
+
+def ld_script(posting):
+    return f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+
+
+def salary(value, currency="USD"):
+    return {"baseSalary": {"@type": "MonetaryAmount", "currency": currency, "value": value}}
+
+
+def make_jobs():
+    jobs = []
+    for i in range(6):
+        for host in ("barren.example", "paying.example", "broken.example"):
+            jobs.append({"jobTitle": f"Job {i}", "pay": "N/A", "sourceFile": f"https://{host}/jobs/{i}"})
+    jobs.append({"jobTitle": "Has pay", "pay": "$20.0/hr", "sourceFile": "https://paying.example/jobs/x"})
+    jobs.append({"jobTitle": "No URL", "pay": "N/A", "sourceFile": "Word/job.docx"})
+    return jobs
+
+
+class TestPayEnrichment:
+    """Test class for concurrent pay enrichment"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    async def run_pass(self, jobs, server, host_stats=None, **limits):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server.handle)) as client:
+            return await enrich_pay(jobs, client, host_stats=host_stats, **limits)
+
+    def test_enrichment(self):
+        """Pay filled in concurrently within the per-host limit"""
+        print("Testing Enrichment")
+        jobs = make_jobs()
+        server = PageServer()
+        stats = asyncio.run(self.run_pass(jobs, server, concurrency=6, per_host=2, delay=0.005))
+        paying = [j["pay"] for j in jobs if "paying.example/jobs/" in j["sourceFile"] and j["jobTitle"] != "Has pay"]
+        self.check(paying == ["$23.0/hr"] * 6, "Pay filled in from pages that state it", f"Got: {paying}")
+        self.check(all(j["pay"] == "N/A" for j in jobs if "paying" not in j["sourceFile"]), "Others left N/A")
+        self.check(jobs[-2]["pay"] == "$20.0/hr" and len(server.order) == 18, "Jobs with pay or without URL skipped")
+        self.check(max(server.peak.values()) == 2, "Per-host limit held and used", f"Peak: {server.peak}")
+        self.check((stats.fetched, stats.found, stats.errors) == (12, 6, 6) and stats.hit_rate == 0.5,
+                   "Fetched, found and errors counted", stats.summary())
+        self.check(stats.bytes == 6 * len(PAY_PAGE) + 6 * len(NO_PAY_PAGE) and stats.pages_per_sec > 0,
+                   "Bytes and pages/sec reported", stats.summary())
+
+        serial = PageServer()
+        asyncio.run(self.run_pass(make_jobs(), serial, concurrency=1, per_host=1, delay=0))
+        self.check(max(serial.peak.values()) == 1, "One page at a time when asked")
+
+    def test_host_history(self):
+        """Hosts that have stated pay before are fetched first, and history is kept"""
+        print("\nTesting Host History")
+        history = {"paying.example": {"fetched": 10, "found": 9}, "barren.example": {"fetched": 10, "found": 0}}
+        self.check(host_hit_rate(history["paying.example"]) > host_hit_rate(None) > host_hit_rate(history["barren.example"]),
+                   "Unseen hosts rank between proven and barren ones")
+        jobs = make_jobs()[:18]
+        ordered = [update_pay_from_urls.host_of(j["sourceFile"]) for j in order_by_host_history(jobs, history)]
+        self.check(ordered == ["paying.example"] * 6 + ["broken.example"] * 6 + ["barren.example"] * 6,
+                   "Ordered by hit rate, stable within a host", f"Got: {ordered}")
+
+        server = PageServer()
+        asyncio.run(self.run_pass(jobs, server, history, concurrency=1, per_host=1, delay=0))
+        self.check(server.order[:6] == ["paying.example"] * 6, "Fetched in that order")
+        self.check(history["paying.example"] == {"fetched": 16, "found": 15}
+                   and history["barren.example"] == {"fetched": 16, "found": 0}
+                   and "broken.example" not in history, "History updated with fetched pages", f"Got: {history}")
+
+    def test_page_text(self):
+        """Streamed text is BeautifulSoup's, however the page is split"""
+        print("\nTesting Page Text")
+        rng = random.Random(45)
+        wrong = []
+        for _ in range(3000):
+            html = make_page(rng, rng.randint(1, 40))
+            page = PageText()
+            cuts = sorted(rng.sample(range(len(html) + 1), min(3, len(html) + 1)))
+            for a, b in zip([0] + cuts, cuts + [len(html)]):
+                page.feed(html[a:b])
+            page.close()
+            expected = BeautifulSoup(html, "html.parser").get_text(separator="\n", strip=True)
+            if page.text != expected:
+                wrong.append((html, expected, page.text))
+        self.check(not wrong, "3000 pages read as BeautifulSoup reads them", f"Wrong: {wrong[:2]}")
+        self.check(extract_pay_from_html("<script>'$50/hr'</script><p>$18/hr</p>")[0] == 18.0,
+                   "Script contents unread")
+
+    def test_streamed_pay(self):
+        """Same pay as the whole page, reading less when an hourly range comes early"""
+        print("\nTesting Streamed Pay")
+        rng = random.Random(450)
+        padding = "<script>" + "var x = 1;" * 3000 + "</script>"
+        wrong = []
+        for _ in range(300):
+            html = padding.join(make_page(rng, rng.randint(1, 30)) for _ in range(rng.randint(1, 6)))
+            page = asyncio.run(stream_page(html))
+            if (page.pay_hr, page.pay_raw) != extract_pay_from_html(html):
+                wrong.append(html)
+        self.check(not wrong, "300 multi-chunk pages give the whole-page pay", f"Wrong: {wrong[:1]}")
+
+        early = "<p>Pay: $20 - $24 per hour</p>" + padding * 40 + "<p>Salary range $90,000 - $99,000 per year</p>"
+        page = asyncio.run(stream_page(early))
+        self.check((page.pay_hr, page.complete) == (22.0, False) and page.bytes_read < 100_000,
+                   "Stops at an hourly range", f"Read {page.bytes_read}")
+        self.check(page.bytes_total == len(early) and page.bytes_saved == len(early) - page.bytes_read,
+                   "Bytes saved from Content-Length")
+        late = "<p>$52,000 annually</p>" + padding * 40 + "<p>$20 - $24 per hour</p>"
+        self.check(asyncio.run(stream_page(late)).pay_hr == 22.0, "Other pay doesn't stop the read")
+        capped = asyncio.run(stream_page(late, max_bytes=200_000))
+        self.check(capped.pay_hr == 25.0 and not capped.complete and capped.bytes_read < 250_000,
+                   "Stops at the byte cap with the pay read so far")
+        self.check(asyncio.run(stream_page(late, headers={"content-type": "text/html; charset=latin-1"})).pay_hr == 22.0,
+                   "Declared charset decoded")
+
+        jobs = [{"jobTitle": "Early", "pay": "N/A", "sourceFile": "https://jobs.example/1"}]
+
+        async def serve(request):
+            return httpx.Response(200, content=early.encode("utf-8"))
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(serve)) as client:
+                return await enrich_pay(jobs, client, delay=0)
+        stats = asyncio.run(run())
+        self.check(jobs[0]["pay"] == "$22.0/hr" and stats.cut_short == 1 and stats.bytes_saved > 1_000_000,
+                   "Pages cut short and bytes saved reported", stats.summary())
+
+    def test_json_ld(self):
+        """JobPosting JSON-LD pay and closing dates, ahead of the page text"""
+        print("\nTesting JobPosting JSON-LD")
+        posting = {"@type": "JobPosting", "validThrough": "2026-11-30T23:59:59Z",
+                   **salary({"@type": "QuantitativeValue", "minValue": 20, "maxValue": 24, "unitText": "HOUR"})}
+        blocks = [json.dumps(posting), "{not json", json.dumps({"@graph": [{"@type": "Organization"},
+                                                                             {"@type": ["JobPosting"], "title": "x"}]}),
+                  json.dumps([{"@type": "WebPage"}])]
+        self.check(len(list(job_postings(blocks))) == 2, "Postings found at any depth, bad blocks skipped")
+        cases = [
+            (posting, (22.0, {"type": "hourly_range", "min": 20.0, "max": 24.0})),
+            (salary({"value": 52000, "unitText": "YEAR"}), (25.0, {"type": "annual", "value": 52000.0})),
+            (salary({"minValue": "4,000", "maxValue": "$3,000", "unitText": "MONTH"}),
+             (20.19, {"type": "annual_range", "min": 36000.0, "max": 48000.0, "annual_mid": 42000.0})),
+            ({"baseSalary": {"value": 800, "unitText": "WEEK"}}, (20.0, {"type": "annual", "value": 41600.0})),
+            ({"baseSalary": [salary({"value": 30, "unitText": "HOUR"}, "CAD")["baseSalary"],
+                             salary({"value": 19, "unitText": "HOUR"})["baseSalary"]]}, (19.0, {"type": "hourly", "value": 19.0})),
+            (salary({"value": 30}), None),
+            (salary({"value": 0, "unitText": "HOUR"}), None),
+            ({"title": "No salary"}, None),
+        ]
+        wrong = [(case, expected, json_ld_pay(case)) for case, expected in cases if json_ld_pay(case) != expected]
+        self.check(not wrong, "baseSalary units, ranges, currencies", f"Wrong: {wrong}")
+        self.check(json_ld_closing_date(posting) == "2026-11-30" and json_ld_closing_date({"validThrough": "soon"}) is None,
+                   "validThrough as a date")
+
+        padding = "<script>" + "var x = 1;" * 3000 + "</script>"
+        html = f"<html><head>{ld_script(posting)}</head><body><p>$52,000 annually</p>{padding * 40}</body></html>"
+        page = asyncio.run(stream_page(html))
+        self.check((page.pay_hr, page.pay_source, page.closing_date) == (22.0, "json-ld", "2026-11-30")
+                   and page.bytes_read < 100_000, "JSON-LD pay read before the page text", f"Read {page.bytes_read}")
+        self.check(extract_pay_from_html(html)[0] == 22.0, "Whole pages prefer JSON-LD pay too")
+        undated = {"@type": "JobPosting", "validThrough": "2026-12-01"}
+        page = asyncio.run(stream_page(f"<head>{ld_script(undated)}</head><p>$52,000 annually</p>{padding}"))
+        self.check((page.pay_hr, page.pay_source, page.closing_date, page.complete) == (25.0, "text", "2026-12-01", True),
+                   "Page text when JSON-LD states no pay")
+
+        jobs = [{"jobTitle": "Listed", "pay": "N/A", "date": None, "sourceFile": "https://jobs.example/1"}]
+
+        async def serve(request):
+            return httpx.Response(200, content=html.encode("utf-8"))
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(serve)) as client:
+                return await enrich_pay(jobs, client, delay=0)
+        stats = asyncio.run(run())
+        self.check(jobs[0]["pay"] == "$22.0/hr" and jobs[0]["date"] == "2026-11-30"
+                   and (stats.found_json_ld, stats.dates) == (1, 1), "Pay and closing date filled in", stats.summary())
+
+    def test_streaming_submissions(self):
+        """Pages read while URLs are still coming in, each URL once"""
+        print("\nTesting Streaming Submissions")
+        server = PageServer(latency=0.005)
+        submitted = ["https://paying.example/jobs/1", "https://barren.example/jobs/1",
+                     "https://paying.example/jobs/1", "https://paying.example/jobs/2"]
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(server.handle)) as client:
+                enricher = PayEnricher(client, concurrency=2, per_host=1, delay=0)
+                enricher.start()
+                read_early = []
+                for url in submitted:
+                    enricher.submit(url)
+                    # Other work, like fetching the next employer's postings
+                    await asyncio.sleep(0.05)
+                    read_early.append(len(server.order))
+                return enricher, read_early, await enricher.finish()
+        enricher, read_early, stats = asyncio.run(run())
+        self.check(read_early == [1, 2, 2, 3], "Each page read before the next URL came in", f"Read: {read_early}")
+        self.check(sorted(enricher.pages) == sorted(set(submitted)) and stats.fetched == 3, "Repeated URLs read once")
+        self.check(enricher.pages[submitted[0]].pay_hr == 23.0 and enricher.host_stats["paying.example"]["found"] == 2,
+                   "Pages and host history kept")
+
+        job = {"jobTitle": "Scheduler", "pay": "N/A", "paySource": None, "date": None}
+        self.check(apply_page(job, enricher.pages[submitted[0]]) and job["pay"] == "$23.0/hr"
+                   and job["paySource"] == "page", "Pay applied with its source")
+        listed = {"jobTitle": "Listed", "pay": "$30.0/hr", "paySource": "listing"}
+        self.check(not apply_page(listed, enricher.pages[submitted[0]]) and listed["pay"] == "$30.0/hr",
+                   "Existing pay kept")
+        none = asyncio.run(self.run_pass([], PageServer()))
+        self.check(none.fetched == 0, "Nothing to read")
+
+    def test_update_file(self):
+        """The jobs file and host history are written back"""
+        print("\nTesting File Update")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "jobs.json"
+            # Two postings of one job share a page
+            shared = {"jobTitle": "Job 0 (second listing)", "pay": "N/A", "sourceFile": "https://paying.example/jobs/0"}
+            path.write_text(json.dumps(make_jobs() + [shared]), encoding="utf-8")
+            server = PageServer(latency=0)
+            original = httpx.AsyncClient
+
+            class ServedClient(original):
+                def __init__(self, **kwargs):
+                    super().__init__(transport=httpx.MockTransport(server.handle), **kwargs)
+
+            httpx.AsyncClient = ServedClient
+            try:
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    asyncio.run(update_pay_from_urls.update_pay_from_urls(path, delay=0))
+            finally:
+                httpx.AsyncClient = original
+            jobs = json.loads(path.read_text(encoding="utf-8"))
+            history = json.loads((Path(tmp) / "host_pay_stats.json").read_text(encoding="utf-8"))
+            self.check(sum(j["pay"] == "$23.0/hr" for j in jobs) == 7, "Jobs file updated")
+            self.check("Updated pay for 7 jobs" in output.getvalue(), "Jobs updated counted, not pages",
+                       output.getvalue()[-300:])
+            self.check(history["paying.example"] == {"fetched": 6, "found": 6}, "Host history saved")
+
+    def run_all_tests(self):
+        """Run all pay enrichment tests"""
+        print("UNIT TESTS: Pay Enrichment")
+        print("=" * 50)
+
+        self.test_enrichment()
+        self.test_host_history()
+        self.test_page_text()
+        self.test_streamed_pay()
+        self.test_json_ld()
+        self.test_streaming_submissions()
+        self.test_update_file()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Pay Enrichment Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All pay enrichment tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review pay enrichment")
+
+
+def main():
+    """Main test execution"""
+    tester = TestPayEnrichment()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL PAY ENRICHMENT TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review pay enrichment")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
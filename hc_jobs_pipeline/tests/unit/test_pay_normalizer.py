@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Numeric Pay Fields
+=================================
+Tests that normalize_pay gives each record the hourly figures pay_engine
+computed for its pay string, flags implausible pay with the per-record and
+batch rules, and that the NumPy and plain-loop backends agree.
+"""
+
+import random
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from pay_engine import pay_from_amounts, pay_from_range
+from pay_normalizer import HAVE_NUMPY, normalize_pay, pay_is_plausible, reflag_batch
+
+
+def random_pay(rng):
+    """(hourly, payRaw) as pay_engine or a listing would give it, or (None, None)"""
+    if rng.random() < 0.1:
+        return None, None
+    if rng.random() < 0.5:
+        unit, low = "hour", rng.choice([rng.randint(500, 9000) / 100, rng.randint(1, 90) + rng.choice([0, .5, .05, .125])])
+    else:
+        unit, low = "year", rng.randint(9000, 250000) + rng.choice([0, .5, .99])
+    if rng.random() < 0.4:
+        return pay_from_amounts(unit, low)
+    return pay_from_range(unit, low, low + rng.choice([0.01, 1, 2.5, 5000, 10000.5, low * 3]))
+
+
+class TestPayNormalizer:
+    """Test class for numeric pay fields"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        # Always exercise the plain loop; NumPy only when installed
+        self.backends = [False, True] if HAVE_NUMPY else [False]
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_fields(self):
+        """Fields of each pay type"""
+        print("Testing Pay Fields")
+        raws = [pay_from_amounts("hour", 22.5)[1], pay_from_range("hour", 24, 20)[1],
+                pay_from_amounts("year", 52000)[1], pay_from_range("year", 41600, 62400)[1], None]
+        expected = [
+            {"payMin": 22.5, "payMax": 22.5, "payHourlyMid": 22.5, "payType": "hourly", "payFlags": []},
+            {"payMin": 20.0, "payMax": 24.0, "payHourlyMid": 22.0, "payType": "hourly_range", "payFlags": []},
+            {"payMin": 25.0, "payMax": 25.0, "payHourlyMid": 25.0, "payType": "annual", "payFlags": []},
+            {"payMin": 20.0, "payMax": 30.0, "payHourlyMid": 25.0, "payType": "annual_range", "payFlags": []},
+            {"payMin": None, "payMax": None, "payHourlyMid": None, "payType": None, "payFlags": []},
+        ]
+        for use_numpy in self.backends:
+            got = normalize_pay(raws, use_numpy=use_numpy)
+            self.check(got == expected, f"Hourly, annual, ranges and no pay (numpy={use_numpy})", f"Got: {got}")
+        self.check(normalize_pay([]) == [] and normalize_pay([None]) == expected[-1:], "Empty batches")
+
+    def test_matches_pay_strings(self):
+        """payHourlyMid is the pay string's number, and the backends agree"""
+        print("\nTesting Midpoints Against pay_engine")
+        rng = random.Random(48)
+        pays = [random_pay(rng) for _ in range(20000)]
+        # Half-cent ties, where rounding after scaling by 100 differs from round()
+        pays += [pay_from_amounts("hour", 0.025), pay_from_amounts("hour", 2.675), pay_from_amounts("year", 52.0)]
+        raws = [raw for _, raw in pays]
+        results = {use_numpy: normalize_pay(raws, use_numpy=use_numpy) for use_numpy in self.backends}
+        for use_numpy, fields in results.items():
+            wrong = [(raw, hourly, f["payHourlyMid"]) for (hourly, raw), f in zip(pays, fields) if f["payHourlyMid"] != hourly]
+            self.check(not wrong, f"{len(pays)} midpoints equal pay_engine's (numpy={use_numpy})", f"Wrong: {wrong[:3]}")
+        if HAVE_NUMPY:
+            differ = [i for i, (a, b) in enumerate(zip(results[False], results[True])) if a != b]
+            self.check(not differ, "NumPy and loop backends agree", f"First: {[results[False][i] for i in differ[:1]]}")
+
+    def test_flags(self):
+        """Per-record rules, the batch rule, and plausibility"""
+        print("\nTesting Pay Flags")
+        rng = random.Random(480)
+        typical = [pay_from_range("hour", low, low + 3)[1] for low in (rng.uniform(17, 24) for _ in range(30))]
+        odd = [pay_from_amounts("hour", 8)[1], pay_from_amounts("year", 520000)[1],
+               pay_from_range("hour", 10, 35)[1], pay_from_amounts("hour", 75)[1]]
+        for use_numpy in self.backends:
+            flags = [f["payFlags"] for f in normalize_pay(typical + odd, use_numpy=use_numpy)]
+            self.check(flags[:30] == [[]] * 30, f"Typical pay unflagged (numpy={use_numpy})", f"Got: {flags[:30]}")
+            self.check(flags[30:] == [["below_minimum", "batch_outlier"], ["above_maximum", "batch_outlier"],
+                                      ["wide_range"], ["batch_outlier"]],
+                       f"Odd pay flagged (numpy={use_numpy})", f"Got: {flags[30:]}")
+            small = [f["payFlags"] for f in normalize_pay(typical[:5] + odd[3:], use_numpy=use_numpy)]
+            self.check(small[-1] == [], f"No batch rule for small batches (numpy={use_numpy})")
+        # A jobs file, then pay filled in from pages for two of its jobs
+        jobs = normalize_pay(typical) + [{"pay": "N/A", "payHourlyMid": None, "payFlags": []}] * 2
+        jobs[30:] = normalize_pay([odd[3], odd[2]])
+        self.check([f["payFlags"] for f in jobs[30:]] == [[], ["wide_range"]], "Page pay alone is too few for the batch rule")
+        reflag_batch(jobs)
+        self.check([f["payFlags"] for f in jobs] == [[]] * 30 + [["batch_outlier"], ["wide_range"]],
+                   "Batch rule redone over the whole file", f"Got: {[f['payFlags'] for f in jobs[30:]]}")
+        reflag_batch(jobs[:5] + jobs[30:])
+        self.check(jobs[30]["payFlags"] == [], "Stale batch flags dropped")
+
+        self.check(pay_is_plausible(typical[0]) and pay_is_plausible(odd[2]), "Plausible pay")
+        self.check(not pay_is_plausible(odd[0]) and not pay_is_plausible(odd[1]) and not pay_is_plausible(None),
+                   "Implausible or missing pay")
+        self.check(pay_is_plausible(pay_from_amounts("hour", 10)[1]) and not pay_is_plausible(pay_from_amounts("hour", 9.99)[1]),
+                   "The old $10/hr floor")
+
+    def run_all_tests(self):
+        """Run all pay normalizer tests"""
+        print("UNIT TESTS: Pay Normalizer")
+        print("=" * 50)
+
+        self.test_fields()
+        self.test_matches_pay_strings()
+        self.test_flags()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Pay Normalizer Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All pay normalizer tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review pay normalizer")
+
+
+def main():
+    """Main test execution"""
+    tester = TestPayNormalizer()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL PAY NORMALIZER TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review pay normalizer")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
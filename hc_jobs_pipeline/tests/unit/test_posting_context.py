@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Per-Posting Evaluation Context
+=================================================
+Tests that PostingContext returns the same answers as the standalone filter
+functions and derives each value only once.
+"""
+
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import run_collect
+from run_collect import PostingContext
+from section_segmenter import segment_posting
+from benchmarks.corpus import generate_corpus
+
+
+class TestPostingContext:
+    """Test class for PostingContext"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_matches_standalone_functions(self):
+        """Every context value equals the standalone function result"""
+        print("Testing Context vs Standalone Functions")
+        mismatches = 0
+        postings = generate_corpus(500)
+        for p in postings:
+            title, loc, desc = p["title"], p["location"], p["description"]
+            full_text = (title + "\n" + loc + "\n" + desc).strip()
+            sections = segment_posting(full_text)
+            posting = PostingContext(title, loc, desc)
+            expected = (
+                run_collect.looks_like_health_admin(title, desc, sections),
+                run_collect.meets_entry_level_requirement(desc, title, "", sections),
+                run_collect.infer_state(loc),
+                run_collect.infer_remote_flag(loc),
+                run_collect.normalize_pay_to_hourly(full_text, sections),
+                run_collect.infer_career_track(title + "\n" + desc),
+                run_collect.entry_level_flag(title, desc),
+            )
+            actual = (posting.health_admin, posting.meets_entry_level, posting.state, posting.remote,
+                      posting.pay, posting.career_track, posting.entry_level)
+            if actual != expected:
+                mismatches += 1
+        self.check(mismatches == 0, f"{len(postings)} postings agree", f"{mismatches} mismatches")
+
+    def test_memoization(self):
+        """Derived values are computed once and shared between checks"""
+        print("\nTesting Memoization")
+        posting = PostingContext("Patient Access Coordinator", "Nashville, TN",
+                                 "Qualifications:\n- Bachelor's degree preferred\n- Scheduling experience")
+        self.check(posting.health_admin == (True, "passes"), "Health admin check passes")
+        self.check("meets_entry_level" in posting.__dict__,
+                   "Education check cached by the health admin check")
+        self.check(posting.sections is posting.sections, "Sections segmented once")
+        self.check(posting.state == "TN" and not posting.remote, "Location derived")
+        self.check({"patient", "access", "bachelor"} <= posting.tokens, "Tokens from lowercased text")
+
+    def test_empty_fields(self):
+        """Missing fields behave like empty strings"""
+        print("\nTesting Empty Fields")
+        posting = PostingContext(None, None, None)
+        self.check(posting.full_text == "" and posting.state is None, "Empty posting handled")
+        self.check(posting.health_admin == (False, "no_admin_keywords"), "Empty posting filtered")
+
+    def test_listed_pay(self):
+        """Structured ATS pay fields are used instead of scanning the text"""
+        print("\nTesting Listed Pay")
+        lever = run_collect.lever_listed_pay
+        self.check(lever({"salaryRange": {"currency": "USD", "interval": "per-year-salary", "min": 41600, "max": 52000}})
+                   == (22.5, {"type": "annual_range", "min": 41600.0, "max": 52000.0, "annual_mid": 46800.0}),
+                   "Lever annual range")
+        self.check(lever({"salaryRange": {"currency": "USD", "interval": "per-hour-wage", "min": 20, "max": 20}})
+                   == (20.0, {"type": "hourly", "value": 20.0}), "Lever hourly, equal bounds")
+        self.check(lever({"salaryRange": {"currency": "USD", "interval": "per-month-salary", "min": 4000, "max": 5000}})[0]
+                   == round(54000 / 2080, 2), "Lever monthly annualized")
+        self.check(all(lever(j) is None for j in [{}, {"salaryRange": None},
+                                                  {"salaryRange": {"currency": "EUR", "interval": "per-year-salary", "min": 1, "max": 2}},
+                                                  {"salaryRange": {"currency": "USD", "interval": "one-time", "min": 1000, "max": 2000}},
+                                                  {"salaryRange": {"currency": "USD", "interval": "per-year-salary", "min": None, "max": 2}}]),
+                   "Lever without usable USD pay")
+
+        gh = run_collect.gh_listed_pay
+        self.check(gh({"pay_input_ranges": [{"min_cents": 1800, "max_cents": 2200, "currency_type": "USD", "title": "Pay"}]})
+                   == (20.0, {"type": "hourly_range", "min": 18.0, "max": 22.0}), "Greenhouse hourly range by amount")
+        self.check(gh({"pay_input_ranges": [
+            {"min_cents": 100, "max_cents": 200, "currency_type": "CAD"},
+            {"min_cents": 5200000, "max_cents": 5200000, "currency_type": "USD", "title": "Base salary"}]})
+                   == (25.0, {"type": "annual", "value": 52000.0}), "Greenhouse first USD range, annual")
+        self.check(gh({"pay_input_ranges": [{"min_cents": 60000, "max_cents": 70000, "currency_type": "USD",
+                                             "title": "Hourly rate"}]})[1]["type"] == "hourly_range",
+                   "Greenhouse hourly by title")
+        self.check(gh({}) is None and gh({"pay_input_ranges": []}) is None, "Greenhouse without ranges")
+
+        listed = (22.5, {"type": "hourly", "value": 22.5})
+        posting = PostingContext("Scheduler", "Denver, CO", "Pay: $18 per hour", listed_pay=listed)
+        self.check(posting.pay == listed and posting.pay_source == "listing", "Listing wins over the text")
+        self.check("sections" not in posting.__dict__, "Text not segmented or scanned")
+        self.check(PostingContext("Scheduler", "Denver, CO", "Pay: $18 per hour").pay_source == "description"
+                   and PostingContext("Scheduler", "Denver, CO", "Competitive pay").pay_source is None,
+                   "Description or no pay")
+
+        counts = {"listing": 0, "description": 0, "none": 0, "page_fetches_avoided": 0}
+        for posting in [PostingContext("A", "", "Pay: $18 per hour", listed_pay=listed),
+                        PostingContext("B", "", "Competitive pay", listed_pay=listed),
+                        PostingContext("C", "", "Pay: $18 per hour"),
+                        PostingContext("D", "", "Competitive pay")]:
+            run_collect.count_pay_source(counts, posting)
+        self.check(counts == {"listing": 2, "description": 1, "none": 1, "page_fetches_avoided": 1},
+                   "Page fetches avoided only where the text states no pay", f"Got: {counts}")
+
+    def run_all_tests(self):
+        """Run all posting context tests"""
+        print("UNIT TESTS: Posting Context")
+        print("=" * 50)
+
+        self.test_matches_standalone_functions()
+        self.test_memoization()
+        self.test_empty_fields()
+        self.test_listed_pay()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Posting Context Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All posting context tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review posting context")
+
+
+def main():
+    """Main test execution"""
+    tester = TestPostingContext()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL POSTING CONTEXT TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review posting context")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
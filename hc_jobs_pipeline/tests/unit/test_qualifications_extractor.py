@@ -122,6 +122,54 @@ class TestQualificationsExtractor:
                 print(f"FAIL: {test_name} - Exception: {e}")
                 self.failed += 1
     
+    def test_batch_extraction(self):
+        """Test extract_many against per-posting extraction"""
+        print("\nTesting Batch Extraction")
+        
+        templates = [
+            "Billing Specialist\n• Bachelor's degree in Health Administration\n• {n}+ years of experience in billing\n• Knowledge of HIPAA",
+            "Patient Access Rep {n}\n- Strong customer service skills\n- High school diploma or GED\n- Familiar with Epic",
+            "We are hiring. Must have {n} years of prior experience with scheduling. Ability to multitask is required.",
+            "Great team! Apply today. Posting {n}.",
+            "",
+        ]
+        descriptions = [templates[n % len(templates)].format(n=n) for n in range(60)]
+        expected = [self.extractor.extract_structured(d) for d in descriptions]
+        
+        try:
+            results = self.extractor.extract_many(descriptions, workers=2, chunk_size=7)
+            self.check(results == expected, "Pooled results match per-posting results in order")
+            self.check(self.extractor.extract_many(descriptions, workers=1) == expected, "Single worker runs in process")
+            self.check(all(r.formatted == self.extractor.extract_comprehensive_qualifications(d)
+                           for r, d in zip(results, descriptions)), "Formatted string unchanged")
+            first = results[0]
+            self.check(first.education == ["Bachelor's degree in Health Administration"]
+                       and first.experience == ["years of experience in billing"]
+                       and first.skills == ["Knowledge of HIPAA"] and first.other == [],
+                       "Qualifications grouped by category", f"Got: {first}")
+            self.check(results[4].formatted == "N/A" and results[4].education == [], "Empty description")
+            
+            # Workers use the extractor they were given, keyword lists included
+            custom = QualificationsExtractor()
+            custom.FORMAT_EDUCATION_KEYWORDS = ['hipaa']
+            custom._compile()
+            pooled = custom.extract_many(descriptions[:20], workers=2, chunk_size=5)
+            self.check(pooled[0].education == ["Knowledge of HIPAA"],
+                       "Custom keyword lists reach the workers", f"Got: {pooled[0]}")
+        except Exception as e:
+            print(f"ERROR: Batch extraction failed with {e}")
+            self.failed += 1
+    
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+    
     def run_all_tests(self):
         """Run all qualification extractor tests"""
         print("UNIT TESTS: Qualifications Extractor")
@@ -130,6 +178,7 @@ class TestQualificationsExtractor:
         self.test_basic_extraction()
         self.test_section_recognition()
         self.test_edge_cases()
+        self.test_batch_extraction()
         
         self.print_summary()
     
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Recorded-Output Tests for the Qualifications Extractor
+======================================================
+Checks extract_comprehensive_qualifications against outputs recorded from
+an earlier version of the extractor, so refactors of its internals can't
+change what ends up in the qualifications column, and checks the one-scan
+line classifier against the keyword lists it replaced.
+
+The recorded corpus is the synthetic benchmark corpus plus generated texts
+whose lines exercise the bullet, indicator-line and sentence fallbacks and
+the skip rules. Re-record (only for an intended output change) with:
+
+    python tests/unit/test_qualifications_recorded.py --record
+"""
+
+import hashlib
+import json
+import random
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import enhanced_qualifications as eq
+from enhanced_qualifications import QualificationsExtractor
+from benchmarks.corpus import generate_corpus
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'qualifications_recorded.json')
+
+CORPUS_POSTINGS = 600
+GENERATED_TEXTS = 1500
+SEED = 40
+
+# Lines the generated texts are made of
+LINES = [
+    "Qualifications:", "Requirements", "What You Bring", "Preferred Qualifications:", "Job Description",
+    "- Bachelor's degree in healthcare administration required", "• 2+ years of customer service experience",
+    "* Strong skills in Microsoft Excel", "1. Must have knowledge of HIPAA", "2. Epic or Cerner EMR experience",
+    "- BLS certification", "• Ability to work independently", "- Monday through Friday, 8am-5pm",
+    "- About our clinic: we serve the community", "• Benefits include medical and dental",
+    "- Apply online at https://careers.example.com", "• Equal opportunity employer",
+    "Required: valid driver's license", "Must be proficient with scheduling software",
+    "Preferred: medical terminology knowledge", "Minimum of a high school diploma or GED",
+    "Need strong communication skills", "Should be familiar with ICD-10 and CPT coding",
+    "Our team values patient experience.", "We are looking for a coordinator with prior experience in billing.",
+    "The company offers tuition support.", "You will manage patient intake and insurance verification.",
+    "This position requires a degree and two years of related work history.",
+    "Responsibilities include answering phones", "Salary $20 - $24 per hour", "Location: Boise, ID",
+    "Contact hr@example.com", "Understanding of revenue cycle is a plus", "Great team!", "",
+]
+
+
+def recorded_texts():
+    texts = [p["description"] for p in generate_corpus(CORPUS_POSTINGS, seed=SEED)]
+    rng = random.Random(SEED)
+    for _ in range(GENERATED_TEXTS):
+        lines = [rng.choice(LINES) for _ in range(rng.randint(1, 12))]
+        texts.append("\n".join(lines) if rng.random() < 0.8 else " ".join(lines))
+    return texts
+
+
+def digest(output: str) -> str:
+    return hashlib.sha256(output.encode("utf-8")).hexdigest()[:16]
+
+
+def record() -> None:
+    extractor = QualificationsExtractor()
+    digests = [digest(extractor.extract_comprehensive_qualifications(t)) for t in recorded_texts()]
+    os.makedirs(os.path.dirname(FIXTURE), exist_ok=True)
+    with open(FIXTURE, "w", encoding="utf-8") as f:
+        json.dump({"postings": CORPUS_POSTINGS, "generated": GENERATED_TEXTS, "seed": SEED, "digests": digests}, f,
+                  indent=0)
+    print(f"Recorded {len(digests)} outputs to {FIXTURE}")
+
+
+class TestQualificationsRecorded:
+    """Test class for recorded extractor outputs"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_recorded_outputs(self):
+        """Every recorded text gives the recorded output"""
+        print("Testing Recorded Outputs")
+        with open(FIXTURE, encoding="utf-8") as f:
+            recorded = json.load(f)
+        texts = recorded_texts()
+        self.check(len(texts) == len(recorded["digests"]), "Corpus size matches the recording")
+
+        extractor = QualificationsExtractor()
+        changed = [i for i, (text, expected) in enumerate(zip(texts, recorded["digests"]))
+                   if digest(extractor.extract_comprehensive_qualifications(text)) != expected]
+        self.check(not changed, f"{len(texts)} outputs unchanged",
+                   f"{len(changed)} changed, first: {texts[changed[0]][:200]!r}" if changed else "")
+
+    def test_line_classifier(self):
+        """One scan gives the same categories as the separate keyword lists"""
+        print("\nTesting Line Classifier")
+        extractor = QualificationsExtractor()
+        groups = [
+            (eq.QUALIFICATION, extractor.EDUCATION_KEYWORDS + extractor.EXPERIENCE_KEYWORDS +
+             extractor.SKILLS_KEYWORDS + extractor.HEALTHCARE_KEYWORDS),
+            (eq.FORMAT_EDUCATION, extractor.FORMAT_EDUCATION_KEYWORDS),
+            (eq.FORMAT_EXPERIENCE, extractor.FORMAT_EXPERIENCE_KEYWORDS),
+            (eq.FORMAT_SKILLS, extractor.FORMAT_SKILLS_KEYWORDS),
+        ]
+        wrong = []
+        for line in LINES + [l for t in recorded_texts()[:200] for l in t.splitlines()]:
+            lower = line.lower()
+            category = extractor._classifier.classify(lower)
+            for bits, keywords in groups:
+                if bool(category & bits) != any(k in lower for k in keywords):
+                    wrong.append((line, bits))
+        self.check(not wrong, "Categories match substring checks", f"Wrong: {wrong[:5]}")
+        self.check(extractor._classifier is QualificationsExtractor()._classifier, "Classifier shared between extractors")
+        self.check(not extractor._is_qualification_line("  Monday - Friday, years of experience")
+                   and extractor._is_qualification_line("Friendly, 2 years of experience"),
+                   "Skip rules apply to the line opening only")
+
+    def run_all_tests(self):
+        """Run all recorded output tests"""
+        print("UNIT TESTS: Qualifications Recorded Outputs")
+        print("=" * 50)
+
+        self.test_recorded_outputs()
+        self.test_line_classifier()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Qualifications Recorded Output Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All recorded output tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review qualifications extractor")
+
+
+def main():
+    """Main test execution"""
+    if "--record" in sys.argv[1:]:
+        record()
+        return 0
+
+    tester = TestQualificationsRecorded()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL RECORDED OUTPUT TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review qualifications extractor")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
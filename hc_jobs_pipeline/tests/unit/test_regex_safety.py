@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Regex Safety Mode
+================================
+Tests pathological-pattern detection, the bounded-window rewrite, the RE2
+engine when installed, and that switching safety modes rebinds the filter
+modules without changing their verdicts on ordinary postings.
+"""
+
+import sys
+import os
+import re
+import time
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import education_filters
+import rule_bundle
+import simplified_education_filters
+from regex_safety import (HAVE_LINEAR_ENGINE, SafetySettings, adversarial_texts, audit_pattern,
+                          bound_pattern, linear_regex, linear_set)
+from run_collect import PostingContext
+from benchmarks.corpus import generate_corpus
+
+
+class TestRegexSafety:
+    """Test class for regex safety mode"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_audit(self):
+        """Unbounded wildcards and nested quantifiers are reported"""
+        print("Testing Pattern Audit")
+        findings = audit_pattern(r"high school.*required|hs.*required", re.I)
+        self.check([f.detail for f in findings] == ["high school.*required", "hs.*required"],
+                   "Wildcards reported per alternative", f"Got: {findings}")
+        self.check([f.kind for f in audit_pattern(r"(a+)+b")] == ["nested_quantifier"], "Nested quantifier")
+        safe = [r"bachelor.{0,20}preferred", r"\bba\b", r"bachelor'?s?\s+degree", r"[.*]+", r"\.*"]
+        self.check(not any(audit_pattern(p) for p in safe), "Bounded and narrow patterns pass")
+
+    def test_bound_pattern(self):
+        """Only unbounded repeats of broad atoms are rewritten"""
+        print("\nTesting Bounded Rewrite")
+        cases = {
+            r"degree from.*university": r"degree from.{0,50}university",
+            r"a.+?b": r"a.{1,50}?b",
+            r"[^,]+,\S*x": r"[^,]{1,50},\S{0,50}x",
+            r"x.{3,}y": r"x.{3,50}y",
+            r"(?:a|b)*\s+[.*]+\.*(ab)+c{2,}": r"(?:a|b)*\s+[.*]+\.*(ab)+c{2,}",
+        }
+        wrong = {p: bound_pattern(p, 0, 50) for p, expected in cases.items() if bound_pattern(p, 0, 50) != expected}
+        self.check(not wrong, f"{len(cases)} rewrites", f"Wrong: {wrong}")
+
+        shipped = [(p, flags) for path in sorted(rule_bundle.RULES_DIR.glob("*.json"))
+                   for p, flags in rule_bundle._spec_patterns(rule_bundle.compile_rules(path.stem))]
+        risky = [(p, flags) for p, flags in shipped if audit_pattern(p, flags)]
+        still = [p for p, flags in risky if audit_pattern(bound_pattern(p, flags), flags)]
+        self.check(risky and not still, f"{len(risky)} shipped risky patterns bounded", f"Still risky: {still}")
+
+        text = "degree from an accredited university"
+        self.check(re.search(bound_pattern(r"degree from.*university"), text) is not None
+                   and re.search(bound_pattern(r"degree from.*university", 0, 5), text) is None,
+                   "Matches within the window only")
+
+    def test_adversarial_inputs(self):
+        """Bounded patterns stay fast on inputs that make the originals backtrack"""
+        print("\nTesting Adversarial Inputs")
+        pattern = r"associate.?s? degree.*required|aa.*required|as.*required"
+        texts = adversarial_texts(pattern, re.I, 12000)
+        self.check(len(texts) == 3 and all(t.startswith("required | ") and len(t) <= 12000 for t in texts),
+                   "One line per wildcard")
+
+        def worst(regex):
+            start = time.perf_counter()
+            for text in texts:
+                regex.search(text)
+            return time.perf_counter() - start
+
+        original = worst(re.compile(pattern, re.I))
+        bounded = worst(re.compile(bound_pattern(pattern, re.I), re.I))
+        self.check(bounded * 3 < original, "Bounded search much faster",
+                   f"original {original * 1e3:.1f}ms, bounded {bounded * 1e3:.1f}ms")
+
+    def test_linear_engine(self):
+        """RE2 runs supported patterns and declines backtracking-only syntax"""
+        print("\nTesting Linear Engine")
+        if not HAVE_LINEAR_ENGINE:
+            self.check(linear_regex(r"a.*b") is None and linear_set([r"a"]) is None, "RE2 not installed: disabled")
+            return
+        self.check(linear_regex(r"(?<!x)a") is None and linear_regex(r"(a)\1") is None,
+                   "Lookarounds and backreferences left to re")
+        patterns = [r"high school.*required", r"\bba\b", r"bachelor'?s?\s+degree", r"ged"]
+        text = "a ba in business or a bachelors  degree; ged accepted"
+        expected = [i for i, p in enumerate(patterns) if re.search(p, text, re.I)]
+        self.check(sorted(linear_set(patterns, re.I).Match(text.upper()) or []) == expected,
+                   "Pattern set agrees with re")
+
+    def test_modes_rebind_modules(self):
+        """Switching modes rebinds the module tables and keeps verdicts on ordinary postings"""
+        print("\nTesting Safety Modes")
+        postings = generate_corpus(400, seed=35)
+
+        def verdicts():
+            return [(PostingContext(p["title"], p["location"], p["description"]).health_admin,
+                     education_filters.analyze_education_requirements(p["description"]),
+                     simplified_education_filters.meets_simplified_education_requirement(p["description"]))
+                    for p in postings]
+
+        expected = verdicts()
+        try:
+            for mode in ("bounded", "linear"):
+                rebuilt = rule_bundle.set_regex_safety(SafetySettings(mode))
+                rule = education_filters.HIGH_SCHOOL_PRIMARY_RULE
+                self.check(rebuilt and rule.pattern == rule.regex.pattern and rule.engine is not rule.regex,
+                           f"{mode}: tables rebound with a safe engine")
+                self.check(verdicts() == expected, f"{mode}: verdicts unchanged")
+            self.check(rule_bundle.set_regex_safety(SafetySettings("linear", budget_ms=5)) == [],
+                       "Budget-only change does not recompile")
+        finally:
+            rule_bundle.set_regex_safety(SafetySettings())
+        rule = education_filters.HIGH_SCHOOL_PRIMARY_RULE
+        self.check(rule.engine is rule.regex, "Off mode restored")
+        try:
+            SafetySettings("fast").validate()
+            rejected = False
+        except ValueError:
+            rejected = True
+        self.check(rejected, "Unknown mode rejected")
+
+    def run_all_tests(self):
+        """Run all regex safety tests"""
+        print("UNIT TESTS: Regex Safety")
+        print("=" * 50)
+
+        self.test_audit()
+        self.test_bound_pattern()
+        self.test_adversarial_inputs()
+        self.test_linear_engine()
+        self.test_modes_rebind_modules()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Regex Safety Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All regex safety tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review regex safety")
+
+
+def main():
+    """Main test execution"""
+    tester = TestRegexSafety()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL REGEX SAFETY TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review regex safety")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
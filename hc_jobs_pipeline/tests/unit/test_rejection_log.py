@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Rejection Log
+================================
+Tests that rejections round-trip through the binary log across runs, that
+sampling is deterministic per posting, that the query functions answer
+"why" and "top rules", and that the filter chain names the rule and span
+that rejected a posting.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import run_collect
+from filter_chain import Rejection
+from rejection_log import RECORD, RejectionLog, names_path, read_records, rotated_path, top_rules, why
+from run_collect import PostingContext, build_filter_chain
+from benchmarks.corpus import generate_corpus
+
+
+class TestRejectionLog:
+    """Test class for the rejection log"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_round_trip(self):
+        """Records and names survive across runs; queries find them"""
+        print("Testing Round Trip")
+        path = Path(self.tmp.name) / "rejections.bin"
+        with RejectionLog(path) as log:
+            log.record("https://a", "clinical_roles", Rejection("CLINICAL_ROLE", 4, 15))
+            log.record("https://b", "non_us_locations")
+        with RejectionLog(path) as log:
+            log.record("https://a", "education_requirements", Rejection("SENIOR_TITLE[2]", 0, 6))
+            log.record("https://c", "clinical_roles", Rejection("CLINICAL_ROLE", 0, 2))
+
+        records = list(read_records(path))
+        self.check(path.stat().st_size == 4 * RECORD.size and len(records) == 4, "Four fixed-size records")
+        found = [(r.stage, r.rule, r.start, r.end) for r in why(path, "https://a")]
+        self.check(found == [("clinical_roles", "CLINICAL_ROLE", 4, 15),
+                             ("education_requirements", "SENIOR_TITLE[2]", 0, 6)],
+                   "why lists a posting's rejections in order", f"Got: {found}")
+        self.check(why(path, "https://b")[0].rule == "" and why(path, "https://nope") == [],
+                   "Stage without rule; unknown posting")
+        top = top_rules(path)
+        self.check(top[0] == ("clinical_roles", "CLINICAL_ROLE", 2) and len(top) == 3,
+                   "top_rules counts stage and rule", f"Got: {top}")
+        self.check(top_rules(path, stage="education_requirements") == [("education_requirements", "SENIOR_TITLE[2]", 1)],
+                   "top_rules by stage")
+
+        # A run killed mid-append leaves a partial record, which readers skip
+        with path.open("ab") as f:
+            f.write(b"\x01\x02\x03")
+        self.check(len(list(read_records(path))) == 4 and len(why(path, "https://a")) == 2,
+                   "Partial trailing record ignored")
+
+    def test_sampling(self):
+        """A sample rate keeps the same postings every run"""
+        print("\nTesting Sampling")
+        ids = [f"https://jobs.example.com/{i}" for i in range(4000)]
+        kept = []
+        for run in range(2):
+            log = RejectionLog(Path(self.tmp.name) / f"sampled-{run}.bin", 0.25)
+            kept.append([i for i in ids if log.record(i, "software_roles")])
+            log.close()
+        self.check(kept[0] == kept[1], "Same postings sampled in both runs")
+        self.check(800 < len(kept[0]) < 1200, "About a quarter sampled", f"Got: {len(kept[0])}")
+        none = RejectionLog(Path(self.tmp.name) / "none.bin", 0.0)
+        self.check(not any(none.record(i, "software_roles") for i in ids[:100]), "Rate 0 logs nothing")
+        try:
+            RejectionLog(Path(self.tmp.name) / "bad.bin", 1.5)
+            self.check(False, "Rate above 1 rejected")
+        except ValueError:
+            self.check(True, "Rate above 1 rejected")
+
+    def test_rotation(self):
+        """The log is rotated at max_bytes and flushed when a run fails"""
+        print("\nTesting Rotation")
+        path = Path(self.tmp.name) / "rotated.bin"
+        old = rotated_path(path)
+        for run in range(3):
+            with RejectionLog(path, max_bytes=10 * RECORD.size) as log:
+                for i in range(6):
+                    log.record(f"https://{run}/{i}", f"stage-{run}", Rejection(f"RULE[{i}]", i, i + 1))
+            sizes = [p.stat().st_size // RECORD.size if p.exists() else 0 for p in (path, old)]
+            self.check(sizes == [[6, 0], [6, 6], [6, 6]][run], f"Run {run + 1}: records in log and rotated log",
+                       f"Got: {sizes}")
+        self.check([r.stage for r in why(path, "https://2/3")] == ["stage-2"]
+                   and [(r.stage, r.rule) for r in why(old, "https://1/3")] == [("stage-1", "RULE[3]")]
+                   and why(path, "https://0/3") == [] and why(old, "https://0/3") == [],
+                   "Each file keeps its own names; the oldest run is dropped")
+        self.check(names_path(old).exists() and len(list(read_records(old))) == 6, "Rotated names move along")
+
+        path = Path(self.tmp.name) / "failed.bin"
+        try:
+            with RejectionLog(path) as log:
+                log.record("https://a", "clinical_roles", Rejection("CLINICAL_ROLE", 0, 8))
+                raise RuntimeError("feed went away")
+        except RuntimeError:
+            pass
+        self.check([r.rule for r in read_records(path)] == ["CLINICAL_ROLE"], "Buffered records written on failure")
+        self.check(0 < run_collect.REJECTION_LOG_SAMPLE_RATE < 1, "collect() samples by default")
+
+    def test_chain_rejections(self):
+        """The chain reports the rule that rejected, with a span into the text it read"""
+        print("\nTesting Filter Chain Rejections")
+        chain = build_filter_chain(retune_every=None)
+        wrong = []
+        named = 0
+        for p in generate_corpus(1000, seed=37):
+            posting = PostingContext(p["title"], p["location"], p["description"])
+            reason = chain.rejection_reason(posting)
+            rejection = chain.last_rejection
+            if reason is None:
+                if rejection is not None:
+                    wrong.append(("included with rejection", rejection))
+                continue
+            if reason in ("non_us_locations", "no_admin_keywords"):
+                if rejection is not None:
+                    wrong.append((reason, rejection))
+                continue
+            named += 1
+            rule = rejection.rule
+            if reason == "clinical_roles":
+                text, regex = posting.combined_lower, run_collect.CLINICAL_ROLE_RULE.regex
+            elif reason == "software_roles":
+                index = int(rule[rule.index("[") + 1:-1])
+                text, regex = posting.combined_lower, run_collect.SOFTWARE_ROLE_RULES.rules[index].regex
+            elif rule.startswith("SENIOR_TITLE["):
+                index = int(rule[rule.index("[") + 1:-1])
+                text, regex = posting.title_lower, run_collect.SENIOR_TITLE_RULES.rules[index].regex
+            elif rule.startswith("STRICT_ADVANCED_DEGREE["):
+                index = int(rule[rule.index("[") + 1:-1])
+                text, regex = posting.education_text_lower, run_collect.STRICT_ADVANCED_DEGREE_RULES.rules[index].regex
+            elif rule.startswith("STRICT_HIGH_EXPERIENCE["):
+                index = int(rule[rule.index("[") + 1:-1])
+                text, regex = posting.education_text_lower, run_collect.STRICT_HIGH_EXPERIENCE_RULES.rules[index].regex
+            else:
+                if posting.meets_entry_level or rule != "BACHELORS_MENTIONED":
+                    wrong.append((reason, rejection))
+                continue
+            match = regex.search(text)
+            if not match or (match.start(), match.end()) != (rejection.start, rejection.end):
+                wrong.append((reason, rejection))
+        self.check(named > 100 and not wrong, f"{named} rule rejections name their match", f"Wrong: {wrong[:5]}")
+
+        posting = PostingContext("Patient Access Representative", "Boise, ID",
+                                 "Bachelor's degree required. 15+ years experience in billing.")
+        rejection = posting.entry_level_rejection
+        span = posting.education_text_lower[rejection.start:rejection.end] if rejection is not None else None
+        self.check(rejection is not None and rejection.rule == "STRICT_HIGH_EXPERIENCE[2]"
+                   and span == "5+ years experience", "Experience rejection spans its pattern's match", f"Got: {rejection}")
+
+    def run_all_tests(self):
+        """Run all rejection log tests"""
+        print("UNIT TESTS: Rejection Log")
+        print("=" * 50)
+
+        self.test_round_trip()
+        self.test_sampling()
+        self.test_rotation()
+        self.test_chain_rejections()
+        self.tmp.cleanup()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Rejection Log Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All rejection log tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review rejection log")
+
+
+def main():
+    """Main test execution"""
+    tester = TestRejectionLog()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL REJECTION LOG TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review rejection log")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Declarative Rule Files and Cached Bundles
+========================================================
+Tests that rule files compile to the tables the filter modules use, that
+shared pattern lists are included by reference, that the on-disk analysis
+cache is keyed by the rule file contents, and that edited rule files are
+picked up by reload_if_changed.
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import rule_bundle
+from rule_bundle import RuleFileError, compile_rules, load_rules, on_reload, reload_if_changed
+from compiled_rules import analyze_pattern
+import education_filters
+import relaxed_education_filters
+import run_collect
+import simplified_education_filters
+
+
+class TestRuleBundle:
+    """Test class for rule bundles"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_rule_files_compile(self):
+        """Every shipped rule file compiles, and cached analysis equals a fresh derivation"""
+        print("Testing Shipped Rule Files")
+        for path in sorted(rule_bundle.RULES_DIR.glob("*.json")):
+            bundle = compile_rules(path.stem)
+            stale = [key for key, analysis in bundle._analysis.items() if analyze_pattern(*key) != analysis]
+            self.check(bundle._analysis and not stale, f"{path.stem}: {len(bundle._analysis)} patterns",
+                       f"Stale analysis: {stale[:3]}")
+
+    def test_module_tables(self):
+        """Filter modules expose the tables from their rule files"""
+        print("\nTesting Module Tables")
+        rules = load_rules("education_filters")
+        self.check(education_filters.BACHELORS_PATTERNS == rules.patterns("BACHELORS_PATTERNS"),
+                   "education_filters patterns bound")
+        self.check(education_filters.PATTERN_WEIGHTS["advanced_degree"] == -100, "Values bound")
+        self.check(run_collect.SENIOR_TITLE_RULES.any("vice president of operations")
+                   and not run_collect.SENIOR_TITLE_RULES.any("patient access representative"),
+                   "run_collect rule tables bound")
+        self.check(run_collect.ADMIN_HINT_AUTOMATON.contains_any("front desk coordinator"),
+                   "Keyword automata bound")
+        self.check([track for track, _ in run_collect.COMPILED_CAREER_TRACK_RULES]
+                   == ["Long-Term Care Administration", "Hospital Administration"], "Career tracks in order")
+
+    def test_groups_and_alternations(self):
+        """Pattern groups flatten in order and alternations join referenced groups"""
+        print("\nTesting Groups and Alternations")
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "demo.json").write_text(json.dumps({
+                "tables": {
+                    "DEGREES": {"kind": "table", "flags": "i", "patterns": [
+                        "high school",
+                        {"name": "advanced", "comment": "Graduate degrees", "patterns": ["master'?s", "ph\\.?d"]},
+                    ]},
+                    "ADVANCED": {"kind": "alternation", "flags": "i", "of": ["DEGREES.advanced"]},
+                    "HINTS": {"kind": "keywords", "keywords": ["clerk", "admin"]},
+                },
+            }), encoding="utf-8")
+            bundle = compile_rules("demo", Path(tmp))
+            self.check(bundle.patterns("DEGREES") == ["high school", "master'?s", "ph\\.?d"], "Groups flattened")
+            self.check(bundle.pattern("ADVANCED").pattern == "master'?s|ph\\.?d", "Alternation of a group")
+            self.check(bundle.table("DEGREES") is bundle.table("DEGREES"), "Compiled tables memoized")
+            self.check(bundle.automaton("HINTS").hits("unit clerk") == {"clerk"}, "Keywords table")
+            try:
+                bundle.table("HINTS")
+                wrong_kind = False
+            except RuleFileError:
+                wrong_kind = True
+            self.check(wrong_kind, "Wrong table kind rejected")
+
+    def test_shared_patterns(self):
+        """Shared pattern lists are defined once and included where they're used"""
+        print("\nTesting Shared Patterns")
+        shared = load_rules("degree_terms")
+        advanced = shared.patterns("ADVANCED_DEGREE_REQUIRED")
+        self.check(run_collect.STRICT_ADVANCED_DEGREE_RULES.patterns == advanced, "Strict advanced degrees included")
+        self.check(relaxed_education_filters.ADVANCED_REQUIRED_RULES.patterns[:5] == advanced[:5]
+                   and relaxed_education_filters.ADVANCED_REQUIRED_RULES.patterns[6:] == advanced[5:],
+                   "Relaxed advanced degrees included, plus its own")
+        terms = shared.patterns("BACHELORS_DEGREE")
+        scored, simplified = education_filters.BACHELORS_PATTERNS, simplified_education_filters.BACHELOR_MENTION_RULES.patterns
+        self.check(all(p in scored and p in simplified for p in terms), "Bachelor's terms in both filters")
+        shipped = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(rule_bundle.RULES_DIR.glob("*.json"))
+                   if path.stem != "degree_terms"]
+        copies = [p for spec in shipped for table in spec["tables"].values() if table["kind"] in ("patterns", "table")
+                  for p in rule_bundle._group_entries(table["patterns"]) if isinstance(p, str) and p in terms + advanced]
+        self.check(not copies, "No module file repeats a shared pattern", f"Copies: {copies}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_dir = Path(tmp)
+            shared_spec = {"tables": {"DEGREES": {"kind": "patterns", "flags": "i", "patterns": [
+                {"name": "masters", "patterns": ["master'?s", "mba"]}, "ph\\.?d"]}}}
+            (rules_dir / "shared.json").write_text(json.dumps(shared_spec), encoding="utf-8")
+            (rules_dir / "demo.json").write_text(json.dumps({"tables": {
+                "ALL": {"kind": "table", "flags": "i", "patterns": ["associate", {"include": "shared.DEGREES"}]},
+                "MASTERS": {"kind": "table", "flags": "i", "patterns": [
+                    {"name": "grad", "patterns": [{"include": "shared.DEGREES.masters"}, "mha"]}]},
+                "EITHER": {"kind": "alternation", "flags": "i", "of": ["MASTERS.grad"]},
+            }}), encoding="utf-8")
+            bundle = compile_rules("demo", rules_dir)
+            self.check(bundle.patterns("ALL") == ["associate", "master'?s", "mba", "ph\\.?d"]
+                       and bundle.pattern("EITHER").pattern == "master'?s|mba|mha", "Includes expanded in place",
+                       f"Got: {bundle.patterns('ALL')}")
+            self.check(bundle.includes == ("shared",), "Included files recorded")
+
+            shared_spec["tables"]["DEGREES"]["patterns"].append("doctorate")
+            (rules_dir / "shared.json").write_text(json.dumps(shared_spec), encoding="utf-8")
+            edited = compile_rules("demo", rules_dir)
+            self.check(edited.digest != bundle.digest and "doctorate" in edited.patterns("ALL"),
+                       "Editing the shared file changes the including bundle")
+
+            (rules_dir / "bad.json").write_text(json.dumps({"tables": {
+                "T": {"kind": "table", "flags": "", "patterns": [{"include": "shared.DEGREES"}]}}}), encoding="utf-8")
+            try:
+                compile_rules("bad", rules_dir)
+                flags_checked = False
+            except RuleFileError:
+                flags_checked = True
+            self.check(flags_checked, "Included tables must have the same flags")
+
+    def test_cache_keyed_by_contents(self):
+        """The analysis cache is reused for the same file and rebuilt when it changes"""
+        print("\nTesting Analysis Cache")
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_dir = Path(tmp)
+            path = rules_dir / "demo.json"
+            spec = {"tables": {"T": {"kind": "table", "flags": "i", "patterns": ["bachelor.{0,20}preferred"]}}}
+            path.write_text(json.dumps(spec), encoding="utf-8")
+
+            first = compile_rules("demo", rules_dir)
+            cached = list((rules_dir / rule_bundle.CACHE_SUBDIR).glob("demo.*.json"))
+            self.check(len(cached) == 1, "Analysis cached on disk")
+
+            # A cache hit must not re-derive anything: poison the cached guard and see it used
+            payload = json.loads(cached[0].read_text(encoding="utf-8"))
+            payload["patterns"][0][2] = ["sentinel"]
+            cached[0].write_text(json.dumps(payload), encoding="utf-8")
+            second = compile_rules("demo", rules_dir)
+            self.check(second.table("T").rules[0].guard == ("sentinel",), "Cache hit loads analysis")
+
+            spec["tables"]["T"]["patterns"].append("associate'?s degree")
+            path.write_text(json.dumps(spec), encoding="utf-8")
+            third = compile_rules("demo", rules_dir)
+            self.check(third.digest != first.digest and third.table("T").rules[0].guard == ("preferred",),
+                       "Changed file re-derives analysis", f"Got: {third.table('T').rules[0].guard}")
+            remaining = list((rules_dir / rule_bundle.CACHE_SUBDIR).glob("demo.*.json"))
+            self.check(len(remaining) == 1, "Stale cache entries removed")
+
+    def test_reload_if_changed(self):
+        """Editing a rule file rebinds the module tables on the next reload check"""
+        print("\nTesting Reload")
+        original_dir = rule_bundle.RULES_DIR
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_dir = Path(tmp)
+            for path in original_dir.glob("*.json"):
+                shutil.copy(path, rules_dir / path.name)
+            rule_bundle.RULES_DIR = rules_dir
+            try:
+                self.check(reload_if_changed() == [], "Unchanged contents not reloaded")
+
+                path = rules_dir / "education_filters.json"
+                spec = json.loads(path.read_text(encoding="utf-8"))
+                spec["tables"]["BACHELORS_PREFERRED_PATTERNS"]["patterns"].append("bachelor.{0,20}welcome")
+                path.write_text(json.dumps(spec), encoding="utf-8")
+                stat = path.stat()
+                os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+                seen = []
+                on_reload("education_filters", lambda bundle: seen.append(bundle.name))
+                text = "a bachelor's degree is welcome"
+                before = education_filters.analyze_education_requirements(text)["matches"]["bachelors_preferred"]
+                reloaded = reload_if_changed()
+                after = education_filters.analyze_education_requirements(text)["matches"]["bachelors_preferred"]
+                self.check(reloaded == ["education_filters"] and seen == ["education_filters"],
+                           "Changed file reloaded", f"Got: {reloaded}")
+                self.check(not before and after == ["bachelor.{0,20}welcome"], "Module tables rebound",
+                           f"Before: {before}, after: {after}")
+            finally:
+                rule_bundle.RULES_DIR = original_dir
+                rule_bundle._RELOAD_CALLBACKS["education_filters"].pop()
+                reload_if_changed()
+        self.check("bachelor.{0,20}welcome" not in education_filters.BACHELORS_PREFERRED_PATTERNS,
+                   "Original rules restored")
+
+        # Editing the shared file reloads every rule file that includes it
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_dir = Path(tmp)
+            for path in original_dir.glob("*.json"):
+                shutil.copy(path, rules_dir / path.name)
+            rule_bundle.RULES_DIR = rules_dir
+            try:
+                reload_if_changed()
+                path = rules_dir / "degree_terms.json"
+                spec = json.loads(path.read_text(encoding="utf-8"))
+                spec["tables"]["ADVANCED_DEGREE_REQUIRED"]["patterns"][0]["patterns"].append("msw required")
+                path.write_text(json.dumps(spec), encoding="utf-8")
+                stat = path.stat()
+                os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+                reloaded = reload_if_changed()
+                self.check({"strict_entry_level", "relaxed_education"} <= set(reloaded)
+                           and run_collect.STRICT_ADVANCED_DEGREE_RULES.any("msw required")
+                           and relaxed_education_filters.ADVANCED_REQUIRED_RULES.any("msw required"),
+                           "Shared file edit reloads the files including it", f"Got: {reloaded}")
+            finally:
+                rule_bundle.RULES_DIR = original_dir
+                reload_if_changed()
+        self.check(not run_collect.STRICT_ADVANCED_DEGREE_RULES.any("msw required"), "Shared rules restored")
+
+    def run_all_tests(self):
+        """Run all rule bundle tests"""
+        print("UNIT TESTS: Rule Bundles")
+        print("=" * 50)
+
+        self.test_rule_files_compile()
+        self.test_module_tables()
+        self.test_groups_and_alternations()
+        self.test_shared_patterns()
+        self.test_cache_keyed_by_contents()
+        self.test_reload_if_changed()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Rule Bundle Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All rule bundle tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review rule bundles")
+
+
+def main():
+    """Main test execution"""
+    tester = TestRuleBundle()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL RULE BUNDLE TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review rule bundles")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Posting Section Segmentation
+===========================================
+Tests typed section detection, the section-scoped filter, pay and
+qualification consumers, and the heading index the qualification
+extractors find their headings with.
+"""
+
+import random
+import re
+import sys
+import os
+
+# Add the parent directory (hc_jobs_pipeline) to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from section_segmenter import HeadingIndex, segment_posting
+from enhanced_qualifications import SECTION_BODY, QualificationsExtractor
+from run_collect import PostingContext, build_filter_chain, meets_entry_level_requirement, normalize_pay_to_hourly
+from benchmarks.corpus import generate_corpus
+
+# Heading lines and near-misses for the heading index differential test
+HEADING_FRAGMENTS = [
+    "Qualifications", "QUALIFICATIONS:", "  requirements  :", "Required Qualifications\n:",
+    "What You'll Need", "what you bring", "Requirements include:", "Qualifications\r", "foo Qualifications",
+    " Qualifications", "Skills & Qualifications", "Minimum Requirements", "Must Have:", "Ideal Candidate",
+    "Responsibilities And Duties Here:", "Bachelor's degree", "- 2 years experience", "x" * 2100, "", " ", "\t",
+]
+
+# Requirements under a heading the segmenter doesn't know, after a Benefits block
+BENEFITS_THEN_UNKNOWN = """Patient Access Coordinator
+About the role
+- Register patients and verify insurance
+What we offer
+- Competitive pay
+Who you are
+- {requirement}
+- 0-2 years of experience
+Requirements
+- Strong communication skills"""
+
+# ... and after an inline Pay line
+INLINE_PAY_THEN_LIST = """Patient Access Coordinator
+Qualifications
+- Strong communication skills
+Pay: $20 - $24 per hour
+- {requirement}"""
+
+# Wage outside any pay section, a benefit amount under Benefits
+BENEFIT_AMOUNT_POSTING = """Patient Access Coordinator
+About the role
+- Register patients and verify insurance
+- $20 - $24 per hour
+Benefits
+- Tuition reimbursement of $5,250 per year"""
+
+STRUCTURED_POSTING = """Patient Access Coordinator
+Nashville, TN
+About Us:
+We are a growing health system.
+Responsibilities:
+- Register patients and verify insurance
+- Train staff with 5+ years experience
+Qualifications:
+- Bachelor's degree preferred
+- 0-2 years of experience in a healthcare setting
+Benefits
+- Tuition support up to $5,250 per year
+Compensation: $20 - $24 per hour
+Equal Opportunity Employer
+We do not discriminate based on veteran status."""
+
+
+class TestSectionSegmenter:
+    """Test class for section segmentation"""
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.extractor = QualificationsExtractor()
+
+    def check(self, condition: bool, test_name: str, detail: str = "") -> None:
+        if condition:
+            print(f"PASS: {test_name}")
+            self.passed += 1
+        else:
+            print(f"FAIL: {test_name}")
+            if detail:
+                print(f"   {detail}")
+            self.failed += 1
+
+    def test_section_types(self):
+        """Headings are typed and offsets cover the posting"""
+        print("Testing Section Types")
+        segmented = segment_posting(STRUCTURED_POSTING)
+        kinds = [s.kind for s in segmented.sections]
+
+        self.check(kinds == ["other", "other", "responsibilities", "qualifications", "benefits", "compensation", "eeo"],
+                   "Section kinds in order", f"Got: {kinds}")
+        self.check(segmented.sections[0].start == 0 and segmented.sections[-1].end == len(STRUCTURED_POSTING),
+                   "Offsets cover whole posting")
+        quals = segmented.text_for("qualifications")
+        self.check("Bachelor's degree preferred" in quals and "Register patients" not in quals,
+                   "Qualification section body", f"Got: {quals!r}")
+        self.check(segmented.text_for("compensation") == "$20 - $24 per hour\n",
+                   "Inline heading body starts after colon")
+
+    def test_unstructured_posting(self):
+        """Postings without headings keep full-text scanning"""
+        print("\nTesting Unstructured Posting")
+        segmented = segment_posting("Bachelor's degree required. 3+ years experience.")
+        self.check([s.kind for s in segmented.sections] == ["other"], "Single untyped section")
+        self.check(segmented.education_text() is None, "Education scope falls back to full text")
+        self.check(segmented.compensation_text() is None, "Pay scope falls back to full text")
+        self.check(segment_posting("").sections[0].end == 0, "Empty posting handled")
+
+    def test_scoped_consumers(self):
+        """Education rules skip non-qualification sections; pay prefers compensation sections"""
+        print("\nTesting Scoped Consumers")
+        segmented = segment_posting(STRUCTURED_POSTING)
+
+        self.check(not meets_entry_level_requirement(STRUCTURED_POSTING, "Patient Access Coordinator", ""),
+                   "Full-text scan trips on responsibilities text")
+        self.check(meets_entry_level_requirement(STRUCTURED_POSTING, "Patient Access Coordinator", "", segmented),
+                   "Section-scoped scan only sees qualifications")
+
+        pay_hr, pay_raw = normalize_pay_to_hourly(STRUCTURED_POSTING, segmented)
+        self.check(pay_hr == 22.0 and pay_raw["type"] == "hourly_range",
+                   "Pay read from compensation section", f"Got: {pay_hr} {pay_raw}")
+
+        segmented = segment_posting(BENEFIT_AMOUNT_POSTING)
+        pay = normalize_pay_to_hourly(BENEFIT_AMOUNT_POSTING, segmented)
+        self.check(segmented.compensation_text() is None and pay == normalize_pay_to_hourly(BENEFIT_AMOUNT_POSTING)
+                   and pay[0] == 22.0, "Benefit amounts aren't read as pay", f"Got: {pay}")
+
+    def test_boilerplate_boundaries(self):
+        """Compensation and EEO sections don't swallow the sections after them"""
+        print("\nTesting Boilerplate Boundaries")
+        segmented = segment_posting(BENEFITS_THEN_UNKNOWN.format(requirement="Bachelor's degree"))
+        kinds = [(s.kind, s.heading) for s in segmented.sections]
+        self.check(kinds == [("other", ""), ("responsibilities", "About the role"), ("benefits", "What we offer"),
+                             ("other", "Who you are"), ("qualifications", "Requirements")],
+                   "Unknown heading closes Benefits", f"Got: {kinds}")
+        self.check("- Competitive pay" not in segmented.education_text(), "Benefits body still left out")
+        segmented = segment_posting(INLINE_PAY_THEN_LIST.format(requirement="Bachelor's degree"))
+        kinds = [s.kind for s in segmented.sections]
+        self.check(kinds == ["other", "qualifications", "compensation", "other"], "Inline Pay ends with its line",
+                   f"Got: {kinds}")
+        self.check(segmented.compensation_text() == "$20 - $24 per hour\n", "Inline Pay body is its line")
+        self.check([s.kind for s in segment_posting("Intro\nPay: $20/hr").sections] == ["other", "compensation"],
+                   "No empty section after a final inline heading")
+
+        chain = build_filter_chain(retune_every=None)
+        for template in (BENEFITS_THEN_UNKNOWN, INLINE_PAY_THEN_LIST):
+            name = "Benefits block" if template is BENEFITS_THEN_UNKNOWN else "inline Pay line"
+            verdicts = {}
+            for requirement in ("Bachelor's degree in healthcare administration", "Master's degree required",
+                                "5+ years of experience", "PhD required"):
+                posting = PostingContext("Patient Access Coordinator", "Nashville, TN", template.format(requirement=requirement))
+                verdicts[requirement] = chain.rejection_reason(posting)
+            self.check(verdicts == {"Bachelor's degree in healthcare administration": None,
+                                    "Master's degree required": "education_requirements",
+                                    "5+ years of experience": "education_requirements",
+                                    "PhD required": "education_requirements"},
+                       f"Requirements after the {name} are scanned", f"Got: {verdicts}")
+
+    def test_extractor_equivalence(self):
+        """Passing sections never changes extracted qualifications"""
+        print("\nTesting Extractor Equivalence")
+        samples = [
+            STRUCTURED_POSTING,
+            "Job Title\nLocation\n\nRequirements:\n• Bachelor's degree required\n• 2+ years experience\n",
+            "Job Title\nNo requirements section here. Bachelor's degree is a plus.",
+            "WHAT YOU'LL NEED\n- Bachelor's degree in healthcare administration\n",
+            "Requirements:\n• \n• \n• ",
+        ]
+        for i, text in enumerate(samples, 1):
+            plain = self.extractor.extract_comprehensive_qualifications(text)
+            scoped = self.extractor.extract_comprehensive_qualifications(text, segment_posting(text))
+            self.check(plain == scoped, f"Sample {i} unchanged", f"{plain!r} != {scoped!r}")
+
+    def test_heading_index(self):
+        """One heading scan finds what a re.search per heading, in priority order, found"""
+        print("\nTesting Heading Index")
+        headings = self.extractor.QUAL_SECTIONS
+        flags = re.IGNORECASE | re.MULTILINE
+        index = HeadingIndex(headings, SECTION_BODY, flags)
+
+        rng = random.Random(39)
+        texts = [p["description"] for p in generate_corpus(300, seed=39)]
+        texts += ["\n".join(rng.choice(HEADING_FRAGMENTS) for _ in range(rng.randint(1, 8))) for _ in range(3000)]
+        different = []
+        for text in texts:
+            expected = []
+            seen = set()
+            for i, heading in enumerate(headings):
+                # A heading listed again in different case finds the same match
+                if heading.lower() in seen:
+                    continue
+                seen.add(heading.lower())
+                match = re.search(rf"(^|\n)\s*{re.escape(heading)}{SECTION_BODY}", text, flags)
+                if match:
+                    expected.append((i, match.span(2)))
+            if [(i, m.span(2)) for i, m in index.matches(text)] != expected:
+                different.append(text)
+        self.check(not different, f"{len(texts)} texts agree", f"First: {different[:1]!r}")
+
+        unanchored = HeadingIndex(["Qualifications"], r"\s*\n(.{0,20})", re.I)
+        found = [m.group(2) for _, m in unanchored.matches("Intro\nQualifications\nBachelor's degree\n")]
+        self.check(found == ["Bachelor's degree"], "Headings after the first line without re.M", f"Got: {found}")
+        self.check(QualificationsExtractor._heading_index(tuple(headings)) is
+                   QualificationsExtractor()._heading_index(tuple(headings)), "Index compiled once per heading list")
+
+    def run_all_tests(self):
+        """Run all section segmenter tests"""
+        print("UNIT TESTS: Section Segmenter")
+        print("=" * 50)
+
+        self.test_section_types()
+        self.test_unstructured_posting()
+        self.test_scoped_consumers()
+        self.test_boilerplate_boundaries()
+        self.test_extractor_equivalence()
+        self.test_heading_index()
+
+        self.print_summary()
+
+    def print_summary(self):
+        """Print test results summary"""
+        total = self.passed + self.failed
+        success_rate = (self.passed / total * 100) if total > 0 else 0
+
+        print("\n" + "=" * 50)
+        print(f"Section Segmenter Test Results")
+        print(f"Total Tests: {total}")
+        print(f"Passed: {self.passed}")
+        print(f"Failed: {self.failed}")
+        print(f"Success Rate: {success_rate:.1f}%")
+
+        if self.failed == 0:
+            print("All section segmenter tests passed!")
+        else:
+            print(f"WARNING: {self.failed} test(s) failed - review segmentation logic")
+
+
+def main():
+    """Main test execution"""
+    tester = TestSectionSegmenter()
+    tester.run_all_tests()
+
+    if tester.failed == 0:
+        print("\nALL SECTION SEGMENTER TESTS PASSED!")
+        return 0
+    else:
+        print(f"\nSOME TESTS FAILED - Review segmentation logic")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -1,123 +1,549 @@
+"""
+Fill in N/A pay by fetching each job's posting page and scanning it for pay.
+
+Pages are fetched concurrently over one shared connection pool, at most
+PER_HOST_CONCURRENCY at a time per host with PER_HOST_DELAY seconds between a
+host's requests. Hosts whose pages have stated pay before (host_pay_stats.json
+next to the jobs file) are fetched first, so an interrupted or time-limited
+pass fills in the most pay.
+
+Pages are streamed rather than downloaded whole: their text is scanned as it
+arrives, script and style contents unread, and the rest of a page is skipped
+once it states an hourly range (which nothing later on the page can outrank)
+or after MAX_PAGE_BYTES.
+
+Many career pages describe the job as schema.org JobPosting JSON-LD. Its
+baseSalary is taken over the page text, and read as soon as the block has
+arrived, usually in the page's head; its validThrough fills in the job's
+closing date.
+
+    python update_pay_from_urls.py [--concurrency 8] [--per-host 2] [--delay 1.0] [--max-page-bytes 1000000]
+
+--concurrency 1 --per-host 1 fetches one page at a time, as this script used to.
+run_collect.py --enrich-pay runs the same PayEnricher during collection instead.
+"""
+
+import argparse
+import codecs
 import json
-import re
 import asyncio
+import time
+from collections import deque
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from html.parser import HTMLParser
+from typing import Any, Iterator, Optional
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
-
-PAY_PATTERNS = [
-    # hourly patterns
-    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?[-–]\s?\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
-    re.compile(r"\$\s?(\d+(?:\.\d+)?)\s?(?:per\s?hour|/hr|hr)\b", re.I),
-    # annual patterns with decimal support and broader matching
-    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:and|\s?[-–]\s?)\s?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
-    re.compile(r"\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually|a\s?year)\b", re.I),
-    # catch "between $X and $Y per year" patterns
-    re.compile(r"between\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+and\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s+per\s+year", re.I),
-    # Additional patterns for better coverage
-    re.compile(r"salary\s+(?:range\s+)?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?[-–]\s?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?year|/yr|annually)", re.I),
-    re.compile(r"starting\s+(?:at\s+)?\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?hour|/hr|hr)", re.I),
-    re.compile(r"up\s+to\s+\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s?(?:per\s?hour|/hr|hr)", re.I),
-]
+
+from pay_engine import hourly_pay, pay_from_range, pay_mentions
+from pay_normalizer import normalize_pay, pay_is_plausible, reflag_batch
+
+INPUT_FILE = Path("output/healthcare_admin_jobs_us_nationwide.json")
+
+# Pages fetched at once in total, and per host
+DEFAULT_CONCURRENCY = 8
+PER_HOST_CONCURRENCY = 2
+
+# Seconds a host's slot stays taken after each request to it, to be respectful to servers
+PER_HOST_DELAY = 1.0
+
+# Seconds to wait on a page before giving up on it
+PAGE_TIMEOUT = 30
+
+# Bytes of a page read at most (0 reads whole pages), and read at a time
+MAX_PAGE_BYTES = 1_000_000
+READ_CHUNK_SIZE = 16 * 1024
+
+# Text rescanned from before each new piece, for pay mentions split across pieces
+SCAN_OVERLAP = 256
+
+# schema.org QuantitativeValue unitText for pay: pay periods per year, or hourly
+JSON_LD_PAY_UNITS = {"HOUR": None, "DAY": 260, "WEEK": 52, "MONTH": 12, "YEAR": 1}
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) JobResearchCollector/1.0"
+}
 
 def normalize_pay_to_hourly(text: str) -> tuple[float | None, dict | None]:
     """
     Returns (payHourly_midpoint, payRaw_dict).
     payRaw_dict includes type/hourly/annual min/max when found.
     """
-    if not text:
-        return None, None
+    return hourly_pay(text)
+
+class PageText(HTMLParser):
+    """
+    The visible text of an HTML page fed in pieces: its text nodes stripped,
+    empty ones dropped, joined by newlines, as BeautifulSoup's
+    get_text(separator="\n", strip=True) gives it. Only complete text nodes
+    are in ``pieces``; close() completes the last one. The contents of
+    complete JSON-LD scripts are in ``json_ld``.
+    """
+
+    # Elements whose contents get_text leaves out
+    SKIPPED_TAGS = frozenset({"script", "style", "template"})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pieces: list[str] = []
+        self.json_ld: list[str] = []
+        self._data: list[str] = []
+        self._skipped = 0
+        self._json_ld: Optional[list[str]] = None
 
-    for pat in PAY_PATTERNS:
-        m = pat.search(text)
-        if not m:
+    @property
+    def text(self) -> str:
+        return "\n".join(self.pieces)
+
+    def _end_node(self) -> None:
+        if self._data:
+            piece = "".join(self._data).strip()
+            self._data = []
+            if piece:
+                self.pieces.append(piece)
+
+    def handle_starttag(self, tag, attrs):
+        self._end_node()
+        if tag in self.SKIPPED_TAGS:
+            self._skipped += 1
+        if tag == "script" and (dict(attrs).get("type") or "").strip().lower() == "application/ld+json":
+            self._json_ld = []
+
+    def handle_endtag(self, tag):
+        self._end_node()
+        if tag in self.SKIPPED_TAGS and self._skipped:
+            self._skipped -= 1
+        if tag == "script" and self._json_ld is not None:
+            self.json_ld.append("".join(self._json_ld))
+            self._json_ld = None
+
+    def handle_data(self, data):
+        if self._json_ld is not None:
+            self._json_ld.append(data)
+        elif not self._skipped:
+            self._data.append(data)
+
+    def handle_comment(self, data):
+        self._end_node()
+
+    def handle_decl(self, decl):
+        self._end_node()
+
+    def handle_pi(self, data):
+        self._end_node()
+
+    def unknown_decl(self, data):
+        self._end_node()
+        if data.startswith("CDATA[") and not self._skipped:
+            self._data.append(data[len("CDATA["):])
+            self._end_node()
+
+    def close(self):
+        super().close()
+        self._end_node()
+
+def job_postings(blocks: list[str]) -> Iterator[dict[str, Any]]:
+    """The JobPosting objects in JSON-LD script contents, at any depth or in an @graph."""
+    def walk(node):
+        if isinstance(node, list):
+            for item in node:
+                yield from walk(item)
+        elif isinstance(node, dict):
+            types = node.get("@type")
+            if types == "JobPosting" or isinstance(types, list) and "JobPosting" in types:
+                yield node
+            else:
+                for value in node.values():
+                    yield from walk(value)
+
+    for block in blocks:
+        try:
+            yield from walk(json.loads(block))
+        except ValueError:
+            continue
+
+def _ld_amount(value: Any) -> Optional[float]:
+    try:
+        amount = float(str(value).replace(",", "").lstrip("$"))
+    except ValueError:
+        return None
+    return amount if amount > 0 else None
+
+def json_ld_pay(posting: dict[str, Any]) -> Optional[tuple[float, dict]]:
+    """
+    (hourly, payRaw) from a JobPosting's baseSalary, or None if it doesn't
+    state USD pay with a unit. Postings that leave the currency out are taken
+    as USD, like the rest of this pipeline's US postings.
+    """
+    salaries = posting.get("baseSalary")
+    for salary in salaries if isinstance(salaries, list) else [salaries]:
+        if not isinstance(salary, dict) or (salary.get("currency") or "USD").upper() != "USD":
+            continue
+        value = salary.get("value")
+        if not isinstance(value, dict):
+            value = {"value": value, "unitText": salary.get("unitText")}
+        unit = (value.get("unitText") or "").upper()
+        if unit not in JSON_LD_PAY_UNITS:
+            continue
+        low = _ld_amount(value.get("minValue", value.get("value")))
+        high = _ld_amount(value.get("maxValue")) or low
+        if low is None:
             continue
+        per_year = JSON_LD_PAY_UNITS[unit]
+        if per_year is None:
+            return pay_from_range("hour", low, high)
+        return pay_from_range("year", low * per_year, high * per_year)
+    return None
 
-        groups = m.groups()
-        # hourly range
-        if len(groups) == 2 and pat.pattern.lower().find("hour") != -1:
-            low = float(groups[0])
-            high = float(groups[1])
-            mid = round((low + high) / 2.0, 2)
-            return mid, {"type": "hourly_range", "min": low, "max": high}
-        # hourly single
-        if len(groups) == 1 and pat.pattern.lower().find("hour") != -1:
-            val = float(groups[0])
-            return round(val, 2), {"type": "hourly", "value": val}
-
-        # annual range
-        if len(groups) == 2 and pat.pattern.lower().find("year") != -1:
-            low = float(groups[0].replace(",", ""))
-            high = float(groups[1].replace(",", ""))
-            mid_annual = (low + high) / 2.0
-            mid_hr = round(mid_annual / 2080.0, 2)
-            return mid_hr, {"type": "annual_range", "min": low, "max": high, "annual_mid": mid_annual}
-
-        # annual single
-        if len(groups) == 1 and pat.pattern.lower().find("year") != -1:
-            val = float(groups[0].replace(",", ""))
-            hr = round(val / 2080.0, 2)
-            return hr, {"type": "annual", "value": val}
-
-    return None, None
+def json_ld_closing_date(posting: dict[str, Any]) -> Optional[str]:
+    """A JobPosting's validThrough as YYYY-MM-DD, or None."""
+    try:
+        return date.fromisoformat(str(posting.get("validThrough") or "")[:10]).isoformat()
+    except ValueError:
+        return None
+
+def structured_job_data(blocks: list[str]) -> tuple[Optional[tuple[float, dict]], Optional[str]]:
+    """((hourly, payRaw) or None, closing date or None) from the first JobPostings stating them."""
+    pay, closing_date = None, None
+    for posting in job_postings(blocks):
+        pay = pay or json_ld_pay(posting)
+        closing_date = closing_date or json_ld_closing_date(posting)
+        if pay and closing_date:
+            break
+    return pay, closing_date
 
 def extract_pay_from_html(html: str) -> tuple[float | None, dict | None]:
-    """Extract pay from full HTML content."""
+    """Extract pay from full HTML content: JobPosting JSON-LD, else the page text."""
     if not html:
         return None, None
 
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(separator="\n", strip=True)
-    return normalize_pay_to_hourly(text)
+    page = PageText()
+    page.feed(html)
+    page.close()
+    pay, _ = structured_job_data(page.json_ld)
+    return pay or normalize_pay_to_hourly(page.text)
 
-async def update_pay_from_urls():
-    # Load the existing JSON
-    input_file = Path("output/healthcare_admin_jobs_us_nationwide.json")
-    if not input_file.exists():
-        print("Input file not found")
-        return
+class PagePay:
+    """Pay read from a streamed page, and how much of the page was read for it."""
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        jobs = json.load(f)
+    def __init__(self, pay_hr, pay_raw, bytes_read: int, bytes_total: Optional[int], complete: bool,
+                 pay_source: Optional[str] = None, closing_date: Optional[str] = None):
+        self.pay_hr = pay_hr
+        self.pay_raw = pay_raw
+        self.pay_source = pay_source  # "json-ld" or "text" when pay was found
+        self.closing_date = closing_date
+        self.bytes_read = bytes_read
+        self.bytes_total = bytes_total  # Content-Length, when the server sent one
+        self.complete = complete
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.bytes_total - self.bytes_read) if self.bytes_total else 0
+
+async def read_page_pay(response: httpx.Response, max_bytes: int = MAX_PAGE_BYTES) -> PagePay:
+    """
+    Stream a page's body into PageText and scan its text for pay as it
+    arrives. A JobPosting JSON-LD block stating pay settles it, so reading
+    stops there. Otherwise first_hit takes the leftmost mention of the
+    top-priority variant, an hourly range, so once one is read the rest of the
+    page can't change the text's pay and is left unread; so is anything past
+    max_bytes. The pay is the same as extract_pay_from_html on the whole page
+    whenever the page is read to its end, to JSON-LD pay, or to an hourly range
+    with no JSON-LD after it.
+    """
+    page = PageText()
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    read, scanned_to, tail, complete = 0, 0, "", True
+    ld_read, ld_pay, closing_date = 0, None, None
+    async for chunk in response.aiter_bytes(READ_CHUNK_SIZE):
+        read += len(chunk)
+        page.feed(decoder.decode(chunk))
+        if len(page.json_ld) > ld_read:
+            ld_pay, closing_date = structured_job_data(page.json_ld)
+            ld_read = len(page.json_ld)
+            if ld_pay:
+                complete = False
+                break
+        if len(page.pieces) > scanned_to:
+            # The new pieces, after a little of the text before them in case a mention started there
+            new = "\n".join(page.pieces[scanned_to:])
+            window = f"{tail}\n{new}" if scanned_to else new
+            scanned_to, tail = len(page.pieces), window[-SCAN_OVERLAP:]
+            if any(mention.variant == 0 for mention in pay_mentions(window)):
+                complete = False
+                break
+        if max_bytes and read >= max_bytes:
+            complete = False
+            break
+    else:
+        page.feed(decoder.decode(b"", final=True))
+        page.close()
+        if len(page.json_ld) > ld_read:
+            ld_pay, closing_date = structured_job_data(page.json_ld)
+    # In-process transports hand over bodies without counting them as downloaded
+    downloaded = response.num_bytes_downloaded or read
+    content_length = response.headers.get("content-length")
+    if ld_pay:
+        (pay_hr, pay_raw), pay_source = ld_pay, "json-ld"
+    else:
+        pay_hr, pay_raw = normalize_pay_to_hourly(page.text)
+        pay_source = "text" if pay_hr is not None else None
+    return PagePay(pay_hr, pay_raw, downloaded, int(content_length) if content_length else None, complete,
+                   pay_source, closing_date)
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+def host_stats_path(input_file: Path) -> Path:
+    return input_file.with_name("host_pay_stats.json")
 
-    updated_count = 0
+def load_host_stats(path: Path) -> dict[str, dict[str, int]]:
+    """{host: {"fetched": pages, "found": pages with pay}} from earlier passes."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) JobResearchCollector/1.0"
-    }
+def host_hit_rate(stats: dict[str, int] | None) -> float:
+    # Smoothed so unseen hosts (0.5) rank between proven and barren ones
+    stats = stats or {}
+    return (stats.get("found", 0) + 1) / (stats.get("fetched", 0) + 2)
+
+def order_by_host_history(jobs: list[dict], host_stats: dict[str, dict[str, int]]) -> list[dict]:
+    """Jobs on hosts with the best pay hit rate first; otherwise in file order."""
+    return sorted(jobs, key=lambda job: -host_hit_rate(host_stats.get(host_of(job["sourceFile"]))))
+
+class EnrichStats:
+    """Counters for one enrichment pass."""
+
+    def __init__(self):
+        self.fetched = 0
+        self.found = 0
+        self.found_json_ld = 0
+        self.dates = 0
+        self.errors = 0
+        self.bytes = 0
+        self.cut_short = 0
+        self.bytes_saved = 0
+        self.elapsed = 0.0
+        # Jobs whose pay was set from a page; jobs sharing a URL each count
+        self.jobs_updated = 0
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.fetched / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.found / self.fetched if self.fetched else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """The counters for filtering_stats.json."""
+        return {"jobs_updated": self.jobs_updated, "pages_fetched": self.fetched, "pay_found": self.found, "pay_from_json_ld": self.found_json_ld,
+                "closing_dates": self.dates, "errors": self.errors, "bytes_downloaded": self.bytes,
+                "pages_cut_short": self.cut_short, "bytes_not_downloaded": self.bytes_saved,
+                "seconds": round(self.elapsed, 2), "pages_per_sec": round(self.pages_per_sec, 2)}
+
+    def summary(self) -> str:
+        return (f"{self.fetched} pages in {self.elapsed:.1f}s ({self.pages_per_sec:.1f} pages/sec), "
+                f"pay found on {self.found} ({self.hit_rate:.0%}, {self.found_json_ld} from JSON-LD), "
+                f"{self.dates} closing dates, {self.bytes / 1e6:.1f} MB downloaded, "
+                f"{self.cut_short} pages cut short ({self.bytes_saved / 1e6:.1f} MB not downloaded), "
+                f"{self.errors} errors")
+
+class PayEnricher:
+    """
+    Reads posting pages for pay on a pool of workers, started before the URLs
+    are all known: submit() queues a URL and returns at once, so pages are
+    fetched while the caller is still producing them (run_collect.collect()
+    submits postings as they pass its filters). Each worker takes the next
+    URL of the host with the best pay hit rate in host_stats that has a free
+    slot; host_stats is updated as pages are read. finish() waits for the
+    queued pages and returns the pass's stats; ``pages`` has the page read for
+    each URL that could be fetched.
+    """
 
-    async with httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=30) as client:
-        for job in jobs:
-            if job.get("pay") != "N/A":
-                continue  # Already has pay
+    def __init__(self, client: httpx.AsyncClient, concurrency: int = DEFAULT_CONCURRENCY,
+                 per_host: int = PER_HOST_CONCURRENCY, delay: float = PER_HOST_DELAY,
+                 max_page_bytes: int = MAX_PAGE_BYTES,
+                 host_stats: Optional[dict[str, dict[str, int]]] = None):
+        self.client = client
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.delay = delay
+        self.max_page_bytes = max_page_bytes
+        self.host_stats = {} if host_stats is None else host_stats
+        self.stats = EnrichStats()
+        self.pages: dict[str, PagePay] = {}
+        self._submitted: set[str] = set()
+        self._queues: dict[str, deque] = {}  # each host's URLs in submission order
+        self._in_flight: dict[str, int] = {}
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._workers: list[asyncio.Task] = []
+        self._started = 0.0
 
-            url = job.get("sourceFile")
-            if not url or not url.startswith("http"):
+    def start(self) -> None:
+        """Start the workers; needs a running event loop."""
+        self._started = time.perf_counter()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(max(1, self.concurrency))]
+
+    def submit(self, url: str) -> None:
+        """Queue a page for reading; URLs already submitted are ignored."""
+        if url in self._submitted:
+            return
+        self._submitted.add(url)
+        self._queues.setdefault(host_of(url), deque()).append(url)
+        self._wake.set()
+
+    async def finish(self) -> EnrichStats:
+        """Read the pages still queued, stop the workers and return the stats."""
+        self._closed = True
+        self._wake.set()
+        await asyncio.gather(*self._workers)
+        self.stats.elapsed = time.perf_counter() - self._started
+        return self.stats
+
+    def _next_url(self) -> Optional[str]:
+        # The best-ranked host with work left and a free slot; ties go to the host submitted first
+        best = None
+        for host, queue in self._queues.items():
+            if queue and self._in_flight.get(host, 0) < self.per_host:
+                if best is None or host_hit_rate(self.host_stats.get(host)) > host_hit_rate(self.host_stats.get(best)):
+                    best = host
+        if best is None:
+            return None
+        self._in_flight[best] = self._in_flight.get(best, 0) + 1
+        return self._queues[best].popleft()
+
+    async def _work(self) -> None:
+        while True:
+            url = self._next_url()
+            if url is None:
+                if self._closed and not any(self._queues.values()):
+                    return
+                # Woken by a submitted URL, a freed host slot or finish()
+                self._wake.clear()
+                await self._wake.wait()
                 continue
+            await self._read(url)
+            # Hold the host's slot a little longer before its next request
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            self._in_flight[host_of(url)] -= 1
+            self._wake.set()
 
-            try:
-                response = await client.get(url)
+    async def _read(self, url: str) -> None:
+        stats = self.stats
+        try:
+            async with self.client.stream("GET", url, timeout=PAGE_TIMEOUT) as response:
                 response.raise_for_status()
-                html = response.text
+                page = await read_page_pay(response, self.max_page_bytes)
+        except Exception as e:
+            stats.errors += 1
+            print(f"Error fetching {url}: {e}")
+            return
+        self.pages[url] = page
+        stats.bytes += page.bytes_read
+        stats.fetched += 1
+        if not page.complete:
+            stats.cut_short += 1
+            stats.bytes_saved += page.bytes_saved
+            print(f"Read {page.bytes_read:,} of {page.bytes_total or '?'} bytes of {url}")
+        stats.dates += page.closing_date is not None
+        seen = self.host_stats.setdefault(host_of(url), {"fetched": 0, "found": 0})
+        seen["fetched"] += 1
+        if pay_is_plausible(page.pay_raw):
+            stats.found += 1
+            stats.found_json_ld += page.pay_source == "json-ld"
+            seen["found"] += 1
 
-                pay_hr, pay_raw = extract_pay_from_html(html)
-                if pay_hr and pay_hr >= 10:  # Only update if pay is reasonable (>= $10/hr)
-                    job["pay"] = f"${pay_hr}/hr"
-                    updated_count += 1
-                    print(f"Updated pay for: {job.get('jobTitle', '')[:50]}... to ${pay_hr}/hr")
-                    await asyncio.sleep(1)  # Be respectful to servers
+def needs_pay(job: dict) -> bool:
+    """True for jobs with N/A pay and an http(s) sourceFile to read it from."""
+    return job.get("pay") == "N/A" and (job.get("sourceFile") or "").startswith("http")
 
-            except Exception as e:
-                print(f"Error fetching {url}: {e}")
-                continue
+def apply_page(job: dict, page: PagePay) -> bool:
+    """
+    Set the job's pay from its page when the page states a plausible one (see
+    pay_normalizer), and its closing date when it has none. Returns True if
+    pay was set; its numeric fields are set from the page's payRaw by
+    normalize_pay over the batch.
+    """
+    if page.closing_date and not job.get("date"):
+        job["date"] = page.closing_date
+    if not pay_is_plausible(page.pay_raw) or job.get("pay") != "N/A":
+        return False
+    job["pay"] = f"${page.pay_hr}/hr"
+    job["paySource"] = "page"
+    print(f"Updated pay for: {job.get('jobTitle', '')[:50]}... to ${page.pay_hr}/hr")
+    return True
+
+async def enrich_pay(jobs: list[dict], client: httpx.AsyncClient,
+                     concurrency: int = DEFAULT_CONCURRENCY, per_host: int = PER_HOST_CONCURRENCY,
+                     delay: float = PER_HOST_DELAY, max_page_bytes: int = MAX_PAGE_BYTES,
+                     host_stats: Optional[dict[str, dict[str, int]]] = None) -> EnrichStats:
+    """
+    Fetch the page of every job with N/A pay and an http(s) sourceFile, and
+    set its pay and numeric pay fields when the page states a plausible one,
+    and its closing date when the page's JSON-LD has one. batch_outlier flags
+    are then redone over all the jobs. host_stats orders the fetches and is
+    updated with this pass's results.
+    """
+    pending = [job for job in jobs if needs_pay(job)]
+    enricher = PayEnricher(client, min(concurrency, len(pending)), per_host, delay, max_page_bytes, host_stats)
+    enricher.start()
+    for job in order_by_host_history(pending, enricher.host_stats):
+        enricher.submit(job["sourceFile"])
+    stats = await enricher.finish()
+    updated = [job for job in pending
+               if job["sourceFile"] in enricher.pages and apply_page(job, enricher.pages[job["sourceFile"]])]
+    for job, fields in zip(updated, normalize_pay([enricher.pages[job["sourceFile"]].pay_raw for job in updated])):
+        job.update(fields)
+    if updated:
+        # Outliers against the whole file, not the few jobs updated here
+        reflag_batch(jobs)
+    stats.jobs_updated = len(updated)
+    return stats
+
+async def update_pay_from_urls(input_file: Path = INPUT_FILE, concurrency: int = DEFAULT_CONCURRENCY,
+                               per_host: int = PER_HOST_CONCURRENCY, delay: float = PER_HOST_DELAY,
+                               max_page_bytes: int = MAX_PAGE_BYTES):
+    # Load the existing JSON
+    if not input_file.exists():
+        print("Input file not found")
+        return
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    stats_file = host_stats_path(input_file)
+    host_stats = load_host_stats(stats_file)
+    # One connection pool for every fetch; keep-alive connections are reused per host
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(headers=HEADERS, follow_redirects=True, timeout=PAGE_TIMEOUT, limits=limits) as client:
+        stats = await enrich_pay(jobs, client, concurrency, per_host, delay, max_page_bytes, host_stats)
 
     # Save the updated JSON
     with open(input_file, 'w', encoding='utf-8') as f:
         json.dump(jobs, f, indent=2, ensure_ascii=False)
+    stats_file.write_text(json.dumps(host_stats, indent=2, sort_keys=True), encoding="utf-8")
+
+    print(f"Updated pay for {stats.jobs_updated} jobs by fetching URLs")
+    print(stats.summary())
 
-    print(f"Updated pay for {updated_count} jobs by fetching URLs")
+def main():
+    parser = argparse.ArgumentParser(description="Fill in N/A pay from the jobs' posting pages")
+    parser.add_argument("--input", type=Path, default=INPUT_FILE)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="pages fetched at once")
+    parser.add_argument("--per-host", type=int, default=PER_HOST_CONCURRENCY, help="pages fetched at once per host")
+    parser.add_argument("--delay", type=float, default=PER_HOST_DELAY, help="seconds between a host's requests")
+    parser.add_argument("--max-page-bytes", type=int, default=MAX_PAGE_BYTES,
+                        help="bytes of a page read at most, 0 for whole pages")
+    args = parser.parse_args()
+    asyncio.run(update_pay_from_urls(args.input, args.concurrency, args.per_host, args.delay,
+                                     args.max_page_bytes))
 
 if __name__ == "__main__":
-    asyncio.run(update_pay_from_urls())
\ No newline at end of file
+    main()